@@ -0,0 +1,7 @@
+"""
+Módulo de ingesta de archivos.
+
+Contiene la lectura de los archivos subidos hacia S3 y el validador, la
+carga de las filas de archivos CSV validados en las tablas de staging y
+el registro de sus validaciones por fila.
+"""
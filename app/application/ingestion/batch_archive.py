@@ -0,0 +1,161 @@
+"""
+Archivos de una carga por lotes.
+
+Un lote llega como varios archivos de un formulario o como un único ZIP.
+Cada archivo se representa con un BatchItem que sabe abrir su contenido
+desde el inicio, ya que el lote lo lee dos veces: una para calcular su
+resumen SHA-256 (y detectar duplicados antes de subir nada) y otra para
+subirlo y validarlo.
+"""
+
+import posixpath
+import zipfile
+from typing import BinaryIO, Callable, List, Optional
+
+from app.application.ingestion.decompression import ACCEPTED_EXTENSIONS
+
+# Carpetas de metadatos que algunos compresores añaden a los ZIP
+IGNORED_ZIP_PREFIXES = ("__MACOSX/",)
+
+
+class BatchItem:
+    """
+    Archivo de una carga por lotes.
+
+    Attributes:
+        filename: Nombre del archivo (sin carpetas)
+        content_type: Tipo MIME del archivo
+        open: Función que abre el contenido del archivo desde el inicio
+        error: Motivo por el que el archivo no se puede cargar, si lo hay
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        content_type: str,
+        open: Callable[[], BinaryIO],
+        error: Optional[str] = None
+    ):
+        """
+        Inicializa el archivo del lote.
+
+        Args:
+            filename: Nombre del archivo (sin carpetas)
+            content_type: Tipo MIME del archivo
+            open: Función que abre el contenido del archivo desde el inicio
+            error: Motivo por el que el archivo no se puede cargar (opcional)
+        """
+        self.filename = filename
+        self.content_type = content_type
+        self.open = open
+        self.error = error
+
+
+class RewoundStream:
+    """
+    Lectura desde el inicio de un flujo compartido que no se cierra al terminar.
+
+    Permite leer varias veces un archivo recibido en un formulario, cuyo
+    flujo pertenece a la petición.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Vuelve al inicio del flujo.
+
+        Args:
+            stream: Flujo binario que admite seek
+        """
+        stream.seek(0)
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lee hasta size bytes del flujo.
+
+        Args:
+            size: Número máximo de bytes a leer (-1 para todo)
+
+        Returns:
+            bytes: Bytes leídos (vacío al final del flujo)
+        """
+        return self._stream.read(size)
+
+    def close(self) -> None:
+        """
+        No cierra el flujo compartido.
+        """
+
+
+def check_filename(filename: str) -> Optional[str]:
+    """
+    Comprueba que un archivo del lote tenga una extensión aceptada.
+
+    Args:
+        filename: Nombre del archivo
+
+    Returns:
+        Optional[str]: Motivo del rechazo, None si el archivo es válido
+    """
+    if not filename.lower().endswith(ACCEPTED_EXTENSIONS):
+        return "El archivo debe ser un CSV (.csv, .csv.gz o .csv.zst)"
+    return None
+
+
+def read_zip_items(stream: BinaryIO, max_files: int, max_file_size: int) -> List[BatchItem]:
+    """
+    Obtiene los archivos de un ZIP como archivos de un lote.
+
+    Las carpetas y los metadatos de macOS se ignoran; los miembros se
+    abren bajo demanda desde el ZIP, sin extraerlos a disco. Los archivos
+    con una extensión no aceptada o cuyo tamaño descomprimido declarado
+    supera max_file_size se devuelven con su error.
+
+    Args:
+        stream: Flujo binario con el ZIP (debe admitir seek)
+        max_files: Número máximo de archivos del ZIP
+        max_file_size: Tamaño descomprimido máximo de cada archivo
+
+    Returns:
+        List[BatchItem]: Archivos del ZIP, en su orden
+
+    Raises:
+        ValueError: Si el ZIP no es válido, está vacío o supera max_files
+    """
+    try:
+        archive = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile:
+        raise ValueError("El archivo ZIP no es válido")
+
+    members = [
+        info for info in archive.infolist()
+        if not info.is_dir() and not info.filename.startswith(IGNORED_ZIP_PREFIXES)
+    ]
+    if not members:
+        raise ValueError("El archivo ZIP no contiene archivos")
+    if len(members) > max_files:
+        raise ValueError(f"El archivo ZIP supera el máximo de {max_files} archivos")
+
+    items = []
+    for info in members:
+        filename = posixpath.basename(info.filename)
+        error = check_filename(filename)
+        if error is None and info.file_size > max_file_size:
+            error = f"El archivo supera el máximo de {max_file_size} bytes"
+        items.append(BatchItem(filename, "text/csv", lambda info=info: archive.open(info), error))
+    return items
+
+
+def stream_item(filename: str, content_type: str, stream: BinaryIO) -> BatchItem:
+    """
+    Crea el archivo de un lote a partir de un flujo que admite seek.
+
+    Args:
+        filename: Nombre del archivo
+        content_type: Tipo MIME del archivo
+        stream: Flujo binario con el contenido del archivo
+
+    Returns:
+        BatchItem: Archivo del lote, con su error si la extensión no se acepta
+    """
+    return BatchItem(filename, content_type, lambda: RewoundStream(stream), check_filename(filename))
@@ -0,0 +1,147 @@
+"""
+Descompresión al vuelo de archivos CSV comprimidos.
+
+Los archivos .csv.gz y .csv.zst se guardan comprimidos en S3 y se
+descomprimen por bloques mientras los lee el validador, sin escribir el
+contenido descomprimido en memoria ni en disco.
+"""
+
+import gzip
+from typing import BinaryIO, Optional
+
+# Codificación de contenido (ContentEncoding) según la extensión del archivo
+COMPRESSED_EXTENSIONS = {
+    ".csv.gz": "gzip",
+    ".csv.zst": "zstd",
+}
+
+# Extensiones de archivo aceptadas en las cargas
+ACCEPTED_EXTENSIONS = (".csv",) + tuple(COMPRESSED_EXTENSIONS)
+
+# Tamaño de los bloques al leer todo el contenido descomprimido (1 MB)
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class DecompressedSizeExceeded(ValueError):
+    """
+    Error de un archivo cuyo contenido descomprimido supera el máximo permitido.
+    """
+
+
+def content_encoding(filename: str) -> Optional[str]:
+    """
+    Obtiene la codificación de compresión de un archivo por su extensión.
+
+    Args:
+        filename: Nombre del archivo
+
+    Returns:
+        Optional[str]: gzip o zstd, None si el archivo no está comprimido
+    """
+    lowered = filename.lower()
+    for extension, encoding in COMPRESSED_EXTENSIONS.items():
+        if lowered.endswith(extension):
+            return encoding
+    return None
+
+
+def _open_reader(source: BinaryIO, encoding: str) -> BinaryIO:
+    """
+    Abre un lector que descomprime un flujo.
+
+    Args:
+        source: Flujo binario comprimido
+        encoding: Codificación de compresión (gzip o zstd)
+
+    Returns:
+        BinaryIO: Lector del contenido descomprimido
+
+    Raises:
+        ValueError: Si la codificación no existe o su librería no está instalada
+    """
+    if encoding == "gzip":
+        return gzip.GzipFile(fileobj=source, mode="rb")
+    if encoding == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("La descompresión zstd requiere el paquete zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True)
+    raise ValueError(f"Compresión no soportada: {encoding}")
+
+
+class DecompressingStream:
+    """
+    Flujo que descomprime otro flujo a medida que se lee.
+
+    Si el contenido descomprimido supera max_bytes la lectura se detiene
+    con DecompressedSizeExceeded, que se conserva para volver a lanzarse
+    en las lecturas siguientes aunque el lector lo haya capturado (los
+    validadores convierten los errores de lectura en validaciones
+    parse_error).
+
+    Attributes:
+        source: Flujo binario comprimido
+        encoding: Codificación de compresión (gzip o zstd)
+        max_bytes: Tamaño máximo del contenido descomprimido
+        size: Bytes descomprimidos leídos
+        error: Error por superar el tamaño máximo, si ocurrió
+    """
+
+    def __init__(self, source: BinaryIO, encoding: str, max_bytes: int):
+        """
+        Inicializa el flujo.
+
+        Args:
+            source: Flujo binario comprimido
+            encoding: Codificación de compresión (gzip o zstd)
+            max_bytes: Tamaño máximo del contenido descomprimido
+
+        Raises:
+            ValueError: Si la codificación no existe o su librería no está instalada
+        """
+        self.source = source
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.error: Optional[DecompressedSizeExceeded] = None
+        self._reader = _open_reader(source, encoding)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lee hasta size bytes descomprimidos.
+
+        Args:
+            size: Número máximo de bytes a leer (-1 para todo)
+
+        Returns:
+            bytes: Bytes descomprimidos (vacío al final del flujo)
+
+        Raises:
+            DecompressedSizeExceeded: Si el contenido descomprimido supera max_bytes
+        """
+        if self.error is not None:
+            raise self.error
+        if size is None or size < 0:
+            # Leer por bloques para no descomprimir en memoria más allá del máximo
+            parts = []
+            while True:
+                data = self.read(READ_CHUNK_SIZE)
+                if not data:
+                    return b"".join(parts)
+                parts.append(data)
+
+        data = self._reader.read(min(size, self.max_bytes + 1))
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.error = DecompressedSizeExceeded(
+                f"El archivo descomprimido supera el máximo de {self.max_bytes} bytes"
+            )
+            raise self.error
+        return data
+
+    def close(self) -> None:
+        """
+        Cierra el lector de descompresión (el flujo comprimido no se cierra).
+        """
+        self._reader.close()
@@ -0,0 +1,129 @@
+"""
+Registro de validaciones en la tabla de validaciones por fila.
+
+Las validaciones se guardan en lotes a medida que el validador las
+produce, sin acumular la lista completa en memoria.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List
+
+from app.domain.repositories.file_validation_repository import IFileValidationRepository
+
+# Validaciones por lote de inserción por defecto
+DEFAULT_BATCH_SIZE = 5000
+
+
+class FindingRecorder:
+    """
+    Guarda en lotes las validaciones de un archivo mientras se recorren.
+
+    Attributes:
+        repository: Repositorio de validaciones de archivos
+        file_id: ID del archivo
+        batch_size: Número de validaciones por lote de inserción
+        count: Número de validaciones guardadas
+    """
+
+    def __init__(
+        self,
+        repository: IFileValidationRepository,
+        file_id: int,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        """
+        Inicializa el registro.
+
+        Args:
+            repository: Repositorio de validaciones de archivos
+            file_id: ID del archivo
+            batch_size: Número de validaciones por lote de inserción
+        """
+        self.repository = repository
+        self.file_id = file_id
+        self.batch_size = max(1, batch_size)
+        self.count = 0
+        self._batch: List[Dict[str, Any]] = []
+
+    def record(self, findings: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Devuelve las validaciones guardándolas en lotes.
+
+        Si el consumidor se detiene antes de tiempo (por ejemplo, al alcanzar
+        el máximo de validaciones del reporte) se guardan las ya devueltas y
+        se cierra el generador de origen.
+
+        Args:
+            findings: Validaciones a guardar (normalmente un generador)
+
+        Yields:
+            Dict[str, Any]: Cada validación, tras añadirla al lote actual
+        """
+        iterator = iter(findings)
+        try:
+            for finding in iterator:
+                self._batch.append(finding)
+                if len(self._batch) >= self.batch_size:
+                    self.flush()
+                yield finding
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            self.flush()
+
+    def record_all(self, findings: Iterable[Dict[str, Any]]) -> int:
+        """
+        Guarda todas las validaciones de una secuencia.
+
+        Args:
+            findings: Validaciones a guardar
+
+        Returns:
+            int: Número de validaciones guardadas en total
+        """
+        for _ in self.record(findings):
+            pass
+        return self.count
+
+    def flush(self) -> None:
+        """
+        Inserta las validaciones pendientes del lote actual.
+        """
+        if self._batch:
+            self.count += self.repository.insert_batch(self.file_id, self.count, self._batch)
+            self._batch = []
+
+
+class FindingBuffer:
+    """
+    Acumula en memoria las validaciones de un archivo que aún no está registrado.
+
+    Se usa como repositorio de un FindingRecorder cuando el ID del archivo
+    no se conoce hasta el final (cargas por lotes, que insertan todos los
+    archivos en una sola transacción); después las validaciones se guardan
+    con FindingRecorder.record_all.
+
+    Attributes:
+        findings: Validaciones recibidas, en orden
+    """
+
+    def __init__(self):
+        """
+        Inicializa el búfer vacío.
+        """
+        self.findings: List[Dict[str, Any]] = []
+
+    def insert_batch(self, file_id: int, first_seq: int, findings: List[Dict[str, Any]]) -> int:
+        """
+        Acumula un lote de validaciones.
+
+        Args:
+            file_id: ID del archivo (se ignora)
+            first_seq: Posición de la primera validación del lote (se ignora)
+            findings: Validaciones del lote
+
+        Returns:
+            int: Número de validaciones acumuladas del lote
+        """
+        self.findings.extend(findings)
+        return len(findings)
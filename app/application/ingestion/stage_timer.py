@@ -0,0 +1,63 @@
+"""
+Medición de la duración de las etapas de una carga.
+
+Las etapas pueden solaparse (la subida a S3 transcurre mientras se valida),
+por lo que la suma de las etapas puede superar el total.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StageTimer:
+    """
+    Registra la duración en segundos de cada etapa de una carga.
+
+    Attributes:
+        started: Instante de inicio de la carga (time.perf_counter)
+        timings: Duración de cada etapa registrada, en segundos
+    """
+
+    def __init__(self):
+        """
+        Inicializa el registro tomando el instante actual como inicio de la carga.
+        """
+        self.started = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Mide la duración del bloque como la etapa indicada.
+
+        Args:
+            name: Nombre de la etapa
+
+        Yields:
+            None
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    def record(self, name: str, started: float) -> None:
+        """
+        Registra como etapa el tiempo transcurrido desde un instante.
+
+        Args:
+            name: Nombre de la etapa
+            started: Instante de inicio de la etapa (time.perf_counter)
+        """
+        self.timings[name] = round(time.perf_counter() - started, 3)
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Devuelve la duración de cada etapa y el total transcurrido.
+
+        Returns:
+            Dict[str, float]: Segundos por etapa y total
+        """
+        return {**self.timings, "total": round(time.perf_counter() - self.started, 3)}
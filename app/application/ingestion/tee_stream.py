@@ -0,0 +1,102 @@
+"""
+Lectura de un archivo subido copiando sus bytes a otro destino.
+
+Permite subir un archivo a S3 mientras se valida, calculando su tamaño y
+su resumen SHA-256 en la misma pasada y sin mantenerlo completo en memoria.
+"""
+
+import hashlib
+from typing import Any, BinaryIO, Optional
+
+# Tamaño de los bloques de lectura al vaciar el flujo (1 MB)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class TeeStream:
+    """
+    Flujo que copia cada bloque leído de otro flujo a un destino.
+
+    Quien lee el flujo (normalmente el validador) marca el ritmo; cada
+    bloque se escribe en el destino y se acumula en el tamaño y el resumen
+    antes de devolverse. Si el lector se detiene antes del final, drain()
+    copia el resto.
+
+    Si el destino falla, el error se lanza al lector (que deja de leer) y se
+    conserva para volver a lanzarse en las lecturas siguientes y en drain(),
+    aunque el lector lo haya capturado (los validadores convierten los
+    errores de lectura en validaciones parse_error).
+
+    Attributes:
+        source: Flujo binario original
+        sink: Destino de los bytes leídos (objeto con método write), None para solo medirlos
+        size: Bytes leídos
+        error: Error del destino, si falló
+    """
+
+    def __init__(self, source: BinaryIO, sink: Optional[Any], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Inicializa el flujo.
+
+        Args:
+            source: Flujo binario original
+            sink: Destino de los bytes leídos (por ejemplo, una carga por partes a S3),
+                  None para solo calcular el tamaño y el resumen
+            chunk_size: Tamaño de los bloques de lectura de drain()
+        """
+        self.source = source
+        self.sink = sink
+        self.chunk_size = chunk_size
+        self.size = 0
+        self.error: Optional[Exception] = None
+        self._digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lee hasta size bytes copiándolos al destino.
+
+        Args:
+            size: Número máximo de bytes a leer (-1 para todo)
+
+        Returns:
+            bytes: Bytes leídos (vacío al final del flujo)
+
+        Raises:
+            Exception: Si el destino falló al escribir este bloque o uno anterior
+        """
+        if self.error is not None:
+            raise self.error
+        data = self.source.read(size)
+        if data:
+            self.size += len(data)
+            self._digest.update(data)
+            if self.sink is None:
+                return data
+            try:
+                self.sink.write(data)
+            except Exception as e:
+                self.error = e
+                raise
+        return data
+
+    def drain(self) -> int:
+        """
+        Lee y copia al destino el resto del flujo.
+
+        Returns:
+            int: Bytes leídos en total
+
+        Raises:
+            Exception: Si el destino falló
+        """
+        while self.read(self.chunk_size):
+            pass
+        return self.size
+
+    def hexdigest(self) -> str:
+        """
+        Devuelve el resumen SHA-256 de los bytes leídos.
+
+        Returns:
+            str: Resumen en hexadecimal
+        """
+        return self._digest.hexdigest()
@@ -0,0 +1,530 @@
+"""
+Sesiones de carga reanudable por bloques numerados.
+
+El cliente abre una sesión, envía el archivo en bloques numerados
+consecutivos y la completa. Cada bloque se sube a S3 como una parte de
+una carga por partes y se entrega a un validador que lee el archivo como
+un único flujo continuo en su propio hilo, de modo que las líneas
+partidas entre bloques y la detección de duplicados funcionan igual que
+en una carga de una sola petición. Al completar solo queda por validar
+el final del último bloque.
+
+El estado de la sesión (carga por partes y partes recibidas) se puede
+guardar con to_record y restaurar en otro proceso con from_record. Una
+sesión restaurada no tiene validador: recibe los bloques siguientes y, al
+completarse, el archivo se valida leyéndolo de S3.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+from app.domain.services.storage_backend import IStorageBackend
+from app.application.jobs.upload_jobs import ProgressStream, UploadProgress
+
+# Número máximo de partes de una carga por partes de S3
+MAX_PARTS = 10000
+
+
+class ChunkOrderError(ValueError):
+    """
+    Error de un bloque que no corresponde al estado de la sesión.
+
+    Attributes:
+        next_part: Número del bloque que espera la sesión
+    """
+
+    def __init__(self, message: str, next_part: int):
+        """
+        Inicializa el error.
+
+        Args:
+            message: Descripción del error
+            next_part: Número del bloque que espera la sesión
+        """
+        super().__init__(message)
+        self.next_part = next_part
+
+
+class UploadSessionAborted(Exception):
+    """
+    Error de lectura de un flujo de bloques cuya sesión se canceló.
+    """
+
+
+class ChunkFeedStream:
+    """
+    Flujo de lectura alimentado por bloques desde otro hilo.
+
+    feed() entrega un bloque y espera a que el lector lo consuma, de modo
+    que en memoria hay como mucho un bloque pendiente. read(n) espera a
+    tener n bytes o al final del flujo, igual que un flujo de archivo, y
+    puede devolver bytes de dos bloques consecutivos.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el flujo vacío.
+        """
+        self._condition = threading.Condition()
+        self._chunk = b""
+        self._offset = 0
+        self._finished = False
+        self._aborted = False
+        self._reader_done = False
+
+    def feed(self, data: bytes) -> None:
+        """
+        Entrega un bloque al lector y espera a que lo consuma.
+
+        Si el lector ya terminó (por ejemplo, el validador se detuvo al
+        alcanzar el máximo de validaciones) el bloque se descarta.
+
+        Args:
+            data: Bytes del bloque
+        """
+        with self._condition:
+            if self._reader_done:
+                return
+            self._chunk, self._offset = data, 0
+            self._condition.notify_all()
+            while self._offset < len(self._chunk) and not self._reader_done:
+                self._condition.wait()
+            self._chunk, self._offset = b"", 0
+
+    def finish(self) -> None:
+        """
+        Marca el final del flujo: las lecturas pendientes devuelven lo que queda.
+        """
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def abort(self) -> None:
+        """
+        Cancela el flujo: las lecturas siguientes lanzan UploadSessionAborted.
+        """
+        with self._condition:
+            self._aborted = True
+            self._condition.notify_all()
+
+    def close_reader(self) -> None:
+        """
+        Indica que el lector terminó, liberando a quien espera en feed().
+        """
+        with self._condition:
+            self._reader_done = True
+            self._condition.notify_all()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lee hasta size bytes esperando a los bloques siguientes si hace falta.
+
+        Args:
+            size: Número máximo de bytes a leer (-1 para todo)
+
+        Returns:
+            bytes: Bytes leídos (vacío al final del flujo)
+
+        Raises:
+            UploadSessionAborted: Si la sesión se canceló
+        """
+        parts: List[bytes] = []
+        remaining = size
+        with self._condition:
+            while remaining != 0:
+                while self._offset >= len(self._chunk) and not self._finished and not self._aborted:
+                    self._condition.wait()
+                if self._aborted:
+                    raise UploadSessionAborted("Sesión de carga cancelada")
+                if self._offset >= len(self._chunk):
+                    break
+                end = len(self._chunk) if remaining < 0 else min(len(self._chunk), self._offset + remaining)
+                parts.append(self._chunk[self._offset:end])
+                if remaining > 0:
+                    remaining -= end - self._offset
+                self._offset = end
+                if self._offset >= len(self._chunk):
+                    self._condition.notify_all()
+        return b"".join(parts)
+
+
+class UploadSession:
+    """
+    Carga reanudable de un archivo por bloques numerados.
+
+    Los bloques deben llegar en orden (1, 2, 3...). Reenviar un bloque ya
+    recibido con el mismo contenido no tiene efecto, por lo que el cliente
+    puede repetir el último bloque si no recibió la respuesta. Todos los
+    bloques salvo el último deben tener al menos min_chunk_size bytes; un
+    bloque menor se toma como el último.
+
+    Attributes:
+        session_id: ID de la sesión
+        file_id: ID del archivo registrado para la carga
+        user_id: ID del usuario que carga el archivo
+        s3_key: Clave del archivo en S3
+        upload_id: ID de la carga por partes en S3
+        param1: Primer parámetro adicional
+        param2: Segundo parámetro adicional
+        min_chunk_size: Tamaño mínimo de los bloques salvo el último
+        validation_options: Clave de las opciones de validación (deduplicación)
+        validation_backend: Backend de validación (streaming o columnar)
+        report_mode: Modo de reporte (full o summary)
+        schema_profile: Nombre del perfil de esquema a aplicar
+        state: Estado de la sesión (open, completing, completed, aborted)
+        size: Bytes recibidos
+        parts: Partes subidas a S3 (número, ETag, tamaño y resumen SHA-256)
+        progress: Bytes y filas leídos por el validador
+        result: Resultado de la validación, al terminar
+        error: Error de la validación, si falló
+        last_activity: Instante del último bloque recibido (time.monotonic)
+        detached: Si la sesión no tiene validador (restaurada o detenida); el
+                  archivo debe validarse desde S3 al completarla
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        file_id: int,
+        user_id: int,
+        s3_key: str,
+        upload_id: str,
+        storage: IStorageBackend,
+        param1: str,
+        param2: str,
+        min_chunk_size: int,
+        validation_options: Optional[str] = None,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None
+    ):
+        """
+        Inicializa la sesión.
+
+        Args:
+            session_id: ID de la sesión
+            file_id: ID del archivo registrado para la carga
+            user_id: ID del usuario que carga el archivo
+            s3_key: Clave del archivo en S3
+            upload_id: ID de la carga por partes en S3
+            storage: Backend de almacenamiento con el que se suben las partes
+            param1: Primer parámetro adicional
+            param2: Segundo parámetro adicional
+            min_chunk_size: Tamaño mínimo de los bloques salvo el último
+            validation_options: Clave de las opciones de validación (deduplicación)
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+        """
+        self.session_id = session_id
+        self.file_id = file_id
+        self.user_id = user_id
+        self.s3_key = s3_key
+        self.upload_id = upload_id
+        self.storage = storage
+        self.param1 = param1
+        self.param2 = param2
+        self.min_chunk_size = min_chunk_size
+        self.validation_options = validation_options
+        self.validation_backend = validation_backend
+        self.report_mode = report_mode
+        self.schema_profile = schema_profile
+        self.state = "open"
+        self.size = 0
+        self.parts: List[Dict[str, Any]] = []
+        self.progress = UploadProgress(0)
+        self.last_activity = time.monotonic()
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.detached = False
+        self._final_part = False
+        self._digest = hashlib.sha256()
+        self._stream = ChunkFeedStream()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_record(
+        cls,
+        record: Dict[str, Any],
+        parts: List[Dict[str, Any]],
+        storage: IStorageBackend
+    ) -> "UploadSession":
+        """
+        Restaura una sesión guardada con to_record, sin validador.
+
+        Args:
+            record: Estado guardado de la sesión
+            parts: Partes recibidas, en orden
+            storage: Backend de almacenamiento con el que se suben las partes
+
+        Returns:
+            UploadSession: Sesión abierta y desconectada del validador
+        """
+        session = cls(
+            record["session_id"],
+            record["file_id"],
+            record["user_id"],
+            record["s3_key"],
+            record["upload_id"],
+            storage,
+            record["param1"],
+            record["param2"],
+            record["min_chunk_size"],
+            validation_options=record.get("validation_options"),
+            validation_backend=record.get("validation_backend"),
+            report_mode=record.get("report_mode"),
+            schema_profile=record.get("schema_profile")
+        )
+        session.detached = True
+        session.parts = list(parts)
+        session.size = record.get("size", 0)
+        session._final_part = bool(record.get("final_part"))
+        return session
+
+    @property
+    def next_part(self) -> int:
+        """
+        Número del siguiente bloque que espera la sesión.
+
+        Returns:
+            int: Número de bloque (desde 1)
+        """
+        return len(self.parts) + 1
+
+    def start_validation(self, validate: Callable[[BinaryIO], Any], count_rows: bool = True) -> None:
+        """
+        Inicia el validador en su propio hilo leyendo los bloques a medida que llegan.
+
+        Args:
+            validate: Función que valida el flujo completo y devuelve su resultado
+            count_rows: Si la sesión cuenta las filas del flujo de bloques (False si
+                        las cuenta validate, p. ej. sobre el contenido descomprimido)
+        """
+        self.progress.stage = "validating"
+        self._thread = threading.Thread(
+            target=self._run_validation,
+            args=(validate, count_rows),
+            name=f"upload-session-{self.session_id[:8]}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def put_chunk(self, part_number: int, data: bytes) -> Dict[str, Any]:
+        """
+        Recibe un bloque: lo sube a S3 como parte y lo entrega al validador.
+
+        La respuesta se devuelve cuando el validador ha leído el bloque. Si
+        falla la subida a S3 el estado de la sesión no cambia y el bloque
+        puede reenviarse.
+
+        Args:
+            part_number: Número del bloque (desde 1)
+            data: Contenido del bloque
+
+        Returns:
+            Dict[str, Any]: Estado de la sesión tras el bloque
+
+        Raises:
+            ChunkOrderError: Si el bloque no es el que espera la sesión
+            ValueError: Si el bloque está vacío, su número es inválido o la
+                        validación falló (por ejemplo, al superar el tamaño
+                        descomprimido máximo)
+            Exception: Si falla la subida de la parte a S3
+        """
+        with self._lock:
+            if self.state != "open":
+                raise ChunkOrderError(f"La sesión de carga no está abierta ({self.state})", self.next_part)
+            if self.error is not None:
+                raise ValueError(f"La validación de la sesión falló: {self.error}")
+            if part_number < 1 or part_number > MAX_PARTS:
+                raise ValueError(f"Número de bloque inválido: debe estar entre 1 y {MAX_PARTS}")
+
+            if part_number < self.next_part:
+                received = self.parts[part_number - 1]
+                if received["sha256"] != hashlib.sha256(data).hexdigest():
+                    raise ChunkOrderError(
+                        f"El bloque {part_number} ya se recibió con otro contenido", self.next_part
+                    )
+                return self.to_dict()
+            if part_number > self.next_part or self._final_part:
+                raise ChunkOrderError(
+                    f"Se esperaba el bloque {self.next_part}"
+                    if not self._final_part else "Ya se recibió el último bloque",
+                    self.next_part
+                )
+            if not data:
+                raise ValueError("El bloque está vacío")
+
+            etag = self.storage.upload_part(self.s3_key, self.upload_id, part_number, data)
+            if not etag:
+                raise Exception("Error al subir el bloque a S3")
+
+            self.parts.append({
+                "PartNumber": part_number,
+                "ETag": etag,
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest()
+            })
+            self.size += len(data)
+            self._digest.update(data)
+            self._final_part = len(data) < self.min_chunk_size
+            if not self.detached:
+                self._stream.feed(data)
+            self.last_activity = time.monotonic()
+            return self.to_dict()
+
+    def finish(self) -> None:
+        """
+        Cierra la recepción de bloques y espera a que el validador termine.
+
+        Como el validador ya leyó los bloques anteriores, solo queda por
+        validar el final del último. El resultado queda en result o, si la
+        validación falló, el error en error.
+
+        Raises:
+            ChunkOrderError: Si la sesión no está abierta
+            ValueError: Si no se recibió ningún bloque
+        """
+        with self._lock:
+            if self.state != "open":
+                raise ChunkOrderError(f"La sesión de carga no está abierta ({self.state})", self.next_part)
+            if not self.parts:
+                raise ValueError("La sesión de carga no tiene bloques")
+            self.state = "completing"
+        self._stream.finish()
+        if self._thread is not None:
+            self._thread.join()
+
+    def complete_upload(self) -> Optional[str]:
+        """
+        Completa en S3 la carga por partes con los bloques recibidos.
+
+        Returns:
+            Optional[str]: URL del archivo en S3, None si no se pudo completar
+        """
+        parts = [{"ETag": part["ETag"], "PartNumber": part["PartNumber"]} for part in self.parts]
+        s3_url = self.storage.complete_multipart_upload(self.s3_key, self.upload_id, parts)
+        if s3_url:
+            self.state = "completed"
+        return s3_url
+
+    def abort(self) -> None:
+        """
+        Cancela la sesión: detiene el validador y descarta las partes subidas a S3.
+        """
+        with self._lock:
+            self.state = "aborted"
+        self._stream.abort()
+        if self._thread is not None:
+            self._thread.join()
+        self.storage.abort_multipart_upload(self.s3_key, self.upload_id)
+
+    def detach(self) -> None:
+        """
+        Detiene el validador sin cancelar la carga por partes en S3.
+
+        Se usa cuando la sesión recibió bloques en otro proceso: el validador
+        ya no vería el archivo completo, así que la sesión pasa a validarse
+        desde S3 al completarse.
+        """
+        with self._lock:
+            if self.detached:
+                return
+            self.detached = True
+        self._stream.abort()
+        if self._thread is not None:
+            self._thread.join()
+        self.result = None
+        self.error = None
+        self.progress = UploadProgress(0)
+
+    def restore_parts(self, parts: List[Dict[str, Any]], size: int, final_part: bool) -> None:
+        """
+        Sustituye las partes por las guardadas, recibidas también en otros procesos.
+
+        Args:
+            parts: Partes recibidas, en orden
+            size: Bytes recibidos
+            final_part: Si ya se recibió el último bloque
+        """
+        self.detach()
+        with self._lock:
+            self.parts = list(parts)
+            self.size = size
+            self._final_part = final_part
+
+    def hexdigest(self) -> str:
+        """
+        Devuelve el resumen SHA-256 de los bloques recibidos.
+
+        Solo es válido si la sesión no está desconectada (detached): en otro
+        caso no recibió todos los bloques.
+
+        Returns:
+            str: Resumen en hexadecimal
+        """
+        return self._digest.hexdigest()
+
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Convierte la sesión al estado que se guarda para restaurarla en otro proceso.
+
+        Returns:
+            Dict[str, Any]: Carga por partes, opciones de validación y partes recibidas
+        """
+        return {
+            "session_id": self.session_id,
+            "file_id": self.file_id,
+            "user_id": self.user_id,
+            "s3_key": self.s3_key,
+            "upload_id": self.upload_id,
+            "param1": self.param1,
+            "param2": self.param2,
+            "min_chunk_size": self.min_chunk_size,
+            "validation_options": self.validation_options,
+            "validation_backend": self.validation_backend,
+            "report_mode": self.report_mode,
+            "schema_profile": self.schema_profile,
+            "size": self.size,
+            "part_count": len(self.parts),
+            "final_part": self._final_part,
+            "parts": list(self.parts)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte el estado de la sesión a un diccionario serializable.
+
+        Returns:
+            Dict[str, Any]: ID, estado, siguiente bloque y bytes recibidos y validados
+        """
+        return {
+            "session_id": self.session_id,
+            "file_id": self.file_id,
+            "state": self.state,
+            "next_part": self.next_part,
+            "final_part_received": self._final_part,
+            "received_bytes": self.size,
+            "validated_bytes": self.progress.bytes_read,
+            "validated_rows": self.progress.rows_read,
+            "min_chunk_size": self.min_chunk_size
+        }
+
+    def _run_validation(self, validate: Callable[[BinaryIO], Any], count_rows: bool) -> None:
+        """
+        Ejecuta la validación del flujo de bloques guardando su resultado.
+
+        Args:
+            validate: Función que valida el flujo completo
+            count_rows: Si se cuentan las filas del flujo de bloques
+        """
+        try:
+            self.result = validate(ProgressStream(self._stream, self.progress, count_rows=count_rows))
+        except Exception as e:
+            print(f"Error al validar la sesión de carga {self.session_id}: {e}")
+            self.error = e
+        finally:
+            self._stream.close_reader()
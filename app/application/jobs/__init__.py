@@ -0,0 +1,7 @@
+"""
+Módulo de trabajos en segundo plano.
+
+Contiene el pool de trabajos del proceso que procesa las cargas
+de archivos de forma asíncrona y la limpieza de objetos huérfanos
+del almacenamiento.
+"""
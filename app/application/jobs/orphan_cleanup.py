@@ -0,0 +1,167 @@
+"""
+Limpieza de objetos huérfanos del almacenamiento.
+
+Un objeto es huérfano cuando ningún registro de la tabla files lo
+referencia: el registro se eliminó, o la subida terminó pero no se llegó a
+registrar. La limpieza recorre el listado del almacenamiento por páginas y,
+por cada página, consulta a la base de datos solo sus claves, de modo que
+nunca carga ninguno de los dos lados completo en memoria.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from app.domain.repositories.file_repository import IFileRepository
+from app.domain.services.storage_backend import MAX_KEYS_PER_REQUEST, IStorageBackend
+
+# Sufijo del detalle de validaciones guardado junto a cada archivo
+DETAILS_SUFFIX = ".validations.jsonl.gz"
+
+
+class OrphanCleanupStats:
+    """
+    Resultado de una limpieza de huérfanos.
+
+    Attributes:
+        listed: Objetos listados
+        referenced: Objetos con registro en la tabla files
+        skipped_recent: Objetos sin registro más recientes que la antigüedad mínima
+        orphans: Objetos huérfanos encontrados
+        deleted: Huérfanos eliminados
+        failed: Huérfanos que no se pudieron eliminar
+    """
+
+    def __init__(self):
+        """
+        Inicializa los contadores a cero.
+        """
+        self.listed = 0
+        self.referenced = 0
+        self.skipped_recent = 0
+        self.orphans = 0
+        self.deleted = 0
+        self.failed = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Convierte el resultado a un diccionario serializable.
+
+        Returns:
+            Dict[str, int]: Contadores de la limpieza
+        """
+        return {
+            "listed": self.listed,
+            "referenced": self.referenced,
+            "skipped_recent": self.skipped_recent,
+            "orphans": self.orphans,
+            "deleted": self.deleted,
+            "failed": self.failed
+        }
+
+
+class OrphanCleanup:
+    """
+    Elimina los objetos del almacenamiento sin registro en la tabla files.
+
+    Los objetos se crean antes que su registro (la subida termina antes de
+    guardarlo), así que solo se consideran huérfanos los que superan una
+    antigüedad mínima. El detalle de validaciones (<clave>.validations.jsonl.gz)
+    pertenece al archivo de su clave base.
+
+    Attributes:
+        storage: Backend de almacenamiento
+        file_repository: Repositorio de archivos
+        min_age: Antigüedad mínima de un objeto para eliminarlo
+        page_size: Objetos por página del listado
+        dry_run: True para contar los huérfanos sin eliminarlos
+    """
+
+    def __init__(
+        self,
+        storage: IStorageBackend,
+        file_repository: IFileRepository,
+        min_age: timedelta = timedelta(hours=24),
+        page_size: int = MAX_KEYS_PER_REQUEST,
+        dry_run: bool = False
+    ):
+        """
+        Inicializa la limpieza.
+
+        Args:
+            storage: Backend de almacenamiento
+            file_repository: Repositorio de archivos
+            min_age: Antigüedad mínima de un objeto para eliminarlo
+            page_size: Objetos por página del listado (hasta MAX_KEYS_PER_REQUEST)
+            dry_run: True para contar los huérfanos sin eliminarlos
+        """
+        self.storage = storage
+        self.file_repository = file_repository
+        self.min_age = min_age
+        self.page_size = page_size
+        self.dry_run = dry_run
+
+    def run(self, prefix: str = "uploads/", now: Optional[datetime] = None) -> OrphanCleanupStats:
+        """
+        Recorre los objetos bajo un prefijo y elimina los huérfanos.
+
+        Args:
+            prefix: Prefijo de las claves a revisar
+            now: Instante de referencia para la antigüedad (por defecto, el actual en UTC)
+
+        Returns:
+            OrphanCleanupStats: Contadores de la limpieza
+
+        Raises:
+            Exception: Si no se pudo listar el almacenamiento o consultar la base de datos
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - self.min_age
+        stats = OrphanCleanupStats()
+        for page in self.storage.list_objects(prefix, self.page_size):
+            stats.listed += len(page)
+            orphans = self._find_orphans(page, cutoff, stats)
+            stats.orphans += len(orphans)
+            if self.dry_run or not orphans:
+                continue
+            failed = self.storage.delete_files(orphans)
+            stats.failed += len(failed)
+            stats.deleted += len(orphans) - len(failed)
+        return stats
+
+    def _find_orphans(self, page: List[Dict[str, Any]], cutoff: datetime, stats: OrphanCleanupStats) -> List[str]:
+        """
+        Obtiene las claves huérfanas de una página del listado.
+
+        Args:
+            page: Objetos de la página con key, size y last_modified
+            cutoff: Fecha de modificación a partir de la cual un objeto es reciente
+            stats: Contadores a actualizar con los referenciados y los recientes
+
+        Returns:
+            List[str]: Claves huérfanas con la antigüedad mínima
+        """
+        owners = {item["key"]: self._owner_key(item["key"]) for item in page}
+        existing = self.file_repository.get_existing_s3_keys(list(set(owners.values())))
+        orphans = []
+        for item in page:
+            if owners[item["key"]] in existing:
+                stats.referenced += 1
+            elif item["last_modified"] > cutoff:
+                stats.skipped_recent += 1
+            else:
+                orphans.append(item["key"])
+        return orphans
+
+    @staticmethod
+    def _owner_key(s3_key: str) -> str:
+        """
+        Obtiene la clave del archivo al que pertenece un objeto.
+
+        Args:
+            s3_key: Clave del objeto
+
+        Returns:
+            str: Clave base si es un detalle de validaciones, la propia clave en caso contrario
+        """
+        if s3_key.endswith(DETAILS_SUFFIX):
+            return s3_key[:-len(DETAILS_SUFFIX)]
+        return s3_key
@@ -0,0 +1,220 @@
+"""
+Procesamiento asíncrono de cargas de archivos.
+
+Las cargas en modo asíncrono se encolan en un pool de hilos del propio
+proceso. Cada trabajo publica su progreso (etapa, bytes y filas leídas)
+en un registro en memoria que consulta el endpoint de estado mientras
+el trabajo está en curso; el estado final queda en la base de datos.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+from app.infrastructure.config import settings
+
+
+class UploadProgress:
+    """
+    Progreso de un trabajo de carga.
+
+    Attributes:
+        total_bytes: Tamaño del archivo en bytes
+        stage: Etapa actual (queued, validating, staging, done)
+        bytes_read: Bytes leídos por el validador
+        rows_read: Filas leídas por el validador (incluido el encabezado)
+    """
+
+    def __init__(self, total_bytes: int):
+        """
+        Inicializa el progreso de un trabajo encolado.
+
+        Args:
+            total_bytes: Tamaño del archivo en bytes
+        """
+        self.total_bytes = total_bytes
+        self.stage = "queued"
+        self.bytes_read = 0
+        self.rows_read = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte el progreso a un diccionario serializable.
+
+        Returns:
+            Dict[str, Any]: Etapa, bytes y filas leídas y porcentaje leído
+        """
+        percent = 100.0 if not self.total_bytes else round(100.0 * self.bytes_read / self.total_bytes, 1)
+        return {
+            "stage": self.stage,
+            "bytes_read": self.bytes_read,
+            "total_bytes": self.total_bytes,
+            "rows_read": self.rows_read,
+            "percent": percent
+        }
+
+
+class ProgressStream:
+    """
+    Flujo que registra en un UploadProgress los bytes y filas leídos de otro flujo.
+
+    Las filas se cuentan por saltos de línea, de modo que las filas con
+    saltos de línea entre comillas cuentan más de una vez. Con un archivo
+    comprimido se usan dos flujos: uno cuenta los bytes del archivo
+    comprimido (los de total_bytes) y otro las filas del contenido
+    descomprimido.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        progress: UploadProgress,
+        count_bytes: bool = True,
+        count_rows: bool = True
+    ):
+        """
+        Inicializa el flujo.
+
+        Args:
+            stream: Flujo binario original
+            progress: Progreso a actualizar
+            count_bytes: Si se suman los bytes leídos a bytes_read
+            count_rows: Si se suman las filas leídas a rows_read
+        """
+        self.stream = stream
+        self.progress = progress
+        self.count_bytes = count_bytes
+        self.count_rows = count_rows
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lee hasta size bytes actualizando el progreso.
+
+        Args:
+            size: Número máximo de bytes a leer (-1 para todo)
+
+        Returns:
+            bytes: Bytes leídos (vacío al final del flujo)
+        """
+        data = self.stream.read(size)
+        if self.count_bytes:
+            self.progress.bytes_read += len(data)
+        if self.count_rows:
+            self.progress.rows_read += data.count(b"\n")
+        return data
+
+    def tell(self) -> int:
+        """
+        Devuelve la posición actual del flujo original.
+
+        Returns:
+            int: Posición en bytes
+        """
+        return self.stream.tell()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """
+        Cambia la posición del flujo original.
+
+        Args:
+            offset: Desplazamiento en bytes
+            whence: Referencia del desplazamiento
+
+        Returns:
+            int: Nueva posición en bytes
+        """
+        return self.stream.seek(offset, whence)
+
+
+class UploadJobQueue:
+    """
+    Pool de hilos del proceso para procesar cargas de archivos.
+
+    El pool se crea al encolar el primer trabajo. El progreso de cada
+    trabajo se conserva solo mientras está encolado o en curso.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Inicializa la cola de trabajos.
+
+        Args:
+            max_workers: Número máximo de trabajos simultáneos
+        """
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._progress: Dict[int, UploadProgress] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        file_id: int,
+        total_bytes: int,
+        job: Callable[[UploadProgress], None]
+    ) -> UploadProgress:
+        """
+        Encola el procesamiento de un archivo.
+
+        Args:
+            file_id: ID del archivo
+            total_bytes: Tamaño del archivo en bytes
+            job: Función que procesa el archivo actualizando su progreso
+
+        Returns:
+            UploadProgress: Progreso del trabajo encolado
+        """
+        progress = UploadProgress(total_bytes)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="upload-job"
+                )
+            self._progress[file_id] = progress
+            self._executor.submit(self._run, file_id, job, progress)
+        return progress
+
+    def get_progress(self, file_id: int) -> Optional[UploadProgress]:
+        """
+        Obtiene el progreso de un trabajo encolado o en curso.
+
+        Args:
+            file_id: ID del archivo
+
+        Returns:
+            Optional[UploadProgress]: Progreso del trabajo, None si no está en curso en este proceso
+        """
+        return self._progress.get(file_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Detiene el pool esperando, si se indica, a los trabajos en curso.
+
+        Args:
+            wait: True para esperar a que terminen los trabajos
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _run(self, file_id: int, job: Callable[[UploadProgress], None], progress: UploadProgress) -> None:
+        """
+        Ejecuta un trabajo y retira su progreso al terminar.
+
+        Args:
+            file_id: ID del archivo
+            job: Función que procesa el archivo
+            progress: Progreso del trabajo
+        """
+        try:
+            job(progress)
+        except Exception as e:
+            print(f"Error en el trabajo de carga del archivo {file_id}: {e}")
+        finally:
+            with self._lock:
+                self._progress.pop(file_id, None)
+
+
+# Cola de trabajos de carga del proceso
+upload_jobs = UploadJobQueue(settings.UPLOAD_JOB_WORKERS)
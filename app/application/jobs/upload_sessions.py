@@ -0,0 +1,89 @@
+"""
+Registro de sesiones de carga reanudable.
+
+Cada proceso registra las sesiones que atiende, junto al hilo que valida
+sus bloques. El estado de las sesiones se guarda además en base de datos,
+de modo que un bloque que llega a otro proceso restaura allí la sesión
+(FileUseCase.resume_upload_session). Las sesiones sin actividad durante
+UPLOAD_SESSION_TTL_SECONDS se retiran para cancelarlas.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from app.application.ingestion.upload_session import UploadSession
+from app.infrastructure.config import settings
+
+
+class UploadSessionRegistry:
+    """
+    Sesiones de carga abiertas en el proceso, indexadas por ID.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        """
+        Inicializa el registro vacío.
+
+        Args:
+            ttl_seconds: Segundos sin recibir bloques tras los que una sesión caduca
+        """
+        self.ttl_seconds = ttl_seconds
+        self._sessions: Dict[str, UploadSession] = {}
+        self._lock = threading.Lock()
+
+    def add(self, session: UploadSession) -> None:
+        """
+        Registra una sesión.
+
+        Args:
+            session: Sesión de carga
+        """
+        with self._lock:
+            self._sessions[session.session_id] = session
+
+    def get(self, session_id: str) -> Optional[UploadSession]:
+        """
+        Obtiene una sesión registrada.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Optional[UploadSession]: Sesión, None si no está registrada en este proceso
+        """
+        return self._sessions.get(session_id)
+
+    def remove(self, session_id: str) -> Optional[UploadSession]:
+        """
+        Retira una sesión del registro.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Optional[UploadSession]: Sesión retirada, None si no estaba registrada
+        """
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+
+    def pop_expired(self) -> List[UploadSession]:
+        """
+        Retira las sesiones abiertas que no recibieron bloques durante el TTL.
+
+        Returns:
+            List[UploadSession]: Sesiones caducadas, pendientes de cancelar
+        """
+        limit = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                session for session in self._sessions.values()
+                if session.state == "open" and session.last_activity < limit
+            ]
+            for session in expired:
+                del self._sessions[session.session_id]
+        return expired
+
+
+# Sesiones de carga reanudable del proceso
+upload_sessions = UploadSessionRegistry(settings.UPLOAD_SESSION_TTL_SECONDS)
@@ -0,0 +1,75 @@
+"""
+Pool de hilos de las cargas atendidas durante la petición.
+
+Las cargas síncronas, las sesiones por bloques, las subidas directas y los
+lotes leen, validan y suben el archivo en el caso de uso mientras el
+cliente espera la respuesta. Esas operaciones duran tanto como el archivo,
+así que se ejecutan en un pool propio y acotado: no ocupan el pool de
+AsyncStorage, que queda para las operaciones cortas del almacenamiento
+(firmar URLs, consultar metadatos, leer bloques de una descarga), ni el
+pool de hilos compartido de Starlette.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from app.infrastructure.config import settings
+
+
+class UploadWorkerPool:
+    """
+    Pool de hilos del proceso para las operaciones largas de carga de los endpoints.
+
+    El pool se crea al ejecutar la primera operación.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Inicializa el pool.
+
+        Args:
+            max_workers: Número máximo de operaciones ejecutándose a la vez
+        """
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Ejecuta una operación bloqueante del caso de uso en el pool y espera su resultado.
+
+        Args:
+            func: Función a ejecutar
+            *args: Argumentos posicionales de la función
+            **kwargs: Argumentos con nombre de la función
+
+        Returns:
+            Any: Resultado de la función
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="upload-request"
+                )
+            executor = self._executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Detiene el pool esperando, si se indica, a las operaciones en curso.
+
+        Args:
+            wait: True para esperar a que terminen las operaciones
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Pool de las cargas atendidas durante la petición
+upload_workers = UploadWorkerPool(settings.UPLOAD_REQUEST_WORKERS)
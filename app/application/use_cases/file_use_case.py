@@ -4,13 +4,68 @@ Caso de uso de archivos.
 Implementa la lógica de negocio para la carga y validación de archivos CSV.
 """
 
-import csv
+import gzip
+import hashlib
 import io
-from typing import List, Dict, Any
-from datetime import datetime
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+from typing import List, Dict, Any, BinaryIO, Callable, Optional, Tuple, Union
+from datetime import datetime, timedelta
 from app.domain.entities.file import File, FileStatus
 from app.domain.repositories.file_repository import IFileRepository
-from app.infrastructure.services.s3_service import S3Service
+from app.domain.repositories.file_row_repository import IFileRowRepository
+from app.domain.repositories.file_validation_repository import IFileValidationRepository
+from app.domain.repositories.upload_session_repository import IUploadSessionRepository
+from app.domain.services.storage_backend import MIN_PART_SIZE, IStorageBackend
+from app.infrastructure.services.storage_backends import get_storage_backend
+from app.infrastructure.config import settings
+from app.application.validation.csv_stream_validator import CSVStreamValidator
+from app.application.validation.columnar_validator import ColumnarCSVValidator
+from app.application.validation.parallel_validator import ParallelCSVValidator
+from app.application.validation.validation_report import ValidationReport
+from app.application.validation.schema_profiles import SchemaProfile, SchemaRegistry
+from app.application.ingestion.batch_archive import BatchItem
+from app.application.ingestion.decompression import DecompressingStream, content_encoding
+from app.application.ingestion.finding_recorder import FindingBuffer, FindingRecorder
+from app.application.ingestion.stage_timer import StageTimer
+from app.application.ingestion.staging_loader import StagingLoader
+from app.application.ingestion.tee_stream import TeeStream
+from app.application.ingestion.upload_session import UploadSession
+from app.application.jobs.upload_jobs import ProgressStream, UploadProgress
+
+# Backends de validación disponibles
+VALIDATION_BACKENDS = ("streaming", "columnar")
+
+# Modos de reporte de validaciones: lista completa o reporte agregado
+REPORT_MODES = ("full", "summary")
+
+# Perfiles de esquema disponibles, compilados una vez por versión
+schema_registry = SchemaRegistry(settings.CSV_SCHEMA_DIR)
+
+# Bytes leídos en cada bloque al calcular el resumen de un archivo
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _sha256(stream: BinaryIO) -> Tuple[str, int]:
+    """
+    Calcula el resumen SHA-256 y el tamaño de un flujo leyéndolo por bloques hasta el final.
+
+    Args:
+        stream: Flujo binario
+
+    Returns:
+        Tuple[str, int]: Resumen en hexadecimal y tamaño en bytes
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
 
 
 class FileUseCase:
@@ -18,20 +73,43 @@ class FileUseCase:
     Caso de uso para gestión de archivos CSV.
 
     Implementa la lógica de negocio para:
-    - Subir archivos a S3
+    - Subir archivos a S3 (por partes mientras se validan)
     - Validar contenido de archivos CSV
     - Almacenar información en base de datos
+    - Cargar las filas en la tabla de staging
+    - Procesar cargas de forma asíncrona y consultar su estado
+    - Recibir cargas reanudables por bloques
+    - Consultar las validaciones por fila paginadas
     """
 
-    def __init__(self, file_repository: IFileRepository):
+    def __init__(
+        self,
+        file_repository: IFileRepository,
+        file_row_repository: Optional[IFileRowRepository] = None,
+        file_validation_repository: Optional[IFileValidationRepository] = None,
+        storage: Optional[IStorageBackend] = None,
+        upload_session_repository: Optional[IUploadSessionRepository] = None
+    ):
         """
         Inicializa el caso de uso con sus dependencias.
 
         Args:
             file_repository: Repositorio de archivos para acceso a datos
+            file_row_repository: Repositorio de staging de filas (opcional; sin él
+                                 no se cargan las filas)
+            file_validation_repository: Repositorio de validaciones por fila (opcional;
+                                        sin él solo se guardan en el archivo)
+            storage: Backend de almacenamiento de los archivos (por defecto el de
+                     STORAGE_BACKEND compartido por el proceso)
+            upload_session_repository: Repositorio de sesiones de carga reanudable
+                                       (opcional; sin él las sesiones solo viven en
+                                       el proceso que las creó)
         """
         self.file_repository = file_repository
-        self.s3_service = S3Service()
+        self.file_row_repository = file_row_repository
+        self.file_validation_repository = file_validation_repository
+        self.storage = storage or get_storage_backend()
+        self.upload_session_repository = upload_session_repository
 
     def upload_and_validate_file(
         self,
@@ -40,11 +118,25 @@ class FileUseCase:
         content_type: str,
         user_id: int,
         param1: str,
-        param2: str
+        param2: str,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        force_upload: bool = False
     ) -> Dict[str, Any]:
         """
         Sube un archivo CSV a S3, lo valida y almacena en la base de datos.
 
+        Si el usuario ya subió el mismo contenido (mismo resumen SHA-256) se
+        devuelven la URL y las validaciones del archivo existente sin volver
+        a subirlo ni validarlo, salvo que se indique force_upload.
+
+        En modo summary se guarda un reporte agregado con una muestra de
+        validaciones en lugar de la lista completa, y el detalle completo
+        se sube a S3 junto al archivo. Si el archivo se pudo leer completo,
+        sus filas se cargan en la tabla de staging.
+
         Args:
             file_content: Contenido del archivo en bytes
             filename: Nombre original del archivo
@@ -52,113 +144,1899 @@ class FileUseCase:
             user_id: ID del usuario que carga el archivo
             param1: Primer parámetro adicional
             param2: Segundo parámetro adicional
+            validation_backend: Backend de validación (streaming o columnar).
+                                Si no se indica se usa el configurado.
+            report_mode: Modo de reporte (full o summary). Si no se indica
+                         se usa el configurado.
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            content_hash: Resumen SHA-256 del contenido calculado durante la lectura.
+                          Si no se indica se calcula aquí.
+            force_upload: True para subir y validar una copia nueva aunque el
+                          contenido ya exista
 
         Returns:
             Dict[str, Any]: Diccionario con:
-                - file_id: ID del archivo creado
+                - file_id: ID del archivo creado (o del existente con el mismo contenido)
                 - s3_url: URL del archivo en S3
-                - validations: Lista de validaciones aplicadas
+                - validations: Lista de validaciones aplicadas (muestra en modo summary)
+                - report: Reporte agregado (solo en modo summary)
+                - staging: Resultado de la carga en staging, con su rendimiento
+                           en filas por segundo (None si no se cargó)
+                - timings: Segundos de cada etapa (upload, validation, persist,
+                           staging) y total
+                - deduplicated: True si se devolvió un archivo existente
         """
-        # Generar clave única para S3
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        s3_key = f"uploads/{user_id}/{timestamp}_{filename}"
+        return self.upload_and_validate_stream(
+            io.BytesIO(file_content),
+            filename,
+            content_type,
+            user_id,
+            param1,
+            param2,
+            validation_backend=validation_backend,
+            report_mode=report_mode,
+            schema_profile=schema_profile,
+            content_hash=content_hash or hashlib.sha256(file_content).hexdigest(),
+            force_upload=force_upload
+        )
+
+    def hash_stream(self, stream: BinaryIO) -> Tuple[str, int]:
+        """
+        Calcula el resumen SHA-256 y el tamaño de un archivo recibido y lo deja al inicio.
 
-        # Subir archivo a S3
-        file_obj = io.BytesIO(file_content)
-        s3_url = self.s3_service.upload_file(file_obj, s3_key, content_type)
+        Permite buscar un duplicado antes de subir y validar el archivo,
+        pasando el resumen a upload_and_validate_stream como content_hash.
 
-        if not s3_url:
-            raise Exception("Error al subir archivo a S3")
+        Args:
+            stream: Flujo binario que admite seek (p. ej. el temporal de un UploadFile)
+
+        Returns:
+            Tuple[str, int]: Resumen en hexadecimal y tamaño en bytes
+        """
+        stream.seek(0)
+        result = _sha256(stream)
+        stream.seek(0)
+        return result
+
+    def upload_and_validate_stream(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        content_type: str,
+        user_id: int,
+        param1: str,
+        param2: str,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        force_upload: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Sube un archivo CSV a S3 a la vez que lo valida, leyéndolo una sola vez por bloques.
+
+        Cada bloque que lee el validador se acumula en el tamaño y el resumen
+        SHA-256 del archivo y en la parte en curso de una carga por partes;
+        las partes completas se suben en segundo plano mientras el validador
+        sigue con los bloques siguientes, de modo que el tiempo de red y el
+        de validación se solapan. La memoria usada está acotada por el
+        tamaño de parte (S3_MULTIPART_PART_SIZE) y no por el del archivo.
+        Ambas etapas se esperan antes de guardar el resultado:
 
-        # Validar contenido del CSV
-        validations = self._validate_csv(file_content)
+        - Si falla la subida de una parte, la validación se detiene en el
+          siguiente bloque.
+        - Si falla la validación, se cancela la carga y las partes pendientes.
 
-        # Crear entidad File
+        Si el usuario ya subió y validó el mismo contenido con las mismas
+        opciones se devuelve el archivo existente, salvo que se indique
+        force_upload. Con content_hash la
+        comprobación se hace antes de empezar; sin él, al terminar la
+        lectura, cancelando la carga antes de completarse y descartando el
+        registro provisional.
+
+        Los archivos .csv.gz y .csv.zst se suben a S3 comprimidos, con su
+        ContentEncoding, y se descomprimen al vuelo para validarlos; el
+        tamaño y el resumen son los del archivo comprimido. Si el contenido
+        descomprimido supera CSV_MAX_DECOMPRESSED_BYTES la carga se cancela.
+
+        Args:
+            stream: Flujo binario con el contenido del archivo (si admite seek,
+                    se relee para la carga en staging; si no, se lee de S3)
+            filename: Nombre original del archivo (.csv, .csv.gz o .csv.zst)
+            content_type: Tipo MIME del archivo
+            user_id: ID del usuario que carga el archivo
+            param1: Primer parámetro adicional
+            param2: Segundo parámetro adicional
+            validation_backend: Backend de validación (streaming o columnar).
+                                Si no se indica se usa el configurado.
+            report_mode: Modo de reporte (full o summary). Si no se indica
+                         se usa el configurado.
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            content_hash: Resumen SHA-256 del contenido si se conoce de antemano (opcional)
+            force_upload: True para guardar una copia nueva aunque el contenido ya exista
+
+        Returns:
+            Dict[str, Any]: Diccionario con los mismos campos que upload_and_validate_file
+
+        Raises:
+            DecompressedSizeExceeded: Si el contenido descomprimido supera el máximo
+        """
+        timer = StageTimer()
+        options = self._validation_options(validation_backend, report_mode, schema_profile)
+        hash_known = bool(content_hash)
+        if hash_known and not force_upload:
+            existing = self.file_repository.get_by_content_hash(user_id, content_hash, options)
+            if existing is not None:
+                return self._deduplicated_result(existing, param1, param2, timer)
+
+        s3_key = self._build_s3_key(user_id, filename)
+        encoding = content_encoding(filename)
+        if encoding:
+            content_type = "text/csv"
+        upload_started = time.perf_counter()
+        upload = self.storage.start_upload(s3_key, content_type, encoding)
+        tee = TeeStream(stream, upload)
+        source = self._decompressed(tee, encoding)
+
+        # Registrar el archivo en proceso (las validaciones por fila se guardan con su ID)
         file_entity = File(
             filename=filename,
             s3_key=s3_key,
-            s3_url=s3_url,
-            file_size=len(file_content),
             content_type=content_type,
-            status=FileStatus.COMPLETED if not validations else FileStatus.PENDING,
-            validations=validations,
+            status=FileStatus.PROCESSING,
+            content_hash=content_hash,
             user_id=user_id
         )
-
-        # Guardar en base de datos
         saved_file = self.file_repository.create(file_entity)
 
+        try:
+            with timer.stage("validation"):
+                validations, report = self._validate_upload(
+                    source, s3_key, validation_backend, report_mode, schema_profile, saved_file.id
+                )
+                self._check_decompressed(source)
+                # El validador puede detenerse antes del final (modo summary con límite)
+                tee.drain()
+            content_hash = tee.hexdigest()
+
+            existing = None
+            if not hash_known and not force_upload:
+                existing = self.file_repository.get_by_content_hash(user_id, content_hash, options)
+            if existing is not None:
+                upload.abort()
+                self._discard_provisional_file(saved_file.id, report)
+                return self._deduplicated_result(existing, param1, param2, timer)
+
+            # Esperar a las partes en vuelo y completar el objeto
+            s3_url = upload.complete()
+            timer.record("upload", upload_started)
+            if not s3_url:
+                raise Exception("Error al subir archivo a S3")
+        except Exception:
+            upload.abort()
+            saved_file.status = FileStatus.FAILED
+            saved_file.file_size = tee.size
+            saved_file.updated_at = datetime.utcnow()
+            self.file_repository.update(saved_file)
+            raise
+
+        # Guardar las validaciones en base de datos
+        with timer.stage("persist"):
+            saved_file.s3_url = s3_url
+            saved_file.file_size = tee.size
+            saved_file.content_hash = content_hash
+            saved_file.validation_options = options
+            saved_file.validations = validations
+            saved_file.validation_report = report
+            saved_file.status = FileStatus.COMPLETED if not validations else FileStatus.PENDING
+            saved_file.updated_at = datetime.utcnow()
+            saved_file = self.file_repository.update(saved_file)
+
+        # Cargar las filas en la tabla de staging
+        with timer.stage("staging"):
+            staging = self._load_staging_if_readable(
+                saved_file.id,
+                lambda: self._decompressed(self._reopen_stream(stream, s3_key), encoding),
+                validations,
+                report
+            )
+
         return {
             "file_id": saved_file.id,
             "s3_url": saved_file.s3_url,
             "validations": saved_file.validations,
+            "report": saved_file.validation_report,
+            "staging": staging,
+            "timings": timer.to_dict(),
+            "deduplicated": False,
             "param1": param1,
             "param2": param2
         }
 
-    def _validate_csv(self, file_content: bytes) -> List[Dict[str, Any]]:
+    def create_pending_upload(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        content_type: str,
+        user_id: int,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        force_upload: bool = False
+    ) -> Dict[str, Any]:
         """
-        Valida el contenido de un archivo CSV.
+        Sube un archivo a S3 y lo registra en estado PENDING para procesarlo de forma asíncrona.
+
+        El archivo se sube por partes leyéndolo por bloques, calculando su
+        tamaño y su resumen SHA-256 en la misma pasada; después se procesa
+        con process_upload leyéndolo de S3. Si el usuario ya subió y validó
+        el mismo contenido con las mismas opciones se cancela la carga y se
+        devuelve el archivo existente, salvo que se indique force_upload.
 
         Args:
-            file_content: Contenido del archivo en bytes
+            stream: Flujo binario con el contenido del archivo
+            filename: Nombre original del archivo
+            content_type: Tipo MIME del archivo
+            user_id: ID del usuario que carga el archivo
+            validation_backend: Backend de validación con que se procesará (streaming o columnar)
+            report_mode: Modo de reporte con que se procesará (full o summary)
+            schema_profile: Nombre del perfil de esquema con que se procesará (opcional)
+            force_upload: True para registrar una copia nueva aunque el contenido ya exista
 
         Returns:
-            List[Dict[str, Any]]: Lista de validaciones encontradas.
-                                 Lista vacía si no hay errores.
+            Dict[str, Any]: Diccionario con:
+                - file_id: ID del archivo registrado (o del existente con el mismo contenido)
+                - status: Estado del archivo
+                - file_size: Tamaño del archivo en bytes
+                - deduplicated: True si se devolvió un archivo existente
+
+        Raises:
+            ValueError: Si el perfil de esquema no existe
+            Exception: Si falla la subida a S3
+        """
+        options = self._validation_options(validation_backend, report_mode, schema_profile)
+        s3_key = self._build_s3_key(user_id, filename)
+        encoding = content_encoding(filename)
+        if encoding:
+            content_type = "text/csv"
+        upload = self.storage.start_upload(s3_key, content_type, encoding)
+        tee = TeeStream(stream, upload)
+        try:
+            tee.drain()
+        except Exception:
+            upload.abort()
+            raise
+
+        content_hash = tee.hexdigest()
+        existing = None
+        if not force_upload:
+            existing = self.file_repository.get_by_content_hash(user_id, content_hash, options)
+        if existing is not None:
+            upload.abort()
+            return {
+                "file_id": existing.id,
+                "status": existing.status.value,
+                "file_size": existing.file_size,
+                "deduplicated": True
+            }
+
+        s3_url = upload.complete()
+        if not s3_url:
+            raise Exception("Error al subir archivo a S3")
+
+        file_entity = File(
+            filename=filename,
+            s3_key=s3_key,
+            s3_url=s3_url,
+            file_size=tee.size,
+            content_type=content_type,
+            status=FileStatus.PENDING,
+            content_hash=content_hash,
+            user_id=user_id
+        )
+        saved_file = self.file_repository.create(file_entity)
+        return {
+            "file_id": saved_file.id,
+            "status": saved_file.status.value,
+            "file_size": saved_file.file_size,
+            "deduplicated": False
+        }
+
+    def process_upload(
+        self,
+        file_id: int,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        progress: Optional[UploadProgress] = None
+    ) -> Optional[File]:
+        """
+        Procesa un archivo registrado con create_pending_upload.
+
+        Mueve el archivo a PROCESSING, lo valida y carga sus filas en staging
+        leyéndolo de S3, y lo deja con sus validaciones en COMPLETED si no
+        tiene hallazgos o en PENDING si los tiene, igual que una carga
+        síncrona. Ante cualquier error el archivo queda en FAILED con una
+        validación processing_error que describe el fallo.
+
+        Args:
+            file_id: ID del archivo registrado
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            progress: Progreso del trabajo a actualizar (opcional)
+
+        Returns:
+            Optional[File]: Archivo procesado, None si no existe
         """
-        validations = []
+        file = self.file_repository.get_by_id(file_id)
+        if file is None:
+            return None
+        progress = progress or UploadProgress(file.file_size)
+
+        file.status = FileStatus.PROCESSING
+        file.updated_at = datetime.utcnow()
+        file = self.file_repository.update(file)
 
+        encoding = content_encoding(file.filename)
         try:
-            # Decodificar contenido
-            content = file_content.decode('utf-8')
-            csv_reader = csv.DictReader(io.StringIO(content))
-
-            rows = list(csv_reader)
-            seen_rows = set()
-
-            for row_num, row in enumerate(rows, start=2):  # Empezar en 2 (después del header)
-                row_key = tuple(row.values())
-
-                # Validar valores vacíos
-                for col, value in row.items():
-                    if not value or value.strip() == "":
-                        validations.append({
-                            "type": "empty_value",
-                            "row": row_num,
-                            "column": col,
-                            "message": f"Valor vacío en fila {row_num}, columna {col}"
-                        })
-
-                # Validar duplicados
-                if row_key in seen_rows:
-                    validations.append({
-                        "type": "duplicate",
-                        "row": row_num,
-                        "message": f"Fila duplicada en la línea {row_num}"
-                    })
-                else:
-                    seen_rows.add(row_key)
-
-                # Validar tipos de datos (ejemplo: números)
-                for col, value in row.items():
-                    if value and value.strip():
-                        # Intentar validar como número si el nombre de columna sugiere que debería ser numérico
-                        if any(keyword in col.lower() for keyword in ['precio', 'cantidad', 'total', 'amount', 'price', 'quantity']):
-                            try:
-                                float(value.replace(',', '.'))
-                            except ValueError:
-                                validations.append({
-                                    "type": "invalid_type",
-                                    "row": row_num,
-                                    "column": col,
-                                    "message": f"Valor no numérico en fila {row_num}, columna {col}: {value}"
-                                })
+            progress.stage = "validating"
+            with closing(self._open_s3_stream(file.s3_key)) as body:
+                # Los bytes se cuentan sobre el archivo guardado (como total_bytes) y las filas
+                # sobre el contenido descomprimido
+                source = self._decompressed(ProgressStream(body, progress, count_rows=False), encoding)
+                validations, report = self._validate_upload(
+                    ProgressStream(source, progress, count_bytes=False),
+                    file.s3_key,
+                    validation_backend,
+                    report_mode,
+                    schema_profile,
+                    file_id
+                )
+                self._check_decompressed(source)
 
+            progress.stage = "staging"
+            self._load_staging_if_readable(
+                file_id,
+                lambda: self._decompressed(self._open_s3_stream(file.s3_key), encoding),
+                validations,
+                report
+            )
+
+            file.validations = validations
+            file.validation_report = report
+            file.validation_options = self._validation_options(validation_backend, report_mode, schema_profile)
+            file.status = FileStatus.COMPLETED if not validations else FileStatus.PENDING
         except Exception as e:
-            validations.append({
-                "type": "parse_error",
-                "message": f"Error al procesar el archivo CSV: {str(e)}"
-            })
+            print(f"Error al procesar el archivo {file_id}: {e}")
+            file.validations = [{"type": "processing_error", "message": f"Error al procesar el archivo: {e}"}]
+            file.status = FileStatus.FAILED
+
+        file.updated_at = datetime.utcnow()
+        file = self.file_repository.update(file)
+        progress.stage = "done"
+        return file
+
+    def fail_stale_uploads(self, stale_seconds: int) -> int:
+        """
+        Marca como fallidas las cargas asíncronas encoladas que nunca se procesaron.
+
+        Los trabajos viven en el pool del proceso que aceptó la carga, así
+        que si el proceso se detiene la carga queda en PENDING sin validar.
+        Como las opciones de validación pedidas no se guardan hasta terminar,
+        no se puede volver a encolar: queda en FAILED con una validación
+        processing_error para que el cliente la vuelva a subir.
+
+        Args:
+            stale_seconds: Segundos sin actualizarse tras los que una carga se da por perdida
+
+        Returns:
+            int: Número de cargas marcadas como fallidas
+        """
+        limit = datetime.utcnow() - timedelta(seconds=stale_seconds)
+        failed = 0
+        for file in self.file_repository.get_stale_pending(limit):
+            if file.validations:
+                continue
+            file.status = FileStatus.FAILED
+            file.validations = [{
+                "type": "processing_error",
+                "message": "El procesamiento del archivo se interrumpió; vuelva a subirlo"
+            }]
+            file.updated_at = datetime.utcnow()
+            self.file_repository.update(file)
+            failed += 1
+        return failed
+
+    def start_upload_session(
+        self,
+        filename: str,
+        content_type: str,
+        user_id: int,
+        param1: str,
+        param2: str,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        run_validation: Optional[Callable[[int, str, BinaryIO], Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]] = None
+    ) -> UploadSession:
+        """
+        Abre una sesión de carga reanudable por bloques.
+
+        Inicia la carga por partes en S3, registra el archivo en PROCESSING,
+        guarda el estado de la sesión y arranca el validador, que leerá los
+        bloques a medida que lleguen. Como la validación dura más que la petición que abre la sesión,
+        quien llama puede indicar una función de validación con su propia
+        sesión de base de datos.
+
+        Args:
+            filename: Nombre original del archivo
+            content_type: Tipo MIME del archivo
+            user_id: ID del usuario que carga el archivo
+            param1: Primer parámetro adicional
+            param2: Segundo parámetro adicional
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            run_validation: Función que valida el flujo de bloques a partir del ID
+                            del archivo, su clave en S3 y el flujo (por defecto
+                            validate_upload_chunks de este caso de uso)
+
+        Returns:
+            UploadSession: Sesión abierta
+
+        Raises:
+            ValueError: Si el backend o el perfil de esquema no existen
+            Exception: Si no se pudo iniciar la carga en S3
+        """
+        self._build_validator(validation_backend, schema_profile, sequential=True)
+        options = self._validation_options(validation_backend, report_mode, schema_profile)
+        s3_key = self._build_s3_key(user_id, filename)
+        encoding = content_encoding(filename)
+        if encoding:
+            content_type = "text/csv"
+        upload_id = self.storage.create_multipart_upload(s3_key, content_type, encoding)
+        if not upload_id:
+            raise Exception("Error al iniciar la carga en S3")
+
+        file_entity = File(
+            filename=filename,
+            s3_key=s3_key,
+            content_type=content_type,
+            status=FileStatus.PROCESSING,
+            user_id=user_id
+        )
+        saved_file = self.file_repository.create(file_entity)
+
+        if run_validation is None:
+            def run_validation(file_id: int, key: str, stream: BinaryIO):
+                return self.validate_upload_chunks(
+                    file_id, key, stream, validation_backend, report_mode, schema_profile
+                )
+
+        session = UploadSession(
+            uuid.uuid4().hex,
+            saved_file.id,
+            user_id,
+            s3_key,
+            upload_id,
+            self.storage,
+            param1,
+            param2,
+            MIN_PART_SIZE,
+            validation_options=options,
+            validation_backend=validation_backend,
+            report_mode=report_mode,
+            schema_profile=schema_profile
+        )
+        if self.upload_session_repository is not None:
+            self.upload_session_repository.create(session.to_record())
+
+        def validate(stream: BinaryIO):
+            source = self._decompressed(stream, encoding)
+            # Las filas se cuentan sobre el contenido descomprimido
+            rows = ProgressStream(source, session.progress, count_bytes=False)
+            result = run_validation(saved_file.id, s3_key, rows)
+            self._check_decompressed(source)
+            return result
+
+        session.start_validation(validate, count_rows=False)
+        return session
+
+    def validate_upload_chunks(
+        self,
+        file_id: int,
+        s3_key: str,
+        stream: BinaryIO,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Valida el flujo de bloques de una sesión de carga a medida que llegan.
+
+        La validación es secuencial para procesar cada bloque al recibirlo;
+        las validaciones por fila se guardan en lotes igual que en una carga
+        de una sola petición.
+
+        Args:
+            file_id: ID del archivo registrado para la sesión
+            s3_key: Clave del archivo en S3
+            stream: Flujo con los bloques de la sesión
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]: Validaciones (muestra en
+                modo summary) y reporte agregado (None en modo full)
+        """
+        return self._validate_upload(
+            stream, s3_key, validation_backend, report_mode, schema_profile, file_id, sequential=True
+        )
+
+    def resume_upload_session(
+        self,
+        session_id: str,
+        user_id: int,
+        local: Optional[UploadSession] = None
+    ) -> Optional[UploadSession]:
+        """
+        Obtiene una sesión de carga del usuario a partir de su estado guardado.
+
+        Si la sesión no está en este proceso (la abrió otro o el proceso se
+        reinició) se restaura sin validador. Si está pero otro proceso
+        recibió bloques después, se detiene su validador y se toman las
+        partes guardadas. En ambos casos el archivo se valida desde S3 al
+        completar la sesión.
+
+        Args:
+            session_id: ID de la sesión
+            user_id: ID del usuario actual
+            local: Sesión registrada en este proceso, si existe
+
+        Returns:
+            Optional[UploadSession]: Sesión, None si no existe o es de otro usuario
+        """
+        if self.upload_session_repository is None:
+            return local if local is not None and local.user_id == user_id else None
+
+        record = self.upload_session_repository.get(session_id)
+        if record is None:
+            if local is not None:
+                # Se completó o canceló en otro proceso
+                local.detach()
+            return None
+        if record["user_id"] != user_id:
+            return None
+        if local is not None and (local.state != "open" or len(local.parts) == record["part_count"]):
+            return local
+
+        parts = self.upload_session_repository.list_parts(session_id)
+        if local is None:
+            return UploadSession.from_record(record, parts, self.storage)
+        local.restore_parts(parts, record["size"], record["final_part"])
+        return local
+
+    def put_upload_session_chunk(self, session: UploadSession, part_number: int, data: bytes) -> Dict[str, Any]:
+        """
+        Recibe un bloque de una sesión de carga y guarda la parte subida.
+
+        Args:
+            session: Sesión de carga abierta
+            part_number: Número del bloque (desde 1)
+            data: Contenido del bloque
+
+        Returns:
+            Dict[str, Any]: Estado de la sesión tras el bloque
+
+        Raises:
+            ChunkOrderError: Si el bloque no es el que espera la sesión
+            ValueError: Si el bloque es inválido o la validación falló
+            Exception: Si falla la subida de la parte a S3
+        """
+        received = len(session.parts)
+        state = session.put_chunk(part_number, data)
+        if self.upload_session_repository is not None and len(session.parts) > received:
+            self.upload_session_repository.add_part(
+                session.session_id, session.parts[-1], session.size, state["final_part_received"]
+            )
+        return state
+
+    def complete_upload_session(self, session: UploadSession, force_upload: bool = False) -> Dict[str, Any]:
+        """
+        Completa una sesión de carga reanudable.
+
+        Los bloques ya están en S3 y validados, así que completar solo espera
+        a que el validador termine el último bloque, completa la carga por
+        partes y guarda el resultado: su duración no depende del tamaño del
+        archivo. Si la sesión recibió bloques en otro proceso (detached), se
+        completa la carga por partes y el archivo se valida leyéndolo de S3,
+        como en una subida directa. Las filas no se cargan en staging aquí;
+        se hace en segundo plano con load_uploaded_staging.
+
+        Si el usuario ya subió y validó el mismo contenido con las mismas
+        opciones se cancela la carga, se descarta el registro provisional y
+        se devuelve el archivo existente, salvo que se indique force_upload.
+
+        Args:
+            session: Sesión de carga abierta
+            force_upload: True para guardar una copia nueva aunque el contenido ya exista
+
+        Returns:
+            Dict[str, Any]: Diccionario con los mismos campos que upload_and_validate_file
+
+        Raises:
+            ChunkOrderError: Si la sesión no está abierta
+            ValueError: Si la sesión no tiene bloques
+            Exception: Si falla la validación o la subida a S3 (la sesión se cancela
+                       y el archivo queda en FAILED)
+        """
+        timer = StageTimer()
+        with timer.stage("validation"):
+            session.finish()
+
+        saved_file = self.file_repository.get_by_id(session.file_id)
+        try:
+            s3_url = None
+            if session.detached:
+                with timer.stage("upload"):
+                    s3_url = session.complete_upload()
+                if not s3_url:
+                    raise Exception("Error al subir archivo a S3")
+                with timer.stage("validation"):
+                    # Descarta las validaciones parciales del validador detenido
+                    if self.file_validation_repository is not None:
+                        self.file_validation_repository.delete_by_file_id(session.file_id)
+                    validations, report, content_hash, _ = self._validate_stored_file(
+                        session.s3_key,
+                        saved_file.filename,
+                        session.file_id,
+                        session.validation_backend,
+                        session.report_mode,
+                        session.schema_profile
+                    )
+            else:
+                if session.error is not None:
+                    raise session.error
+                validations, report = session.result
+                content_hash = session.hexdigest()
+
+            existing = None
+            if not force_upload:
+                existing = self.file_repository.get_by_content_hash(
+                    session.user_id, content_hash, session.validation_options
+                )
+            if existing is not None:
+                if s3_url:
+                    self.storage.delete_file(session.s3_key)
+                else:
+                    session.abort()
+                self._forget_upload_session(session.session_id)
+                self._discard_provisional_file(session.file_id, report)
+                return self._deduplicated_result(existing, session.param1, session.param2, timer)
+
+            if not s3_url:
+                with timer.stage("upload"):
+                    s3_url = session.complete_upload()
+                if not s3_url:
+                    raise Exception("Error al subir archivo a S3")
+        except Exception:
+            if session.state != "completed":
+                session.abort()
+            self._forget_upload_session(session.session_id)
+            saved_file.status = FileStatus.FAILED
+            saved_file.file_size = session.size
+            saved_file.updated_at = datetime.utcnow()
+            self.file_repository.update(saved_file)
+            raise
+
+        with timer.stage("persist"):
+            saved_file.s3_url = s3_url
+            saved_file.file_size = session.size
+            saved_file.content_hash = content_hash
+            saved_file.validation_options = session.validation_options
+            saved_file.validations = validations
+            saved_file.validation_report = report
+            saved_file.status = FileStatus.COMPLETED if not validations else FileStatus.PENDING
+            saved_file.updated_at = datetime.utcnow()
+            saved_file = self.file_repository.update(saved_file)
+            self._forget_upload_session(session.session_id)
+
+        return {
+            "file_id": saved_file.id,
+            "s3_url": saved_file.s3_url,
+            "validations": saved_file.validations,
+            "report": saved_file.validation_report,
+            "staging": None,
+            "timings": timer.to_dict(),
+            "deduplicated": False,
+            "param1": session.param1,
+            "param2": session.param2
+        }
+
+    def abort_upload_session(self, session: UploadSession) -> None:
+        """
+        Cancela una sesión de carga descartando sus partes, sus validaciones y el registro provisional.
+
+        Args:
+            session: Sesión de carga abierta
+        """
+        session.abort()
+        self._forget_upload_session(session.session_id)
+        report = session.result[1] if session.result is not None else None
+        self._discard_provisional_file(session.file_id, report)
+
+    def abort_expired_upload_sessions(self, expired: List[UploadSession]) -> None:
+        """
+        Cancela las sesiones de carga caducadas de este proceso y las guardadas.
+
+        Una sesión caducada en este proceso que sigue activa en otro (recibió
+        bloques allí) o que ya se completó o canceló solo se desconecta de su
+        validador.
+
+        Args:
+            expired: Sesiones de este proceso sin bloques durante el TTL
+        """
+        limit = datetime.utcnow() - timedelta(seconds=settings.UPLOAD_SESSION_TTL_SECONDS)
+        for session in expired:
+            if self.upload_session_repository is not None:
+                record = self.upload_session_repository.get(session.session_id)
+                if record is None or record["updated_at"] >= limit:
+                    session.detach()
+                    continue
+            self.abort_upload_session(session)
+
+        if self.upload_session_repository is None:
+            return
+        for record in self.upload_session_repository.list_expired(limit):
+            self.abort_upload_session(UploadSession.from_record(record, [], self.storage))
+
+    def load_uploaded_staging(
+        self,
+        file_id: int,
+        progress: Optional[UploadProgress] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Carga en staging las filas de un archivo ya validado leyéndolo de S3.
+
+        Args:
+            file_id: ID del archivo
+            progress: Progreso del trabajo a actualizar (opcional)
+
+        Returns:
+            Optional[Dict[str, Any]]: Resultado de la carga, None si no se cargó
+        """
+        file = self.file_repository.get_by_id(file_id)
+        if file is None:
+            return None
+        if progress is not None:
+            progress.stage = "staging"
+        return self._load_staging_if_readable(
+            file_id,
+            lambda: self._decompressed(self._open_s3_stream(file.s3_key), content_encoding(file.filename)),
+            file.validations,
+            file.validation_report
+        )
+
+    def start_direct_upload(self, filename: str, content_type: str, user_id: int) -> Dict[str, Any]:
+        """
+        Prepara la subida directa de un archivo al almacenamiento, sin pasar por la API.
+
+        Registra el archivo en PENDING sin URL (el registro reserva la clave
+        para el usuario y evita que la limpieza de huérfanos elimine el
+        objeto antes de completarse) y genera el formulario firmado con el
+        que el cliente sube el archivo. Después se llama a complete_direct_upload.
+
+        Args:
+            filename: Nombre original del archivo (.csv, .csv.gz o .csv.zst)
+            content_type: Tipo MIME del archivo
+            user_id: ID del usuario que carga el archivo
+
+        Returns:
+            Dict[str, Any]: Diccionario con:
+                - file_id: ID del archivo registrado
+                - s3_key: Clave del archivo en el almacenamiento
+                - url: URL a la que enviar el formulario
+                - fields: Campos a enviar en el formulario antes del archivo
+                - max_size: Tamaño máximo del archivo en bytes
+                - expires_in: Segundos de validez del formulario
+
+        Raises:
+            Exception: Si no se pudo generar el formulario
+        """
+        s3_key = self._build_s3_key(user_id, filename)
+        encoding = content_encoding(filename)
+        if encoding:
+            content_type = "text/csv"
+        form = self.storage.create_presigned_post(
+            s3_key,
+            content_type,
+            encoding,
+            settings.DIRECT_UPLOAD_MAX_BYTES,
+            settings.DIRECT_UPLOAD_EXPIRES_SECONDS
+        )
+        if form is None:
+            raise Exception("Error al generar el formulario de subida")
+
+        file_entity = File(
+            filename=filename,
+            s3_key=s3_key,
+            content_type=content_type,
+            status=FileStatus.PENDING,
+            user_id=user_id
+        )
+        saved_file = self.file_repository.create(file_entity)
+        return {
+            "file_id": saved_file.id,
+            "s3_key": s3_key,
+            "url": form["url"],
+            "fields": form["fields"],
+            "max_size": settings.DIRECT_UPLOAD_MAX_BYTES,
+            "expires_in": settings.DIRECT_UPLOAD_EXPIRES_SECONDS
+        }
+
+    def complete_direct_upload(
+        self,
+        file_id: int,
+        user_id: int,
+        param1: str,
+        param2: str,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        force_upload: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Completa una subida directa validando el archivo leído del almacenamiento.
+
+        El archivo se lee por bloques una sola vez, calculando su tamaño y su
+        resumen SHA-256 mientras se valida, sin mantenerlo en memoria. Las
+        filas no se cargan en staging aquí; se hace en segundo plano con
+        load_uploaded_staging.
+
+        Si el usuario ya subió y validó el mismo contenido con las mismas
+        opciones se elimina el objeto subido, se descarta el registro
+        provisional y se devuelve el archivo existente, salvo que se indique
+        force_upload.
+
+        Args:
+            file_id: ID del archivo registrado con start_direct_upload
+            user_id: ID del usuario que completa la subida
+            param1: Primer parámetro adicional
+            param2: Segundo parámetro adicional
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            force_upload: True para guardar una copia nueva aunque el contenido ya exista
+
+        Returns:
+            Optional[Dict[str, Any]]: Diccionario con los mismos campos que upload_and_validate_file,
+                                      None si el archivo no existe o es de otro usuario
 
-        return validations
+        Raises:
+            ValueError: Si la subida ya se completó o el archivo aún no está en el almacenamiento
+            DecompressedSizeExceeded: Si el contenido descomprimido supera el máximo
+            Exception: Si falla la lectura del almacenamiento (el archivo queda en FAILED)
+        """
+        file = self.file_repository.get_by_id(file_id)
+        if file is None or file.user_id != user_id:
+            return None
+        if file.status != FileStatus.PENDING or file.s3_url:
+            raise ValueError("La subida directa del archivo ya se completó")
+        metadata = self.storage.head_file(file.s3_key)
+        if metadata is None:
+            raise ValueError("El archivo aún no se ha subido al almacenamiento")
+
+        timer = StageTimer()
+        file.status = FileStatus.PROCESSING
+        file.updated_at = datetime.utcnow()
+        file = self.file_repository.update(file)
+
+        try:
+            with timer.stage("validation"):
+                validations, report, content_hash, size = self._validate_stored_file(
+                    file.s3_key, file.filename, file.id, validation_backend, report_mode, schema_profile
+                )
+            options = self._validation_options(validation_backend, report_mode, schema_profile)
+
+            existing = None
+            if not force_upload:
+                existing = self.file_repository.get_by_content_hash(user_id, content_hash, options)
+            if existing is not None:
+                self.storage.delete_file(file.s3_key)
+                self._discard_provisional_file(file.id, report)
+                return self._deduplicated_result(existing, param1, param2, timer)
+        except Exception:
+            file.status = FileStatus.FAILED
+            file.file_size = metadata["size"]
+            file.updated_at = datetime.utcnow()
+            self.file_repository.update(file)
+            raise
+
+        with timer.stage("persist"):
+            file.s3_url = self.storage.object_url(file.s3_key)
+            file.file_size = size
+            file.content_hash = content_hash
+            file.validation_options = options
+            file.validations = validations
+            file.validation_report = report
+            file.status = FileStatus.COMPLETED if not validations else FileStatus.PENDING
+            file.updated_at = datetime.utcnow()
+            file = self.file_repository.update(file)
+
+        return {
+            "file_id": file.id,
+            "s3_url": file.s3_url,
+            "validations": file.validations,
+            "report": file.validation_report,
+            "staging": None,
+            "timings": timer.to_dict(),
+            "deduplicated": False,
+            "param1": param1,
+            "param2": param2
+        }
+
+    def upload_batch(
+        self,
+        items: List[BatchItem],
+        user_id: int,
+        param1: str,
+        param2: str,
+        validation_backend: Optional[str] = None,
+        report_mode: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        force_upload: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Sube y valida varios archivos CSV a la vez y los registra en una sola transacción.
+
+        El lote se procesa por etapas con un pool de UPLOAD_BATCH_WORKERS hilos:
+
+        1. hash: se calcula el resumen SHA-256 de cada archivo y se buscan
+           con una sola consulta los que el usuario ya subió y validó con
+           las mismas opciones; esos archivos, y las copias repetidas dentro
+           del lote, no se suben.
+        2. upload: cada archivo se sube a S3 por partes a la vez que se
+           valida, igual que en upload_and_validate_stream. Las validaciones
+           por fila se acumulan en memoria porque el archivo aún no tiene ID,
+           y la validación de cada archivo es secuencial: el paralelismo está
+           entre archivos.
+        3. persist: los registros de todos los archivos subidos se insertan
+           en una sola transacción y después se guardan sus validaciones por
+           fila. Si la inserción falla se eliminan de S3 los archivos subidos.
+
+        Un archivo que falla no detiene el resto del lote; su error queda en
+        su resultado. Las filas no se cargan en staging aquí; se hace en
+        segundo plano con load_uploaded_staging.
+
+        Args:
+            items: Archivos del lote
+            user_id: ID del usuario que carga los archivos
+            param1: Primer parámetro adicional
+            param2: Segundo parámetro adicional
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            force_upload: True para guardar copias nuevas aunque el contenido ya exista
+
+        Returns:
+            Dict[str, Any]: Diccionario con:
+                - files: Resultado de cada archivo, en el orden del lote (nombre,
+                         ID, estado, tamaño, URL, validaciones, reporte, si se
+                         reutilizó un archivo existente y error)
+                - uploaded: Archivos subidos y registrados
+                - deduplicated: Archivos resueltos con un archivo existente
+                - failed: Archivos que no se pudieron cargar
+                - timings: Segundos por etapa y total
+                - param1: Primer parámetro
+                - param2: Segundo parámetro
+
+        Raises:
+            ValueError: Si el backend o el perfil de esquema no existen
+            Exception: Si falla la inserción de los registros
+        """
+        self._build_validator(validation_backend, schema_profile, sequential=True)
+        options = self._validation_options(validation_backend, report_mode, schema_profile)
+        timer = StageTimer()
+        results = [
+            {
+                "filename": item.filename,
+                "file_id": None,
+                "status": FileStatus.FAILED.value,
+                "file_size": 0,
+                "s3_url": None,
+                "validations": [],
+                "report": None,
+                "deduplicated": False,
+                "error": item.error
+            }
+            for item in items
+        ]
+        pending = [index for index, item in enumerate(items) if item.error is None]
+        workers = max(1, min(settings.UPLOAD_BATCH_WORKERS, len(pending)))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="upload-batch") as executor:
+            with timer.stage("hash"):
+                hashes = self._run_batch_stage(executor, self._hash_batch_item, items, pending, results)
+                existing: Dict[str, File] = {}
+                if not force_upload and hashes:
+                    existing = self.file_repository.get_by_content_hashes(
+                        user_id, [content_hash for content_hash, _ in hashes.values()], options
+                    )
+
+            to_upload: List[int] = []
+            copies: Dict[int, int] = {}
+            first_by_hash: Dict[str, int] = {}
+            for index in sorted(hashes):
+                content_hash, size = hashes[index]
+                results[index]["file_size"] = size
+                if content_hash in existing:
+                    self._set_batch_result(results[index], existing[content_hash], deduplicated=True)
+                elif not force_upload and content_hash in first_by_hash:
+                    copies[index] = first_by_hash[content_hash]
+                else:
+                    first_by_hash[content_hash] = index
+                    to_upload.append(index)
+
+            with timer.stage("upload"):
+                uploads = self._run_batch_stage(
+                    executor,
+                    partial(
+                        self._upload_batch_item,
+                        user_id=user_id,
+                        validation_backend=validation_backend,
+                        report_mode=report_mode,
+                        schema_profile=schema_profile,
+                        validation_options=options
+                    ),
+                    items,
+                    to_upload,
+                    results
+                )
+
+        with timer.stage("persist"):
+            uploaded = sorted(uploads)
+            try:
+                saved_files = []
+                if uploaded:
+                    saved_files = self.file_repository.create_many([uploads[index][0] for index in uploaded])
+            except Exception:
+                self._delete_batch_objects([uploads[index][0] for index in uploaded])
+                raise
+
+            for index, saved_file in zip(uploaded, saved_files):
+                findings = uploads[index][1]
+                if self.file_validation_repository is not None and findings:
+                    try:
+                        FindingRecorder(
+                            self.file_validation_repository, saved_file.id, settings.CSV_VALIDATIONS_BATCH_SIZE
+                        ).record_all(findings)
+                    except Exception as e:
+                        print(f"Error al guardar las validaciones del archivo {saved_file.id}: {e}")
+                        saved_file.validations = [
+                            {"type": "processing_error", "message": f"Error al guardar las validaciones: {e}"}
+                        ]
+                        saved_file.status = FileStatus.FAILED
+                        saved_file.updated_at = datetime.utcnow()
+                        saved_file = self.file_repository.update(saved_file)
+                        results[index]["error"] = str(e)
+                self._set_batch_result(results[index], saved_file)
+
+            for index, first in copies.items():
+                if results[first]["file_id"] is None:
+                    results[index]["error"] = results[first]["error"]
+                else:
+                    results[index].update({
+                        key: value for key, value in results[first].items() if key != "filename"
+                    })
+                    results[index]["deduplicated"] = True
+
+        return {
+            "files": results,
+            "uploaded": len(uploaded),
+            "deduplicated": sum(1 for result in results if result["deduplicated"]),
+            "failed": sum(1 for result in results if result["status"] == FileStatus.FAILED.value),
+            "timings": timer.to_dict(),
+            "param1": param1,
+            "param2": param2
+        }
+
+    def list_files(self, user_id: int, after: Optional[int] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        Obtiene una página de los archivos del usuario con sus URLs de descarga.
+
+        La paginación es por clave, del archivo más reciente al más antiguo:
+        cada página empieza tras el ID del último archivo de la anterior. Las
+        URLs de la página se firman con una sola llamada al almacenamiento,
+        que reutiliza las que tiene en caché.
+
+        Args:
+            user_id: ID del usuario
+            after: Cursor devuelto por la página anterior (None para la primera)
+            limit: Número máximo de archivos de la página
+
+        Returns:
+            Dict[str, Any]: Diccionario con items y next_cursor (None en la última página)
+        """
+        files = self.file_repository.get_by_user_id(user_id, after, limit)
+        urls = self.storage.get_file_urls([file.s3_key for file in files if file.s3_url])
+        items = [
+            {
+                "file_id": file.id,
+                "filename": file.filename,
+                "status": file.status.value,
+                "file_size": file.file_size,
+                "download_url": urls.get(file.s3_key) if file.s3_url else None,
+                "created_at": file.created_at,
+                "updated_at": file.updated_at
+            }
+            for file in files
+        ]
+        next_cursor = files[-1].id if len(files) == limit else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    def get_file_status(
+        self,
+        file_id: int,
+        user_id: int,
+        progress: Optional[UploadProgress] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene el estado de procesamiento de un archivo del usuario.
+
+        La etapa distingue un archivo en PENDING a la espera de procesarse
+        (queued) de uno que terminó con hallazgos (done), aunque el trabajo
+        no esté en este proceso:
+
+        - queued, validating o staging: la del trabajo en curso en este proceso
+        - queued: subido y a la espera de su trabajo de validación
+        - uploading: subida directa a la espera de que el cliente suba el archivo
+        - processing: en proceso en otro proceso o en una sesión por bloques
+        - done: validación terminada (completed, pending con hallazgos o failed)
+
+        Args:
+            file_id: ID del archivo
+            user_id: ID del usuario que consulta
+            progress: Progreso del trabajo si está encolado o en curso (opcional)
+
+        Returns:
+            Optional[Dict[str, Any]]: Estado, etapa, clave en S3, progreso, validaciones y
+                                      reporte del archivo, None si no existe o es de otro usuario
+        """
+        file = self.file_repository.get_by_id(file_id)
+        if file is None or file.user_id != user_id:
+            return None
+        if progress is not None:
+            stage = progress.stage
+        elif file.status in (FileStatus.COMPLETED, FileStatus.FAILED) or file.validation_options is not None:
+            stage = "done"
+        elif file.status == FileStatus.PENDING:
+            stage = "queued" if file.s3_url else "uploading"
+        else:
+            stage = "processing"
+        return {
+            "file_id": file.id,
+            "filename": file.filename,
+            "status": file.status.value,
+            "stage": stage,
+            "s3_key": file.s3_key,
+            "s3_url": file.s3_url or None,
+            "file_size": file.file_size,
+            "progress": progress.to_dict() if progress is not None else None,
+            "validations": file.validations,
+            "report": file.validation_report,
+            "created_at": file.created_at,
+            "updated_at": file.updated_at
+        }
+
+    def delete_file(self, file_id: int, user_id: int) -> Optional[List[str]]:
+        """
+        Elimina el registro de un archivo del usuario con sus validaciones por fila.
+
+        Los objetos del almacenamiento no se eliminan aquí: se devuelven sus
+        claves para que quien llama los elimine (los que queden los retira
+        la limpieza de huérfanos).
+
+        Args:
+            file_id: ID del archivo
+            user_id: ID del usuario que elimina
+
+        Returns:
+            Optional[List[str]]: Claves del archivo y de su detalle de validaciones en el
+                                 almacenamiento, None si no existe o es de otro usuario
+
+        Raises:
+            ValueError: Si el archivo todavía se está subiendo o procesando
+        """
+        file = self.file_repository.get_by_id(file_id)
+        if file is None or file.user_id != user_id:
+            return None
+        if not file.s3_url or file.status == FileStatus.PROCESSING:
+            raise ValueError("El archivo todavía se está subiendo o procesando")
+
+        s3_keys = [file.s3_key]
+        if file.validation_report and file.validation_report.get("details_key"):
+            s3_keys.append(file.validation_report["details_key"])
+        if self.file_validation_repository is not None:
+            self.file_validation_repository.delete_by_file_id(file_id)
+        self.file_repository.delete(file_id)
+        return s3_keys
+
+    def list_file_validations(
+        self,
+        file_id: int,
+        user_id: int,
+        after: Optional[int] = None,
+        limit: int = 100,
+        kind: Optional[str] = None,
+        column: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene una página de las validaciones por fila de un archivo del usuario.
+
+        La paginación es por clave: cada página empieza tras el número de
+        orden (seq) de la última validación de la anterior.
+
+        Args:
+            file_id: ID del archivo
+            user_id: ID del usuario que consulta
+            after: Cursor devuelto por la página anterior (None para la primera)
+            limit: Número máximo de validaciones de la página
+            kind: Tipo de validación por el que filtrar (opcional)
+            column: Columna por la que filtrar (opcional)
+
+        Returns:
+            Optional[Dict[str, Any]]: Diccionario con items y next_cursor (None en la
+                                      última página), None si el archivo no existe o
+                                      es de otro usuario
+        """
+        file = self.file_repository.get_by_id(file_id)
+        if file is None or file.user_id != user_id:
+            return None
+        items = self.file_validation_repository.list_by_file_id(file_id, after, limit, kind, column)
+        next_cursor = items[-1]["seq"] if len(items) == limit else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    def validate_csv_stream(
+        self,
+        stream: BinaryIO,
+        validation_backend: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        sequential: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Valida un CSV leyendo sus filas de forma incremental desde un flujo de bytes.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV (UploadFile, cuerpo de S3...)
+            validation_backend: Backend de validación (streaming o columnar).
+                                Si no se indica se usa el configurado.
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            sequential: True para validar a medida que se lee, sin repartir el
+                        archivo entre procesos
+
+        Returns:
+            List[Dict[str, Any]]: Lista de validaciones encontradas.
+                                 Lista vacía si no hay errores.
+        """
+        return self._build_validator(validation_backend, schema_profile, sequential).validate(stream)
+
+    def build_validation_report(
+        self,
+        stream: BinaryIO,
+        validation_backend: Optional[str] = None,
+        details_key: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        recorder: Optional[FindingRecorder] = None
+    ) -> Dict[str, Any]:
+        """
+        Valida un CSV resumiendo las validaciones en un reporte agregado.
+
+        La validación es siempre secuencial: el reparto entre procesos
+        valida el archivo completo y guarda todas sus validaciones antes de
+        emitir la primera, de modo que ni la memoria del reporte quedaría
+        acotada ni se podría detener la validación al alcanzar
+        CSV_REPORT_MAX_FINDINGS. Si se indica details_key y la muestra no
+        contiene todas las validaciones, el detalle completo se sube a S3
+        como JSON Lines comprimido con gzip.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+            validation_backend: Backend de validación (streaming o columnar).
+                                Si no se indica se usa el configurado.
+            details_key: Clave en S3 para el detalle completo (opcional)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            recorder: Registro donde guardar todas las validaciones (opcional)
+
+        Returns:
+            Dict[str, Any]: Reporte con contadores por tipo y columna y una muestra
+                            de validaciones
+        """
+        validator = self._build_validator(validation_backend, schema_profile, sequential=True)
+        store_details = details_key is not None and settings.CSV_REPORT_STORE_DETAILS
+
+        with tempfile.TemporaryFile() as spool:
+            details = None
+            if store_details:
+                details = io.TextIOWrapper(gzip.GzipFile(fileobj=spool, mode="wb"), encoding="utf-8")
+
+            report = ValidationReport(
+                samples_per_type=settings.CSV_REPORT_SAMPLES_PER_TYPE,
+                max_samples=settings.CSV_REPORT_MAX_SAMPLES,
+                max_findings=settings.CSV_REPORT_MAX_FINDINGS,
+                details=details
+            )
+            findings = validator.iter_findings(stream)
+            report.consume(recorder.record(findings) if recorder is not None else findings)
+
+            if details is not None:
+                details.close()
+                if report.samples_truncated:
+                    spool.seek(0)
+                    if self.storage.upload_file(spool, details_key, "application/gzip"):
+                        report.details_key = details_key
+
+        return report.to_dict()
+
+    def load_staging_rows(self, file_id: int, stream: BinaryIO) -> Optional[Dict[str, Any]]:
+        """
+        Carga las filas de un CSV en la tabla de staging en lotes de CSV_STAGING_BATCH_SIZE.
+
+        Args:
+            file_id: ID del archivo al que pertenecen las filas
+            stream: Flujo binario con el contenido del CSV
+
+        Returns:
+            Optional[Dict[str, Any]]: Filas insertadas, duración y filas por segundo,
+                                      None si la carga falló
+        """
+        loader = StagingLoader(
+            self.file_row_repository,
+            batch_size=settings.CSV_STAGING_BATCH_SIZE,
+            encoding=settings.CSV_ENCODING or None,
+            delimiter=settings.CSV_DELIMITER or None
+        )
+        try:
+            result = loader.load(file_id, stream)
+        except Exception as e:
+            print(f"Error al cargar filas en staging del archivo {file_id}: {e}")
+            return None
+        print(
+            f"Staging del archivo {file_id}: {result['rows']} filas en {result['seconds']} s "
+            f"({result['rows_per_second']} filas/s)"
+        )
+        return result
+
+    def _run_batch_stage(
+        self,
+        executor: ThreadPoolExecutor,
+        task: Callable[[BatchItem], Any],
+        items: List[BatchItem],
+        indexes: List[int],
+        results: List[Dict[str, Any]]
+    ) -> Dict[int, Any]:
+        """
+        Ejecuta una etapa de un lote sobre varios archivos en el pool de hilos.
+
+        Args:
+            executor: Pool de hilos del lote
+            task: Función que procesa un archivo del lote
+            items: Archivos del lote
+            indexes: Posiciones de los archivos a procesar
+            results: Resultados del lote, donde se anotan los errores
+
+        Returns:
+            Dict[int, Any]: Resultado de la etapa por posición de los archivos que no fallaron
+        """
+        futures = {index: executor.submit(task, items[index]) for index in indexes}
+        completed = {}
+        for index, future in futures.items():
+            try:
+                completed[index] = future.result()
+            except Exception as e:
+                print(f"Error al procesar el archivo {items[index].filename} del lote: {e}")
+                results[index]["error"] = str(e)
+        return completed
+
+    def _hash_batch_item(self, item: BatchItem) -> Tuple[str, int]:
+        """
+        Calcula el resumen SHA-256 y el tamaño de un archivo de un lote.
+
+        Args:
+            item: Archivo del lote
+
+        Returns:
+            Tuple[str, int]: Resumen en hexadecimal y tamaño en bytes
+        """
+        with closing(item.open()) as stream:
+            return _sha256(stream)
+
+    def _upload_batch_item(
+        self,
+        item: BatchItem,
+        user_id: int,
+        validation_backend: Optional[str],
+        report_mode: Optional[str],
+        schema_profile: Optional[str],
+        validation_options: str
+    ) -> Tuple[File, List[Dict[str, Any]]]:
+        """
+        Sube a S3 y valida un archivo de un lote en una sola lectura, sin registrarlo.
+
+        Args:
+            item: Archivo del lote
+            user_id: ID del usuario que carga el archivo
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            validation_options: Clave de las opciones de validación a guardar en el archivo
+
+        Returns:
+            Tuple[File, List[Dict[str, Any]]]: Archivo a registrar y sus validaciones
+                por fila pendientes de guardar
+
+        Raises:
+            DecompressedSizeExceeded: Si el contenido descomprimido supera el máximo
+            Exception: Si falla la subida a S3
+        """
+        s3_key = self._build_s3_key(user_id, item.filename)
+        encoding = content_encoding(item.filename)
+        content_type = "text/csv" if encoding else item.content_type
+        upload = self.storage.start_upload(s3_key, content_type, encoding)
+        buffer = FindingBuffer()
+        recorder = None
+        if self.file_validation_repository is not None:
+            recorder = FindingRecorder(buffer, 0, settings.CSV_VALIDATIONS_BATCH_SIZE)
+
+        report = None
+        try:
+            with closing(item.open()) as stream:
+                tee = TeeStream(stream, upload)
+                source = self._decompressed(tee, encoding)
+                validations, report = self._validate_upload(
+                    source,
+                    s3_key,
+                    validation_backend,
+                    report_mode,
+                    schema_profile,
+                    sequential=True,
+                    recorder=recorder
+                )
+                self._check_decompressed(source)
+                tee.drain()
+
+            s3_url = upload.complete()
+            if not s3_url:
+                raise Exception("Error al subir archivo a S3")
+        except Exception:
+            upload.abort()
+            if report is not None and report.get("details_key"):
+                self.storage.delete_file(report["details_key"])
+            raise
+
+        file_entity = File(
+            filename=item.filename,
+            s3_key=s3_key,
+            s3_url=s3_url,
+            file_size=tee.size,
+            content_type=content_type,
+            status=FileStatus.COMPLETED if not validations else FileStatus.PENDING,
+            validations=validations,
+            validation_report=report,
+            content_hash=tee.hexdigest(),
+            validation_options=validation_options,
+            user_id=user_id
+        )
+        return file_entity, buffer.findings
+
+    def _delete_batch_objects(self, files: List[File]) -> None:
+        """
+        Elimina de S3 los archivos de un lote que no se pudieron registrar y su detalle de validaciones.
+
+        Los objetos se eliminan por lotes; los que fallen quedan para la limpieza de huérfanos.
+
+        Args:
+            files: Archivos subidos sin registrar
+        """
+        s3_keys = []
+        for file in files:
+            s3_keys.append(file.s3_key)
+            if file.validation_report and file.validation_report.get("details_key"):
+                s3_keys.append(file.validation_report["details_key"])
+        failed = self.storage.delete_files(s3_keys)
+        if failed:
+            print(f"Error al eliminar {len(failed)} objetos de un lote sin registrar")
+
+    def _set_batch_result(self, result: Dict[str, Any], file: File, deduplicated: bool = False) -> None:
+        """
+        Completa el resultado de un archivo de un lote con su registro.
+
+        Args:
+            result: Resultado del archivo en el lote
+            file: Archivo registrado (o el existente con el mismo contenido)
+            deduplicated: True si se reutilizó un archivo existente
+        """
+        result.update({
+            "file_id": file.id,
+            "status": file.status.value,
+            "file_size": file.file_size,
+            "s3_url": file.s3_url,
+            "validations": file.validations,
+            "report": file.validation_report,
+            "deduplicated": deduplicated
+        })
+
+    def _deduplicated_result(
+        self,
+        existing: File,
+        param1: str,
+        param2: str,
+        timer: StageTimer
+    ) -> Dict[str, Any]:
+        """
+        Construye el resultado de una carga resuelta con un archivo existente.
+
+        Args:
+            existing: Archivo del usuario con el mismo contenido
+            param1: Primer parámetro adicional
+            param2: Segundo parámetro adicional
+            timer: Duración de las etapas de la carga
+
+        Returns:
+            Dict[str, Any]: Resultado con la URL y las validaciones del archivo existente
+        """
+        return {
+            "file_id": existing.id,
+            "s3_url": existing.s3_url,
+            "validations": existing.validations,
+            "report": existing.validation_report,
+            "staging": None,
+            "timings": timer.to_dict(),
+            "deduplicated": True,
+            "param1": param1,
+            "param2": param2
+        }
+
+    def _discard_provisional_file(self, file_id: int, report: Optional[Dict[str, Any]]) -> None:
+        """
+        Elimina el registro provisional de una carga descartada y sus validaciones.
+
+        Args:
+            file_id: ID del archivo provisional
+            report: Reporte agregado (modo summary), para eliminar su detalle de S3
+        """
+        if report is not None and report.get("details_key"):
+            self.storage.delete_file(report["details_key"])
+        if self.file_validation_repository is not None:
+            self.file_validation_repository.delete_by_file_id(file_id)
+        self.file_repository.delete(file_id)
+
+    def _forget_upload_session(self, session_id: str) -> None:
+        """
+        Elimina el estado guardado de una sesión de carga terminada o cancelada.
+
+        Args:
+            session_id: ID de la sesión
+        """
+        if self.upload_session_repository is not None:
+            self.upload_session_repository.delete(session_id)
+
+    def _validate_stored_file(
+        self,
+        s3_key: str,
+        filename: str,
+        file_id: int,
+        validation_backend: Optional[str],
+        report_mode: Optional[str],
+        schema_profile: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], str, int]:
+        """
+        Valida un archivo leído del almacenamiento calculando su resumen y su tamaño.
+
+        El archivo se lee por bloques una sola vez, sin mantenerlo en memoria.
+
+        Args:
+            s3_key: Clave del archivo en S3
+            filename: Nombre original del archivo (indica la compresión)
+            file_id: ID del archivo, para guardar sus validaciones por fila
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], str, int]: Validaciones,
+                reporte agregado, resumen SHA-256 y tamaño del archivo
+
+        Raises:
+            DecompressedSizeExceeded: Si el contenido descomprimido supera el máximo
+            Exception: Si falla la lectura del almacenamiento
+        """
+        with closing(self._open_s3_stream(s3_key)) as body:
+            tee = TeeStream(body, None)
+            source = self._decompressed(tee, content_encoding(filename))
+            validations, report = self._validate_upload(
+                source, s3_key, validation_backend, report_mode, schema_profile, file_id
+            )
+            self._check_decompressed(source)
+            # El validador puede detenerse antes del final (modo summary con límite)
+            tee.drain()
+        return validations, report, tee.hexdigest(), tee.size
+
+    def _open_s3_stream(self, s3_key: str) -> BinaryIO:
+        """
+        Abre el contenido de un archivo de S3 como flujo de bytes.
+
+        Args:
+            s3_key: Clave del archivo en S3
+
+        Returns:
+            BinaryIO: Flujo con el contenido del archivo
+
+        Raises:
+            Exception: Si no se pudo leer el archivo de S3
+        """
+        body = self.storage.get_file_stream(s3_key)
+        if body is None:
+            raise Exception("Error al leer archivo de S3")
+        return body
+
+    def _reopen_stream(self, stream: BinaryIO, s3_key: str) -> BinaryIO:
+        """
+        Vuelve al inicio de un flujo ya leído o, si no admite seek, lo abre de S3.
+
+        Args:
+            stream: Flujo binario leído
+            s3_key: Clave del archivo en S3
+
+        Returns:
+            BinaryIO: Flujo posicionado al inicio del contenido
+        """
+        seekable = getattr(stream, "seekable", None)
+        if seekable is not None and seekable():
+            stream.seek(0)
+            return stream
+        return self._open_s3_stream(s3_key)
+
+    def _decompressed(self, stream: BinaryIO, encoding: Optional[str]) -> BinaryIO:
+        """
+        Envuelve un flujo comprimido para leerlo descomprimido.
+
+        Args:
+            stream: Flujo binario con el contenido del archivo
+            encoding: Compresión del archivo (gzip, zstd), None si no está comprimido
+
+        Returns:
+            BinaryIO: Flujo descomprimido limitado a CSV_MAX_DECOMPRESSED_BYTES, o el
+                      mismo flujo si no está comprimido
+        """
+        if not encoding:
+            return stream
+        return DecompressingStream(stream, encoding, settings.CSV_MAX_DECOMPRESSED_BYTES)
+
+    def _check_decompressed(self, stream: BinaryIO) -> None:
+        """
+        Lanza el error de descompresión que el validador haya convertido en validación.
+
+        Args:
+            stream: Flujo leído por el validador
+
+        Raises:
+            DecompressedSizeExceeded: Si el contenido descomprimido superó el máximo
+        """
+        if isinstance(stream, DecompressingStream) and stream.error is not None:
+            raise stream.error
+
+    def _build_s3_key(self, user_id: int, filename: str) -> str:
+        """
+        Genera la clave única de un archivo en S3.
+
+        Incluye un sufijo aleatorio para que dos cargas del mismo archivo en
+        el mismo segundo (por ejemplo con force_upload) no compartan clave.
+
+        Args:
+            user_id: ID del usuario que carga el archivo
+            filename: Nombre original del archivo
+
+        Returns:
+            str: Clave del archivo en S3
+        """
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        return f"uploads/{user_id}/{timestamp}_{uuid.uuid4().hex[:8]}_{filename}"
+
+    def _validate_upload(
+        self,
+        stream: BinaryIO,
+        s3_key: str,
+        validation_backend: Optional[str],
+        report_mode: Optional[str],
+        schema_profile: Optional[str],
+        file_id: Optional[int] = None,
+        sequential: bool = False,
+        recorder: Optional[FindingRecorder] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Valida el contenido de un archivo subido según el modo de reporte.
+
+        Si hay repositorio de validaciones, todas las validaciones (no solo
+        la muestra del modo summary) se guardan en la tabla file_validations
+        en lotes de CSV_VALIDATIONS_BATCH_SIZE.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+            s3_key: Clave del archivo en S3 (base de la clave del detalle completo)
+            validation_backend: Backend de validación (streaming o columnar)
+            report_mode: Modo de reporte (full o summary)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            file_id: ID del archivo para guardar sus validaciones (opcional)
+            sequential: True para validar a medida que se lee, sin repartir el
+                        archivo entre procesos (el modo summary es siempre secuencial)
+            recorder: Registro de validaciones a usar en lugar del de file_id (opcional)
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]: Validaciones (muestra en
+                modo summary) y reporte agregado (None en modo full)
+        """
+        if recorder is None and self.file_validation_repository is not None and file_id is not None:
+            recorder = FindingRecorder(
+                self.file_validation_repository, file_id, settings.CSV_VALIDATIONS_BATCH_SIZE
+            )
+
+        if (report_mode or settings.CSV_REPORT_MODE) == "summary":
+            report = self.build_validation_report(
+                stream,
+                validation_backend,
+                details_key=f"{s3_key}.validations.jsonl.gz",
+                schema_profile=schema_profile,
+                recorder=recorder
+            )
+            return report["samples"], report
+
+        validations = self.validate_csv_stream(stream, validation_backend, schema_profile, sequential)
+        if recorder is not None:
+            recorder.record_all(validations)
+        return validations, None
+
+    def _load_staging_if_readable(
+        self,
+        file_id: int,
+        open_stream: Callable[[], BinaryIO],
+        validations: List[Dict[str, Any]],
+        report: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Carga las filas en staging si está habilitado y el archivo se pudo leer completo.
+
+        Args:
+            file_id: ID del archivo
+            open_stream: Función que abre el contenido del archivo desde el inicio
+                         (solo se llama si se cargan las filas)
+            validations: Validaciones del archivo
+            report: Reporte agregado (modo summary)
+
+        Returns:
+            Optional[Dict[str, Any]]: Resultado de la carga, None si no se cargó
+        """
+        if self.file_row_repository is None or not settings.CSV_STAGING_ENABLED:
+            return None
+        if report is not None:
+            readable = "parse_error" not in report["by_type"]
+        else:
+            readable = all(validation["type"] != "parse_error" for validation in validations)
+        if not readable:
+            return None
+        return self.load_staging_rows(file_id, open_stream())
+
+    def _build_validator(
+        self,
+        validation_backend: Optional[str] = None,
+        schema_profile: Optional[str] = None,
+        sequential: bool = False
+    ) -> Union[CSVStreamValidator, ParallelCSVValidator]:
+        """
+        Construye el validador correspondiente al backend indicado.
+
+        El backend streaming reparte los archivos grandes entre varios procesos
+        según CSV_PARALLEL_WORKERS y CSV_PARALLEL_MIN_BYTES, salvo que se pida
+        una validación secuencial (para archivos de tamaño desconocido, el
+        reparto exige volcarlos antes a disco). La detección de
+        duplicados vuelca los resúmenes de fila a disco al superar
+        CSV_DUPLICATE_MEMORY_BYTES. La codificación y el delimitador se
+        deducen del primer bloque salvo que se fijen con CSV_ENCODING y
+        CSV_DELIMITER.
+
+        Args:
+            validation_backend: Backend de validación (streaming o columnar)
+            schema_profile: Nombre del perfil de esquema a aplicar (opcional)
+            sequential: True para no repartir el archivo entre procesos
+
+        Returns:
+            Union[CSVStreamValidator, ParallelCSVValidator]: Validador de CSV
+
+        Raises:
+            ValueError: Si el backend o el perfil de esquema no existen
+        """
+        backend = validation_backend or settings.CSV_VALIDATION_BACKEND
+        validator_options = {
+            "encoding": settings.CSV_ENCODING or None,
+            "delimiter": settings.CSV_DELIMITER or None,
+            "duplicate_memory_bytes": settings.CSV_DUPLICATE_MEMORY_BYTES,
+            "duplicate_spill_dir": settings.CSV_DUPLICATE_SPILL_DIR,
+            "profile": self._get_schema_profile(schema_profile),
+        }
+        if backend == "columnar":
+            return ColumnarCSVValidator(chunk_rows=settings.CSV_COLUMNAR_CHUNK_ROWS, **validator_options)
+        if backend == "streaming" and sequential:
+            return CSVStreamValidator(**validator_options)
+        if backend == "streaming":
+            return ParallelCSVValidator(
+                CSVStreamValidator(**validator_options),
+                workers=settings.CSV_PARALLEL_WORKERS,
+                min_bytes=settings.CSV_PARALLEL_MIN_BYTES
+            )
+        raise ValueError(f"Backend de validación inválido: {backend}")
+
+    def _get_schema_profile(self, schema_profile: Optional[str]) -> Optional[SchemaProfile]:
+        """
+        Obtiene el perfil de esquema compilado por nombre.
+
+        Args:
+            schema_profile: Nombre del perfil (None para la validación por palabras clave)
+
+        Returns:
+            Optional[SchemaProfile]: Perfil compilado, None si no se indicó
+
+        Raises:
+            ValueError: Si el perfil no existe
+        """
+        if not schema_profile:
+            return None
+        profile = schema_registry.get(schema_profile)
+        if profile is None:
+            raise ValueError(f"Perfil de esquema inexistente: {schema_profile}")
+        return profile
+
+    def _validation_options(
+        self,
+        validation_backend: Optional[str],
+        report_mode: Optional[str],
+        schema_profile: Optional[str]
+    ) -> str:
+        """
+        Construye la clave de las opciones con que se valida un archivo.
+
+        Junto al resumen del contenido forma la clave de deduplicación: el
+        mismo contenido validado con otro backend, otro modo de reporte u
+        otro perfil (o versión del perfil) no reutiliza el resultado. Se
+        guarda en el archivo solo al terminar la validación.
+
+        Args:
+            validation_backend: Backend de validación (None para el configurado)
+            report_mode: Modo de reporte (None para el configurado)
+            schema_profile: Nombre del perfil de esquema (opcional)
+
+        Returns:
+            str: Clave de las opciones (backend|modo|perfil@versión)
+
+        Raises:
+            ValueError: Si el perfil no existe
+        """
+        profile = self._get_schema_profile(schema_profile)
+        return "|".join((
+            validation_backend or settings.CSV_VALIDATION_BACKEND,
+            report_mode or settings.CSV_REPORT_MODE,
+            f"{profile.name}@{profile.version}" if profile is not None else ""
+        ))
+
+    def _validate_csv(self, file_content: bytes) -> List[Dict[str, Any]]:
+        """
+        Valida el contenido de un archivo CSV.
+
+        Args:
+            file_content: Contenido del archivo en bytes
+
+        Returns:
+            List[Dict[str, Any]]: Lista de validaciones encontradas.
+                                 Lista vacía si no hay errores.
+        """
+        return self.validate_csv_stream(io.BytesIO(file_content))
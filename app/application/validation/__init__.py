@@ -0,0 +1,6 @@
+"""
+Módulo de validación de archivos.
+
+Contiene los validadores de contenido CSV utilizados
+por los casos de uso de archivos.
+"""
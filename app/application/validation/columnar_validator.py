@@ -0,0 +1,195 @@
+"""
+Validador de CSV columnar.
+
+Carga el CSV por bloques de filas en estructuras de pandas/NumPy y aplica
+las validaciones de valores vacíos, tipos numéricos y filas duplicadas como
+operaciones vectorizadas por columna, en lugar de bucles por celda.
+"""
+
+import csv
+from typing import BinaryIO, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.application.validation.validation_plan import ValidationPlan, is_number
+from app.application.validation.row_digest_store import DEFAULT_MEMORY_BYTES, RowDigestStore, row_digest
+from app.application.validation.schema_profiles import SchemaProfile
+from app.application.validation.csv_sniffer import sniff_stream
+from app.application.validation.csv_stream_validator import (
+    DEFAULT_CHUNK_SIZE,
+    CSVStreamValidator,
+    Issue,
+    RowLengthError,
+    header_issues,
+    iter_text_lines,
+)
+
+# Número de filas por bloque por defecto
+DEFAULT_CHUNK_ROWS = 50000
+
+# str.isspace aplicado elemento a elemento sobre matrices de objetos
+_isspace = np.frompyfunc(str.isspace, 1, 1)
+
+
+class ColumnarCSVValidator(CSVStreamValidator):
+    """
+    Validador de contenido CSV que procesa el archivo por columnas.
+
+    Produce exactamente las mismas validaciones, con los mismos números de
+    fila y columnas, que CSVStreamValidator, de modo que el backend puede
+    elegirse en cada carga.
+    """
+
+    def __init__(
+        self,
+        encoding: Optional[str] = "utf-8",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        duplicate_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        duplicate_spill_dir: Optional[str] = None,
+        profile: Optional[SchemaProfile] = None,
+        delimiter: Optional[str] = ","
+    ):
+        """
+        Inicializa el validador.
+
+        Args:
+            encoding: Codificación del contenido (None para deducirla del primer bloque)
+            chunk_size: Tamaño en bytes de cada lectura del flujo
+            chunk_rows: Número de filas cargadas en cada bloque
+            duplicate_memory_bytes: Memoria para los resúmenes de fila antes de volcar a disco
+            duplicate_spill_dir: Directorio para el volcado a disco (por defecto el temporal)
+            profile: Perfil de esquema a aplicar (por defecto, columnas numéricas por palabra clave)
+            delimiter: Delimitador de campos (None para deducirlo del primer bloque)
+        """
+        super().__init__(encoding, chunk_size, duplicate_memory_bytes, duplicate_spill_dir, profile, delimiter)
+        self.chunk_rows = chunk_rows
+
+    def _iter_stream_issues(self, stream: BinaryIO, row_index: RowDigestStore) -> Iterator[Issue]:
+        """
+        Lee el flujo por bloques de filas produciendo incidencias compactas.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+            row_index: Índice de filas vistas para detectar duplicados
+
+        Yields:
+            Issue: Cada incidencia encontrada, en orden de fila
+        """
+        stream, dialect = sniff_stream(stream, self.encoding, self.delimiter)
+        reader = csv.reader(iter_text_lines(stream, dialect.encoding, self.chunk_size), delimiter=dialect.delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        plan = self.compile_plan(header)
+        yield from header_issues(plan)
+        next_row_num = 2  # Empezar en 2 (después del header)
+
+        rows: List[List[str]] = []
+        for row in reader:
+            if not row:
+                continue
+            rows.append(row)
+            overflow = len(row) > plan.width
+            if overflow or len(rows) >= self.chunk_rows:
+                yield from self._validate_chunk(rows, plan, row_index, next_row_num)
+                next_row_num += len(rows)
+                rows = []
+                if overflow:
+                    raise RowLengthError(next_row_num - 1)
+
+        if rows:
+            yield from self._validate_chunk(rows, plan, row_index, next_row_num)
+
+    def _validate_chunk(
+        self,
+        rows: List[List[str]],
+        plan: ValidationPlan,
+        row_index: RowDigestStore,
+        first_row_num: int
+    ) -> Iterator[Issue]:
+        """
+        Aplica las comprobaciones del plan de forma vectorizada a un bloque de filas.
+
+        Si la última fila del bloque tiene más columnas que el encabezado,
+        solo se validan sus valores vacíos, como en la validación fila a fila.
+
+        Args:
+            rows: Filas del bloque (sin filas en blanco)
+            plan: Plan de validación compilado
+            row_index: Índice de filas vistas para detectar duplicados
+            first_row_num: Número de fila de la primera fila del bloque
+
+        Yields:
+            Issue: Incidencias encontradas en el bloque, en orden de fila
+        """
+        width = plan.width
+        truncated = len(rows[-1]) > width
+        columns = plan.columns
+
+        # Matriz de celdas: las filas cortas se completan y se marcan como ausentes
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        if (lengths != width).any():
+            rows = [row[:width] + [""] * (width - len(row)) for row in rows]
+        cells = np.empty((len(rows), width), dtype=object)
+        cells[:] = rows
+        if not plan.positional:
+            cells = cells[:, list(plan.key_positions)]
+        missing = np.asarray(plan.key_positions, dtype=np.int64) >= lengths[:, None]
+
+        # Valores vacíos: ausentes, cadena vacía o solo espacios
+        blank = missing | (cells == "") | _isspace(cells).astype(bool)
+        empty = blank & np.array([rule.check_empty for rule in columns], dtype=bool)
+
+        # Comprobaciones de valor por columna; la numérica la resuelve pandas y
+        # float() confirma los rechazos (coma decimal, 'nan'...)
+        failures = []
+        for i, rule in enumerate(columns):
+            present = ~blank[:, i]
+            for kind, check in rule.checks:
+                if check is is_number:
+                    parsed = pd.to_numeric(pd.Series(cells[:, i]), errors="coerce").to_numpy()
+                    rejected = present & pd.isna(parsed)
+                    for index in np.flatnonzero(rejected):
+                        rejected[index] = not is_number(cells[index, i])
+                else:
+                    rejected = present.copy()
+                    rejected[present] = ~np.frompyfunc(check, 1, 1)(cells[present, i]).astype(bool)
+                if rejected.any():
+                    failures.append((i, kind, rejected))
+        invalid = np.zeros(len(rows), dtype=bool)
+        for _, _, rejected in failures:
+            invalid |= rejected
+
+        # Duplicados: resumen de 128 bits por fila y fila de la primera aparición
+        duplicate = np.zeros(len(rows), dtype=bool)
+        first_rows = np.zeros(len(rows), dtype=np.int64)
+        keys = rows if plan.positional else cells.tolist()
+        if missing.any():
+            keys = cells.tolist()
+            for index in np.flatnonzero(missing.any(axis=1)):
+                keys[index] = [None if gap else value for gap, value in zip(missing[index], keys[index])]
+        # La fila truncada no se registra: tampoco puede aparecer como duplicado
+        # al resolver las filas volcadas a disco
+        for index in range(len(keys) - 1 if truncated else len(keys)):
+            first_row = row_index.add_digest(row_digest(keys[index]), first_row_num + index)
+            if first_row is not None:
+                duplicate[index] = True
+                first_rows[index] = first_row
+
+        if truncated:
+            invalid[-1] = False
+
+        flagged = empty.any(axis=1) | duplicate | invalid
+        for index in np.flatnonzero(flagged):
+            row_num = first_row_num + int(index)
+            for i in np.flatnonzero(empty[index]):
+                yield ("empty_value", row_num, columns[i].name, None)
+            if duplicate[index]:
+                yield ("duplicate", row_num, None, int(first_rows[index]))
+            if invalid[index]:
+                for i, kind, rejected in failures:
+                    if rejected[index]:
+                        yield (kind, row_num, columns[i].name, cells[index, i])
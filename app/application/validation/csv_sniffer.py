@@ -0,0 +1,191 @@
+"""
+Detección de codificación y delimitador de archivos CSV.
+
+Examina solo el primer bloque del flujo para deducir la codificación
+(UTF-8 con o sin BOM, CP1252 o Latin-1) y el delimitador (coma, punto y
+coma, tabulador o barra vertical). El bloque examinado se devuelve al
+flujo, de modo que la validación sigue leyendo de forma incremental sin
+copias del contenido completo.
+"""
+
+import codecs
+import csv
+import io
+from typing import BinaryIO, NamedTuple, Optional, Tuple
+
+# Bytes examinados para la detección (64 KB)
+SNIFF_BYTES = 64 * 1024
+
+# Delimitadores candidatos, en orden de preferencia ante empates
+DELIMITERS = (",", ";", "\t", "|")
+
+# Filas examinadas para deducir el delimitador
+_SNIFF_ROWS = 50
+
+
+class CSVDialect(NamedTuple):
+    """
+    Codificación y delimitador de un archivo CSV.
+
+    Attributes:
+        encoding: Codificación del contenido
+        delimiter: Delimitador de campos
+    """
+    encoding: str
+    delimiter: str
+
+
+class _PrefixedStream:
+    """
+    Flujo que devuelve primero un bloque ya leído y después el resto del flujo original.
+    """
+
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        """
+        Inicializa el flujo.
+
+        Args:
+            prefix: Bytes ya leídos del flujo original
+            stream: Flujo original, posicionado tras el prefijo
+        """
+        self.prefix = prefix
+        self.stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lee hasta size bytes.
+
+        Args:
+            size: Número máximo de bytes a leer (-1 para todo)
+
+        Returns:
+            bytes: Bytes leídos (vacío al final del flujo)
+        """
+        if not self.prefix:
+            return self.stream.read(size)
+        if size < 0:
+            data = self.prefix + self.stream.read()
+            self.prefix = b""
+            return data
+        data = self.prefix[:size]
+        self.prefix = self.prefix[size:]
+        return data
+
+
+def detect_encoding(sample: bytes, final: bool = True) -> str:
+    """
+    Deduce la codificación de un bloque inicial de bytes.
+
+    Args:
+        sample: Primeros bytes del archivo
+        final: True si el bloque es el archivo completo
+
+    Returns:
+        str: utf-8-sig, utf-8, cp1252 o latin-1
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.isascii():
+        return "utf-8"
+    try:
+        # El bloque puede terminar a mitad de un carácter multibyte
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=final)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    try:
+        sample.decode("cp1252")
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def detect_delimiter(text: str) -> str:
+    """
+    Deduce el delimitador a partir de las primeras líneas de texto.
+
+    Se elige el candidato con el que más filas tienen el mismo número de
+    campos que el encabezado, y ante empate el de más columnas.
+
+    Args:
+        text: Texto inicial del archivo
+
+    Returns:
+        str: Delimitador deducido (coma por defecto)
+    """
+    best = ","
+    best_score = (0.0, 1)
+    for delimiter in DELIMITERS:
+        widths = []
+        try:
+            for row in csv.reader(io.StringIO(text), delimiter=delimiter):
+                if row:
+                    widths.append(len(row))
+                    if len(widths) >= _SNIFF_ROWS:
+                        break
+        except csv.Error:
+            pass
+        if not widths or widths[0] < 2:
+            continue
+        score = (sum(1 for width in widths if width == widths[0]) / len(widths), widths[0])
+        if score > best_score:
+            best, best_score = delimiter, score
+    return best
+
+
+def detect_dialect(
+    sample: bytes,
+    final: bool = True,
+    encoding: Optional[str] = None,
+    delimiter: Optional[str] = None
+) -> CSVDialect:
+    """
+    Deduce la codificación y el delimitador de un bloque inicial de bytes.
+
+    Args:
+        sample: Primeros bytes del archivo
+        final: True si el bloque es el archivo completo
+        encoding: Codificación fija (None para deducirla)
+        delimiter: Delimitador fijo (None para deducirlo)
+
+    Returns:
+        CSVDialect: Codificación y delimitador del archivo
+    """
+    encoding = encoding or detect_encoding(sample, final)
+    if delimiter is None:
+        text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample, final=final)
+        if not final:
+            # Descartar la última línea, posiblemente incompleta
+            text = text[:text.rfind("\n") + 1]
+        delimiter = detect_delimiter(text)
+    return CSVDialect(encoding, delimiter)
+
+
+def sniff_stream(
+    stream: BinaryIO,
+    encoding: Optional[str] = None,
+    delimiter: Optional[str] = None,
+    sample_bytes: int = SNIFF_BYTES
+) -> Tuple[BinaryIO, CSVDialect]:
+    """
+    Deduce el dialecto de un flujo leyendo solo su primer bloque.
+
+    Args:
+        stream: Flujo binario con el contenido del CSV
+        encoding: Codificación fija (None para deducirla)
+        delimiter: Delimitador fijo (None para deducirlo)
+        sample_bytes: Bytes a examinar
+
+    Returns:
+        Tuple[BinaryIO, CSVDialect]: Flujo equivalente al original (con el bloque
+                                     examinado devuelto) y dialecto deducido
+    """
+    if encoding is not None and delimiter is not None:
+        return stream, CSVDialect(encoding, delimiter)
+    sample = stream.read(sample_bytes)
+    dialect = detect_dialect(sample, len(sample) < sample_bytes, encoding, delimiter)
+    if dialect.encoding == "utf-8-sig" and sample.startswith(codecs.BOM_UTF8):
+        # Sin el BOM, el resto del flujo es UTF-8 y admite la vía rápida ASCII
+        sample = sample[len(codecs.BOM_UTF8):]
+        dialect = CSVDialect("utf-8", dialect.delimiter)
+    return _PrefixedStream(sample, stream), dialect
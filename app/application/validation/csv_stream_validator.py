@@ -0,0 +1,455 @@
+"""
+Validador de CSV en streaming.
+
+Lee las filas de un flujo de bytes de forma incremental y emite
+las validaciones encontradas a medida que avanza, con un uso de
+memoria acotado por el tamaño de bloque de lectura.
+"""
+
+import codecs
+import csv
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.application.validation.validation_plan import ValidationPlan
+from app.application.validation.row_digest_store import DEFAULT_MEMORY_BYTES, RowDigestStore
+from app.application.validation.schema_profiles import SchemaProfile
+from app.application.validation.csv_sniffer import sniff_stream
+
+# Tamaño de bloque de lectura por defecto (1 MB)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Codificaciones en las que un bloque ASCII se decodifica sin cambios
+_ASCII_COMPATIBLE = {"ascii", "utf-8", "cp1252", "iso8859-1", "iso8859-15"}
+
+# Separadores de línea ASCII de str.splitlines distintos de '\n' y '\r'
+_OTHER_LINE_BREAKS = ("\x0b", "\x0c", "\x1c", "\x1d", "\x1e")
+
+# Mensajes de las comprobaciones de valor por tipo de validación
+VALUE_MESSAGES = {
+    "invalid_type": "Valor no numérico",
+    "invalid_integer": "Valor no entero",
+    "invalid_date": "Fecha inválida",
+    "invalid_enum": "Valor no permitido",
+    "invalid_format": "Valor con formato inválido",
+}
+
+# Incidencia de validación compacta: (tipo, fila, columna, valor). En los
+# duplicados el valor es la fila de la primera aparición.
+Issue = Tuple[str, int, Optional[str], Any]
+
+
+def _splits_like_newline(text: str) -> bool:
+    """
+    Indica si str.splitlines separa un texto igual que '\\n'.
+
+    Se cumple en texto ASCII sin más separadores de línea que '\\n' y
+    '\\r\\n' (splitlines mantiene '\\r\\n' unido, como el corte por '\\n').
+
+    Args:
+        text: Texto a comprobar
+
+    Returns:
+        bool: True si puede usarse splitlines
+    """
+    if not text.isascii():
+        return False
+    for separator in _OTHER_LINE_BREAKS:
+        if separator in text:
+            return False
+    return text.count("\r") == text.count("\r\n")
+
+
+def iter_text_lines(
+    stream: BinaryIO,
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Decodifica un flujo de bytes por bloques y produce sus líneas.
+
+    Las líneas se separan únicamente por '\\n' y conservan el salto de
+    línea, igual que al iterar un io.StringIO, de modo que csv.reader
+    pueda reconstruir los campos entrecomillados que contienen saltos.
+
+    Los bloques ASCII siguen una vía rápida: se decodifican sin el
+    decodificador incremental y se parten en líneas con splitlines.
+
+    Args:
+        stream: Flujo binario con método read(n) (UploadFile, cuerpo de S3...)
+        encoding: Codificación del contenido
+        chunk_size: Tamaño en bytes de cada lectura
+
+    Yields:
+        str: Cada línea de texto del flujo
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    ascii_compatible = codecs.lookup(encoding).name in _ASCII_COMPATIBLE
+    pending = ""
+
+    while True:
+        chunk = stream.read(chunk_size)
+        final = not chunk
+        if ascii_compatible and chunk and chunk.isascii() and not decoder.getstate()[0]:
+            # Vía rápida: un bloque ASCII se decodifica igual en estas codificaciones
+            text = pending + chunk.decode("ascii")
+        else:
+            text = pending + decoder.decode(chunk or b"", final=final)
+
+        if _splits_like_newline(text):
+            lines = text.splitlines(True)
+            pending = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+            yield from lines
+        else:
+            start = 0
+            end = text.find("\n")
+            while end != -1:
+                yield text[start:end + 1]
+                start = end + 1
+                end = text.find("\n", start)
+            pending = text[start:]
+
+        if final:
+            break
+
+    if pending:
+        yield pending
+
+
+def build_finding(
+    kind: str,
+    row_num: int,
+    column: Optional[str] = None,
+    value: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Construye el diccionario de una validación a partir de una incidencia.
+
+    Args:
+        kind: Tipo de validación (empty_value, duplicate, missing_column o
+              una comprobación de valor de VALUE_MESSAGES)
+        row_num: Número de fila en el archivo
+        column: Nombre de columna (si aplica)
+        value: Valor inválido, o fila de la primera aparición en los duplicados
+
+    Returns:
+        Dict[str, Any]: Validación con su mensaje descriptivo
+    """
+    if kind == "empty_value":
+        return {
+            "type": "empty_value",
+            "row": row_num,
+            "column": column,
+            "message": f"Valor vacío en fila {row_num}, columna {column}"
+        }
+    if kind == "duplicate":
+        return {
+            "type": "duplicate",
+            "row": row_num,
+            "first_row": value,
+            "message": f"Fila duplicada en la línea {row_num}"
+        }
+    if kind == "missing_column":
+        return {
+            "type": "missing_column",
+            "row": row_num,
+            "column": column,
+            "message": f"Falta la columna obligatoria {column}"
+        }
+    label = VALUE_MESSAGES.get(kind, VALUE_MESSAGES["invalid_type"])
+    return {
+        "type": kind,
+        "row": row_num,
+        "column": column,
+        "message": f"{label} en fila {row_num}, columna {column}: {value}"
+    }
+
+
+def header_issues(plan: ValidationPlan) -> List[Issue]:
+    """
+    Obtiene las incidencias del encabezado (columnas obligatorias ausentes).
+
+    Args:
+        plan: Plan de validación compilado
+
+    Returns:
+        List[Issue]: Incidencias de la fila 1 (encabezado)
+    """
+    return [("missing_column", 1, name, None) for name in plan.missing_columns]
+
+
+def build_parse_error(error: Any) -> Dict[str, Any]:
+    """
+    Construye la validación de error de parseo.
+
+    Args:
+        error: Excepción o descripción del error
+
+    Returns:
+        Dict[str, Any]: Validación de tipo parse_error
+    """
+    return {
+        "type": "parse_error",
+        "message": f"Error al procesar el archivo CSV: {str(error)}"
+    }
+
+
+class RowLengthError(ValueError):
+    """
+    Error de una fila con más columnas que el encabezado.
+    """
+
+    def __init__(self, row_num: int):
+        """
+        Inicializa el error.
+
+        Args:
+            row_num: Número de fila con columnas de más
+        """
+        super().__init__(f"la fila {row_num} tiene más columnas que el encabezado")
+        self.row_num = row_num
+
+
+def merge_duplicate_issues(
+    issues: Sequence[Issue],
+    duplicates: Sequence[Tuple[int, int]]
+) -> List[Issue]:
+    """
+    Inserta incidencias de duplicado en una lista ordenada de incidencias.
+
+    Cada duplicado se coloca tras los valores vacíos de su fila y antes de
+    sus errores de tipo, igual que en la validación fila a fila.
+
+    Args:
+        issues: Incidencias ordenadas por fila
+        duplicates: Pares (fila, fila de la primera aparición) ordenados por fila
+
+    Returns:
+        List[Issue]: Incidencias combinadas en orden
+    """
+    merged: List[Issue] = []
+    pending = iter(duplicates)
+    duplicate = next(pending, None)
+    for issue in issues:
+        while duplicate is not None and (
+            issue[1] > duplicate[0] or (issue[1] == duplicate[0] and issue[0] != "empty_value")
+        ):
+            merged.append(("duplicate", duplicate[0], None, duplicate[1]))
+            duplicate = next(pending, None)
+        merged.append(issue)
+    while duplicate is not None:
+        merged.append(("duplicate", duplicate[0], None, duplicate[1]))
+        duplicate = next(pending, None)
+    return merged
+
+
+class CSVStreamValidator:
+    """
+    Validador de contenido CSV que procesa el archivo fila a fila.
+
+    Aplica las mismas validaciones que el procesamiento en memoria:
+    - empty_value: valores vacíos
+    - duplicate: filas duplicadas
+    - invalid_type: valores no numéricos en columnas numéricas
+    - parse_error: errores al decodificar o interpretar el CSV
+    """
+
+    def __init__(
+        self,
+        encoding: Optional[str] = "utf-8",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        duplicate_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        duplicate_spill_dir: Optional[str] = None,
+        profile: Optional[SchemaProfile] = None,
+        delimiter: Optional[str] = ","
+    ):
+        """
+        Inicializa el validador.
+
+        Args:
+            encoding: Codificación del contenido (None para deducirla del primer bloque)
+            chunk_size: Tamaño en bytes de cada lectura del flujo
+            duplicate_memory_bytes: Memoria para los resúmenes de fila antes de volcar a disco
+            duplicate_spill_dir: Directorio para el volcado a disco (por defecto el temporal)
+            profile: Perfil de esquema a aplicar (por defecto, columnas numéricas por palabra clave)
+            delimiter: Delimitador de campos (None para deducirlo del primer bloque)
+        """
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.duplicate_memory_bytes = duplicate_memory_bytes
+        self.duplicate_spill_dir = duplicate_spill_dir
+        self.profile = profile
+        self.delimiter = delimiter
+
+    def validate(self, stream: BinaryIO) -> List[Dict[str, Any]]:
+        """
+        Valida un flujo CSV completo.
+
+        Los duplicados resueltos tras volcar resúmenes a disco se colocan
+        en su fila, de modo que la lista queda siempre en orden de fila.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+
+        Returns:
+            List[Dict[str, Any]]: Lista de validaciones encontradas.
+                                 Lista vacía si no hay errores.
+        """
+        issues: List[Issue] = []
+        error = None
+        with self.create_row_index() as row_index:
+            try:
+                for issue in self._iter_stream_issues(stream, row_index):
+                    issues.append(issue)
+            except Exception as e:
+                error = e
+            if row_index.spilled:
+                issues = merge_duplicate_issues(issues, row_index.spilled_duplicates())
+
+        validations = [build_finding(*issue) for issue in issues]
+        if error is not None:
+            validations.append(build_parse_error(error))
+        return validations
+
+    def iter_findings(self, stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """
+        Valida un flujo CSV emitiendo las validaciones a medida que se encuentran.
+
+        Si los resúmenes de fila se vuelcan a disco, los duplicados entre
+        filas volcadas se emiten al final, antes del error de parseo.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+
+        Yields:
+            Dict[str, Any]: Cada validación encontrada
+        """
+        error = None
+        with self.create_row_index() as row_index:
+            try:
+                for issue in self._iter_stream_issues(stream, row_index):
+                    yield build_finding(*issue)
+            except Exception as e:
+                error = e
+            for row_num, first_row in row_index.spilled_duplicates():
+                yield build_finding("duplicate", row_num, None, first_row)
+        if error is not None:
+            yield build_parse_error(error)
+
+    def create_row_index(self) -> RowDigestStore:
+        """
+        Crea el índice de filas para la detección de duplicados de una validación.
+
+        Returns:
+            RowDigestStore: Almacén de resúmenes con el presupuesto configurado
+        """
+        return RowDigestStore(self.duplicate_memory_bytes, self.duplicate_spill_dir)
+
+    def compile_plan(self, header: List[str]) -> ValidationPlan:
+        """
+        Compila el plan de validación para el encabezado del archivo.
+
+        Args:
+            header: Nombres de columna del CSV
+
+        Returns:
+            ValidationPlan: Plan de validación compilado
+        """
+        if self.profile is not None:
+            return self.profile.compile_plan(header)
+        return ValidationPlan.compile(header)
+
+    def _iter_stream_issues(self, stream: BinaryIO, row_index: RowDigestStore) -> Iterator[Issue]:
+        """
+        Lee el encabezado y las filas de un flujo produciendo incidencias compactas.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+            row_index: Índice de filas vistas para detectar duplicados
+
+        Yields:
+            Issue: Cada incidencia encontrada, en orden de fila
+        """
+        stream, dialect = sniff_stream(stream, self.encoding, self.delimiter)
+        csv_reader = csv.reader(
+            iter_text_lines(stream, dialect.encoding, self.chunk_size), delimiter=dialect.delimiter
+        )
+        header = next(csv_reader, None)
+        if header is None:
+            return
+        plan = self.compile_plan(header)
+        yield from header_issues(plan)
+        yield from self.iter_issues(csv_reader, plan, row_index)
+
+    def iter_issues(
+        self,
+        rows: Iterable[List[str]],
+        plan: ValidationPlan,
+        row_index: RowDigestStore,
+        first_row_num: int = 2
+    ) -> Iterator[Issue]:
+        """
+        Valida una secuencia de filas produciendo incidencias compactas.
+
+        Las filas en blanco se omiten y no cuentan para la numeración,
+        igual que con csv.DictReader.
+
+        Args:
+            rows: Filas leídas con csv.reader (sin el encabezado)
+            plan: Plan de validación compilado
+            row_index: Índice de filas vistas para detectar duplicados
+            first_row_num: Número de la primera fila (2 = después del header)
+
+        Yields:
+            Issue: Cada incidencia encontrada, en orden de fila
+
+        Raises:
+            RowLengthError: Si una fila tiene más columnas que el encabezado
+        """
+        row_num = first_row_num
+        for row in rows:
+            if row:
+                yield from self._validate_row(row_num, row, plan, row_index)
+                row_num += 1
+
+    def _validate_row(
+        self,
+        row_num: int,
+        row: List[str],
+        plan: ValidationPlan,
+        row_index: RowDigestStore
+    ) -> Iterator[Issue]:
+        """
+        Aplica a una fila las comprobaciones del plan.
+
+        Args:
+            row_num: Número de fila en el archivo
+            row: Valores de la fila
+            plan: Plan de validación compilado
+            row_index: Índice de filas vistas para detectar duplicados
+
+        Yields:
+            Issue: Incidencias encontradas en la fila
+        """
+        size = len(row)
+
+        # Validar valores vacíos
+        for rule in plan.columns:
+            if rule.check_empty:
+                value = row[rule.position] if rule.position < size else None
+                if not value or value.isspace():
+                    yield ("empty_value", row_num, rule.name, None)
+        if size > plan.width:
+            raise RowLengthError(row_num)
+
+        # Validar duplicados
+        first_row = row_index.add(plan.row_key(row), row_num)
+        if first_row is not None:
+            yield ("duplicate", row_num, None, first_row)
+
+        # Validar tipos de datos
+        for rule in plan.typed_columns:
+            value = row[rule.position] if rule.position < size else None
+            if value and not value.isspace():
+                for kind, check in rule.checks:
+                    if not check(value):
+                        yield (kind, row_num, rule.name, value)
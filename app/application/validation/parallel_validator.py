@@ -0,0 +1,557 @@
+"""
+Validador de CSV en paralelo.
+
+Vuelca el archivo a un fichero temporal, lo recorre mediante mmap para
+partirlo en bloques que terminan en límites de fila seguros (respetando
+los saltos de línea entre comillas) y valida cada bloque en un
+ProcessPoolExecutor. Los resultados parciales se combinan, incluida la
+detección de duplicados entre bloques, en la misma lista ordenada de
+validaciones que produce la validación secuencial.
+"""
+
+import codecs
+import copy
+import csv
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.application.validation.validation_plan import ValidationPlan
+from app.application.validation.row_digest_store import RowDigestStore
+from app.application.validation.csv_sniffer import SNIFF_BYTES, detect_dialect
+from app.application.validation.csv_stream_validator import (
+    CSVStreamValidator,
+    Issue,
+    RowLengthError,
+    build_finding,
+    build_parse_error,
+    header_issues,
+    iter_text_lines,
+    merge_duplicate_issues,
+)
+
+# Tamaño de bloque para contar comillas sobre el mmap (4 MB)
+_SCAN_BLOCK = 4 * 1024 * 1024
+
+# Tamaño mínimo de cada bloque de validación (8 MB)
+MIN_SEGMENT_BYTES = 8 * 1024 * 1024
+
+# Línea centinela para comprobar que un bloque no termina dentro de un campo entrecomillado
+_SENTINEL = "\x00\x00fin-de-bloque\x00\x00"
+
+
+class SegmentResult(NamedTuple):
+    """
+    Resultado de validar un bloque del archivo.
+
+    Attributes:
+        row_count: Número de filas (no en blanco) del bloque
+        issues: Incidencias con números de fila locales (desde 0)
+        digests: Resúmenes concatenados de las filas no duplicadas del bloque
+        first_rows: Fila local de cada resumen de digests
+        error: Mensaje de error de parseo, si lo hubo
+        error_row: Fila local con columnas de más, si ese fue el error
+        aligned: False si el bloque terminó dentro de un campo entrecomillado
+    """
+    row_count: int
+    issues: List[Issue]
+    digests: bytes
+    first_rows: array
+    error: Optional[str]
+    error_row: Optional[int]
+    aligned: bool
+
+
+class _MmapRangeReader:
+    """
+    Lector de un rango de bytes de un mmap con interfaz read(n).
+    """
+
+    def __init__(self, buffer: mmap.mmap, start: int, end: int):
+        """
+        Inicializa el lector.
+
+        Args:
+            buffer: Archivo mapeado en memoria
+            start: Posición inicial del rango
+            end: Posición final (exclusiva) del rango
+        """
+        self.buffer = buffer
+        self.position = start
+        self.end = end
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lee hasta size bytes del rango.
+
+        Args:
+            size: Número máximo de bytes a leer (-1 para todo)
+
+        Returns:
+            bytes: Bytes leídos (vacío al final del rango)
+        """
+        stop = self.end if size < 0 else min(self.end, self.position + size)
+        data = self.buffer[self.position:stop]
+        self.position = stop
+        return data
+
+
+class _SegmentRowIndex(RowDigestStore):
+    """
+    Índice de filas de un bloque que guarda el resumen y la fila local
+    de cada fila no duplicada, para cruzarlos después con el resto de bloques.
+
+    Las filas volcadas a disco también se exportan, de modo que sus
+    duplicados se resuelven en el proceso principal.
+    """
+
+    def __init__(self, memory_bytes: int, spill_dir: Optional[str] = None):
+        """
+        Inicializa el índice vacío.
+
+        Args:
+            memory_bytes: Presupuesto de memoria antes de volcar a disco
+            spill_dir: Directorio para las particiones en disco
+        """
+        super().__init__(memory_bytes, spill_dir)
+        self.digests = bytearray()
+        self.unique_rows = array("q")
+        self.row_count = 0
+
+    def add_digest(self, digest: bytes, row_num: int) -> Optional[int]:
+        """
+        Registra el resumen de una fila en el índice.
+
+        Args:
+            digest: Resumen de 16 bytes de la fila
+            row_num: Número de fila local
+
+        Returns:
+            Optional[int]: Fila local de la primera aparición si la fila ya se
+                           había visto en el bloque, None en caso contrario
+        """
+        self.row_count += 1
+        first_row = super().add_digest(digest, row_num)
+        if first_row is None:
+            self.digests += digest
+            self.unique_rows.append(row_num)
+        return first_row
+
+
+def _count_quotes(buffer: mmap.mmap, start: int, end: int) -> int:
+    """
+    Cuenta las comillas dobles de un rango del mmap por bloques.
+
+    Args:
+        buffer: Archivo mapeado en memoria
+        start: Posición inicial
+        end: Posición final (exclusiva)
+
+    Returns:
+        int: Número de comillas en el rango
+    """
+    total = 0
+    for position in range(start, end, _SCAN_BLOCK):
+        total += buffer[position:min(end, position + _SCAN_BLOCK)].count(b'"')
+    return total
+
+
+def _next_boundary(buffer: mmap.mmap, start: int, target: int) -> Optional[int]:
+    """
+    Busca el primer fin de línea a partir de target que queda fuera de comillas.
+
+    Se considera fuera de comillas cuando el número de comillas desde start
+    (un límite de fila) es par. El resultado es un candidato; su validez se
+    confirma al validar el bloque anterior.
+
+    Args:
+        buffer: Archivo mapeado en memoria
+        start: Inicio del bloque actual (límite de fila)
+        target: Posición a partir de la que buscar
+
+    Returns:
+        Optional[int]: Posición siguiente al salto de línea, None si no hay más
+    """
+    parity = _count_quotes(buffer, start, target) % 2
+    position = target
+    while True:
+        newline = buffer.find(b"\n", position)
+        if newline == -1:
+            return None
+        parity = (parity + _count_quotes(buffer, position, newline)) % 2
+        if parity == 0:
+            return newline + 1
+        position = newline + 1
+
+
+def find_segments(buffer: mmap.mmap, start: int, segment_bytes: int) -> List[Tuple[int, int]]:
+    """
+    Divide el contenido del mmap en bloques que terminan en límites de fila.
+
+    Args:
+        buffer: Archivo mapeado en memoria
+        start: Posición donde empiezan los datos (después del encabezado)
+        segment_bytes: Tamaño aproximado de cada bloque
+
+    Returns:
+        List[Tuple[int, int]]: Rangos (inicio, fin) de cada bloque
+    """
+    size = len(buffer)
+    segments = []
+    while start < size:
+        end = None
+        if start + segment_bytes < size:
+            end = _next_boundary(buffer, start, start + segment_bytes)
+        end = end or size
+        segments.append((start, end))
+        start = end
+    return segments
+
+
+def _validate_segment(
+    validator: CSVStreamValidator,
+    path: str,
+    plan: ValidationPlan,
+    start: int,
+    end: int,
+    last: bool
+) -> SegmentResult:
+    """
+    Valida un bloque del archivo en un proceso de trabajo.
+
+    Args:
+        validator: Validador fila a fila a aplicar
+        path: Ruta del archivo temporal
+        plan: Plan de validación compilado a partir del encabezado
+        start: Posición inicial del bloque
+        end: Posición final (exclusiva) del bloque
+        last: True si es el último bloque del archivo
+
+    Returns:
+        SegmentResult: Resultado parcial del bloque
+    """
+    row_index = _SegmentRowIndex(validator.duplicate_memory_bytes, validator.duplicate_spill_dir)
+    issues: List[Issue] = []
+    error = None
+    error_row = None
+    aligned = True
+
+    with open(path, "rb") as spool, mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        lines = iter_text_lines(_MmapRangeReader(buffer, start, end), validator.encoding, validator.chunk_size)
+        if not last:
+            lines = _with_sentinel(lines)
+        reader = csv.reader(lines, delimiter=validator.delimiter)
+        try:
+            for issue in validator.iter_issues(_until_sentinel(reader, last), plan, row_index, 0):
+                issues.append(issue)
+        except _Misaligned:
+            aligned = False
+        except RowLengthError as e:
+            error, error_row = str(e), e.row_num
+        except Exception as e:
+            error = str(e)
+        finally:
+            row_index.close()
+
+    return SegmentResult(
+        row_index.row_count, issues, bytes(row_index.digests), row_index.unique_rows, error, error_row, aligned
+    )
+
+
+class _Misaligned(Exception):
+    """El bloque terminó dentro de un campo entrecomillado."""
+
+
+def _with_sentinel(lines: Iterator[str]) -> Iterator[str]:
+    """
+    Añade una línea centinela al final de las líneas de un bloque.
+
+    Args:
+        lines: Líneas del bloque
+
+    Yields:
+        str: Las líneas del bloque seguidas del centinela
+    """
+    last = "\n"
+    for line in lines:
+        last = line
+        yield line
+    if not last.endswith("\n"):
+        yield "\n"
+    yield _SENTINEL + "\n"
+
+
+def _until_sentinel(reader: Iterator[List[str]], last: bool) -> Iterator[List[str]]:
+    """
+    Produce las filas de un bloque comprobando que el centinela quedó aislado.
+
+    Args:
+        reader: Lector csv sobre las líneas del bloque con centinela
+        last: True si el bloque es el último (no lleva centinela)
+
+    Yields:
+        List[str]: Cada fila del bloque
+
+    Raises:
+        _Misaligned: Si el centinela quedó absorbido por un campo entrecomillado
+    """
+    if last:
+        yield from reader
+        return
+
+    previous = None
+    for row in reader:
+        if previous is not None:
+            yield previous
+        previous = row
+    if previous != [_SENTINEL]:
+        raise _Misaligned()
+
+
+class ParallelCSVValidator:
+    """
+    Validador de contenido CSV que reparte los archivos grandes entre varios procesos.
+
+    Los archivos por debajo del tamaño mínimo, o con comillas que impiden
+    partirlos con seguridad, se validan de forma secuencial.
+    """
+
+    def __init__(
+        self,
+        validator: Optional[CSVStreamValidator] = None,
+        workers: int = 0,
+        min_bytes: int = 64 * 1024 * 1024,
+        segment_bytes: Optional[int] = None
+    ):
+        """
+        Inicializa el validador.
+
+        Args:
+            validator: Validador fila a fila que se ejecuta en cada bloque
+            workers: Número de procesos (0 = número de CPUs)
+            min_bytes: Tamaño mínimo del archivo para validar en paralelo
+            segment_bytes: Tamaño de cada bloque (por defecto se reparte
+                           el archivo en cuatro bloques por proceso)
+        """
+        self.validator = validator or CSVStreamValidator()
+        self.workers = workers or os.cpu_count() or 1
+        self.min_bytes = min_bytes
+        self.segment_bytes = segment_bytes
+
+    def validate(self, stream: BinaryIO) -> List[Dict[str, Any]]:
+        """
+        Valida un flujo CSV completo.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+
+        Returns:
+            List[Dict[str, Any]]: Lista de validaciones encontradas.
+                                 Lista vacía si no hay errores.
+        """
+        size = _remaining_size(stream)
+        if self.workers <= 1 or (size is not None and size < self.min_bytes):
+            return self.validator.validate(stream)
+
+        with tempfile.NamedTemporaryFile(prefix="csv_", suffix=".spool") as spool:
+            shutil.copyfileobj(stream, spool, self.validator.chunk_size)
+            spool.flush()
+            if spool.tell() < self.min_bytes or spool.tell() == 0:
+                spool.seek(0)
+                return self.validator.validate(spool)
+
+            validations = self._validate_spool(spool.name)
+            if validations is None:
+                spool.seek(0)
+                return self.validator.validate(spool)
+            return validations
+
+    def iter_findings(self, stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """
+        Valida un flujo CSV emitiendo las validaciones.
+
+        Los archivos que se validan de forma secuencial se procesan bajo
+        demanda; los que se reparten entre procesos se validan completos
+        antes de emitir la primera validación.
+
+        Args:
+            stream: Flujo binario con el contenido del CSV
+
+        Yields:
+            Dict[str, Any]: Cada validación encontrada
+        """
+        size = _remaining_size(stream)
+        if self.workers <= 1 or (size is not None and size < self.min_bytes):
+            yield from self.validator.iter_findings(stream)
+            return
+        yield from self.validate(stream)
+
+    def _validate_spool(self, path: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Valida en paralelo un archivo volcado a disco.
+
+        Args:
+            path: Ruta del archivo temporal
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Validaciones encontradas, o None si el
+                                            archivo no pudo partirse con seguridad
+        """
+        with open(path, "rb") as spool, mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            # Dialecto deducido una sola vez; los procesos reciben un validador con
+            # la codificación y el delimitador ya resueltos
+            validator = copy.copy(self.validator)
+            encoding, validator.delimiter = detect_dialect(
+                buffer[:SNIFF_BYTES], len(buffer) < SNIFF_BYTES, validator.encoding, validator.delimiter
+            )
+            header_start = 0
+            if encoding == "utf-8-sig":
+                encoding = "utf-8"
+                if buffer[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                    header_start = len(codecs.BOM_UTF8)
+            validator.encoding = encoding
+
+            header_end = _next_boundary(buffer, header_start, header_start) or len(buffer)
+            try:
+                header, aligned = self._read_header(buffer, validator, header_start, header_end)
+            except Exception as e:
+                return [build_parse_error(e)]
+            if not aligned:
+                return None
+            plan = validator.compile_plan(header)
+            segment_bytes = self.segment_bytes or max(
+                MIN_SEGMENT_BYTES, (len(buffer) - header_end) // (self.workers * 4) + 1
+            )
+            segments = find_segments(buffer, header_end, segment_bytes)
+
+        if not segments:
+            return []
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(segments))) as executor:
+            results = list(executor.map(
+                _validate_segment,
+                [validator] * len(segments),
+                [path] * len(segments),
+                [plan] * len(segments),
+                [start for start, _ in segments],
+                [end for _, end in segments],
+                [index == len(segments) - 1 for index in range(len(segments))]
+            ))
+
+        return self._merge(results, plan)
+
+    def _read_header(
+        self,
+        buffer: mmap.mmap,
+        validator: CSVStreamValidator,
+        header_start: int,
+        header_end: int
+    ) -> Tuple[List[str], bool]:
+        """
+        Lee el encabezado del archivo.
+
+        Args:
+            buffer: Archivo mapeado en memoria
+            validator: Validador con el dialecto del archivo resuelto
+            header_start: Posición donde empieza el encabezado (tras el BOM)
+            header_end: Posición siguiente al fin del encabezado
+
+        Returns:
+            Tuple[List[str], bool]: Columnas del encabezado y si el corte es seguro
+        """
+        lines = iter_text_lines(_MmapRangeReader(buffer, header_start, header_end), validator.encoding)
+        if header_end < len(buffer):
+            lines = _with_sentinel(lines)
+        reader = csv.reader(lines, delimiter=validator.delimiter)
+        try:
+            rows = list(_until_sentinel(reader, header_end >= len(buffer)))
+        except _Misaligned:
+            return [], False
+        return (rows[0] if rows else []), True
+
+    def _merge(self, results: List[SegmentResult], plan: ValidationPlan) -> Optional[List[Dict[str, Any]]]:
+        """
+        Combina los resultados de los bloques en una lista ordenada de validaciones.
+
+        Args:
+            results: Resultados de cada bloque, en orden
+            plan: Plan de validación compilado a partir del encabezado
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Validaciones combinadas, o None si algún
+                                            bloque no terminaba en un límite de fila
+        """
+        if not all(result.aligned for result in results):
+            return None
+
+        issues: List[Issue] = header_issues(plan)
+        error = None
+        base = 2  # Empezar en 2 (después del header)
+        with self.validator.create_row_index() as row_index:
+            for result in results:
+                # Duplicados entre bloques y primera aparición en el archivo de las
+                # filas del bloque que repiten una fila de un bloque anterior
+                duplicates = []
+                first_rows = {}
+                for index, local_row in enumerate(result.first_rows):
+                    digest = result.digests[index * 16:(index + 1) * 16]
+                    first_row = row_index.add_digest(digest, base + local_row)
+                    if first_row is not None:
+                        duplicates.append((local_row, first_row))
+                        first_rows[local_row] = first_row
+
+                # Los duplicados dentro del bloque apuntan a una fila local
+                segment_issues = [
+                    (kind, local_row, column, first_rows.get(value, base + value))
+                    if kind == "duplicate" else (kind, local_row, column, value)
+                    for kind, local_row, column, value in result.issues
+                ]
+                for kind, local_row, column, value in merge_duplicate_issues(segment_issues, duplicates):
+                    issues.append((kind, base + local_row, column, value))
+
+                if result.error_row is not None:
+                    error = RowLengthError(base + result.error_row)
+                    break
+                if result.error is not None:
+                    error = result.error
+                    break
+                base += result.row_count
+
+            if row_index.spilled:
+                # Una fila volcada puede ser a su vez la primera aparición local de
+                # un duplicado dentro de su bloque
+                spilled = row_index.spilled_duplicates()
+                first_rows = dict(spilled)
+                issues = merge_duplicate_issues([
+                    (kind, row, column, first_rows.get(value, value))
+                    if kind == "duplicate" else (kind, row, column, value)
+                    for kind, row, column, value in issues
+                ], spilled)
+
+        validations = [build_finding(*issue) for issue in issues]
+        if error is not None:
+            validations.append(build_parse_error(error))
+        return validations
+
+
+def _remaining_size(stream: BinaryIO) -> Optional[int]:
+    """
+    Calcula los bytes pendientes de leer de un flujo, si es posible.
+
+    Args:
+        stream: Flujo binario
+
+    Returns:
+        Optional[int]: Bytes restantes, o None si el flujo no admite seek
+    """
+    try:
+        position = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
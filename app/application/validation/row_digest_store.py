@@ -0,0 +1,193 @@
+"""
+Almacén de resúmenes de fila para la detección de duplicados.
+
+Guarda un resumen de 128 bits por fila distinta, junto con la fila de su
+primera aparición, en lugar de la tupla completa de valores. Cuando el
+almacén supera el presupuesto de memoria configurado, las filas nuevas se
+vuelcan a disco en particiones y los duplicados entre ellas se resuelven al
+final ordenando cada partición.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Memoria aproximada por entrada del almacén en memoria: bytes de 16 bytes,
+# entero de fila y entrada del diccionario
+ENTRY_BYTES = 130
+
+# Presupuesto de memoria por defecto (256 MB)
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+
+# Número de particiones en disco (por el primer byte del resumen)
+_PARTITIONS = 256
+
+# Registro en disco: resumen de 16 bytes + fila como entero de 8 bytes
+_RECORD = np.dtype([("high", ">u8"), ("low", ">u8"), ("row", "<i8")])
+
+
+def row_digest(values: Sequence[Optional[str]]) -> bytes:
+    """
+    Calcula el resumen de 128 bits de los valores de una fila.
+
+    Args:
+        values: Valores de la fila (None para los valores ausentes)
+
+    Returns:
+        bytes: Resumen BLAKE2b de 16 bytes
+    """
+    return hashlib.blake2b(repr(tuple(values)).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class RowDigestStore:
+    """
+    Índice de filas basado en resúmenes de 128 bits con volcado a disco.
+
+    Para cada duplicado informa la fila de la primera aparición. Las filas
+    registradas después de superar el presupuesto de memoria se resuelven
+    al final con spilled_duplicates().
+    """
+
+    def __init__(
+        self,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        spill_dir: Optional[str] = None
+    ):
+        """
+        Inicializa el almacén.
+
+        Args:
+            memory_bytes: Presupuesto de memoria antes de volcar a disco
+            spill_dir: Directorio para las particiones en disco (por defecto el temporal)
+        """
+        self.memory_bytes = memory_bytes
+        self.spill_dir = spill_dir
+        self.first_rows: Dict[bytes, int] = {}
+        self._capacity = max(1, memory_bytes // ENTRY_BYTES)
+        self._spill_path: Optional[str] = None
+        self._partitions: List[Optional[BinaryIO]] = []
+
+    @property
+    def spilled(self) -> bool:
+        """
+        Indica si el almacén ha empezado a volcar filas a disco.
+
+        Returns:
+            bool: True si hay filas en disco pendientes de resolver
+        """
+        return self._spill_path is not None
+
+    def add(self, row_key: Tuple[Optional[str], ...], row_num: int) -> Optional[int]:
+        """
+        Registra una fila en el almacén.
+
+        Args:
+            row_key: Valores de la fila
+            row_num: Número de fila
+
+        Returns:
+            Optional[int]: Fila de la primera aparición si la fila es un duplicado
+                           conocido, None en caso contrario
+        """
+        return self.add_digest(row_digest(row_key), row_num)
+
+    def add_digest(self, digest: bytes, row_num: int) -> Optional[int]:
+        """
+        Registra el resumen de una fila en el almacén.
+
+        Args:
+            digest: Resumen de 16 bytes de la fila
+            row_num: Número de fila
+
+        Returns:
+            Optional[int]: Fila de la primera aparición si la fila es un duplicado
+                           conocido, None en caso contrario
+        """
+        first_row = self.first_rows.get(digest)
+        if first_row is not None:
+            return first_row
+
+        if len(self.first_rows) < self._capacity:
+            self.first_rows[digest] = row_num
+        else:
+            self._spill(digest, row_num)
+        return None
+
+    def spilled_duplicates(self) -> List[Tuple[int, int]]:
+        """
+        Resuelve los duplicados entre las filas volcadas a disco.
+
+        Returns:
+            List[Tuple[int, int]]: Pares (fila, fila de la primera aparición)
+                                   ordenados por fila
+        """
+        if not self.spilled:
+            return []
+
+        duplicates = []
+        for index, partition in enumerate(self._partitions):
+            if partition is None:
+                continue
+            partition.flush()
+            records = np.fromfile(os.path.join(self._spill_path, f"{index:03d}.bin"), dtype=_RECORD)
+            if len(records) < 2:
+                continue
+            records = records[np.lexsort((records["row"], records["low"], records["high"]))]
+            same = (records["high"][1:] == records["high"][:-1]) & (records["low"][1:] == records["low"][:-1])
+            if not same.any():
+                continue
+            # Primera fila de cada grupo de resúmenes iguales
+            starts = np.concatenate(([True], ~same))
+            group_first = records["row"][np.flatnonzero(starts)][np.cumsum(starts) - 1]
+            repeated = np.flatnonzero(np.concatenate(([False], same)))
+            duplicates.append(np.stack((records["row"][repeated], group_first[repeated]), axis=1))
+
+        if not duplicates:
+            return []
+        pairs = np.concatenate(duplicates)
+        pairs = pairs[np.argsort(pairs[:, 0], kind="stable")]
+        return [(int(row), int(first)) for row, first in pairs]
+
+    def close(self) -> None:
+        """
+        Libera las particiones en disco.
+        """
+        for partition in self._partitions:
+            if partition is not None:
+                partition.close()
+        self._partitions = []
+        if self._spill_path is not None:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+            self._spill_path = None
+
+    def __enter__(self) -> "RowDigestStore":
+        """Permite usar el almacén como gestor de contexto."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Libera las particiones en disco al salir del contexto."""
+        self.close()
+
+    def _spill(self, digest: bytes, row_num: int) -> None:
+        """
+        Escribe el resumen de una fila en su partición en disco.
+
+        Args:
+            digest: Resumen de 16 bytes de la fila
+            row_num: Número de fila
+        """
+        if self._spill_path is None:
+            self._spill_path = tempfile.mkdtemp(prefix="csv_digests_", dir=self.spill_dir)
+            self._partitions = [None] * _PARTITIONS
+
+        index = digest[0]
+        partition = self._partitions[index]
+        if partition is None:
+            partition = open(os.path.join(self._spill_path, f"{index:03d}.bin"), "ab")
+            self._partitions[index] = partition
+        partition.write(digest + row_num.to_bytes(8, "little", signed=True))
+
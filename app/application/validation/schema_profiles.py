@@ -0,0 +1,357 @@
+"""
+Perfiles de esquema para la validación de CSV.
+
+Un perfil describe de forma declarativa (JSON) las columnas esperadas de
+un tipo de archivo: su tipo (number, integer, date, enum, regex, string),
+si son obligatorias y restricciones adicionales. Cada perfil se carga y
+compila una sola vez por versión; en cada carga solo se resuelven las
+posiciones de sus columnas en el encabezado del archivo.
+
+Ejemplo de perfil::
+
+    {
+        "name": "ventas",
+        "version": 1,
+        "extra_columns": "check_empty",
+        "columns": [
+            {"name": "fecha", "type": "date", "format": "%Y-%m-%d"},
+            {"name": "cantidad", "type": "integer"},
+            {"name": "estado", "type": "enum", "values": ["abierta", "cerrada"]},
+            {"name": "codigo", "type": "regex", "pattern": "[A-Z]{3}-\\\\d+"},
+            {"name": "notas", "type": "string", "required": false}
+        ]
+    }
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Sequence, Tuple
+
+from app.application.validation.validation_plan import ColumnRule, ValidationPlan, ValueCheck, is_number
+
+# Tipos de columna admitidos
+COLUMN_TYPES = ("string", "number", "integer", "date", "enum", "regex")
+
+# Tratamiento de las columnas del archivo que no describe el perfil
+EXTRA_COLUMN_MODES = ("check_empty", "ignore")
+
+# Formato de fecha por defecto
+DEFAULT_DATE_FORMAT = "%Y-%m-%d"
+
+# Máximo de planes compilados por perfil (uno por encabezado distinto)
+_MAX_CACHED_PLANS = 32
+
+# Nombres de perfil válidos (evita rutas fuera del directorio de perfiles)
+_PROFILE_NAME = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def is_integer(value: str) -> bool:
+    """
+    Indica si un valor es un número entero.
+
+    Args:
+        value: Valor a comprobar
+
+    Returns:
+        bool: True si el valor es entero
+    """
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
+def is_date(date_format: str, value: str) -> bool:
+    """
+    Indica si un valor es una fecha con el formato indicado.
+
+    Args:
+        date_format: Formato de fecha de strptime
+        value: Valor a comprobar
+
+    Returns:
+        bool: True si el valor es una fecha válida
+    """
+    try:
+        datetime.strptime(value.strip(), date_format)
+        return True
+    except ValueError:
+        return False
+
+
+def is_allowed(values: FrozenSet[str], value: str) -> bool:
+    """
+    Indica si un valor pertenece al conjunto de valores permitidos.
+
+    Args:
+        values: Valores permitidos
+        value: Valor a comprobar
+
+    Returns:
+        bool: True si el valor está permitido
+    """
+    return value.strip() in values
+
+
+def matches(pattern: Pattern, value: str) -> bool:
+    """
+    Indica si un valor completo cumple una expresión regular.
+
+    Args:
+        pattern: Expresión regular compilada
+        value: Valor a comprobar
+
+    Returns:
+        bool: True si el valor cumple la expresión
+    """
+    return pattern.fullmatch(value) is not None
+
+
+class ColumnSchema:
+    """
+    Definición compilada de una columna de un perfil.
+
+    Attributes:
+        name: Nombre de la columna
+        required: Si la columna debe existir y no admite valores vacíos
+        checks: Comprobaciones aplicadas a los valores no vacíos
+    """
+
+    def __init__(self, name: str, required: bool, checks: Tuple[ValueCheck, ...]):
+        """
+        Inicializa la definición de columna.
+
+        Args:
+            name: Nombre de la columna
+            required: Si la columna es obligatoria
+            checks: Comprobaciones de valor compiladas
+        """
+        self.name = name
+        self.required = required
+        self.checks = checks
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnSchema":
+        """
+        Compila la definición declarativa de una columna.
+
+        Args:
+            data: Definición de la columna (name, type, required, format, values, pattern)
+
+        Returns:
+            ColumnSchema: Columna compilada
+
+        Raises:
+            ValueError: Si la definición no es válida
+        """
+        name = data.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError("Cada columna debe tener un nombre")
+        column_type = data.get("type", "string")
+        if column_type not in COLUMN_TYPES:
+            raise ValueError(f"Tipo de columna inválido en {name}: {column_type}")
+
+        checks: List[ValueCheck] = []
+        if column_type == "number":
+            checks.append(("invalid_type", is_number))
+        elif column_type == "integer":
+            checks.append(("invalid_integer", is_integer))
+        elif column_type == "date":
+            checks.append(("invalid_date", partial(is_date, data.get("format", DEFAULT_DATE_FORMAT))))
+
+        if column_type == "enum" or "values" in data:
+            values = data.get("values")
+            if not values:
+                raise ValueError(f"La columna {name} debe indicar sus valores permitidos")
+            checks.append(("invalid_enum", partial(is_allowed, frozenset(str(value) for value in values))))
+
+        if column_type == "regex" or "pattern" in data:
+            pattern = data.get("pattern")
+            if not pattern:
+                raise ValueError(f"La columna {name} debe indicar su expresión regular")
+            try:
+                checks.append(("invalid_format", partial(matches, re.compile(pattern))))
+            except re.error as e:
+                raise ValueError(f"Expresión regular inválida en {name}: {e}")
+
+        return cls(name, bool(data.get("required", True)), tuple(checks))
+
+
+class SchemaProfile:
+    """
+    Perfil de esquema compilado.
+
+    Attributes:
+        name: Nombre del perfil
+        version: Versión del perfil
+        columns: Columnas descritas por el perfil, por nombre
+        extra_columns: Tratamiento de las columnas no descritas (check_empty o ignore)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        version: Any,
+        columns: Sequence[ColumnSchema],
+        extra_columns: str = "check_empty"
+    ):
+        """
+        Inicializa el perfil.
+
+        Args:
+            name: Nombre del perfil
+            version: Versión del perfil
+            columns: Columnas compiladas
+            extra_columns: Tratamiento de las columnas no descritas
+        """
+        self.name = name
+        self.version = version
+        self.columns = {column.name: column for column in columns}
+        self.extra_columns = extra_columns
+        self._plans: Dict[Tuple[str, ...], ValidationPlan] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], name: Optional[str] = None) -> "SchemaProfile":
+        """
+        Compila un perfil a partir de su definición declarativa.
+
+        Args:
+            data: Definición del perfil (name, version, extra_columns, columns)
+            name: Nombre del perfil si la definición no lo incluye
+
+        Returns:
+            SchemaProfile: Perfil compilado
+
+        Raises:
+            ValueError: Si la definición no es válida
+        """
+        extra_columns = data.get("extra_columns", "check_empty")
+        if extra_columns not in EXTRA_COLUMN_MODES:
+            raise ValueError(f"Valor de extra_columns inválido: {extra_columns}")
+        columns = data.get("columns")
+        if not isinstance(columns, list):
+            raise ValueError("El perfil debe definir una lista de columnas")
+        return cls(
+            name=data.get("name", name),
+            version=data.get("version", 1),
+            columns=[ColumnSchema.from_dict(column) for column in columns],
+            extra_columns=extra_columns
+        )
+
+    def compile_plan(self, header: Sequence[str]) -> ValidationPlan:
+        """
+        Resuelve el perfil sobre el encabezado de un archivo.
+
+        Los planes se guardan por encabezado, de modo que las cargas
+        sucesivas de un mismo feed reutilizan el plan compilado.
+
+        Args:
+            header: Nombres de columna del CSV
+
+        Returns:
+            ValidationPlan: Plan de validación con las columnas obligatorias ausentes
+        """
+        key = tuple(header)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        positions = {name: index for index, name in enumerate(header)}
+        rules = []
+        for name, position in positions.items():
+            column = self.columns.get(name)
+            if column is not None:
+                rules.append(ColumnRule(name, position, column.required, column.checks))
+            else:
+                rules.append(ColumnRule(name, position, self.extra_columns == "check_empty", ()))
+        missing = tuple(
+            column.name for column in self.columns.values()
+            if column.required and column.name not in positions
+        )
+
+        plan = ValidationPlan.from_rules(len(header), rules, missing)
+        if len(self._plans) >= _MAX_CACHED_PLANS:
+            self._plans.clear()
+        self._plans[key] = plan
+        return plan
+
+
+class SchemaRegistry:
+    """
+    Registro de perfiles de esquema almacenados como archivos JSON.
+
+    Cada perfil se lee de <directorio>/<nombre>.json la primera vez que se
+    solicita. Si el archivo cambia pero conserva la versión se mantiene el
+    perfil ya compilado; al cambiar la versión se vuelve a compilar.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Inicializa el registro.
+
+        Args:
+            directory: Directorio con los perfiles en formato JSON
+        """
+        self.directory = directory
+        self._profiles: Dict[str, Tuple[int, SchemaProfile]] = {}
+        self._lock = threading.Lock()
+
+    def names(self) -> List[str]:
+        """
+        Lista los perfiles disponibles.
+
+        Returns:
+            List[str]: Nombres de los perfiles del directorio
+        """
+        try:
+            entries = os.listdir(self.directory)
+        except OSError:
+            return []
+        return sorted(entry[:-5] for entry in entries if entry.endswith(".json"))
+
+    def get(self, name: str) -> Optional[SchemaProfile]:
+        """
+        Obtiene un perfil compilado por nombre.
+
+        Args:
+            name: Nombre del perfil
+
+        Returns:
+            Optional[SchemaProfile]: Perfil compilado, None si no existe
+
+        Raises:
+            ValueError: Si la definición del perfil no es válida
+        """
+        if not _PROFILE_NAME.fullmatch(name):
+            return None
+        path = os.path.join(self.directory, f"{name}.json")
+        try:
+            modified = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._profiles.get(name)
+            if cached is not None and cached[0] == modified:
+                return cached[1]
+
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Perfil de esquema inválido {name}: {e}")
+
+            if cached is not None and cached[1].version == data.get("version", 1):
+                profile = cached[1]
+            else:
+                try:
+                    profile = SchemaProfile.from_dict(data, name)
+                except ValueError as e:
+                    raise ValueError(f"Perfil de esquema inválido {name}: {e}")
+            self._profiles[name] = (modified, profile)
+            return profile
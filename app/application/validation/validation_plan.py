@@ -0,0 +1,156 @@
+"""
+Plan de validación de CSV.
+
+Compila el encabezado de un archivo, una sola vez por carga, en la lista
+de comprobaciones que debe pasar cada columna. Durante la validación cada
+fila solo ejecuta esas comprobaciones, sin volver a analizar los nombres
+de columna.
+"""
+
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Palabras clave que indican que una columna debería ser numérica
+NUMERIC_KEYWORDS = ['precio', 'cantidad', 'total', 'amount', 'price', 'quantity']
+
+# Comprobación de valor: (tipo de incidencia, función que indica si el valor es válido)
+ValueCheck = Tuple[str, Callable[[str], bool]]
+
+
+def is_number(value: str) -> bool:
+    """
+    Indica si un valor es numérico, admitiendo coma como separador decimal.
+
+    Args:
+        value: Valor a comprobar
+
+    Returns:
+        bool: True si el valor es numérico
+    """
+    try:
+        float(value.replace(',', '.'))
+        return True
+    except ValueError:
+        return False
+
+
+class ColumnRule(NamedTuple):
+    """
+    Comprobaciones compiladas para una columna.
+
+    Attributes:
+        name: Nombre de la columna
+        position: Posición de la que se toma el valor en cada fila
+        check_empty: Si se informan los valores vacíos
+        checks: Comprobaciones aplicadas a los valores no vacíos
+    """
+    name: str
+    position: int
+    check_empty: bool
+    checks: Tuple[ValueCheck, ...]
+
+
+class ValidationPlan(NamedTuple):
+    """
+    Plan de validación compilado a partir del encabezado de un CSV.
+
+    Attributes:
+        width: Número de columnas del encabezado
+        columns: Reglas de todas las columnas, en orden de aparición
+        typed_columns: Subconjunto de columnas con comprobaciones de valor
+        key_positions: Posiciones que forman la clave de fila para duplicados
+        positional: True si la clave de fila es la fila completa
+        missing_columns: Columnas obligatorias que no aparecen en el encabezado
+    """
+    width: int
+    columns: Tuple[ColumnRule, ...]
+    typed_columns: Tuple[ColumnRule, ...]
+    key_positions: Tuple[int, ...]
+    positional: bool
+    missing_columns: Tuple[str, ...] = ()
+
+    @classmethod
+    def compile(
+        cls,
+        header: Sequence[str],
+        numeric_keywords: Optional[Sequence[str]] = None
+    ) -> "ValidationPlan":
+        """
+        Compila el plan de validación para un encabezado.
+
+        Igual que csv.DictReader, un nombre de columna repetido conserva su
+        primera posición pero toma el valor de su última aparición.
+
+        Args:
+            header: Nombres de columna del CSV
+            numeric_keywords: Palabras clave de columnas numéricas
+
+        Returns:
+            ValidationPlan: Plan de validación compilado
+        """
+        keywords = NUMERIC_KEYWORDS if numeric_keywords is None else numeric_keywords
+        positions = {name: index for index, name in enumerate(header)}
+
+        columns: List[ColumnRule] = []
+        for name, position in positions.items():
+            checks: Tuple[ValueCheck, ...] = ()
+            if any(keyword in name.lower() for keyword in keywords):
+                checks = (("invalid_type", is_number),)
+            columns.append(ColumnRule(name, position, True, checks))
+
+        return cls.from_rules(len(header), columns)
+
+    @classmethod
+    def from_rules(
+        cls,
+        width: int,
+        columns: Sequence[ColumnRule],
+        missing_columns: Sequence[str] = ()
+    ) -> "ValidationPlan":
+        """
+        Construye el plan a partir de reglas de columna ya resueltas.
+
+        Args:
+            width: Número de columnas del encabezado
+            columns: Reglas de cada columna, en orden de aparición
+            missing_columns: Columnas obligatorias ausentes del encabezado
+
+        Returns:
+            ValidationPlan: Plan de validación compilado
+        """
+        key_positions = tuple(rule.position for rule in columns)
+        return cls(
+            width=width,
+            columns=tuple(columns),
+            typed_columns=tuple(rule for rule in columns if rule.checks),
+            key_positions=key_positions,
+            positional=key_positions == tuple(range(width)),
+            missing_columns=tuple(missing_columns)
+        )
+
+    @property
+    def numeric_positions(self) -> List[int]:
+        """
+        Índices (dentro de columns) de las columnas con comprobación numérica.
+
+        Returns:
+            List[int]: Índices de columnas numéricas
+        """
+        return [
+            index for index, rule in enumerate(self.columns)
+            if any(check is is_number for _, check in rule.checks)
+        ]
+
+    def row_key(self, row: List[str]) -> Tuple[Optional[str], ...]:
+        """
+        Obtiene la clave de una fila para la detección de duplicados.
+
+        Args:
+            row: Valores de la fila
+
+        Returns:
+            Tuple[Optional[str], ...]: Valores de cada columna (None si falta)
+        """
+        if self.positional and len(row) == self.width:
+            return tuple(row)
+        size = len(row)
+        return tuple(row[position] if position < size else None for position in self.key_positions)
@@ -0,0 +1,140 @@
+"""
+Reporte agregado de validaciones.
+
+Resume las validaciones de un archivo en contadores por tipo y por columna
+más una muestra acotada de validaciones, en lugar de la lista completa.
+Permite detener la validación al alcanzar un número máximo de validaciones
+y volcar el detalle completo a un destino aparte (JSON Lines).
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+# Validaciones de muestra por tipo por defecto
+DEFAULT_SAMPLES_PER_TYPE = 20
+
+# Validaciones de muestra en total por defecto
+DEFAULT_MAX_SAMPLES = 100
+
+
+class ValidationReport:
+    """
+    Acumulador de validaciones con contadores y muestras acotadas.
+
+    Attributes:
+        total: Número de validaciones registradas
+        by_type: Número de validaciones por tipo
+        by_column: Número de validaciones por tipo y columna
+        samples: Primeras validaciones de cada tipo, hasta los límites configurados
+        stopped_early: True si se alcanzó el máximo de validaciones
+        details_key: Clave del detalle completo almacenado aparte, si lo hay
+    """
+
+    def __init__(
+        self,
+        samples_per_type: int = DEFAULT_SAMPLES_PER_TYPE,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        max_findings: int = 0,
+        details: Optional[TextIO] = None
+    ):
+        """
+        Inicializa el reporte vacío.
+
+        Args:
+            samples_per_type: Máximo de validaciones de muestra de cada tipo
+            max_samples: Máximo de validaciones de muestra en total
+            max_findings: Número de validaciones tras el que se detiene la validación (0 = sin límite)
+            details: Destino de texto donde escribir cada validación como una línea JSON
+        """
+        self.samples_per_type = samples_per_type
+        self.max_samples = max_samples
+        self.max_findings = max_findings
+        self.details = details
+        self.total = 0
+        self.by_type: Dict[str, int] = {}
+        self.by_column: Dict[str, Dict[str, int]] = {}
+        self.samples: List[Dict[str, Any]] = []
+        self.stopped_early = False
+        self.details_key: Optional[str] = None
+
+    def add(self, finding: Dict[str, Any]) -> bool:
+        """
+        Registra una validación en el reporte.
+
+        Args:
+            finding: Validación a registrar
+
+        Returns:
+            bool: False si se alcanzó el máximo de validaciones y debe detenerse la validación
+        """
+        kind = finding["type"]
+        self.total += 1
+        type_count = self.by_type.get(kind, 0) + 1
+        self.by_type[kind] = type_count
+
+        column = finding.get("column")
+        if column is not None:
+            columns = self.by_column.setdefault(kind, {})
+            columns[column] = columns.get(column, 0) + 1
+
+        if type_count <= self.samples_per_type and len(self.samples) < self.max_samples:
+            self.samples.append(finding)
+
+        if self.details is not None:
+            self.details.write(json.dumps(finding, ensure_ascii=False) + "\n")
+
+        if self.max_findings and self.total >= self.max_findings:
+            self.stopped_early = True
+            return False
+        return True
+
+    def consume(self, findings: Iterable[Dict[str, Any]]) -> "ValidationReport":
+        """
+        Registra validaciones hasta agotarlas o alcanzar el máximo.
+
+        Al detenerse antes de tiempo se cierra el generador de validaciones,
+        de modo que el validador deja de leer el archivo y libera sus recursos.
+
+        Args:
+            findings: Validaciones a registrar (normalmente un generador)
+
+        Returns:
+            ValidationReport: El propio reporte
+        """
+        iterator = iter(findings)
+        try:
+            for finding in iterator:
+                if not self.add(finding):
+                    break
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        return self
+
+    @property
+    def samples_truncated(self) -> bool:
+        """
+        Indica si la muestra no contiene todas las validaciones registradas.
+
+        Returns:
+            bool: True si hay validaciones fuera de la muestra
+        """
+        return len(self.samples) < self.total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte el reporte a un diccionario serializable.
+
+        Returns:
+            Dict[str, Any]: Contadores, muestra y estado del reporte
+        """
+        return {
+            "total": self.total,
+            "by_type": dict(self.by_type),
+            "by_column": {kind: dict(columns) for kind, columns in self.by_column.items()},
+            "samples": list(self.samples),
+            "samples_truncated": self.samples_truncated,
+            "stopped_early": self.stopped_early,
+            "details_key": self.details_key
+        }
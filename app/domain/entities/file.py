@@ -29,6 +29,10 @@ class File:
         content_type: Tipo MIME del archivo
         status: Estado del procesamiento del archivo
         validations: Lista de validaciones aplicadas al archivo
+        validation_report: Reporte agregado de validaciones (modo summary)
+        content_hash: Resumen SHA-256 del contenido (hexadecimal)
+        validation_options: Opciones con que se validó el contenido (backend, modo de
+                            reporte y perfil); None hasta que termina la validación
         user_id: ID del usuario que cargó el archivo
         created_at: Fecha y hora de carga del archivo
         updated_at: Fecha y hora de última actualización
@@ -44,6 +48,9 @@ class File:
         content_type: str = "",
         status: FileStatus = FileStatus.PENDING,
         validations: Optional[List[dict]] = None,
+        validation_report: Optional[dict] = None,
+        content_hash: Optional[str] = None,
+        validation_options: Optional[str] = None,
         user_id: Optional[int] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
@@ -60,6 +67,9 @@ class File:
             content_type: Tipo MIME del archivo
             status: Estado del procesamiento
             validations: Lista de validaciones aplicadas
+            validation_report: Reporte agregado de validaciones
+            content_hash: Resumen SHA-256 del contenido
+            validation_options: Opciones con que se validó el contenido
             user_id: ID del usuario que cargó el archivo
             created_at: Fecha de creación
             updated_at: Fecha de actualización
@@ -72,6 +82,9 @@ class File:
         self.content_type = content_type
         self.status = status
         self.validations = validations or []
+        self.validation_report = validation_report
+        self.content_hash = content_hash
+        self.validation_options = validation_options
         self.user_id = user_id
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
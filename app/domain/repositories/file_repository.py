@@ -6,7 +6,8 @@ del repositorio de archivos.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, List, Optional, Set
 from app.domain.entities.file import File
 
 
@@ -31,6 +32,19 @@ class IFileRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def create_many(self, files: List[File]) -> List[File]:
+        """
+        Crea varios archivos en una sola transacción.
+
+        Args:
+            files: Instancias de File a crear
+
+        Returns:
+            List[File]: Archivos creados con ID asignado, en el mismo orden
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, file_id: int) -> Optional[File]:
         """
@@ -45,18 +59,84 @@ class IFileRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_user_id(self, user_id: int) -> List[File]:
+    def get_by_user_id(self, user_id: int, after: Optional[int] = None, limit: Optional[int] = None) -> List[File]:
         """
-        Obtiene todos los archivos de un usuario.
+        Obtiene los archivos de un usuario, del más reciente al más antiguo.
 
         Args:
             user_id: Identificador único del usuario
+            after: Devolver solo los archivos con ID menor (cursor de paginación)
+            limit: Número máximo de archivos (None para todos)
 
         Returns:
             List[File]: Lista de archivos del usuario
         """
         pass
 
+    @abstractmethod
+    def get_by_content_hash(self, user_id: int, content_hash: str, validation_options: str) -> Optional[File]:
+        """
+        Obtiene el último archivo de un usuario con el contenido indicado ya validado con las mismas opciones.
+
+        Args:
+            user_id: Identificador único del usuario
+            content_hash: Resumen SHA-256 del contenido
+            validation_options: Opciones de validación (backend, modo de reporte y perfil)
+
+        Returns:
+            Optional[File]: Archivo encontrado o None si no existe
+        """
+        pass
+
+    @abstractmethod
+    def get_by_content_hashes(
+        self,
+        user_id: int,
+        content_hashes: List[str],
+        validation_options: str
+    ) -> Dict[str, File]:
+        """
+        Obtiene el último archivo validado con las mismas opciones para cada contenido indicado.
+
+        Args:
+            user_id: Identificador único del usuario
+            content_hashes: Resúmenes SHA-256 de los contenidos
+            validation_options: Opciones de validación (backend, modo de reporte y perfil)
+
+        Returns:
+            Dict[str, File]: Archivo encontrado por resumen (sin los que no existen)
+        """
+        pass
+
+    @abstractmethod
+    def get_existing_s3_keys(self, s3_keys: List[str]) -> Set[str]:
+        """
+        Obtiene cuáles de las claves de S3 indicadas pertenecen a algún archivo registrado.
+
+        Args:
+            s3_keys: Claves de S3 a comprobar
+
+        Returns:
+            Set[str]: Claves con archivo registrado
+        """
+        pass
+
+    @abstractmethod
+    def get_stale_pending(self, before: datetime) -> List[File]:
+        """
+        Obtiene los archivos subidos en PENDING que no terminaron de validarse.
+
+        Son las cargas asíncronas encoladas cuyo trabajo no llegó a terminar
+        (las opciones de validación se guardan al terminar).
+
+        Args:
+            before: Instante (UTC) de la última actualización admitida
+
+        Returns:
+            List[File]: Archivos sin actualizar desde antes del instante
+        """
+        pass
+
     @abstractmethod
     def update(self, file: File) -> File:
         """
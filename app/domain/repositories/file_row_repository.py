@@ -0,0 +1,33 @@
+"""
+Interfaz del repositorio de filas de archivos.
+
+Define el contrato que deben cumplir las implementaciones
+del repositorio de staging de filas de archivos CSV.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Tuple
+
+
+class IFileRowRepository(ABC):
+    """
+    Interfaz abstracta para el repositorio de filas de archivos.
+
+    Define los métodos que deben implementar los repositorios
+    de staging sin especificar la implementación concreta.
+    """
+
+    @abstractmethod
+    def bulk_insert(self, file_id: int, rows: Iterable[Tuple[int, List[str]]], batch_size: int) -> int:
+        """
+        Inserta las filas de un archivo en lotes.
+
+        Args:
+            file_id: ID del archivo al que pertenecen las filas
+            rows: Pares (número de fila, valores) a insertar
+            batch_size: Número de filas por lote
+
+        Returns:
+            int: Número de filas insertadas
+        """
+        pass
@@ -0,0 +1,70 @@
+"""
+Interfaz del repositorio de validaciones de archivos.
+
+Define el contrato que deben cumplir las implementaciones
+del repositorio de validaciones por fila de archivos CSV.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class IFileValidationRepository(ABC):
+    """
+    Interfaz abstracta para el repositorio de validaciones de archivos.
+
+    Cada validación se identifica por el archivo y su número de orden
+    (seq) dentro de las validaciones del archivo.
+    """
+
+    @abstractmethod
+    def insert_batch(self, file_id: int, first_seq: int, findings: List[Dict[str, Any]]) -> int:
+        """
+        Inserta un lote de validaciones de un archivo.
+
+        Args:
+            file_id: ID del archivo
+            first_seq: Número de orden de la primera validación del lote
+            findings: Validaciones a insertar, en orden
+
+        Returns:
+            int: Número de validaciones insertadas
+        """
+        pass
+
+    @abstractmethod
+    def list_by_file_id(
+        self,
+        file_id: int,
+        after: Optional[int] = None,
+        limit: int = 100,
+        kind: Optional[str] = None,
+        column: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene una página de validaciones de un archivo.
+
+        Args:
+            file_id: ID del archivo
+            after: Número de orden de la última validación de la página anterior
+            limit: Número máximo de validaciones
+            kind: Tipo de validación por el que filtrar (opcional)
+            column: Columna por la que filtrar (opcional)
+
+        Returns:
+            List[Dict[str, Any]]: Validaciones en orden, cada una con su número de orden (seq)
+        """
+        pass
+
+    @abstractmethod
+    def delete_by_file_id(self, file_id: int) -> int:
+        """
+        Elimina todas las validaciones de un archivo.
+
+        Args:
+            file_id: ID del archivo
+
+        Returns:
+            int: Número de validaciones eliminadas
+        """
+        pass
@@ -0,0 +1,96 @@
+"""
+Interfaz del repositorio de sesiones de carga reanudable.
+
+Define el contrato que deben cumplir las implementaciones
+del repositorio que guarda el estado de las sesiones de carga por bloques.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class IUploadSessionRepository(ABC):
+    """
+    Interfaz abstracta para el repositorio de sesiones de carga.
+
+    Guarda lo necesario para reanudar una sesión en cualquier proceso: la
+    carga por partes de S3, las opciones de validación y las partes
+    recibidas (número, ETag, tamaño y resumen SHA-256).
+    """
+
+    @abstractmethod
+    def create(self, session: Dict[str, Any]) -> None:
+        """
+        Registra una sesión abierta.
+
+        Args:
+            session: Estado de la sesión (UploadSession.to_record)
+        """
+        pass
+
+    @abstractmethod
+    def add_part(self, session_id: str, part: Dict[str, Any], size: int, final_part: bool) -> None:
+        """
+        Registra una parte recibida y actualiza el estado de la sesión.
+
+        Args:
+            session_id: ID de la sesión
+            part: Parte recibida (PartNumber, ETag, size y sha256)
+            size: Bytes recibidos por la sesión tras la parte
+            final_part: Si la parte es la última del archivo
+        """
+        pass
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene el estado de una sesión sin sus partes.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Optional[Dict[str, Any]]: Estado de la sesión con su número de partes
+                                      (part_count), None si no existe
+        """
+        pass
+
+    @abstractmethod
+    def list_parts(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Obtiene las partes recibidas de una sesión en orden.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            List[Dict[str, Any]]: Partes (PartNumber, ETag, size y sha256)
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """
+        Elimina una sesión y sus partes.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            bool: True si la sesión existía
+        """
+        pass
+
+    @abstractmethod
+    def list_expired(self, before: datetime) -> List[Dict[str, Any]]:
+        """
+        Obtiene las sesiones sin actividad desde antes de un instante.
+
+        Args:
+            before: Instante (UTC) de la última actividad admitida
+
+        Returns:
+            List[Dict[str, Any]]: Estado de las sesiones caducadas
+        """
+        pass
@@ -0,0 +1,6 @@
+"""
+Módulo de servicios del dominio.
+
+Define las interfaces (contratos) de los servicios externos de los que
+dependen los casos de uso, como el almacenamiento de archivos.
+"""
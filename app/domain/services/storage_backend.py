@@ -0,0 +1,327 @@
+"""
+Interfaz del backend de almacenamiento de archivos.
+
+Define el contrato que deben cumplir las implementaciones del
+almacenamiento de objetos (S3, sistema de archivos local, memoria).
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+# Tamaño mínimo de las partes de una carga por partes (salvo la última)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Número máximo de objetos por petición de eliminación o página de listado
+MAX_KEYS_PER_REQUEST = 1000
+
+
+class TransferStats:
+    """
+    Bytes, duración y velocidad de una transferencia al almacenamiento.
+
+    Los bytes transferidos se notifican desde los hilos de cada parte,
+    por lo que la suma se protege con un lock.
+
+    Attributes:
+        bytes: Bytes transferidos
+        seconds: Duración de la transferencia en segundos
+    """
+
+    def __init__(self):
+        """
+        Inicializa las estadísticas vacías.
+        """
+        self.bytes = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, amount: int) -> None:
+        """
+        Suma bytes transferidos.
+
+        Args:
+            amount: Bytes transferidos desde la última notificación
+        """
+        with self._lock:
+            self.bytes += amount
+
+    @property
+    def bytes_per_second(self) -> float:
+        """
+        Velocidad media de la transferencia.
+
+        Returns:
+            float: Bytes por segundo (0 si no hubo duración)
+        """
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Convierte las estadísticas a un diccionario serializable.
+
+        Returns:
+            Dict[str, float]: Bytes, segundos y MB por segundo
+        """
+        return {
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 3),
+            "mb_per_second": round(self.bytes_per_second / (1024 * 1024), 2)
+        }
+
+
+class IStorageBackend(ABC):
+    """
+    Interfaz abstracta para el almacenamiento de objetos.
+
+    Los objetos se identifican por su clave (ruta/nombre). Las operaciones
+    no lanzan errores del backend: devuelven None o False si fallan (salvo
+    list_objects, que no puede distinguir un fallo de un listado vacío).
+    """
+
+    @abstractmethod
+    def upload_file(
+        self,
+        file_obj: BinaryIO,
+        s3_key: str,
+        content_type: str,
+        stats: Optional[TransferStats] = None
+    ) -> Optional[str]:
+        """
+        Sube un archivo completo.
+
+        Args:
+            file_obj: Objeto de archivo a subir (file-like object)
+            s3_key: Clave única del archivo (ruta/nombre)
+            content_type: Tipo MIME del archivo
+            stats: Estadísticas donde anotar bytes, duración y velocidad (opcional)
+
+        Returns:
+            Optional[str]: URL del archivo si la subida fue exitosa, None en caso contrario
+        """
+        pass
+
+    @abstractmethod
+    def start_upload(self, s3_key: str, content_type: str, content_encoding: Optional[str] = None) -> Any:
+        """
+        Inicia la carga de un archivo cuyo contenido se escribe por bloques.
+
+        Args:
+            s3_key: Clave única del archivo (ruta/nombre)
+            content_type: Tipo MIME del archivo
+            content_encoding: Compresión del archivo (gzip, zstd), None si no está comprimido
+
+        Returns:
+            Any: Carga en curso con write(data), complete() (devuelve la URL o None),
+                 abort() y el atributo size con los bytes escritos
+        """
+        pass
+
+    @abstractmethod
+    def create_presigned_post(
+        self,
+        s3_key: str,
+        content_type: str,
+        content_encoding: Optional[str] = None,
+        max_size: int = 5 * 1024 * 1024 * 1024,
+        expires_in: int = 3600
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Genera un formulario firmado para que un cliente suba un archivo directamente al almacenamiento.
+
+        Args:
+            s3_key: Clave única del archivo (ruta/nombre)
+            content_type: Tipo MIME que debe enviar el cliente
+            content_encoding: Compresión que debe enviar el cliente (gzip, zstd), None si no está comprimido
+            max_size: Tamaño máximo del archivo en bytes
+            expires_in: Segundos de validez del formulario
+
+        Returns:
+            Optional[Dict[str, Any]]: URL del formulario (url) y campos a enviar con el archivo (fields),
+                                      None si no se pudo generar
+        """
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(
+        self,
+        s3_key: str,
+        content_type: str,
+        content_encoding: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Inicia una carga por partes cuyas partes se suben con upload_part.
+
+        Args:
+            s3_key: Clave única del archivo (ruta/nombre)
+            content_type: Tipo MIME del archivo
+            content_encoding: Compresión del archivo (gzip, zstd), None si no está comprimido
+
+        Returns:
+            Optional[str]: ID de la carga por partes, None si no se pudo iniciar
+        """
+        pass
+
+    @abstractmethod
+    def upload_part(self, s3_key: str, upload_id: str, part_number: int, body: bytes) -> Optional[str]:
+        """
+        Sube una parte de una carga por partes. Subir de nuevo un número de parte la reemplaza.
+
+        Args:
+            s3_key: Clave del archivo
+            upload_id: ID de la carga por partes
+            part_number: Número de la parte (desde 1)
+            body: Contenido de la parte (mínimo MIN_PART_SIZE salvo la última)
+
+        Returns:
+            Optional[str]: ETag de la parte, None si no se pudo subir
+        """
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(
+        self,
+        s3_key: str,
+        upload_id: str,
+        parts: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Completa una carga por partes con las partes indicadas.
+
+        Args:
+            s3_key: Clave del archivo
+            upload_id: ID de la carga por partes
+            parts: ETag y número de cada parte, en orden
+
+        Returns:
+            Optional[str]: URL del archivo, None si no se pudo completar
+        """
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, s3_key: str, upload_id: str) -> bool:
+        """
+        Cancela una carga por partes descartando las partes subidas.
+
+        Args:
+            s3_key: Clave del archivo
+            upload_id: ID de la carga por partes
+
+        Returns:
+            bool: True si se canceló correctamente, False en caso contrario
+        """
+        pass
+
+    @abstractmethod
+    def head_file(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene los metadatos de un archivo sin leer su contenido.
+
+        Args:
+            s3_key: Clave del archivo
+
+        Returns:
+            Optional[Dict[str, Any]]: size, etag, content_type, content_encoding y last_modified,
+                                      None si el archivo no existe o no se pudo consultar
+        """
+        pass
+
+    @abstractmethod
+    def get_file_stream(self, s3_key: str, byte_range: Optional[Tuple[int, int]] = None) -> Optional[BinaryIO]:
+        """
+        Abre el contenido de un archivo como flujo de bytes leído bajo demanda.
+
+        Args:
+            s3_key: Clave del archivo
+            byte_range: Primer y último byte a leer, ambos incluidos (por defecto, el archivo completo)
+
+        Returns:
+            Optional[BinaryIO]: Flujo con el contenido del archivo, None si no se pudo abrir
+        """
+        pass
+
+    @abstractmethod
+    def delete_file(self, s3_key: str) -> bool:
+        """
+        Elimina un archivo.
+
+        Args:
+            s3_key: Clave del archivo a eliminar
+
+        Returns:
+            bool: True si se eliminó correctamente, False en caso contrario
+        """
+        pass
+
+    @abstractmethod
+    def delete_files(self, s3_keys: List[str]) -> List[str]:
+        """
+        Elimina varios archivos con una petición por cada MAX_KEYS_PER_REQUEST claves.
+
+        Args:
+            s3_keys: Claves de los archivos a eliminar
+
+        Returns:
+            List[str]: Claves que no se pudieron eliminar (vacía si se eliminaron todas)
+        """
+        pass
+
+    @abstractmethod
+    def list_objects(self, prefix: str = "", page_size: int = MAX_KEYS_PER_REQUEST) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Recorre los objetos bajo un prefijo por páginas, en orden de clave.
+
+        Cada página se pide al recorrerla, de modo que nunca hay más de una en memoria.
+
+        Args:
+            prefix: Prefijo de las claves
+            page_size: Número máximo de objetos por página (hasta MAX_KEYS_PER_REQUEST)
+
+        Returns:
+            Iterator[List[Dict[str, Any]]]: Páginas de objetos con key, size y last_modified
+
+        Raises:
+            Exception: Si no se pudo obtener una página
+        """
+        pass
+
+    @abstractmethod
+    def object_url(self, s3_key: str) -> str:
+        """
+        Construye la URL con la que se registra un objeto subido.
+
+        Args:
+            s3_key: Clave del objeto
+
+        Returns:
+            str: URL del objeto
+        """
+        pass
+
+    @abstractmethod
+    def get_file_url(self, s3_key: str, expires_in: int = 3600) -> Optional[str]:
+        """
+        Genera una URL temporal para acceder a un archivo.
+
+        Args:
+            s3_key: Clave del archivo
+            expires_in: Tiempo de expiración de la URL en segundos
+
+        Returns:
+            Optional[str]: URL del archivo, None si no se pudo generar
+        """
+        pass
+
+    @abstractmethod
+    def get_file_urls(self, s3_keys: List[str], expires_in: int = 3600) -> Dict[str, Optional[str]]:
+        """
+        Genera URLs temporales de varios archivos.
+
+        Args:
+            s3_keys: Claves de los archivos
+            expires_in: Tiempo de expiración de las URLs en segundos
+
+        Returns:
+            Dict[str, Optional[str]]: URL de cada clave (None si no se pudo generar)
+        """
+        pass
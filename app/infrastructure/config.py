@@ -7,6 +7,8 @@ para el funcionamiento de la aplicación, incluyendo:
 - Configuración de JWT
 - Configuración de AWS S3
 - Configuración de Azure Cognitive Services
+- Configuración de validación de archivos CSV
+- Configuración del procesamiento asíncrono de cargas
 """
 
 from pydantic_settings import BaseSettings
@@ -33,6 +35,26 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str
     AWS_REGION: str = "us-east-1"
     S3_BUCKET_NAME: str
+    S3_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # Tamaño de parte de las cargas por partes (mínimo 5 MB)
+    S3_UPLOAD_CONCURRENCY: int = 2  # Partes subiéndose a la vez mientras se valida el archivo
+    S3_ENDPOINT_URL: Optional[str] = None  # Endpoint alternativo (S3 local o compatible)
+    S3_MAX_POOL_CONNECTIONS: int = 50  # Conexiones del pool del cliente compartido por el proceso
+    S3_CONNECT_TIMEOUT: float = 5  # Segundos para establecer la conexión
+    S3_READ_TIMEOUT: float = 60  # Segundos de espera de cada respuesta
+    S3_TCP_KEEPALIVE: bool = True  # Keep-alive TCP en las conexiones del pool
+    S3_MAX_ATTEMPTS: int = 3  # Intentos por petición (reintentos estándar de botocore)
+    S3_TRANSFER_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024  # upload_file: tamaño desde el que sube por partes
+    S3_TRANSFER_CHUNK_SIZE: int = 8 * 1024 * 1024  # upload_file: tamaño de cada parte
+    S3_TRANSFER_MAX_CONCURRENCY: int = 10  # upload_file: partes subiéndose a la vez
+    S3_ASYNC_WORKERS: int = 16  # Operaciones de S3 a la vez de la API asíncrona de almacenamiento
+    PRESIGN_CACHE_SIZE: int = 10000  # URLs firmadas en caché por proceso, 0 = sin caché
+    PRESIGN_CACHE_MIN_VALIDITY: float = 0.5  # Fracción de validez que debe quedarle a una URL reutilizada
+
+    # Almacenamiento de archivos
+    STORAGE_BACKEND: str = "s3"  # s3 | local | memory
+    STORAGE_LOCAL_ROOT: str = "storage"  # Directorio del backend local
+    STORAGE_LATENCY_MS: float = 0  # Latencia simulada por petición (backends local y memory)
+    STORAGE_BANDWIDTH_MBPS: float = 0  # MB/s simulados por transferencia, 0 = sin límite (local y memory)
 
     # Azure Cognitive Services
     AZURE_FORM_RECOGNIZER_ENDPOINT: str
@@ -40,6 +62,43 @@ class Settings(BaseSettings):
     AZURE_TEXT_ANALYTICS_ENDPOINT: str
     AZURE_TEXT_ANALYTICS_KEY: str
 
+    # Validación de CSV
+    CSV_VALIDATION_BACKEND: str = "streaming"  # streaming | columnar
+    CSV_ENCODING: Optional[str] = None  # None = detectar (UTF-8, UTF-8 con BOM, CP1252, Latin-1)
+    CSV_DELIMITER: Optional[str] = None  # None = detectar (, ; tabulador |)
+    CSV_COLUMNAR_CHUNK_ROWS: int = 50000
+    CSV_PARALLEL_WORKERS: int = 0  # 0 = número de CPUs, 1 = sin paralelismo
+    CSV_PARALLEL_MIN_BYTES: int = 64 * 1024 * 1024
+    CSV_DUPLICATE_MEMORY_BYTES: int = 256 * 1024 * 1024  # Resúmenes de fila antes de volcar a disco
+    CSV_DUPLICATE_SPILL_DIR: Optional[str] = None  # None = directorio temporal del sistema
+    CSV_REPORT_MODE: str = "full"  # full | summary
+    CSV_REPORT_SAMPLES_PER_TYPE: int = 20
+    CSV_REPORT_MAX_SAMPLES: int = 100
+    CSV_REPORT_MAX_FINDINGS: int = 0  # 0 = sin límite; al alcanzarlo se detiene la validación
+    CSV_REPORT_STORE_DETAILS: bool = True  # Guardar el detalle completo en S3 (modo summary)
+    CSV_SCHEMA_DIR: str = "schemas"  # Directorio de perfiles de esquema (<nombre>.json)
+    CSV_STAGING_ENABLED: bool = True  # Cargar las filas en la tabla de staging file_rows
+    CSV_STAGING_BATCH_SIZE: int = 10000  # Filas por lote de inserción
+    CSV_VALIDATIONS_BATCH_SIZE: int = 5000  # Validaciones por lote de inserción en file_validations
+    CSV_MAX_DECOMPRESSED_BYTES: int = 10 * 1024 * 1024 * 1024  # Máximo descomprimido de .csv.gz/.csv.zst
+
+    # Procesamiento asíncrono de cargas
+    UPLOAD_JOB_WORKERS: int = 2  # Cargas procesadas a la vez en segundo plano por proceso
+    UPLOAD_REQUEST_WORKERS: int = 8  # Cargas atendidas a la vez durante la petición por proceso
+    UPLOAD_JOB_STALE_SECONDS: int = 3600  # Cargas encoladas sin procesar durante este tiempo fallan al arrancar
+
+    # Cargas reanudables por bloques
+    UPLOAD_SESSION_TTL_SECONDS: int = 3600  # Sesiones sin bloques durante este tiempo se cancelan
+    UPLOAD_SESSION_MAX_CHUNK_SIZE: int = 64 * 1024 * 1024  # Tamaño máximo de cada bloque
+
+    # Cargas directas al almacenamiento (formulario POST firmado)
+    DIRECT_UPLOAD_MAX_BYTES: int = 5 * 1024 * 1024 * 1024  # Tamaño máximo (S3 admite hasta 5 GB por POST)
+    DIRECT_UPLOAD_EXPIRES_SECONDS: int = 3600  # Validez del formulario firmado
+
+    # Cargas por lotes
+    UPLOAD_BATCH_WORKERS: int = 4  # Archivos de un lote subidos y validados a la vez
+    UPLOAD_BATCH_MAX_FILES: int = 500  # Archivos máximos por lote (o por ZIP)
+
     # Application
     APP_NAME: str = "Document Analysis API"
     DEBUG: bool = False
@@ -11,12 +11,19 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.infrastructure.config import settings
 
+# Opciones específicas del driver: con pyodbc, executemany envía cada lote
+# de parámetros en un único viaje (carga de filas en staging)
+engine_options = {}
+if settings.DATABASE_URL.startswith("mssql+pyodbc"):
+    engine_options["fast_executemany"] = True
+
 # Crear motor de base de datos
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     pool_recycle=3600,
-    echo=settings.DEBUG
+    echo=settings.DEBUG,
+    **engine_options
 )
 
 # Crear sesión de base de datos
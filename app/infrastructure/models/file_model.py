@@ -4,7 +4,7 @@ Modelo de base de datos para archivos.
 Mapea la entidad File del dominio a la tabla 'files' en SQL Server.
 """
 
-from sqlalchemy import Column, Integer, String, JSON, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, JSON, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 from app.infrastructure.database import Base
 
@@ -16,6 +16,9 @@ class FileModel(Base):
     Representa la estructura de la tabla 'files' en la base de datos.
     """
     __tablename__ = "files"
+    __table_args__ = (
+        Index("ix_files_user_id_content_hash", "user_id", "content_hash"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String(255), nullable=False)
@@ -25,6 +28,9 @@ class FileModel(Base):
     content_type = Column(String(100), nullable=False)
     status = Column(String(50), nullable=False, default="pending")
     validations = Column(JSON, nullable=True)
+    validation_report = Column(JSON, nullable=True)
+    content_hash = Column(String(64), nullable=True)
+    validation_options = Column(String(255), nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,28 @@
+"""
+Modelo de base de datos para las filas de archivos.
+
+Mapea la tabla de staging 'file_rows' en SQL Server, donde se cargan
+las filas de los archivos CSV validados.
+"""
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, JSON
+from app.infrastructure.database import Base
+
+
+class FileRowModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla de staging de filas.
+
+    Cada registro guarda los valores de una fila del CSV como un array JSON.
+    La fila 1 es el encabezado; las demás se numeran igual que en las
+    validaciones (sin contar las filas en blanco).
+    """
+    __tablename__ = "file_rows"
+    __table_args__ = (
+        Index("ix_file_rows_file_id_row_number", "file_id", "row_number"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    file_id = Column(Integer, ForeignKey("files.id", ondelete="CASCADE"), nullable=False)
+    row_number = Column(Integer, nullable=False)
+    data = Column(JSON, nullable=False)
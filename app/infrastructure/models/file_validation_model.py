@@ -0,0 +1,33 @@
+"""
+Modelo de base de datos para las validaciones de archivos.
+
+Mapea la tabla 'file_validations' en SQL Server, con una fila por
+validación encontrada en un archivo CSV.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text
+from app.infrastructure.database import Base
+
+
+class FileValidationModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla de validaciones de archivos.
+
+    La clave primaria (file_id, seq) ordena las validaciones de cada archivo
+    y permite paginarlas por rango sin ordenar ni desplazar resultados. Los
+    índices (file_id, type, seq) y (file_id, column_name, seq) hacen lo mismo
+    con las páginas filtradas por tipo o por columna.
+    """
+    __tablename__ = "file_validations"
+    __table_args__ = (
+        Index("ix_file_validations_file_id_type_seq", "file_id", "type", "seq"),
+        Index("ix_file_validations_file_id_column_seq", "file_id", "column_name", "seq"),
+    )
+
+    file_id = Column(Integer, ForeignKey("files.id", ondelete="CASCADE"), primary_key=True, autoincrement=False)
+    seq = Column(Integer, primary_key=True, autoincrement=False)
+    row_number = Column(Integer, nullable=True)
+    type = Column(String(50), nullable=False)
+    column_name = Column(String(255), nullable=True)
+    first_row = Column(Integer, nullable=True)
+    message = Column(Text, nullable=False)
@@ -0,0 +1,55 @@
+"""
+Modelos de base de datos para las sesiones de carga reanudable.
+
+Mapean las tablas 'upload_sessions' y 'upload_session_parts' en SQL Server,
+donde se guarda el estado de las sesiones para reanudarlas en cualquier proceso.
+"""
+
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from app.infrastructure.database import Base
+
+
+class UploadSessionModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla de sesiones de carga.
+
+    updated_at registra el último bloque recibido (UTC) y determina la
+    caducidad de la sesión; part_count evita leer las partes para saber
+    qué bloque espera la sesión.
+    """
+    __tablename__ = "upload_sessions"
+
+    session_id = Column(String(32), primary_key=True)
+    file_id = Column(Integer, ForeignKey("files.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, nullable=False)
+    s3_key = Column(String(500), nullable=False)
+    upload_id = Column(String(1024), nullable=False)
+    param1 = Column(Text, nullable=False)
+    param2 = Column(Text, nullable=False)
+    min_chunk_size = Column(Integer, nullable=False)
+    validation_options = Column(String(255), nullable=True)
+    validation_backend = Column(String(50), nullable=True)
+    report_mode = Column(String(50), nullable=True)
+    schema_profile = Column(String(255), nullable=True)
+    size = Column(BigInteger, nullable=False, default=0)
+    part_count = Column(Integer, nullable=False, default=0)
+    final_part = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime, nullable=False, index=True)
+
+
+class UploadSessionPartModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla de partes de las sesiones de carga.
+
+    Cada bloque recibido se inserta como una fila, de modo que guardar un
+    bloque no reescribe la lista de partes de la sesión.
+    """
+    __tablename__ = "upload_session_parts"
+
+    session_id = Column(
+        String(32), ForeignKey("upload_sessions.session_id", ondelete="CASCADE"), primary_key=True
+    )
+    part_number = Column(Integer, primary_key=True)
+    etag = Column(String(255), nullable=False)
+    size = Column(BigInteger, nullable=False)
+    sha256 = Column(String(64), nullable=False)
@@ -4,9 +4,10 @@ Implementación del repositorio de archivos.
 Implementa IFileRepository utilizando SQLAlchemy y SQL Server.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Set
 from sqlalchemy.orm import Session
-from app.domain.entities.file import File
+from app.domain.entities.file import File, FileStatus
 from app.domain.repositories.file_repository import IFileRepository
 from app.infrastructure.models.file_model import FileModel
 
@@ -37,7 +38,6 @@ class FileRepository(IFileRepository):
         Returns:
             File: Instancia de File del dominio
         """
-        from app.domain.entities.file import FileStatus
         return File(
             id_=model.id,
             filename=model.filename,
@@ -47,6 +47,9 @@ class FileRepository(IFileRepository):
             content_type=model.content_type,
             status=FileStatus(model.status) if model.status else FileStatus.PENDING,
             validations=model.validations,
+            validation_report=model.validation_report,
+            content_hash=model.content_hash,
+            validation_options=model.validation_options,
             user_id=model.user_id,
             created_at=model.created_at,
             updated_at=model.updated_at
@@ -71,6 +74,9 @@ class FileRepository(IFileRepository):
             content_type=entity.content_type,
             status=entity.status.value if entity.status else "pending",
             validations=entity.validations,
+            validation_report=entity.validation_report,
+            content_hash=entity.content_hash,
+            validation_options=entity.validation_options,
             user_id=entity.user_id,
             created_at=entity.created_at,
             updated_at=entity.updated_at
@@ -92,6 +98,29 @@ class FileRepository(IFileRepository):
         self.db.refresh(db_file)
         return self._to_entity(db_file)
 
+    def create_many(self, files: List[File]) -> List[File]:
+        """
+        Crea varios archivos en una sola transacción.
+
+        Si falla la inserción de alguno no se crea ninguno.
+
+        Args:
+            files: Instancias de File a crear
+
+        Returns:
+            List[File]: Archivos creados con ID asignado, en el mismo orden
+        """
+        db_files = [self._to_model(file) for file in files]
+        try:
+            self.db.add_all(db_files)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        for db_file in db_files:
+            self.db.refresh(db_file)
+        return [self._to_entity(db_file) for db_file in db_files]
+
     def get_by_id(self, file_id: int) -> Optional[File]:
         """
         Obtiene un archivo por su ID.
@@ -105,17 +134,129 @@ class FileRepository(IFileRepository):
         db_file = self.db.query(FileModel).filter(FileModel.id == file_id).first()
         return self._to_entity(db_file) if db_file else None
 
-    def get_by_user_id(self, user_id: int) -> List[File]:
+    def get_by_user_id(self, user_id: int, after: Optional[int] = None, limit: Optional[int] = None) -> List[File]:
         """
-        Obtiene todos los archivos de un usuario.
+        Obtiene los archivos de un usuario, del más reciente al más antiguo.
 
         Args:
             user_id: Identificador único del usuario
+            after: Devolver solo los archivos con ID menor (cursor de paginación)
+            limit: Número máximo de archivos (None para todos)
 
         Returns:
             List[File]: Lista de archivos del usuario
         """
-        db_files = self.db.query(FileModel).filter(FileModel.user_id == user_id).all()
+        query = self.db.query(FileModel).filter(FileModel.user_id == user_id)
+        if after is not None:
+            query = query.filter(FileModel.id < after)
+        query = query.order_by(FileModel.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        db_files = query.all()
+        return [self._to_entity(db_file) for db_file in db_files]
+
+    def get_by_content_hash(self, user_id: int, content_hash: str, validation_options: str) -> Optional[File]:
+        """
+        Obtiene el último archivo de un usuario con el contenido indicado ya validado con las mismas opciones.
+
+        Las opciones se guardan al terminar la validación, así que los
+        archivos en proceso no coinciden.
+
+        Args:
+            user_id: Identificador único del usuario
+            content_hash: Resumen SHA-256 del contenido
+            validation_options: Opciones de validación (backend, modo de reporte y perfil)
+
+        Returns:
+            Optional[File]: Archivo encontrado o None si no existe (se ignoran los fallidos)
+        """
+        db_file = (
+            self.db.query(FileModel)
+            .filter(
+                FileModel.user_id == user_id,
+                FileModel.content_hash == content_hash,
+                FileModel.validation_options == validation_options,
+                FileModel.status != FileStatus.FAILED.value
+            )
+            .order_by(FileModel.id.desc())
+            .first()
+        )
+        return self._to_entity(db_file) if db_file else None
+
+    def get_by_content_hashes(
+        self,
+        user_id: int,
+        content_hashes: List[str],
+        validation_options: str
+    ) -> Dict[str, File]:
+        """
+        Obtiene el último archivo validado con las mismas opciones para cada contenido con una sola consulta.
+
+        Args:
+            user_id: Identificador único del usuario
+            content_hashes: Resúmenes SHA-256 de los contenidos
+            validation_options: Opciones de validación (backend, modo de reporte y perfil)
+
+        Returns:
+            Dict[str, File]: Archivo encontrado por resumen (se ignoran los fallidos y los en proceso)
+        """
+        if not content_hashes:
+            return {}
+        db_files = (
+            self.db.query(FileModel)
+            .filter(
+                FileModel.user_id == user_id,
+                FileModel.content_hash.in_(set(content_hashes)),
+                FileModel.validation_options == validation_options,
+                FileModel.status != FileStatus.FAILED.value
+            )
+            .order_by(FileModel.id)
+            .all()
+        )
+        # Ordenados por ID, el último de cada resumen queda en el diccionario
+        return {db_file.content_hash: self._to_entity(db_file) for db_file in db_files}
+
+    def get_existing_s3_keys(self, s3_keys: List[str]) -> Set[str]:
+        """
+        Obtiene cuáles de las claves de S3 indicadas pertenecen a algún archivo registrado.
+
+        Usa el índice único de s3_key con una sola consulta y sin cargar los archivos.
+
+        Args:
+            s3_keys: Claves de S3 a comprobar
+
+        Returns:
+            Set[str]: Claves con archivo registrado
+        """
+        if not s3_keys:
+            return set()
+        rows = self.db.query(FileModel.s3_key).filter(FileModel.s3_key.in_(set(s3_keys))).all()
+        return {row[0] for row in rows}
+
+    def get_stale_pending(self, before: datetime) -> List[File]:
+        """
+        Obtiene los archivos subidos en PENDING que no terminaron de validarse.
+
+        Las subidas directas aún no completadas (sin s3_url) no se incluyen.
+
+        Args:
+            before: Instante (UTC) de la última actualización admitida
+
+        Returns:
+            List[File]: Archivos sin actualizar desde antes del instante
+        """
+        db_files = (
+            self.db.query(FileModel)
+            .filter(
+                FileModel.status == FileStatus.PENDING.value,
+                FileModel.validation_options.is_(None),
+                FileModel.s3_url.isnot(None),
+                FileModel.s3_url != "",
+                FileModel.updated_at < before
+            )
+            .order_by(FileModel.id)
+            .all()
+        )
         return [self._to_entity(db_file) for db_file in db_files]
 
     def update(self, file: File) -> File:
@@ -137,6 +278,9 @@ class FileRepository(IFileRepository):
             db_file.content_type = file.content_type
             db_file.status = file.status.value if file.status else "pending"
             db_file.validations = file.validations
+            db_file.validation_report = file.validation_report
+            db_file.content_hash = file.content_hash
+            db_file.validation_options = file.validation_options
             db_file.updated_at = file.updated_at
             self.db.commit()
             self.db.refresh(db_file)
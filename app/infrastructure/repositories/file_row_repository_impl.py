@@ -0,0 +1,65 @@
+"""
+Implementación del repositorio de filas de archivos.
+
+Implementa IFileRowRepository con inserciones por lotes de SQLAlchemy Core.
+"""
+
+from typing import Iterable, List, Tuple
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.domain.repositories.file_row_repository import IFileRowRepository
+from app.infrastructure.models.file_row_model import FileRowModel
+
+
+class FileRowRepository(IFileRowRepository):
+    """
+    Implementación concreta del repositorio de filas de archivos.
+
+    Las filas se insertan con una sentencia INSERT de Core ejecutada como
+    executemany por lote, sin crear objetos ORM por fila. Con SQL Server
+    el motor activa fast_executemany de pyodbc, que envía cada lote en
+    un único viaje a la base de datos.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Args:
+            db: Sesión de SQLAlchemy para operaciones de base de datos
+        """
+        self.db = db
+
+    def bulk_insert(self, file_id: int, rows: Iterable[Tuple[int, List[str]]], batch_size: int) -> int:
+        """
+        Inserta las filas de un archivo en lotes dentro de una única transacción.
+
+        Args:
+            file_id: ID del archivo al que pertenecen las filas
+            rows: Pares (número de fila, valores) a insertar
+            batch_size: Número de filas por lote
+
+        Returns:
+            int: Número de filas insertadas
+
+        Raises:
+            Exception: Si falla la lectura de las filas o la inserción (se revierte la transacción)
+        """
+        statement = insert(FileRowModel.__table__)
+        batch = []
+        total = 0
+        try:
+            for row_number, values in rows:
+                batch.append({"file_id": file_id, "row_number": row_number, "data": values})
+                if len(batch) >= batch_size:
+                    self.db.execute(statement, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                self.db.execute(statement, batch)
+                total += len(batch)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return total
@@ -0,0 +1,130 @@
+"""
+Implementación del repositorio de validaciones de archivos.
+
+Implementa IFileValidationRepository con inserciones por lotes de
+SQLAlchemy Core y paginación por clave.
+"""
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+from app.domain.repositories.file_validation_repository import IFileValidationRepository
+from app.infrastructure.models.file_validation_model import FileValidationModel
+
+
+class FileValidationRepository(IFileValidationRepository):
+    """
+    Implementación concreta del repositorio de validaciones de archivos.
+
+    Los lotes se insertan con una sentencia INSERT de Core ejecutada como
+    executemany (fast_executemany con SQL Server). Las páginas se leen por
+    rango de seq sobre la clave (file_id, seq) o, con filtro de tipo o de
+    columna, sobre el índice (file_id, type, seq) o (file_id, column_name, seq),
+    de modo que cada consulta lee solo las filas de su página sea cual sea la
+    página. Con los dos filtros a la vez se recorre uno de los índices y el
+    otro filtro se aplica sobre sus filas.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Args:
+            db: Sesión de SQLAlchemy para operaciones de base de datos
+        """
+        self.db = db
+
+    def insert_batch(self, file_id: int, first_seq: int, findings: List[Dict[str, Any]]) -> int:
+        """
+        Inserta un lote de validaciones de un archivo y confirma la transacción.
+
+        Args:
+            file_id: ID del archivo
+            first_seq: Número de orden de la primera validación del lote
+            findings: Validaciones a insertar, en orden
+
+        Returns:
+            int: Número de validaciones insertadas
+        """
+        if not findings:
+            return 0
+        rows = [
+            {
+                "file_id": file_id,
+                "seq": first_seq + offset,
+                "row_number": finding.get("row"),
+                "type": finding["type"],
+                "column_name": finding.get("column"),
+                "first_row": finding.get("first_row"),
+                "message": finding["message"]
+            }
+            for offset, finding in enumerate(findings)
+        ]
+        try:
+            self.db.execute(insert(FileValidationModel.__table__), rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(rows)
+
+    def list_by_file_id(
+        self,
+        file_id: int,
+        after: Optional[int] = None,
+        limit: int = 100,
+        kind: Optional[str] = None,
+        column: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene una página de validaciones de un archivo.
+
+        Args:
+            file_id: ID del archivo
+            after: Número de orden de la última validación de la página anterior
+            limit: Número máximo de validaciones
+            kind: Tipo de validación por el que filtrar (opcional)
+            column: Columna por la que filtrar (opcional)
+
+        Returns:
+            List[Dict[str, Any]]: Validaciones en orden, cada una con su número de orden (seq)
+        """
+        table = FileValidationModel.__table__
+        query = select(table).where(table.c.file_id == file_id)
+        if after is not None:
+            query = query.where(table.c.seq > after)
+        if kind:
+            query = query.where(table.c.type == kind)
+        if column:
+            query = query.where(table.c.column_name == column)
+        query = query.order_by(table.c.seq).limit(limit)
+
+        findings = []
+        for row in self.db.execute(query):
+            finding = {"seq": row.seq, "type": row.type, "row": row.row_number}
+            if row.column_name is not None:
+                finding["column"] = row.column_name
+            if row.first_row is not None:
+                finding["first_row"] = row.first_row
+            finding["message"] = row.message
+            findings.append(finding)
+        return findings
+
+    def delete_by_file_id(self, file_id: int) -> int:
+        """
+        Elimina todas las validaciones de un archivo y confirma la transacción.
+
+        Args:
+            file_id: ID del archivo
+
+        Returns:
+            int: Número de validaciones eliminadas
+        """
+        table = FileValidationModel.__table__
+        try:
+            result = self.db.execute(delete(table).where(table.c.file_id == file_id))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return result.rowcount
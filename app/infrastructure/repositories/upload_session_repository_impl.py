@@ -0,0 +1,153 @@
+"""
+Implementación del repositorio de sesiones de carga reanudable.
+
+Implementa IUploadSessionRepository con SQLAlchemy Core.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+from app.domain.repositories.upload_session_repository import IUploadSessionRepository
+from app.infrastructure.models.upload_session_model import UploadSessionModel, UploadSessionPartModel
+
+
+class UploadSessionRepository(IUploadSessionRepository):
+    """
+    Implementación concreta del repositorio de sesiones de carga.
+
+    Cada bloque recibido cuesta una inserción en upload_session_parts y una
+    actualización de la fila de la sesión; consultar la sesión en cada
+    bloque lee solo su fila.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Inicializa el repositorio con una sesión de base de datos.
+
+        Args:
+            db: Sesión de SQLAlchemy para operaciones de base de datos
+        """
+        self.db = db
+
+    def create(self, session: Dict[str, Any]) -> None:
+        """
+        Registra una sesión abierta y confirma la transacción.
+
+        Args:
+            session: Estado de la sesión (UploadSession.to_record)
+        """
+        values = {key: value for key, value in session.items() if key != "parts"}
+        values["updated_at"] = datetime.utcnow()
+        try:
+            self.db.execute(insert(UploadSessionModel.__table__), values)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def add_part(self, session_id: str, part: Dict[str, Any], size: int, final_part: bool) -> None:
+        """
+        Registra una parte recibida y actualiza la sesión en una única transacción.
+
+        Args:
+            session_id: ID de la sesión
+            part: Parte recibida (PartNumber, ETag, size y sha256)
+            size: Bytes recibidos por la sesión tras la parte
+            final_part: Si la parte es la última del archivo
+        """
+        try:
+            self.db.execute(insert(UploadSessionPartModel.__table__), {
+                "session_id": session_id,
+                "part_number": part["PartNumber"],
+                "etag": part["ETag"],
+                "size": part["size"],
+                "sha256": part["sha256"]
+            })
+            self.db.execute(
+                update(UploadSessionModel.__table__)
+                .where(UploadSessionModel.session_id == session_id)
+                .values(
+                    size=size,
+                    part_count=part["PartNumber"],
+                    final_part=final_part,
+                    updated_at=datetime.utcnow()
+                )
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene el estado de una sesión sin sus partes.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Optional[Dict[str, Any]]: Estado de la sesión, None si no existe
+        """
+        row = self.db.execute(
+            select(UploadSessionModel.__table__).where(UploadSessionModel.session_id == session_id)
+        ).mappings().first()
+        return dict(row) if row is not None else None
+
+    def list_parts(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Obtiene las partes recibidas de una sesión ordenadas por número.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            List[Dict[str, Any]]: Partes (PartNumber, ETag, size y sha256)
+        """
+        rows = self.db.execute(
+            select(UploadSessionPartModel.__table__)
+            .where(UploadSessionPartModel.session_id == session_id)
+            .order_by(UploadSessionPartModel.part_number)
+        ).mappings()
+        return [
+            {"PartNumber": row["part_number"], "ETag": row["etag"], "size": row["size"], "sha256": row["sha256"]}
+            for row in rows
+        ]
+
+    def delete(self, session_id: str) -> bool:
+        """
+        Elimina una sesión y sus partes y confirma la transacción.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            bool: True si la sesión existía
+        """
+        try:
+            self.db.execute(
+                delete(UploadSessionPartModel.__table__).where(UploadSessionPartModel.session_id == session_id)
+            )
+            result = self.db.execute(
+                delete(UploadSessionModel.__table__).where(UploadSessionModel.session_id == session_id)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return result.rowcount > 0
+
+    def list_expired(self, before: datetime) -> List[Dict[str, Any]]:
+        """
+        Obtiene las sesiones cuyo último bloque se recibió antes de un instante.
+
+        Args:
+            before: Instante (UTC) de la última actividad admitida
+
+        Returns:
+            List[Dict[str, Any]]: Estado de las sesiones caducadas
+        """
+        rows = self.db.execute(
+            select(UploadSessionModel.__table__).where(UploadSessionModel.updated_at < before)
+        ).mappings()
+        return [dict(row) for row in rows]
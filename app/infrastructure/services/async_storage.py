@@ -0,0 +1,181 @@
+"""
+API asíncrona de almacenamiento.
+
+Los backends de almacenamiento son bloqueantes (boto3 no tiene cliente
+asíncrono), así que sus operaciones se ejecutan en un pool de hilos
+dedicado y acotado: los endpoints async las esperan sin bloquear el bucle
+de eventos ni ocupar el pool de hilos compartido de Starlette. El pool es
+solo para operaciones cortas del backend; las cargas, que leen y validan
+el archivo entero, se ejecutan en el pool de upload_workers para no
+retrasar las firmas y descargas.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Optional, Tuple
+
+from app.infrastructure.config import settings
+from app.domain.services.storage_backend import IStorageBackend, TransferStats
+from app.infrastructure.services.storage_backends import get_storage_backend
+
+# API asíncrona compartida por el proceso (se crea con get_async_storage)
+_async_storage: Optional["AsyncStorage"] = None
+_async_storage_lock = threading.Lock()
+
+
+class AsyncStorage:
+    """
+    Operaciones de almacenamiento asíncronas sobre un pool de hilos dedicado.
+
+    Attributes:
+        storage: Backend de almacenamiento que ejecuta las operaciones
+        max_workers: Número máximo de operaciones ejecutándose a la vez
+    """
+
+    def __init__(self, storage: Optional[IStorageBackend] = None, max_workers: int = 16):
+        """
+        Inicializa la API con su pool de hilos.
+
+        Args:
+            storage: Backend de almacenamiento (por defecto el compartido por el proceso)
+            max_workers: Número máximo de operaciones ejecutándose a la vez
+        """
+        self.storage = storage or get_storage_backend()
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="storage")
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Ejecuta una operación bloqueante de almacenamiento en el pool dedicado.
+
+        Args:
+            func: Función a ejecutar
+            *args: Argumentos posicionales de la función
+            **kwargs: Argumentos con nombre de la función
+
+        Returns:
+            Any: Resultado de la función
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def upload(
+        self,
+        file_obj: BinaryIO,
+        s3_key: str,
+        content_type: str,
+        stats: Optional[TransferStats] = None
+    ) -> Optional[str]:
+        """
+        Sube un archivo sin bloquear el bucle de eventos.
+
+        Args:
+            file_obj: Objeto de archivo a subir
+            s3_key: Clave del archivo
+            content_type: Tipo MIME del archivo
+            stats: Estadísticas donde anotar bytes, duración y velocidad (opcional)
+
+        Returns:
+            Optional[str]: URL del archivo si la subida fue exitosa, None en caso contrario
+        """
+        return await self.run(self.storage.upload_file, file_obj, s3_key, content_type, stats)
+
+    async def delete(self, s3_key: str) -> bool:
+        """
+        Elimina un archivo sin bloquear el bucle de eventos.
+
+        Args:
+            s3_key: Clave del archivo
+
+        Returns:
+            bool: True si se eliminó, False en caso contrario
+        """
+        return await self.run(self.storage.delete_file, s3_key)
+
+    async def presign(self, s3_key: str, expires_in: int = 3600) -> Optional[str]:
+        """
+        Genera una URL firmada temporal sin bloquear el bucle de eventos.
+
+        Args:
+            s3_key: Clave del archivo
+            expires_in: Tiempo de expiración de la URL en segundos
+
+        Returns:
+            Optional[str]: URL firmada, None si no se pudo generar
+        """
+        return await self.run(self.storage.get_file_url, s3_key, expires_in)
+
+    async def head(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene los metadatos de un archivo sin bloquear el bucle de eventos.
+
+        Args:
+            s3_key: Clave del archivo
+
+        Returns:
+            Optional[Dict[str, Any]]: size, etag, content_type, content_encoding y last_modified,
+                                      None si no existe o no se pudo consultar
+        """
+        return await self.run(self.storage.head_file, s3_key)
+
+    async def open(self, s3_key: str, byte_range: Optional[Tuple[int, int]] = None) -> Optional[BinaryIO]:
+        """
+        Abre el contenido de un archivo, o un rango de bytes, sin bloquear el bucle de eventos.
+
+        Args:
+            s3_key: Clave del archivo
+            byte_range: Primer y último byte a leer, ambos incluidos (opcional)
+
+        Returns:
+            Optional[BinaryIO]: Flujo con el contenido, None si no se pudo abrir
+        """
+        return await self.run(self.storage.get_file_stream, s3_key, byte_range)
+
+    async def iter_chunks(self, stream: BinaryIO, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """
+        Lee un flujo por bloques en el pool dedicado y lo cierra al terminar.
+
+        Solo hay un bloque en memoria a la vez, sea cual sea el tamaño del
+        archivo, y el flujo se cierra también si el cliente se desconecta.
+
+        Args:
+            stream: Flujo abierto con open
+            chunk_size: Bytes por bloque
+
+        Returns:
+            AsyncIterator[bytes]: Bloques del contenido
+        """
+        try:
+            while True:
+                chunk = await self.run(stream.read, chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            stream.close()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Detiene el pool de hilos.
+
+        Args:
+            wait: True para esperar a las operaciones en curso
+        """
+        self._executor.shutdown(wait=wait)
+
+
+def get_async_storage() -> AsyncStorage:
+    """
+    Obtiene la API asíncrona de almacenamiento compartida por el proceso.
+
+    Returns:
+        AsyncStorage: API con un pool de S3_ASYNC_WORKERS hilos
+    """
+    global _async_storage
+    if _async_storage is None:
+        with _async_storage_lock:
+            if _async_storage is None:
+                _async_storage = AsyncStorage(max_workers=settings.S3_ASYNC_WORKERS)
+    return _async_storage
@@ -0,0 +1,191 @@
+"""
+Caché de URLs firmadas de descarga.
+
+Firmar una URL no hace peticiones a S3, pero cuesta CPU y cada firma
+produce una URL distinta, lo que impide que el navegador reutilice la
+descarga. Al listar archivos se firman cientos por página, así que las URLs
+se guardan en memoria del proceso y se reutilizan mientras les quede al
+menos una fracción (PRESIGN_CACHE_MIN_VALIDITY) de su validez.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from app.infrastructure.config import settings
+
+# Caché compartida por el proceso (se crea con get_presigned_url_cache)
+_presigned_url_cache: Optional["PresignedUrlCache"] = None
+_presigned_url_cache_lock = threading.Lock()
+
+
+class PresignedUrlCache:
+    """
+    Caché LRU acotada de URLs firmadas con expiración.
+
+    Cada URL se guarda por (URL base del bucket, clave, segundos de validez
+    pedidos) y se descarta antes de caducar: solo se devuelve mientras le
+    quede al menos min_validity de la validez pedida, de modo que quien la
+    recibe siempre dispone de ese margen. Al superar max_size se descarta la
+    menos usada.
+
+    Attributes:
+        max_size: Número máximo de URLs guardadas (0 desactiva la caché)
+        min_validity: Fracción de la validez que debe quedarle a una URL para reutilizarla
+        hits: URLs servidas desde la caché
+        misses: URLs que hubo que firmar
+        expired: URLs descartadas por estar próximas a caducar
+        evictions: URLs descartadas por superar max_size
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        min_validity: float = 0.5,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa la caché vacía.
+
+        Args:
+            max_size: Número máximo de URLs guardadas (0 desactiva la caché)
+            min_validity: Fracción de la validez que debe quedarle a una URL (entre 0 y 1)
+            clock: Reloj en segundos (monótono por defecto)
+        """
+        self.max_size = max(0, max_size)
+        self.min_validity = min(max(min_validity, 0.0), 1.0)
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, str, int], Tuple[str, float]]" = OrderedDict()
+        self._expirations: Dict[Tuple[str, str], Set[int]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, namespace: str, s3_keys: Iterable[str], expires_in: int) -> Dict[str, str]:
+        """
+        Obtiene las URLs guardadas y vigentes de varias claves.
+
+        Args:
+            namespace: Espacio de nombres de las URLs (URL base del bucket)
+            s3_keys: Claves de los objetos
+            expires_in: Segundos de validez de las URLs pedidas
+
+        Returns:
+            Dict[str, str]: URL de cada clave encontrada (las demás hay que firmarlas)
+        """
+        now = self.clock()
+        urls = {}
+        with self._lock:
+            for s3_key in s3_keys:
+                if s3_key in urls:
+                    continue
+                entry = self._entries.get((namespace, s3_key, expires_in))
+                if entry is not None and now >= entry[1]:
+                    self._remove((namespace, s3_key, expires_in))
+                    self.expired += 1
+                    entry = None
+                if entry is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end((namespace, s3_key, expires_in))
+                self.hits += 1
+                urls[s3_key] = entry[0]
+        return urls
+
+    def put(self, namespace: str, s3_key: str, expires_in: int, url: str, signed_at: float) -> None:
+        """
+        Guarda una URL firmada.
+
+        Args:
+            namespace: Espacio de nombres de las URLs (URL base del bucket)
+            s3_key: Clave del objeto
+            expires_in: Segundos de validez de la URL
+            url: URL firmada
+            signed_at: Instante de la firma según clock (anterior a firmarla)
+        """
+        if self.max_size == 0:
+            return
+        entry_key = (namespace, s3_key, expires_in)
+        reusable_until = signed_at + expires_in * (1 - self.min_validity)
+        with self._lock:
+            self._entries[entry_key] = (url, reusable_until)
+            self._entries.move_to_end(entry_key)
+            self._expirations.setdefault((namespace, s3_key), set()).add(expires_in)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, namespace: str, s3_key: str) -> None:
+        """
+        Descarta las URLs guardadas de un objeto (por ejemplo, al eliminarlo).
+
+        Args:
+            namespace: Espacio de nombres de las URLs (URL base del bucket)
+            s3_key: Clave del objeto
+        """
+        with self._lock:
+            for expires_in in list(self._expirations.get((namespace, s3_key), ())):
+                self._remove((namespace, s3_key, expires_in))
+
+    def clear(self) -> None:
+        """
+        Descarta todas las URLs y reinicia las métricas.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._expirations.clear()
+            self.hits = self.misses = self.expired = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Obtiene las métricas de la caché.
+
+        Returns:
+            Dict[str, float]: Aciertos, fallos, caducadas, descartadas, tamaño y tasa de aciertos
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def _remove(self, entry_key: Tuple[str, str, int]) -> None:
+        """
+        Elimina una URL y su referencia en el índice por objeto (con el lock tomado).
+
+        Args:
+            entry_key: Espacio de nombres, clave y segundos de validez de la URL
+        """
+        self._entries.pop(entry_key, None)
+        object_key = entry_key[:2]
+        expirations = self._expirations.get(object_key)
+        if expirations is not None:
+            expirations.discard(entry_key[2])
+            if not expirations:
+                del self._expirations[object_key]
+
+
+def get_presigned_url_cache() -> PresignedUrlCache:
+    """
+    Obtiene la caché de URLs firmadas compartida por el proceso.
+
+    Returns:
+        PresignedUrlCache: Caché de PRESIGN_CACHE_SIZE URLs
+    """
+    global _presigned_url_cache
+    if _presigned_url_cache is None:
+        with _presigned_url_cache_lock:
+            if _presigned_url_cache is None:
+                _presigned_url_cache = PresignedUrlCache(
+                    settings.PRESIGN_CACHE_SIZE, settings.PRESIGN_CACHE_MIN_VALIDITY
+                )
+    return _presigned_url_cache
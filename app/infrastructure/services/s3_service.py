@@ -4,56 +4,635 @@ Servicio de almacenamiento en AWS S3.
 Proporciona funcionalidades para subir, descargar y gestionar archivos en S3.
 """
 
+import threading
+import time
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional, BinaryIO
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, BinaryIO, Tuple
+from app.domain.services.storage_backend import MAX_KEYS_PER_REQUEST, MIN_PART_SIZE, IStorageBackend, TransferStats
 from app.infrastructure.config import settings
+from app.infrastructure.services.presigned_url_cache import PresignedUrlCache, get_presigned_url_cache
 
+# Cliente de S3 compartido por el proceso (se crea con get_s3_client)
+_s3_client: Optional[Any] = None
+_s3_client_lock = threading.Lock()
 
-class S3Service:
+
+def create_s3_client() -> Any:
     """
-    Servicio para interactuar con AWS S3.
+    Crea un cliente de S3 con el pool de conexiones, keep-alive y timeouts configurados.
 
-    Proporciona métodos para subir archivos a S3 y obtener URLs de acceso.
+    Usa su propia sesión de boto3, ya que la sesión por defecto no es
+    segura al crear clientes desde varios hilos. El cliente creado sí lo es.
+
+    Returns:
+        Any: Cliente de S3 de boto3
+    """
+    config = Config(
+        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+        connect_timeout=settings.S3_CONNECT_TIMEOUT,
+        read_timeout=settings.S3_READ_TIMEOUT,
+        tcp_keepalive=settings.S3_TCP_KEEPALIVE,
+        retries={'max_attempts': settings.S3_MAX_ATTEMPTS, 'mode': 'standard'}
+    )
+    return boto3.session.Session().client(
+        's3',
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+        endpoint_url=settings.S3_ENDPOINT_URL or None,
+        config=config
+    )
+
+
+def get_s3_client() -> Any:
+    """
+    Obtiene el cliente de S3 compartido por el proceso, creándolo la primera vez.
+
+    Crear un cliente cuesta decenas de milisegundos y cada uno tiene su
+    propio pool de conexiones, así que todas las peticiones comparten uno
+    solo y reutilizan sus conexiones abiertas. La aplicación lo crea al
+    arrancar.
+
+    Returns:
+        Any: Cliente de S3 de boto3
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = create_s3_client()
+    return _s3_client
+
+
+def _object_url(bucket_name: str, s3_key: str) -> str:
+    """
+    Construye la URL pública de un objeto de S3.
+
+    Args:
+        bucket_name: Nombre del bucket
+        s3_key: Clave del objeto
+
+    Returns:
+        str: URL del objeto
     """
+    return f"https://{bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
+
+
+def _object_args(content_type: str, content_encoding: Optional[str] = None) -> Dict[str, str]:
+    """
+    Construye los metadatos HTTP con los que se guarda un objeto.
+
+    Args:
+        content_type: Tipo MIME del objeto
+        content_encoding: Compresión del objeto (gzip, zstd), None si no está comprimido
+
+    Returns:
+        Dict[str, str]: ContentType y, si se indica, ContentEncoding
+    """
+    args = {'ContentType': content_type}
+    if content_encoding:
+        args['ContentEncoding'] = content_encoding
+    return args
+
+
+def create_transfer_config() -> TransferConfig:
+    """
+    Crea la configuración de transferencia de upload_file a partir de la configuración.
+
+    Los archivos desde S3_TRANSFER_MULTIPART_THRESHOLD bytes se suben por
+    partes de S3_TRANSFER_CHUNK_SIZE bytes, hasta S3_TRANSFER_MAX_CONCURRENCY
+    a la vez.
+
+    Returns:
+        TransferConfig: Configuración de transferencia de boto3
+    """
+    max_concurrency = max(1, settings.S3_TRANSFER_MAX_CONCURRENCY)
+    return TransferConfig(
+        multipart_threshold=max(MIN_PART_SIZE, settings.S3_TRANSFER_MULTIPART_THRESHOLD),
+        multipart_chunksize=max(MIN_PART_SIZE, settings.S3_TRANSFER_CHUNK_SIZE),
+        max_concurrency=max_concurrency,
+        use_threads=max_concurrency > 1
+    )
+
+
+class S3MultipartUpload:
+    """
+    Carga de un objeto en S3 por partes a medida que se escriben sus bytes.
+
+    Los bytes se acumulan hasta completar una parte, que se sube en segundo
+    plano mientras quien escribe sigue trabajando (por ejemplo, validando el
+    siguiente bloque). Como mucho hay max_concurrency partes en vuelo: al
+    completar otra se espera a la más antigua, de modo que la memoria usada
+    está acotada por (max_concurrency + 1) partes. Los objetos que no llegan
+    a una parte se suben con una sola petición al completar la carga.
+
+    Si falla la subida de una parte, la siguiente escritura lanza el error
+    para que quien escribe se detenga.
+
+    Attributes:
+        s3_key: Clave del objeto en S3
+        content_type: Tipo MIME del objeto
+        content_encoding: Compresión del objeto (None si no está comprimido)
+        part_size: Tamaño de cada parte en bytes
+        max_concurrency: Número máximo de partes subiéndose a la vez
+        size: Bytes escritos
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket_name: str,
+        s3_key: str,
+        content_type: str,
+        part_size: int,
+        max_concurrency: int = 1,
+        content_encoding: Optional[str] = None,
+        url: Optional[str] = None
+    ):
+        """
+        Inicializa la carga. La carga por partes se inicia al subir la primera parte.
+
+        Args:
+            s3_client: Cliente de S3
+            bucket_name: Nombre del bucket
+            s3_key: Clave del objeto en S3
+            content_type: Tipo MIME del objeto
+            part_size: Tamaño de cada parte en bytes (mínimo 5 MB)
+            max_concurrency: Número máximo de partes subiéndose a la vez
+            content_encoding: Compresión del objeto (gzip, zstd), None si no está comprimido
+            url: URL que devuelve complete() (por defecto la URL pública en S3)
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.s3_key = s3_key
+        self.content_type = content_type
+        self.content_encoding = content_encoding
+        self.part_size = max(MIN_PART_SIZE, part_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.url = url or _object_url(bucket_name, s3_key)
+        self.size = 0
+        self.upload_id: Optional[str] = None
+        self.parts: List[Dict[str, Any]] = []
+        self._buffer = bytearray()
+        self._failed = False
+        self._next_part_number = 1
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Future] = deque()
+
+    def write(self, data: bytes) -> int:
+        """
+        Añade bytes al objeto, enviando una parte a subir cada vez que se completa.
+
+        Args:
+            data: Bytes a añadir
+
+        Returns:
+            int: Número de bytes añadidos
+
+        Raises:
+            ClientError: Si falló la subida de una parte (la carga se cancela)
+        """
+        try:
+            self._raise_failed_part()
+            self._buffer += data
+            self.size += len(data)
+            if len(self._buffer) >= self.part_size:
+                self._submit_part()
+        except ClientError:
+            self._failed = True
+            self.abort()
+            raise
+        return len(data)
+
+    def complete(self) -> Optional[str]:
+        """
+        Sube los bytes pendientes, espera a las partes en vuelo y completa el objeto.
+
+        Returns:
+            Optional[str]: URL del objeto en S3 si la subida fue exitosa, None en caso
+                           contrario (también si falló antes una parte)
+        """
+        if self._failed:
+            return None
+        try:
+            if self.upload_id is None:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=self.s3_key,
+                    Body=bytes(self._buffer),
+                    **_object_args(self.content_type, self.content_encoding)
+                )
+            else:
+                if self._buffer:
+                    self._submit_part()
+                while self._pending:
+                    self.parts.append(self._pending.popleft().result())
+                self._shutdown(cancel=False)
+                self.parts.sort(key=lambda part: part['PartNumber'])
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=self.s3_key,
+                    UploadId=self.upload_id,
+                    MultipartUpload={'Parts': self.parts}
+                )
+                self.upload_id = None
+            self._buffer = bytearray()
+            return self.url
+        except ClientError as e:
+            print(f"Error al completar la carga por partes en S3: {e}")
+            self.abort()
+            return None
 
-    def __init__(self):
+    def abort(self) -> None:
         """
-        Inicializa el cliente de S3 con las credenciales configuradas.
+        Cancela la carga: descarta las partes pendientes y las ya subidas.
         """
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
+        self._buffer = bytearray()
+        self._shutdown(cancel=True)
+        upload_id, self.upload_id = self.upload_id, None
+        if upload_id is None:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket_name, Key=self.s3_key, UploadId=upload_id)
+        except ClientError as e:
+            print(f"Error al cancelar la carga por partes en S3: {e}")
+
+    def _submit_part(self) -> None:
+        """
+        Envía a subir en segundo plano los bytes acumulados como una parte.
+
+        Inicia la carga por partes si hace falta y, si ya hay max_concurrency
+        partes en vuelo, espera a que termine la más antigua.
+        """
+        if self.upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=self.s3_key,
+                **_object_args(self.content_type, self.content_encoding)
+            )
+            self.upload_id = response['UploadId']
+        while len(self._pending) >= self.max_concurrency:
+            self.parts.append(self._pending.popleft().result())
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="s3-part")
+
+        body, self._buffer = bytes(self._buffer), bytearray()
+        part_number = self._next_part_number
+        self._next_part_number += 1
+        self._pending.append(self._executor.submit(self._upload_part, self.upload_id, part_number, body))
+
+    def _upload_part(self, upload_id: str, part_number: int, body: bytes) -> Dict[str, Any]:
+        """
+        Sube una parte del objeto.
+
+        Args:
+            upload_id: ID de la carga por partes
+            part_number: Número de la parte (desde 1)
+            body: Contenido de la parte
+
+        Returns:
+            Dict[str, Any]: ETag y número de la parte
+        """
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.s3_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body
         )
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+    def _raise_failed_part(self) -> None:
+        """
+        Lanza el error de la primera parte en vuelo que haya fallado.
+
+        Raises:
+            ClientError: Si alguna parte terminó con error
+        """
+        for future in self._pending:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+    def _shutdown(self, cancel: bool) -> None:
+        """
+        Detiene el pool de subida de partes esperando a las que están en curso.
+
+        Args:
+            cancel: True para descartar las partes que aún no empezaron a subirse
+        """
+        executor, self._executor = self._executor, None
+        if cancel:
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=cancel)
+
+
+class S3Service(IStorageBackend):
+    """
+    Backend de almacenamiento en AWS S3.
+
+    Proporciona métodos para subir archivos a S3 y obtener URLs de acceso.
+    Funciona con cualquier cliente con la API de S3 de boto3, lo que
+    permite reutilizarlo con los backends simulados (local y en memoria).
+    """
+
+    def __init__(
+        self,
+        s3_client: Optional[Any] = None,
+        transfer_config: Optional[TransferConfig] = None,
+        url_cache: Optional[PresignedUrlCache] = None
+    ):
+        """
+        Inicializa el servicio con el cliente de S3 compartido por el proceso.
+
+        Args:
+            s3_client: Cliente de S3 a usar (por defecto el de get_s3_client)
+            transfer_config: Configuración de transferencia de upload_file
+                             (por defecto la de create_transfer_config)
+            url_cache: Caché de URLs firmadas (por defecto la compartida por el proceso)
+        """
+        self.s3_client = s3_client or get_s3_client()
         self.bucket_name = settings.S3_BUCKET_NAME
+        self.transfer_config = transfer_config or create_transfer_config()
+        self.url_cache = url_cache or get_presigned_url_cache()
+
+    def object_url(self, s3_key: str) -> str:
+        """
+        Construye la URL con la que se guarda un objeto subido.
+
+        Args:
+            s3_key: Clave del objeto
+
+        Returns:
+            str: URL del objeto
+        """
+        return _object_url(self.bucket_name, s3_key)
 
-    def upload_file(self, file_obj: BinaryIO, s3_key: str, content_type: str) -> Optional[str]:
+    def create_presigned_post(
+        self,
+        s3_key: str,
+        content_type: str,
+        content_encoding: Optional[str] = None,
+        max_size: int = 5 * 1024 * 1024 * 1024,
+        expires_in: int = 3600
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Genera un formulario POST firmado para subir un archivo directamente a S3.
+
+        La política firmada fija la clave, el tipo MIME, la compresión y el
+        tamaño máximo: S3 rechaza cualquier envío que no los respete.
+
+        Args:
+            s3_key: Clave única del archivo en S3
+            content_type: Tipo MIME que debe enviar el cliente
+            content_encoding: Compresión que debe enviar el cliente (gzip, zstd), None si no está comprimido
+            max_size: Tamaño máximo del archivo en bytes (S3 admite hasta 5 GB por POST)
+            expires_in: Segundos de validez del formulario
+
+        Returns:
+            Optional[Dict[str, Any]]: URL del formulario (url) y campos a enviar con el archivo (fields),
+                                      None si no se pudo generar
+        """
+        fields = {'Content-Type': content_type}
+        conditions: List[Any] = [{'Content-Type': content_type}, ['content-length-range', 1, max_size]]
+        if content_encoding:
+            fields['Content-Encoding'] = content_encoding
+            conditions.append({'Content-Encoding': content_encoding})
+        try:
+            return self.s3_client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Fields=fields,
+                Conditions=conditions,
+                ExpiresIn=expires_in
+            )
+        except ClientError as e:
+            print(f"Error al generar el formulario de subida a S3: {e}")
+            return None
+
+    def upload_file(
+        self,
+        file_obj: BinaryIO,
+        s3_key: str,
+        content_type: str,
+        stats: Optional[TransferStats] = None
+    ) -> Optional[str]:
         """
         Sube un archivo a S3.
 
+        Los archivos que superan el umbral de transfer_config se suben por
+        partes en paralelo.
+
         Args:
             file_obj: Objeto de archivo a subir (file-like object)
             s3_key: Clave única del archivo en S3 (ruta/nombre)
             content_type: Tipo MIME del archivo
+            stats: Estadísticas donde anotar bytes, duración y velocidad (opcional)
 
         Returns:
             Optional[str]: URL del archivo en S3 si la subida fue exitosa, None en caso contrario
         """
+        started = time.perf_counter()
         try:
             self.s3_client.upload_fileobj(
                 file_obj,
                 self.bucket_name,
                 s3_key,
-                ExtraArgs={'ContentType': content_type}
+                ExtraArgs={'ContentType': content_type},
+                Callback=stats.add if stats is not None else None,
+                Config=self.transfer_config
             )
             # Generar URL del archivo
-            url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
-            return url
-        except ClientError as e:
+            return self.object_url(s3_key)
+        except (ClientError, S3UploadFailedError) as e:
             print(f"Error al subir archivo a S3: {e}")
             return None
+        finally:
+            if stats is not None:
+                stats.seconds = time.perf_counter() - started
+
+    def start_upload(
+        self,
+        s3_key: str,
+        content_type: str,
+        content_encoding: Optional[str] = None
+    ) -> S3MultipartUpload:
+        """
+        Inicia la carga de un archivo cuyo contenido se escribe por bloques.
+
+        Las partes se suben en segundo plano (hasta S3_UPLOAD_CONCURRENCY a
+        la vez) mientras se siguen escribiendo bloques.
+
+        Args:
+            s3_key: Clave única del archivo en S3 (ruta/nombre)
+            content_type: Tipo MIME del archivo
+            content_encoding: Compresión del archivo (gzip, zstd), None si no está comprimido
+
+        Returns:
+            S3MultipartUpload: Carga en curso; se completa con complete() o se cancela con abort()
+        """
+        return S3MultipartUpload(
+            self.s3_client,
+            self.bucket_name,
+            s3_key,
+            content_type,
+            settings.S3_MULTIPART_PART_SIZE,
+            settings.S3_UPLOAD_CONCURRENCY,
+            content_encoding,
+            self.object_url(s3_key)
+        )
+
+    def create_multipart_upload(
+        self,
+        s3_key: str,
+        content_type: str,
+        content_encoding: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Inicia una carga por partes cuyas partes se suben con upload_part.
+
+        Args:
+            s3_key: Clave única del archivo en S3 (ruta/nombre)
+            content_type: Tipo MIME del archivo
+            content_encoding: Compresión del archivo (gzip, zstd), None si no está comprimido
+
+        Returns:
+            Optional[str]: ID de la carga por partes, None si no se pudo iniciar
+        """
+        try:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=s3_key, **_object_args(content_type, content_encoding)
+            )
+            return response['UploadId']
+        except ClientError as e:
+            print(f"Error al iniciar la carga por partes en S3: {e}")
+            return None
+
+    def upload_part(self, s3_key: str, upload_id: str, part_number: int, body: bytes) -> Optional[str]:
+        """
+        Sube una parte de una carga por partes. Subir de nuevo un número de parte la reemplaza.
+
+        Args:
+            s3_key: Clave del archivo en S3
+            upload_id: ID de la carga por partes
+            part_number: Número de la parte (desde 1)
+            body: Contenido de la parte (mínimo 5 MB salvo la última)
+
+        Returns:
+            Optional[str]: ETag de la parte, None si no se pudo subir
+        """
+        try:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return response['ETag']
+        except ClientError as e:
+            print(f"Error al subir la parte {part_number} a S3: {e}")
+            return None
+
+    def complete_multipart_upload(
+        self,
+        s3_key: str,
+        upload_id: str,
+        parts: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Completa una carga por partes con las partes indicadas.
+
+        Args:
+            s3_key: Clave del archivo en S3
+            upload_id: ID de la carga por partes
+            parts: ETag y número de cada parte, en orden
+
+        Returns:
+            Optional[str]: URL del archivo en S3, None si no se pudo completar
+        """
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+            return self.object_url(s3_key)
+        except ClientError as e:
+            print(f"Error al completar la carga por partes en S3: {e}")
+            return None
+
+    def abort_multipart_upload(self, s3_key: str, upload_id: str) -> bool:
+        """
+        Cancela una carga por partes descartando las partes subidas.
+
+        Args:
+            s3_key: Clave del archivo en S3
+            upload_id: ID de la carga por partes
+
+        Returns:
+            bool: True si se canceló correctamente, False en caso contrario
+        """
+        try:
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id)
+            return True
+        except ClientError as e:
+            print(f"Error al cancelar la carga por partes en S3: {e}")
+            return False
+
+    def head_file(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene los metadatos de un archivo de S3 con HeadObject.
+
+        Args:
+            s3_key: Clave del archivo en S3
+
+        Returns:
+            Optional[Dict[str, Any]]: size, etag, content_type, content_encoding y last_modified,
+                                      None si el archivo no existe o no se pudo consultar
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError as e:
+            print(f"Error al consultar archivo de S3: {e}")
+            return None
+        return {
+            'size': response['ContentLength'],
+            'etag': response.get('ETag'),
+            'content_type': response.get('ContentType'),
+            'content_encoding': response.get('ContentEncoding'),
+            'last_modified': response.get('LastModified')
+        }
+
+    def get_file_stream(self, s3_key: str, byte_range: Optional[Tuple[int, int]] = None) -> Optional[BinaryIO]:
+        """
+        Abre el contenido de un archivo de S3 como flujo de bytes.
+
+        El cuerpo se lee bajo demanda, sin descargar el archivo completo en memoria.
+
+        Args:
+            s3_key: Clave del archivo en S3
+            byte_range: Primer y último byte a leer, ambos incluidos (por defecto, el archivo completo)
+
+        Returns:
+            Optional[BinaryIO]: Flujo con el contenido del archivo, None si no se pudo abrir
+        """
+        args = {'Bucket': self.bucket_name, 'Key': s3_key}
+        if byte_range is not None:
+            args['Range'] = f"bytes={byte_range[0]}-{byte_range[1]}"
+        try:
+            response = self.s3_client.get_object(**args)
+            return response['Body']
+        except ClientError as e:
+            print(f"Error al leer archivo de S3: {e}")
+            return None
 
     def delete_file(self, s3_key: str) -> bool:
         """
@@ -65,6 +644,7 @@ class S3Service:
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario
         """
+        self.url_cache.invalidate(self.object_url(""), s3_key)
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
             return True
@@ -72,10 +652,70 @@ class S3Service:
             print(f"Error al eliminar archivo de S3: {e}")
             return False
 
+    def delete_files(self, s3_keys: List[str]) -> List[str]:
+        """
+        Elimina varios archivos de S3 con DeleteObjects, hasta 1000 claves por petición.
+
+        Args:
+            s3_keys: Claves de los archivos en S3 a eliminar
+
+        Returns:
+            List[str]: Claves que no se pudieron eliminar (vacía si se eliminaron todas)
+        """
+        failed = []
+        namespace = self.object_url("")
+        for start in range(0, len(s3_keys), MAX_KEYS_PER_REQUEST):
+            batch = s3_keys[start:start + MAX_KEYS_PER_REQUEST]
+            for s3_key in batch:
+                self.url_cache.invalidate(namespace, s3_key)
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': s3_key} for s3_key in batch], 'Quiet': True}
+                )
+            except ClientError as e:
+                print(f"Error al eliminar archivos de S3: {e}")
+                failed.extend(batch)
+                continue
+            for error in response.get('Errors', []):
+                print(f"Error al eliminar {error.get('Key')} de S3: {error.get('Code')} {error.get('Message')}")
+                failed.append(error.get('Key'))
+        return failed
+
+    def list_objects(self, prefix: str = "", page_size: int = MAX_KEYS_PER_REQUEST) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Recorre los objetos de S3 bajo un prefijo por páginas de ListObjectsV2, en orden de clave.
+
+        Args:
+            prefix: Prefijo de las claves
+            page_size: Número máximo de objetos por página (hasta 1000)
+
+        Returns:
+            Iterator[List[Dict[str, Any]]]: Páginas de objetos con key, size y last_modified
+
+        Raises:
+            ClientError: Si no se pudo obtener una página
+        """
+        args = {'Bucket': self.bucket_name, 'Prefix': prefix, 'MaxKeys': min(max(1, page_size), MAX_KEYS_PER_REQUEST)}
+        while True:
+            response = self.s3_client.list_objects_v2(**args)
+            page = [
+                {'key': item['Key'], 'size': item['Size'], 'last_modified': item['LastModified']}
+                for item in response.get('Contents', [])
+            ]
+            if page:
+                yield page
+            if not response.get('IsTruncated'):
+                return
+            args['ContinuationToken'] = response['NextContinuationToken']
+
     def get_file_url(self, s3_key: str, expires_in: int = 3600) -> Optional[str]:
         """
         Genera una URL firmada temporal para acceder a un archivo en S3.
 
+        Reutiliza la URL de la caché mientras le quede al menos
+        PRESIGN_CACHE_MIN_VALIDITY de su validez.
+
         Args:
             s3_key: Clave del archivo en S3
             expires_in: Tiempo de expiración de la URL en segundos (por defecto 1 hora)
@@ -83,13 +723,34 @@ class S3Service:
         Returns:
             Optional[str]: URL firmada si el archivo existe, None en caso contrario
         """
-        try:
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                ExpiresIn=expires_in
-            )
-            return url
-        except ClientError as e:
-            print(f"Error al generar URL de S3: {e}")
-            return None
+        return self.get_file_urls([s3_key], expires_in)[s3_key]
+
+    def get_file_urls(self, s3_keys: List[str], expires_in: int = 3600) -> Dict[str, Optional[str]]:
+        """
+        Genera URLs firmadas temporales de varios archivos, firmando solo las que no están en caché.
+
+        Args:
+            s3_keys: Claves de los archivos en S3
+            expires_in: Tiempo de expiración de las URLs en segundos (por defecto 1 hora)
+
+        Returns:
+            Dict[str, Optional[str]]: URL firmada de cada clave (None si no se pudo generar)
+        """
+        namespace = self.object_url("")
+        urls: Dict[str, Optional[str]] = dict(self.url_cache.get_many(namespace, s3_keys, expires_in))
+        for s3_key in s3_keys:
+            if s3_key in urls:
+                continue
+            signed_at = self.url_cache.clock()
+            try:
+                urls[s3_key] = self.s3_client.generate_presigned_url(
+                    'get_object',
+                    Params={'Bucket': self.bucket_name, 'Key': s3_key},
+                    ExpiresIn=expires_in
+                )
+            except ClientError as e:
+                print(f"Error al generar URL de S3: {e}")
+                urls[s3_key] = None
+                continue
+            self.url_cache.put(namespace, s3_key, expires_in, urls[s3_key], signed_at)
+        return urls
@@ -0,0 +1,1004 @@
+"""
+Backends de almacenamiento simulados y selección del backend.
+
+Los backends local (sistema de archivos) y en memoria permiten ejecutar,
+probar y medir la ruta de subida sin AWS. Implementan un subconjunto de la
+API del cliente de S3 de boto3 (ObjectStoreClient) y reutilizan S3Service
+sobre él, de modo que las cargas por partes, los errores y las URLs se
+comportan igual que con S3. Ambos admiten una latencia por petición y un
+ancho de banda por transferencia simulados.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from app.domain.services.storage_backend import MAX_KEYS_PER_REQUEST, MIN_PART_SIZE, IStorageBackend
+from app.infrastructure.config import settings
+from app.infrastructure.services.s3_service import S3Service
+
+# Backends de almacenamiento disponibles en STORAGE_BACKEND
+STORAGE_BACKENDS = ("s3", "local", "memory")
+
+# Prefijo reservado para las partes de las cargas por partes en curso
+_MULTIPART_PREFIX = ".multipart"
+
+# Rango de bytes de GetObject (el único formato que envía S3Service)
+_BYTE_RANGE = re.compile(r"^bytes=(\d+)-(\d+)$")
+
+# Archivos temporales del backend local mientras se escribe un objeto
+_LOCAL_TEMP_FILE = re.compile(r"^\..+\.[0-9a-f]{32}\.tmp$")
+
+# Backend compartido por el proceso (se crea con get_storage_backend)
+_storage_backend: Optional[IStorageBackend] = None
+_storage_backend_lock = threading.Lock()
+
+
+def _client_error(code: str, message: str, operation: str) -> ClientError:
+    """
+    Construye un error con el mismo formato que los del cliente de S3.
+
+    Args:
+        code: Código de error de S3 (NoSuchKey, NoSuchUpload...)
+        message: Descripción del error
+        operation: Operación de S3 que falló
+
+    Returns:
+        ClientError: Error de botocore
+    """
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+class Throttle:
+    """
+    Latencia y ancho de banda simulados de un almacenamiento remoto.
+
+    El ancho de banda se aplica a cada transferencia por separado (como el
+    de una conexión), de modo que las transferencias en paralelo suman.
+
+    Attributes:
+        latency: Segundos de espera de cada petición
+        bandwidth: Bytes por segundo de cada transferencia (None = sin límite)
+    """
+
+    def __init__(self, latency: float = 0.0, bandwidth: Optional[float] = None):
+        """
+        Inicializa la simulación.
+
+        Args:
+            latency: Segundos de espera de cada petición
+            bandwidth: Bytes por segundo de cada transferencia (None o 0 = sin límite)
+        """
+        self.latency = max(0.0, latency)
+        self.bandwidth = bandwidth or None
+
+    def request(self) -> None:
+        """
+        Espera la latencia de una petición.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+    def transfer(self, amount: int) -> None:
+        """
+        Espera lo que tardaría en transferirse una cantidad de bytes.
+
+        Args:
+            amount: Bytes transferidos
+        """
+        if self.bandwidth and amount:
+            time.sleep(amount / self.bandwidth)
+
+
+class ThrottledReader(io.RawIOBase):
+    """
+    Flujo de lectura que simula el ancho de banda de la descarga.
+
+    Attributes:
+        source: Flujo con el contenido del objeto
+        throttle: Simulación de latencia y ancho de banda
+        remaining: Bytes que quedan por leer (None si se lee hasta el final)
+    """
+
+    def __init__(self, source: BinaryIO, throttle: Throttle, limit: Optional[int] = None):
+        """
+        Inicializa el flujo.
+
+        Args:
+            source: Flujo con el contenido del objeto
+            throttle: Simulación de latencia y ancho de banda
+            limit: Bytes máximos a leer (por defecto, hasta el final del objeto)
+        """
+        super().__init__()
+        self.source = source
+        self.throttle = throttle
+        self.remaining = limit
+
+    def readable(self) -> bool:
+        """
+        Indica que el flujo admite lectura.
+
+        Returns:
+            bool: Siempre True
+        """
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """
+        Lee bytes del objeto esperando lo que tardaría su transferencia.
+
+        Args:
+            buffer: Buffer donde copiar los bytes
+
+        Returns:
+            int: Bytes leídos (0 al final del objeto)
+        """
+        size = len(buffer) if self.remaining is None else min(len(buffer), self.remaining)
+        data = self.source.read(size) if size else b""
+        if self.remaining is not None:
+            self.remaining -= len(data)
+        self.throttle.transfer(len(data))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        """
+        Cierra el flujo y el contenido del objeto.
+        """
+        if not self.closed:
+            self.source.close()
+        super().close()
+
+
+class ObjectStoreClient(ABC):
+    """
+    Almacén de objetos con la API del cliente de S3 de boto3 que usa S3Service.
+
+    Las subclases solo guardan, leen y eliminan blobs con sus metadatos; la
+    lógica de S3 (cargas por partes, ETag, errores) está aquí. Los blobs se
+    identifican por "<bucket>/<clave>", y las partes de las cargas en curso
+    por "<_MULTIPART_PREFIX>/<upload_id>/...", que no colisiona con ningún
+    bucket.
+
+    Attributes:
+        throttle: Simulación de latencia y ancho de banda
+    """
+
+    def __init__(self, throttle: Optional[Throttle] = None):
+        """
+        Inicializa el almacén.
+
+        Args:
+            throttle: Simulación de latencia y ancho de banda (por defecto ninguna)
+        """
+        self.throttle = throttle or Throttle()
+
+    @abstractmethod
+    def _write(self, name: str, chunks: Iterable[bytes], metadata: Dict[str, Any]) -> None:
+        """
+        Guarda un blob reemplazando el anterior.
+
+        Args:
+            name: Nombre del blob
+            chunks: Contenido del blob por bloques
+            metadata: Metadatos del blob
+        """
+        pass
+
+    @abstractmethod
+    def _read(self, name: str) -> Optional[Tuple[BinaryIO, Dict[str, Any]]]:
+        """
+        Abre un blob.
+
+        Args:
+            name: Nombre del blob
+
+        Returns:
+            Optional[Tuple[BinaryIO, Dict[str, Any]]]: Contenido y metadatos, None si no existe
+        """
+        pass
+
+    @abstractmethod
+    def _delete(self, name: str, prefix: bool = False) -> None:
+        """
+        Elimina un blob o todos los blobs bajo un prefijo.
+
+        Args:
+            name: Nombre del blob o prefijo
+            prefix: True para eliminar todos los blobs bajo "<name>/"
+        """
+        pass
+
+    @abstractmethod
+    def _list(self, prefix: str) -> List[Tuple[str, int, datetime]]:
+        """
+        Lista los blobs cuyo nombre empieza por un prefijo.
+
+        Args:
+            prefix: Prefijo de los nombres ("<bucket>/<prefijo de clave>")
+
+        Returns:
+            List[Tuple[str, int, datetime]]: Nombre, tamaño y fecha de modificación de cada blob
+        """
+        pass
+
+    @abstractmethod
+    def object_url(self, bucket: str, key: str) -> str:
+        """
+        Construye la URL de un objeto.
+
+        Args:
+            bucket: Nombre del bucket
+            key: Clave del objeto
+
+        Returns:
+            str: URL del objeto
+        """
+        pass
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Guarda un objeto con una sola petición.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            Body: Contenido del objeto
+            **kwargs: ContentType y ContentEncoding
+
+        Returns:
+            Dict[str, Any]: ETag del objeto
+        """
+        self.throttle.request()
+        self.throttle.transfer(len(Body))
+        return self._write_object(Bucket, Key, [Body], hashlib.md5(Body).hexdigest(), kwargs)
+
+    def upload_fileobj(
+        self,
+        Fileobj: BinaryIO,
+        Bucket: str,
+        Key: str,
+        ExtraArgs: Optional[Dict[str, Any]] = None,
+        Callback: Optional[Callable[[int], None]] = None,
+        Config: Optional[TransferConfig] = None
+    ) -> None:
+        """
+        Sube un archivo en bloques de multipart_chunksize, hasta max_concurrency a la vez.
+
+        Args:
+            Fileobj: Objeto de archivo a subir
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            ExtraArgs: ContentType y ContentEncoding
+            Callback: Función a la que notificar los bytes transferidos
+            Config: Configuración de transferencia (tamaño de parte y concurrencia)
+        """
+        chunk_size = Config.multipart_chunksize if Config is not None else MIN_PART_SIZE
+        concurrency = Config.max_concurrency if Config is not None and Config.use_threads else 1
+
+        def transfer(chunk: bytes) -> bytes:
+            self.throttle.transfer(len(chunk))
+            if Callback is not None:
+                Callback(len(chunk))
+            return chunk
+
+        self.throttle.request()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            chunks = list(executor.map(transfer, iter(lambda: Fileobj.read(chunk_size), b"")))
+        digest = hashlib.md5()
+        for chunk in chunks:
+            digest.update(chunk)
+        self._write_object(Bucket, Key, chunks, digest.hexdigest(), ExtraArgs or {})
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Inicia una carga por partes.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            **kwargs: ContentType y ContentEncoding
+
+        Returns:
+            Dict[str, Any]: ID de la carga (UploadId)
+        """
+        self.throttle.request()
+        upload_id = uuid.uuid4().hex
+        self._write(f"{_MULTIPART_PREFIX}/{upload_id}/upload", [], {"Bucket": Bucket, "Key": Key, **kwargs})
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes) -> Dict[str, Any]:
+        """
+        Sube una parte de una carga por partes.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            UploadId: ID de la carga por partes
+            PartNumber: Número de la parte (desde 1)
+            Body: Contenido de la parte
+
+        Returns:
+            Dict[str, Any]: ETag de la parte
+
+        Raises:
+            ClientError: Si la carga no existe (NoSuchUpload)
+        """
+        self.throttle.request()
+        self._upload_args(Bucket, Key, UploadId, "UploadPart")
+        self.throttle.transfer(len(Body))
+        etag = hashlib.md5(Body).hexdigest()
+        self._write(f"{_MULTIPART_PREFIX}/{UploadId}/{PartNumber}", [Body], {"ETag": f'"{etag}"'})
+        return {"ETag": f'"{etag}"'}
+
+    def complete_multipart_upload(
+        self,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        MultipartUpload: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Completa una carga por partes uniendo las partes indicadas en orden.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            UploadId: ID de la carga por partes
+            MultipartUpload: ETag y número de cada parte
+
+        Returns:
+            Dict[str, Any]: ETag del objeto
+
+        Raises:
+            ClientError: Si la carga no existe (NoSuchUpload) o falta una parte o su ETag
+                         no coincide (InvalidPart)
+        """
+        self.throttle.request()
+        args = self._upload_args(Bucket, Key, UploadId, "CompleteMultipartUpload")
+        parts = MultipartUpload.get("Parts", [])
+        streams = []
+        for part in parts:
+            blob = self._read(f"{_MULTIPART_PREFIX}/{UploadId}/{part['PartNumber']}")
+            if blob is None or blob[1].get("ETag") != part["ETag"]:
+                for stream in streams:
+                    stream.close()
+                if blob is not None:
+                    blob[0].close()
+                raise _client_error(
+                    "InvalidPart", f"La parte {part['PartNumber']} no existe", "CompleteMultipartUpload"
+                )
+            streams.append(blob[0])
+
+        def chunks() -> Iterable[bytes]:
+            for stream in streams:
+                with stream:
+                    yield from iter(lambda: stream.read(MIN_PART_SIZE), b"")
+
+        digest = hashlib.md5(b"".join(bytes.fromhex(part["ETag"].strip('"')) for part in parts))
+        result = self._write_object(Bucket, Key, chunks(), f"{digest.hexdigest()}-{len(parts)}", args)
+        self._delete(f"{_MULTIPART_PREFIX}/{UploadId}", prefix=True)
+        return result
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> Dict[str, Any]:
+        """
+        Cancela una carga por partes descartando sus partes.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            UploadId: ID de la carga por partes
+
+        Returns:
+            Dict[str, Any]: Respuesta vacía
+
+        Raises:
+            ClientError: Si la carga no existe (NoSuchUpload)
+        """
+        self.throttle.request()
+        self._upload_args(Bucket, Key, UploadId, "AbortMultipartUpload")
+        self._delete(f"{_MULTIPART_PREFIX}/{UploadId}", prefix=True)
+        return {}
+
+    def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Abre un objeto, o un rango de bytes de él, para leerlo bajo demanda.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            Range: Rango de bytes "bytes=<primero>-<último>" (opcional)
+
+        Returns:
+            Dict[str, Any]: Contenido (Body) y metadatos del objeto; con Range, ContentLength
+                            es el del rango e incluye ContentRange
+
+        Raises:
+            ClientError: Si el objeto no existe (NoSuchKey) o el rango no es válido (InvalidRange)
+        """
+        self.throttle.request()
+        blob = self._read(f"{Bucket}/{Key}")
+        if blob is None:
+            raise _client_error("NoSuchKey", f"El objeto {Key} no existe", "GetObject")
+        stream, metadata = blob
+        if Range is None:
+            return {**metadata, "Body": ThrottledReader(stream, self.throttle)}
+
+        match = _BYTE_RANGE.match(Range)
+        size = metadata["ContentLength"]
+        if match is None or int(match.group(1)) >= size or int(match.group(2)) < int(match.group(1)):
+            stream.close()
+            raise _client_error("InvalidRange", f"El rango {Range} no es válido", "GetObject")
+        start, end = int(match.group(1)), min(int(match.group(2)), size - 1)
+        stream.seek(start)
+        return {
+            **metadata,
+            "ContentLength": end - start + 1,
+            "ContentRange": f"bytes {start}-{end}/{size}",
+            "Body": ThrottledReader(stream, self.throttle, end - start + 1)
+        }
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """
+        Obtiene los metadatos de un objeto sin leer su contenido.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+
+        Returns:
+            Dict[str, Any]: Metadatos del objeto
+
+        Raises:
+            ClientError: Si el objeto no existe (404)
+        """
+        self.throttle.request()
+        blob = self._read(f"{Bucket}/{Key}")
+        if blob is None:
+            raise _client_error("404", "Not Found", "HeadObject")
+        stream, metadata = blob
+        stream.close()
+        return metadata
+
+    def delete_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        """
+        Elimina un objeto. Como en S3, eliminar un objeto que no existe no es un error.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+
+        Returns:
+            Dict[str, Any]: Respuesta vacía
+        """
+        self.throttle.request()
+        self._delete(f"{Bucket}/{Key}")
+        return {}
+
+    def delete_objects(self, Bucket: str, Delete: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Elimina varios objetos con una sola petición.
+
+        Args:
+            Bucket: Nombre del bucket
+            Delete: Claves de los objetos (Objects) y modo silencioso (Quiet)
+
+        Returns:
+            Dict[str, Any]: Claves eliminadas (salvo en modo silencioso) y errores
+
+        Raises:
+            ClientError: Si hay más de 1000 claves (MalformedXML)
+        """
+        self.throttle.request()
+        objects = Delete.get("Objects", [])
+        if len(objects) > MAX_KEYS_PER_REQUEST:
+            raise _client_error("MalformedXML", "Más de 1000 claves en la petición", "DeleteObjects")
+        for item in objects:
+            self._delete(f"{Bucket}/{item['Key']}")
+        deleted = [] if Delete.get("Quiet") else [{"Key": item["Key"]} for item in objects]
+        return {"Deleted": deleted, "Errors": []}
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        MaxKeys: int = MAX_KEYS_PER_REQUEST,
+        ContinuationToken: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Lista una página de los objetos bajo un prefijo, en orden de clave.
+
+        Args:
+            Bucket: Nombre del bucket
+            Prefix: Prefijo de las claves
+            MaxKeys: Número máximo de objetos de la página
+            ContinuationToken: Token devuelto por la página anterior
+
+        Returns:
+            Dict[str, Any]: Objetos de la página (Contents), IsTruncated y NextContinuationToken
+        """
+        self.throttle.request()
+        blobs = sorted(self._list(f"{Bucket}/{Prefix}"))
+        start = len(Bucket) + 1
+        contents = [
+            {"Key": name[start:], "Size": size, "LastModified": modified}
+            for name, size, modified in blobs
+            if ContinuationToken is None or name[start:] > ContinuationToken
+        ]
+        page = contents[:min(MaxKeys, MAX_KEYS_PER_REQUEST)]
+        response = {"Contents": page, "KeyCount": len(page), "IsTruncated": len(contents) > len(page)}
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = page[-1]["Key"]
+        return response
+
+    def generate_presigned_url(self, ClientMethod: str, Params: Dict[str, str], ExpiresIn: int = 3600) -> str:
+        """
+        Genera la URL de un objeto con su expiración (no hay firma que simular).
+
+        Args:
+            ClientMethod: Operación de la URL (get_object)
+            Params: Bucket y clave del objeto
+            ExpiresIn: Segundos de validez de la URL
+
+        Returns:
+            str: URL del objeto
+        """
+        return f"{self.object_url(Params['Bucket'], Params['Key'])}?expires={int(time.time()) + ExpiresIn}"
+
+    def generate_presigned_post(
+        self,
+        Bucket: str,
+        Key: str,
+        Fields: Optional[Dict[str, str]] = None,
+        Conditions: Optional[List[Any]] = None,
+        ExpiresIn: int = 3600
+    ) -> Dict[str, Any]:
+        """
+        Genera el formulario de subida de un objeto (no hay firma que simular).
+
+        Los almacenamientos simulados no atienden peticiones HTTP: el objeto
+        debe escribirse con las demás operaciones del cliente.
+
+        Args:
+            Bucket: Nombre del bucket
+            Key: Clave del objeto
+            Fields: Campos del formulario
+            Conditions: Condiciones de la política (se ignoran)
+            ExpiresIn: Segundos de validez del formulario
+
+        Returns:
+            Dict[str, Any]: URL del bucket y campos del formulario con la clave
+        """
+        return {"url": self.object_url(Bucket, ""), "fields": {**(Fields or {}), "key": Key}}
+
+    def head_bucket(self, Bucket: str) -> Dict[str, Any]:
+        """
+        Comprueba el acceso al bucket (los buckets simulados siempre existen).
+
+        Args:
+            Bucket: Nombre del bucket
+
+        Returns:
+            Dict[str, Any]: Respuesta vacía
+        """
+        self.throttle.request()
+        return {}
+
+    def _write_object(
+        self,
+        bucket: str,
+        key: str,
+        chunks: Iterable[bytes],
+        etag: str,
+        args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Guarda un objeto con sus metadatos HTTP.
+
+        Args:
+            bucket: Nombre del bucket
+            key: Clave del objeto
+            chunks: Contenido del objeto por bloques
+            etag: ETag del objeto (sin comillas)
+            args: ContentType y ContentEncoding
+
+        Returns:
+            Dict[str, Any]: ETag del objeto
+        """
+        metadata = {name: value for name, value in args.items() if name in ("ContentType", "ContentEncoding")}
+        metadata["ETag"] = f'"{etag}"'
+        self._write(f"{bucket}/{key}", chunks, metadata)
+        return {"ETag": metadata["ETag"]}
+
+    def _upload_args(self, bucket: str, key: str, upload_id: str, operation: str) -> Dict[str, Any]:
+        """
+        Obtiene los metadatos con los que se inició una carga por partes.
+
+        Args:
+            bucket: Nombre del bucket
+            key: Clave del objeto
+            upload_id: ID de la carga por partes
+            operation: Operación de S3 en curso (para el error)
+
+        Returns:
+            Dict[str, Any]: ContentType y ContentEncoding de la carga
+
+        Raises:
+            ClientError: Si la carga no existe o es de otro objeto (NoSuchUpload)
+        """
+        blob = self._read(f"{_MULTIPART_PREFIX}/{upload_id}/upload")
+        if blob is not None:
+            blob[0].close()
+        if blob is None or blob[1].get("Bucket") != bucket or blob[1].get("Key") != key:
+            raise _client_error("NoSuchUpload", f"La carga {upload_id} no existe", operation)
+        return blob[1]
+
+
+class MemoryObjectStore(ObjectStoreClient):
+    """
+    Almacén de objetos en memoria del proceso.
+    """
+
+    def __init__(self, throttle: Optional[Throttle] = None):
+        """
+        Inicializa el almacén vacío.
+
+        Args:
+            throttle: Simulación de latencia y ancho de banda (por defecto ninguna)
+        """
+        super().__init__(throttle)
+        self._blobs: Dict[str, Tuple[bytes, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _write(self, name: str, chunks: Iterable[bytes], metadata: Dict[str, Any]) -> None:
+        """
+        Guarda un blob reemplazando el anterior.
+
+        Args:
+            name: Nombre del blob
+            chunks: Contenido del blob por bloques
+            metadata: Metadatos del blob
+        """
+        data = b"".join(chunks)
+        metadata = {**metadata, "ContentLength": len(data), "LastModified": datetime.now(timezone.utc)}
+        with self._lock:
+            self._blobs[name] = (data, metadata)
+
+    def _read(self, name: str) -> Optional[Tuple[BinaryIO, Dict[str, Any]]]:
+        """
+        Abre un blob.
+
+        Args:
+            name: Nombre del blob
+
+        Returns:
+            Optional[Tuple[BinaryIO, Dict[str, Any]]]: Contenido y metadatos, None si no existe
+        """
+        with self._lock:
+            blob = self._blobs.get(name)
+        if blob is None:
+            return None
+        return io.BytesIO(blob[0]), dict(blob[1])
+
+    def _delete(self, name: str, prefix: bool = False) -> None:
+        """
+        Elimina un blob o todos los blobs bajo un prefijo.
+
+        Args:
+            name: Nombre del blob o prefijo
+            prefix: True para eliminar todos los blobs bajo "<name>/"
+        """
+        with self._lock:
+            if not prefix:
+                self._blobs.pop(name, None)
+                return
+            for blob_name in [blob for blob in self._blobs if blob.startswith(f"{name}/")]:
+                del self._blobs[blob_name]
+
+    def _list(self, prefix: str) -> List[Tuple[str, int, datetime]]:
+        """
+        Lista los blobs cuyo nombre empieza por un prefijo.
+
+        Args:
+            prefix: Prefijo de los nombres ("<bucket>/<prefijo de clave>")
+
+        Returns:
+            List[Tuple[str, int, datetime]]: Nombre, tamaño y fecha de modificación de cada blob
+        """
+        with self._lock:
+            return [
+                (name, len(data), metadata["LastModified"])
+                for name, (data, metadata) in self._blobs.items()
+                if name.startswith(prefix) and "LastModified" in metadata
+            ]
+
+    def object_url(self, bucket: str, key: str) -> str:
+        """
+        Construye la URL de un objeto.
+
+        Args:
+            bucket: Nombre del bucket
+            key: Clave del objeto
+
+        Returns:
+            str: URL memory://<bucket>/<clave>
+        """
+        return f"memory://{bucket}/{key}"
+
+
+class LocalObjectStore(ObjectStoreClient):
+    """
+    Almacén de objetos en un directorio local.
+
+    Cada blob es un archivo bajo root y sus metadatos un JSON bajo
+    root/.meta. Los archivos se escriben en un temporal y se renombran al
+    terminar, de modo que nunca se lee un objeto a medio escribir.
+
+    Attributes:
+        root: Directorio del almacén
+    """
+
+    def __init__(self, root: str, throttle: Optional[Throttle] = None):
+        """
+        Inicializa el almacén creando su directorio si no existe.
+
+        Args:
+            root: Directorio del almacén
+            throttle: Simulación de latencia y ancho de banda (por defecto ninguna)
+        """
+        super().__init__(throttle)
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, name: str, meta: bool = False) -> Path:
+        """
+        Obtiene la ruta de un blob o de sus metadatos.
+
+        Args:
+            name: Nombre del blob
+            meta: True para la ruta de los metadatos
+
+        Returns:
+            Path: Ruta dentro del almacén
+
+        Raises:
+            ClientError: Si el nombre sale del directorio del almacén (InvalidKey)
+        """
+        base = self.root / ".meta" if meta else self.root
+        path = (base / name).resolve()
+        if base.resolve() not in path.parents:
+            raise _client_error("InvalidKey", f"Clave no válida: {name}", "PutObject")
+        return path.with_name(f"{path.name}.json") if meta else path
+
+    def _write(self, name: str, chunks: Iterable[bytes], metadata: Dict[str, Any]) -> None:
+        """
+        Guarda un blob reemplazando el anterior.
+
+        Args:
+            name: Nombre del blob
+            chunks: Contenido del blob por bloques
+            metadata: Metadatos del blob
+        """
+        path, meta_path = self._path(name), self._path(name, meta=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        size = 0
+        try:
+            with open(temp, "wb") as file_obj:
+                for chunk in chunks:
+                    file_obj.write(chunk)
+                    size += len(chunk)
+            meta_path.write_text(json.dumps({**metadata, "ContentLength": size}))
+            os.replace(temp, path)
+        finally:
+            if temp.exists():
+                temp.unlink()
+
+    def _read(self, name: str) -> Optional[Tuple[BinaryIO, Dict[str, Any]]]:
+        """
+        Abre un blob.
+
+        Args:
+            name: Nombre del blob
+
+        Returns:
+            Optional[Tuple[BinaryIO, Dict[str, Any]]]: Contenido y metadatos, None si no existe
+        """
+        try:
+            metadata = json.loads(self._path(name, meta=True).read_text())
+            stream = open(self._path(name), "rb")
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return None
+        metadata["LastModified"] = datetime.fromtimestamp(os.fstat(stream.fileno()).st_mtime, timezone.utc)
+        return stream, metadata
+
+    def _delete(self, name: str, prefix: bool = False) -> None:
+        """
+        Elimina un blob o todos los blobs bajo un prefijo.
+
+        Args:
+            name: Nombre del blob o prefijo
+            prefix: True para eliminar todos los blobs bajo "<name>/"
+        """
+        if prefix:
+            shutil.rmtree(self._path(name), ignore_errors=True)
+            shutil.rmtree(self.root / ".meta" / name, ignore_errors=True)
+            return
+        for path in (self._path(name), self._path(name, meta=True)):
+            if path.is_file():
+                path.unlink()
+
+    def _list(self, prefix: str) -> List[Tuple[str, int, datetime]]:
+        """
+        Lista los blobs cuyo nombre empieza por un prefijo.
+
+        Solo se recorre el directorio más profundo que contiene el prefijo.
+
+        Args:
+            prefix: Prefijo de los nombres ("<bucket>/<prefijo de clave>")
+
+        Returns:
+            List[Tuple[str, int, datetime]]: Nombre, tamaño y fecha de modificación de cada blob
+        """
+        directory = self.root / prefix.rsplit("/", 1)[0] if "/" in prefix else self.root
+        blobs = []
+        for current, _, filenames in os.walk(directory):
+            for filename in filenames:
+                path = Path(current) / filename
+                name = path.relative_to(self.root).as_posix()
+                if not name.startswith(prefix) or _LOCAL_TEMP_FILE.match(filename):
+                    continue
+                stat = path.stat()
+                blobs.append((name, stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc)))
+        return blobs
+
+    def object_url(self, bucket: str, key: str) -> str:
+        """
+        Construye la URL de un objeto.
+
+        Args:
+            bucket: Nombre del bucket
+            key: Clave del objeto
+
+        Returns:
+            str: URL file:// del archivo del objeto
+        """
+        return self._path(f"{bucket}/{key}").as_uri()
+
+
+class SimulatedStorageBackend(S3Service):
+    """
+    Backend de almacenamiento con S3Service sobre un almacén de objetos simulado.
+
+    Attributes:
+        store: Almacén de objetos (local o en memoria)
+    """
+
+    def __init__(self, store: ObjectStoreClient, transfer_config: Optional[TransferConfig] = None):
+        """
+        Inicializa el backend.
+
+        Args:
+            store: Almacén de objetos (local o en memoria)
+            transfer_config: Configuración de transferencia de upload_file
+                             (por defecto la de create_transfer_config)
+        """
+        super().__init__(store, transfer_config)
+        self.store = store
+
+    def object_url(self, s3_key: str) -> str:
+        """
+        Construye la URL con la que se guarda un objeto subido.
+
+        Args:
+            s3_key: Clave del objeto
+
+        Returns:
+            str: URL del objeto en el almacén simulado
+        """
+        return self.store.object_url(self.bucket_name, s3_key)
+
+
+class MemoryStorageBackend(SimulatedStorageBackend):
+    """
+    Backend de almacenamiento en memoria del proceso.
+
+    Los objetos se pierden al terminar el proceso y no se comparten entre
+    workers: sirve para pruebas y benchmarks.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        transfer_config: Optional[TransferConfig] = None
+    ):
+        """
+        Inicializa el backend vacío.
+
+        Args:
+            latency: Segundos de espera de cada petición
+            bandwidth: Bytes por segundo de cada transferencia (None = sin límite)
+            transfer_config: Configuración de transferencia de upload_file
+        """
+        super().__init__(MemoryObjectStore(Throttle(latency, bandwidth)), transfer_config)
+
+
+class LocalStorageBackend(SimulatedStorageBackend):
+    """
+    Backend de almacenamiento en un directorio local.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        transfer_config: Optional[TransferConfig] = None
+    ):
+        """
+        Inicializa el backend creando su directorio si no existe.
+
+        Args:
+            root: Directorio donde se guardan los objetos
+            latency: Segundos de espera de cada petición
+            bandwidth: Bytes por segundo de cada transferencia (None = sin límite)
+            transfer_config: Configuración de transferencia de upload_file
+        """
+        super().__init__(LocalObjectStore(root, Throttle(latency, bandwidth)), transfer_config)
+
+
+def create_storage_backend(backend: Optional[str] = None) -> IStorageBackend:
+    """
+    Crea el backend de almacenamiento indicado en la configuración.
+
+    Args:
+        backend: Backend a crear (s3, local, memory); por defecto STORAGE_BACKEND
+
+    Returns:
+        IStorageBackend: Backend de almacenamiento
+
+    Raises:
+        ValueError: Si el backend no existe
+    """
+    backend = (backend or settings.STORAGE_BACKEND).lower()
+    latency = settings.STORAGE_LATENCY_MS / 1000
+    bandwidth = settings.STORAGE_BANDWIDTH_MBPS * 1024 * 1024 or None
+    if backend == "s3":
+        return S3Service()
+    if backend == "local":
+        return LocalStorageBackend(settings.STORAGE_LOCAL_ROOT, latency, bandwidth)
+    if backend == "memory":
+        return MemoryStorageBackend(latency, bandwidth)
+    raise ValueError(f"Backend de almacenamiento no válido: {backend} (válidos: {', '.join(STORAGE_BACKENDS)})")
+
+
+def get_storage_backend() -> IStorageBackend:
+    """
+    Obtiene el backend de almacenamiento compartido por el proceso, creándolo la primera vez.
+
+    Es compartido para que el backend en memoria conserve sus objetos entre
+    peticiones; el de S3 usa además el cliente compartido.
+
+    Returns:
+        IStorageBackend: Backend de STORAGE_BACKEND
+    """
+    global _storage_backend
+    if _storage_backend is None:
+        with _storage_backend_lock:
+            if _storage_backend is None:
+                _storage_backend = create_storage_backend()
+    return _storage_backend
@@ -8,11 +8,19 @@ Este módulo configura e inicia la aplicación FastAPI, incluyendo:
 - Manejo de excepciones globales
 """
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.presentation.routers import auth, files, tokens, documents, history, web
-from app.infrastructure.database import engine, Base
+from app.infrastructure.database import SessionLocal, engine, Base
 from app.infrastructure.config import settings
+from app.infrastructure.repositories.file_repository_impl import FileRepository
+from app.application.jobs.upload_jobs import upload_jobs
+from app.application.use_cases.file_use_case import FileUseCase
+from app.application.jobs.upload_workers import upload_workers
+from app.infrastructure.services.async_storage import get_async_storage
+from app.infrastructure.services.presigned_url_cache import get_presigned_url_cache
+from app.infrastructure.services.storage_backends import get_storage_backend
+from app.presentation.middleware.auth_middleware import get_current_user
 
 # Crear tablas en la base de datos
 Base.metadata.create_all(bind=engine)
@@ -43,6 +51,44 @@ app.include_router(history.router, prefix="/api/history", tags=["Historial"])
 app.include_router(web.router, tags=["Web"])
 
 
+@app.on_event("startup")
+def create_shared_storage():
+    """
+    Crea al arrancar el backend de almacenamiento (con el cliente de S3, si
+    STORAGE_BACKEND es s3) y la API asíncrona de almacenamiento compartidos.
+    """
+    get_storage_backend()
+    get_async_storage()
+
+
+@app.on_event("startup")
+def fail_interrupted_uploads():
+    """
+    Marca como fallidas al arrancar las cargas asíncronas encoladas hace más de
+    UPLOAD_JOB_STALE_SECONDS que ningún proceso llegó a procesar.
+    """
+    db = SessionLocal()
+    try:
+        failed = FileUseCase(FileRepository(db)).fail_stale_uploads(settings.UPLOAD_JOB_STALE_SECONDS)
+        if failed:
+            print(f"Cargas asíncronas interrumpidas marcadas como fallidas: {failed}")
+    except Exception as e:
+        print(f"Error al revisar las cargas asíncronas interrumpidas: {e}")
+    finally:
+        db.close()
+
+
+@app.on_event("shutdown")
+def shutdown_upload_jobs():
+    """
+    Espera a que terminen las cargas asíncronas, las cargas atendidas durante la
+    petición y las operaciones de almacenamiento en curso al detener la aplicación.
+    """
+    upload_jobs.shutdown(wait=True)
+    upload_workers.shutdown(wait=True)
+    get_async_storage().shutdown(wait=True)
+
+
 @app.get("/")
 async def root():
     """
@@ -67,3 +113,17 @@ async def health_check():
         dict: Estado de la API
     """
     return {"status": "healthy"}
+
+
+@app.get("/metrics")
+async def metrics(current_user: dict = Depends(get_current_user)):
+    """
+    Endpoint de métricas del proceso. Requiere autenticación.
+
+    Args:
+        current_user: Usuario autenticado
+
+    Returns:
+        dict: Aciertos, fallos, tamaño y tasa de aciertos de la caché de URLs firmadas
+    """
+    return {"presigned_url_cache": get_presigned_url_cache().stats()}
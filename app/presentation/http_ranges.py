@@ -0,0 +1,109 @@
+"""
+Utilidades HTTP para la descarga de archivos.
+
+Interpreta las cabeceras Range, If-None-Match e If-Range de las descargas
+(RFC 9110) y construye la cabecera Content-Disposition.
+"""
+
+import re
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+# Un único rango de bytes: "bytes=<primero>-[<último>]" o "bytes=-<sufijo>"
+_SINGLE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    """
+    El rango pedido empieza después del final del archivo.
+
+    Attributes:
+        size: Tamaño del archivo en bytes
+    """
+
+    def __init__(self, size: int):
+        """
+        Inicializa el error.
+
+        Args:
+            size: Tamaño del archivo en bytes
+        """
+        super().__init__(f"Rango no satisfacible para un archivo de {size} bytes")
+        self.size = size
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Interpreta la cabecera Range de una petición.
+
+    Solo se atiende un rango de bytes; una cabecera con varios rangos o mal
+    formada se ignora y se envía el archivo completo, como permite el RFC.
+
+    Args:
+        header: Valor de la cabecera Range (None si no se envió)
+        size: Tamaño del archivo en bytes
+
+    Returns:
+        Optional[Tuple[int, int]]: Primer y último byte del rango (incluidos), None para el archivo completo
+
+    Raises:
+        RangeNotSatisfiable: Si el rango no contiene ningún byte del archivo
+    """
+    if not header:
+        return None
+    match = _SINGLE_RANGE.match(header.strip().replace(" ", ""))
+    if match is None or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.group(1), match.group(2)
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable(size)
+        return max(0, size - suffix), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(size)
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def etag_matches(header: Optional[str], etag: Optional[str], weak: bool = True) -> bool:
+    """
+    Comprueba si una cabecera de condición (If-None-Match, If-Range) incluye un ETag.
+
+    Args:
+        header: Valor de la cabecera (lista de ETags separados por comas o "*")
+        etag: ETag actual del archivo (con comillas)
+        weak: True para la comparación débil (If-None-Match), False para la fuerte (If-Range)
+
+    Returns:
+        bool: True si la cabecera incluye el ETag
+    """
+    if not header or not etag:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag.removeprefix("W/"):
+            return True
+    return False
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Construye la cabecera Content-Disposition de una descarga.
+
+    Args:
+        filename: Nombre original del archivo
+
+    Returns:
+        str: Cabecera con el nombre en ASCII y en UTF-8 (RFC 6266)
+    """
+    fallback = "".join(char if " " <= char <= "~" and char not in '"\\' else "_" for char in filename)
+    return f'attachment; filename="{fallback}"; filename*=UTF-8\'\'{quote(filename, safe="")}'
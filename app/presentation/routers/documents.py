@@ -8,6 +8,7 @@ import os
 import tempfile
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.infrastructure.database import get_db
 from app.domain.repositories.document_repository import IDocumentRepository
 from app.infrastructure.repositories.document_repository_impl import DocumentRepository
@@ -36,6 +37,18 @@ def get_document_use_case(db: Session = Depends(get_db)) -> DocumentUseCase:
     return DocumentUseCase(document_repository)
 
 
+def write_temp_file(path: str, content: bytes) -> None:
+    """
+    Guarda el contenido de un documento en un archivo temporal.
+
+    Args:
+        path: Ruta del archivo temporal
+        content: Contenido del documento
+    """
+    with open(path, "wb") as f:
+        f.write(content)
+
+
 @router.post("/analyze", response_model=DocumentAnalysisResponse, status_code=status.HTTP_201_CREATED)
 async def analyze_document(
     file: UploadFile = File(..., description="Documento a analizar (PDF, JPG, PNG)"),
@@ -74,11 +87,11 @@ async def analyze_document(
     temp_file_path = os.path.join(UPLOAD_DIR, f"temp_{current_user['id_usuario']}_{file.filename}")
 
     try:
-        with open(temp_file_path, "wb") as f:
-            f.write(file_content)
+        await run_in_threadpool(write_temp_file, temp_file_path, file_content)
 
-        # Analizar documento
-        result = use_case.analyze_document(
+        # Analizar documento (llamada bloqueante a Azure, fuera del bucle de eventos)
+        result = await run_in_threadpool(
+            use_case.analyze_document,
             file_path=temp_file_path,
             filename=file.filename,
             user_id=current_user["id_usuario"]
@@ -4,17 +4,58 @@ Router de archivos.
 Define los endpoints relacionados con carga y validación de archivos CSV.
 """
 
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status
+from datetime import timezone
+from email.utils import format_datetime
+from functools import partial
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from app.infrastructure.database import get_db
+from starlette.concurrency import run_in_threadpool
+from app.infrastructure.database import SessionLocal, get_db
 from app.domain.repositories.file_repository import IFileRepository
 from app.infrastructure.repositories.file_repository_impl import FileRepository
-from app.application.use_cases.file_use_case import FileUseCase
-from app.presentation.schemas.file_schemas import FileUploadResponse
+from app.infrastructure.repositories.file_row_repository_impl import FileRowRepository
+from app.infrastructure.repositories.file_validation_repository_impl import FileValidationRepository
+from app.infrastructure.repositories.upload_session_repository_impl import UploadSessionRepository
+from app.application.use_cases.file_use_case import (
+    FileUseCase,
+    REPORT_MODES,
+    VALIDATION_BACKENDS,
+    schema_registry,
+)
+from app.application.ingestion.batch_archive import read_zip_items, stream_item
+from app.application.ingestion.decompression import ACCEPTED_EXTENSIONS, DecompressedSizeExceeded
+from app.application.ingestion.upload_session import ChunkOrderError, UploadSession
+from app.application.jobs.upload_jobs import UploadProgress, upload_jobs
+from app.application.jobs.upload_sessions import upload_sessions
+from app.application.jobs.upload_workers import upload_workers
+from app.infrastructure.config import settings
+from app.infrastructure.services.async_storage import AsyncStorage, get_async_storage
+from app.presentation.schemas.file_schemas import (
+    DirectUploadResponse,
+    FileBatchResponse,
+    FileJobResponse,
+    FileListPage,
+    FileStatusResponse,
+    FileUploadResponse,
+    FileValidationsPage,
+    UploadSessionResponse,
+)
+from app.presentation.http_ranges import RangeNotSatisfiable, content_disposition, etag_matches, parse_range
 from app.presentation.middleware.auth_middleware import require_role
 
 router = APIRouter()
 
+# Tamaño máximo de página de validaciones
+MAX_VALIDATIONS_PAGE_SIZE = 1000
+
+# Tamaño máximo de página de la lista de archivos
+MAX_FILES_PAGE_SIZE = 500
+
+# Bytes leídos del almacenamiento y enviados al cliente en cada bloque de una descarga
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def get_file_use_case(db: Session = Depends(get_db)) -> FileUseCase:
     """
@@ -27,14 +68,194 @@ def get_file_use_case(db: Session = Depends(get_db)) -> FileUseCase:
         FileUseCase: Instancia del caso de uso de archivos
     """
     file_repository: IFileRepository = FileRepository(db)
-    return FileUseCase(file_repository)
+    return FileUseCase(
+        file_repository,
+        FileRowRepository(db),
+        FileValidationRepository(db),
+        upload_session_repository=UploadSessionRepository(db)
+    )
+
+
+def run_upload_job(
+    file_id: int,
+    validation_backend: Optional[str],
+    report_mode: Optional[str],
+    schema_profile: Optional[str],
+    progress: UploadProgress
+) -> None:
+    """
+    Procesa en segundo plano un archivo registrado en modo asíncrono.
+
+    Usa su propia sesión de base de datos, ya que la de la petición se
+    cierra al responder. El contenido se lee de S3, donde se subió durante
+    la petición.
+
+    Args:
+        file_id: ID del archivo registrado
+        validation_backend: Backend de validación (opcional)
+        report_mode: Modo de reporte de validaciones (opcional)
+        schema_profile: Nombre del perfil de esquema (opcional)
+        progress: Progreso del trabajo
+    """
+    db = SessionLocal()
+    try:
+        use_case = FileUseCase(FileRepository(db), FileRowRepository(db), FileValidationRepository(db))
+        use_case.process_upload(
+            file_id,
+            validation_backend=validation_backend,
+            report_mode=report_mode,
+            schema_profile=schema_profile,
+            progress=progress
+        )
+    finally:
+        db.close()
+
+
+def run_session_validation(
+    validation_backend: Optional[str],
+    report_mode: Optional[str],
+    schema_profile: Optional[str],
+    file_id: int,
+    s3_key: str,
+    stream: BinaryIO
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Valida los bloques de una sesión de carga reanudable a medida que llegan.
+
+    Se ejecuta en el hilo de la sesión durante varias peticiones, por lo
+    que usa su propia sesión de base de datos para guardar las validaciones.
+
+    Args:
+        validation_backend: Backend de validación (opcional)
+        report_mode: Modo de reporte de validaciones (opcional)
+        schema_profile: Nombre del perfil de esquema (opcional)
+        file_id: ID del archivo registrado para la sesión
+        s3_key: Clave del archivo en S3
+        stream: Flujo con los bloques de la sesión
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]: Validaciones y reporte agregado
+    """
+    db = SessionLocal()
+    try:
+        use_case = FileUseCase(FileRepository(db), None, FileValidationRepository(db))
+        return use_case.validate_upload_chunks(
+            file_id, s3_key, stream, validation_backend, report_mode, schema_profile
+        )
+    finally:
+        db.close()
+
+
+def run_staging_job(file_id: int, progress: UploadProgress) -> None:
+    """
+    Carga en segundo plano las filas de un archivo completado por bloques.
 
+    Args:
+        file_id: ID del archivo
+        progress: Progreso del trabajo
+    """
+    db = SessionLocal()
+    try:
+        use_case = FileUseCase(FileRepository(db), FileRowRepository(db), FileValidationRepository(db))
+        use_case.load_uploaded_staging(file_id, progress)
+    finally:
+        db.close()
+
+
+async def get_upload_session(session_id: str, user_id: int, use_case: FileUseCase) -> UploadSession:
+    """
+    Obtiene una sesión de carga abierta del usuario.
+
+    La sesión se restaura de su estado guardado si la abrió otro proceso o
+    si recibió bloques en otro proceso, y se registra en este.
+
+    Args:
+        session_id: ID de la sesión
+        user_id: ID del usuario actual
+        use_case: Caso de uso de archivos
+
+    Returns:
+        UploadSession: Sesión de carga
 
-@router.post("/upload", response_model=FileUploadResponse, status_code=status.HTTP_201_CREATED)
+    Raises:
+        HTTPException: Si la sesión no existe o es de otro usuario
+    """
+    local = upload_sessions.get(session_id)
+    session = await run_in_threadpool(use_case.resume_upload_session, session_id, user_id, local)
+    if session is None:
+        if local is not None and local.user_id == user_id:
+            upload_sessions.remove(session_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sesión de carga no encontrada"
+        )
+    upload_sessions.add(session)
+    return session
+
+
+def session_response(state: Dict[str, Any]) -> UploadSessionResponse:
+    """
+    Construye la respuesta con el estado de una sesión de carga.
+
+    Args:
+        state: Estado de la sesión (UploadSession.to_dict)
+
+    Returns:
+        UploadSessionResponse: Estado de la sesión y límites de tamaño de bloque
+    """
+    return UploadSessionResponse(**state, max_chunk_size=settings.UPLOAD_SESSION_MAX_CHUNK_SIZE)
+
+
+def validate_upload_options(
+    validation_backend: Optional[str],
+    report_mode: Optional[str],
+    schema_profile: Optional[str]
+) -> None:
+    """
+    Comprueba el backend de validación, el modo de reporte y el perfil de esquema.
+
+    Args:
+        validation_backend: Backend de validación (opcional)
+        report_mode: Modo de reporte (opcional)
+        schema_profile: Nombre del perfil de esquema (opcional)
+
+    Raises:
+        HTTPException: Si alguna opción no existe
+    """
+    if validation_backend and validation_backend not in VALIDATION_BACKENDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Backend de validación inválido. Permitidos: {', '.join(VALIDATION_BACKENDS)}"
+        )
+
+    if report_mode and report_mode not in REPORT_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Modo de reporte inválido. Permitidos: {', '.join(REPORT_MODES)}"
+        )
+
+    if schema_profile and schema_profile not in schema_registry.names():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Perfil de esquema inexistente: {schema_profile}"
+        )
+
+
+@router.post(
+    "/upload",
+    response_model=Union[FileUploadResponse, FileJobResponse],
+    status_code=status.HTTP_201_CREATED
+)
 async def upload_file(
+    response: Response,
     file: UploadFile = File(..., description="Archivo CSV a subir"),
     param1: str = Form(..., description="Primer parámetro adicional"),
     param2: str = Form(..., description="Segundo parámetro adicional"),
+    validation_backend: Optional[str] = Form(None, description="Backend de validación: streaming o columnar"),
+    report_mode: Optional[str] = Form(None, description="Modo de reporte: full o summary"),
+    schema_profile: Optional[str] = Form(None, description="Perfil de esquema de validación"),
+    force_upload: bool = Form(False, description="Subir una copia nueva aunque el contenido ya exista"),
+    async_processing: bool = Form(False, description="Procesar en segundo plano y responder 202"),
     current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
     use_case: FileUseCase = Depends(get_file_use_case)
 ):
@@ -42,45 +263,811 @@ async def upload_file(
     Endpoint para subir y validar un archivo CSV.
 
     Sube el archivo a AWS S3, procesa y guarda el contenido en SQL Server,
-    y devuelve una lista de validaciones aplicadas al archivo.
+    y devuelve una lista de validaciones aplicadas al archivo. Primero se
+    calcula el resumen del archivo recibido para devolver sin subirlo un
+    contenido ya validado; después se lee por bloques una sola vez: cada
+    bloque se sube a S3 como parte de una carga por partes a la vez que lo
+    procesa el validador. Los archivos
+    .csv.gz y .csv.zst se guardan comprimidos y se validan descomprimiéndolos
+    al vuelo.
     El acceso está limitado a usuarios con rol específico.
 
     Args:
+        response: Respuesta HTTP (para fijar el código 202 en modo asíncrono)
         file: Archivo CSV a subir
         param1: Primer parámetro adicional
         param2: Segundo parámetro adicional
+        validation_backend: Backend de validación (opcional)
+        report_mode: Modo de reporte de validaciones (opcional)
+        schema_profile: Nombre del perfil de esquema (opcional)
+        force_upload: Si se sube una copia nueva aunque el mismo contenido ya exista
+        async_processing: Si el archivo se procesa en segundo plano. En ese caso
+                          se responde 202 con el ID del archivo y el estado se
+                          consulta en GET /api/files/{file_id}
         current_user: Usuario actual autenticado (validado por middleware)
         use_case: Caso de uso de archivos
 
     Returns:
-        FileUploadResponse: Información del archivo subido y validaciones
+        Union[FileUploadResponse, FileJobResponse]: Información del archivo subido y
+            validaciones, o el ID del archivo encolado en modo asíncrono
 
     Raises:
-        HTTPException: Si hay error al procesar el archivo
+        HTTPException: Si hay error al procesar el archivo o el contenido
+                       descomprimido supera el máximo (413)
     """
-    # Validar que sea un archivo CSV
-    if not file.filename.endswith('.csv'):
+    # Validar que sea un archivo CSV (opcionalmente comprimido)
+    if not file.filename.lower().endswith(ACCEPTED_EXTENSIONS):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="El archivo debe ser un CSV"
+            detail="El archivo debe ser un CSV (.csv, .csv.gz o .csv.zst)"
         )
 
-    # Leer contenido del archivo
-    file_content = await file.read()
+    validate_upload_options(validation_backend, report_mode, schema_profile)
+
+    if async_processing:
+        try:
+            result = await upload_workers.run(
+                use_case.create_pending_upload,
+                stream=file.file,
+                filename=file.filename,
+                content_type=file.content_type or "text/csv",
+                user_id=current_user["id_usuario"],
+                validation_backend=validation_backend,
+                report_mode=report_mode,
+                schema_profile=schema_profile,
+                force_upload=force_upload
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error al registrar el archivo: {str(e)}"
+            )
+
+        if not result["deduplicated"]:
+            upload_jobs.submit(
+                result["file_id"],
+                result["file_size"],
+                partial(run_upload_job, result["file_id"], validation_backend, report_mode, schema_profile)
+            )
+
+        response.status_code = status.HTTP_202_ACCEPTED
+        return FileJobResponse(
+            file_id=result["file_id"],
+            status=result["status"],
+            status_url=f"/api/files/{result['file_id']}",
+            deduplicated=result["deduplicated"],
+            param1=param1,
+            param2=param2
+        )
 
     try:
-        result = use_case.upload_and_validate_file(
-            file_content=file_content,
+        # El archivo ya está en el temporal de la petición: con su resumen los
+        # duplicados se resuelven antes de subirlo y validarlo
+        content_hash = None
+        if not force_upload:
+            content_hash, _ = await upload_workers.run(use_case.hash_stream, file.file)
+
+        result = await upload_workers.run(
+            use_case.upload_and_validate_stream,
+            stream=file.file,
             filename=file.filename,
             content_type=file.content_type or "text/csv",
             user_id=current_user["id_usuario"],
             param1=param1,
-            param2=param2
+            param2=param2,
+            validation_backend=validation_backend,
+            report_mode=report_mode,
+            schema_profile=schema_profile,
+            content_hash=content_hash,
+            force_upload=force_upload
         )
 
         return FileUploadResponse(**result)
+    except DecompressedSizeExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error al procesar el archivo: {str(e)}"
         )
+
+
+@router.post("/upload/batch", response_model=FileBatchResponse, status_code=status.HTTP_201_CREATED)
+async def upload_batch(
+    files: List[UploadFile] = File(..., description="Archivos CSV del lote o un único ZIP"),
+    param1: str = Form(..., description="Primer parámetro adicional"),
+    param2: str = Form(..., description="Segundo parámetro adicional"),
+    validation_backend: Optional[str] = Form(None, description="Backend de validación: streaming o columnar"),
+    report_mode: Optional[str] = Form(None, description="Modo de reporte: full o summary"),
+    schema_profile: Optional[str] = Form(None, description="Perfil de esquema de validación"),
+    force_upload: bool = Form(False, description="Subir copias nuevas aunque el contenido ya exista"),
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para subir y validar varios archivos CSV en una sola petición.
+
+    Acepta varios archivos (.csv, .csv.gz o .csv.zst) o un único ZIP que
+    los contenga. Los archivos se suben a S3 y se validan a la vez con un
+    pool de UPLOAD_BATCH_WORKERS hilos y sus registros se insertan en una
+    sola transacción. Un archivo que falla no detiene el resto: la
+    respuesta incluye el resultado de cada archivo. Las filas de los
+    archivos nuevos se cargan en staging en segundo plano.
+    El acceso está limitado a usuarios con rol específico.
+
+    Args:
+        files: Archivos CSV del lote o un único ZIP
+        param1: Primer parámetro adicional
+        param2: Segundo parámetro adicional
+        validation_backend: Backend de validación (opcional)
+        report_mode: Modo de reporte de validaciones (opcional)
+        schema_profile: Nombre del perfil de esquema (opcional)
+        force_upload: Si se suben copias nuevas aunque el mismo contenido ya exista
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        FileBatchResponse: Resultado de cada archivo y totales del lote
+
+    Raises:
+        HTTPException: Si el ZIP no es válido o el lote supera UPLOAD_BATCH_MAX_FILES (400),
+                       o si falla el registro de los archivos (500)
+    """
+    validate_upload_options(validation_backend, report_mode, schema_profile)
+
+    if len(files) > settings.UPLOAD_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"El lote supera el máximo de {settings.UPLOAD_BATCH_MAX_FILES} archivos"
+        )
+
+    if len(files) == 1 and files[0].filename.lower().endswith(".zip"):
+        try:
+            items = read_zip_items(
+                files[0].file, settings.UPLOAD_BATCH_MAX_FILES, settings.CSV_MAX_DECOMPRESSED_BYTES
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    else:
+        items = [stream_item(file.filename, file.content_type or "text/csv", file.file) for file in files]
+
+    try:
+        result = await upload_workers.run(
+            use_case.upload_batch,
+            items,
+            current_user["id_usuario"],
+            param1,
+            param2,
+            validation_backend=validation_backend,
+            report_mode=report_mode,
+            schema_profile=schema_profile,
+            force_upload=force_upload
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al registrar los archivos del lote: {str(e)}"
+        )
+
+    for file_result in result["files"]:
+        if file_result["error"] is None and not file_result["deduplicated"]:
+            upload_jobs.submit(
+                file_result["file_id"],
+                file_result["file_size"],
+                partial(run_staging_job, file_result["file_id"])
+            )
+
+    return FileBatchResponse(**result)
+
+
+@router.post("/uploads", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+async def create_upload_session(
+    filename: str = Form(..., description="Nombre del archivo CSV"),
+    param1: str = Form(..., description="Primer parámetro adicional"),
+    param2: str = Form(..., description="Segundo parámetro adicional"),
+    content_type: str = Form("text/csv", description="Tipo MIME del archivo"),
+    validation_backend: Optional[str] = Form(None, description="Backend de validación: streaming o columnar"),
+    report_mode: Optional[str] = Form(None, description="Modo de reporte: full o summary"),
+    schema_profile: Optional[str] = Form(None, description="Perfil de esquema de validación"),
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para abrir una sesión de carga reanudable por bloques.
+
+    El archivo se envía después en bloques numerados desde 1 con
+    PUT /api/files/uploads/{session_id}/parts/{part_number} y la carga se
+    cierra con POST /api/files/uploads/{session_id}/complete. Si se corta
+    la conexión, GET /api/files/uploads/{session_id} indica el siguiente
+    bloque a enviar. Antes de abrir la sesión se cancelan las sesiones
+    caducadas.
+
+    Args:
+        filename: Nombre del archivo CSV
+        param1: Primer parámetro adicional
+        param2: Segundo parámetro adicional
+        content_type: Tipo MIME del archivo
+        validation_backend: Backend de validación (opcional)
+        report_mode: Modo de reporte de validaciones (opcional)
+        schema_profile: Nombre del perfil de esquema (opcional)
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        UploadSessionResponse: Estado de la sesión abierta
+
+    Raises:
+        HTTPException: Si el archivo no es un CSV, alguna opción no existe o falla S3
+    """
+    if not filename.lower().endswith(ACCEPTED_EXTENSIONS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El archivo debe ser un CSV (.csv, .csv.gz o .csv.zst)"
+        )
+
+    validate_upload_options(validation_backend, report_mode, schema_profile)
+
+    await upload_workers.run(use_case.abort_expired_upload_sessions, upload_sessions.pop_expired())
+
+    try:
+        session = await upload_workers.run(
+            use_case.start_upload_session,
+            filename=filename,
+            content_type=content_type,
+            user_id=current_user["id_usuario"],
+            param1=param1,
+            param2=param2,
+            validation_backend=validation_backend,
+            report_mode=report_mode,
+            schema_profile=schema_profile,
+            run_validation=partial(run_session_validation, validation_backend, report_mode, schema_profile)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al abrir la sesión de carga: {str(e)}"
+        )
+
+    upload_sessions.add(session)
+    return session_response(session.to_dict())
+
+
+@router.put("/uploads/{session_id}/parts/{part_number}", response_model=UploadSessionResponse)
+async def upload_session_part(
+    session_id: str,
+    part_number: int,
+    request: Request,
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para enviar un bloque de una sesión de carga.
+
+    El cuerpo de la petición son los bytes del bloque. El bloque se sube a
+    S3 como parte y se valida antes de responder. Reenviar un bloque ya
+    recibido con el mismo contenido devuelve el estado sin repetirlo; si
+    se envía fuera de orden se responde 409 indicando el bloque esperado.
+
+    Args:
+        session_id: ID de la sesión
+        part_number: Número del bloque (desde 1)
+        request: Petición HTTP con los bytes del bloque
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        UploadSessionResponse: Estado de la sesión tras el bloque
+
+    Raises:
+        HTTPException: Si la sesión no existe, el bloque es inválido o está fuera
+                       de orden, o falla la subida a S3
+    """
+    session = await get_upload_session(session_id, current_user["id_usuario"], use_case)
+
+    # Los fragmentos se unen una sola vez al final para no copiar el bloque dos veces
+    pieces = []
+    size = 0
+    async for piece in request.stream():
+        pieces.append(piece)
+        size += len(piece)
+        if size > settings.UPLOAD_SESSION_MAX_CHUNK_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"El bloque supera el tamaño máximo de {settings.UPLOAD_SESSION_MAX_CHUNK_SIZE} bytes"
+            )
+    data = b"".join(pieces)
+    del pieces
+
+    try:
+        state = await upload_workers.run(use_case.put_upload_session_chunk, session, part_number, data)
+    except ChunkOrderError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "next_part": e.next_part}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al recibir el bloque: {str(e)}"
+        )
+    return session_response(state)
+
+
+@router.get("/uploads/{session_id}", response_model=UploadSessionResponse)
+async def get_upload_session_status(
+    session_id: str,
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para consultar el estado de una sesión de carga.
+
+    Permite reanudar una carga interrumpida desde el bloque next_part, en
+    este o en otro proceso del servicio.
+
+    Args:
+        session_id: ID de la sesión
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        UploadSessionResponse: Estado de la sesión
+
+    Raises:
+        HTTPException: Si la sesión no existe
+    """
+    session = await get_upload_session(session_id, current_user["id_usuario"], use_case)
+    return session_response(session.to_dict())
+
+
+@router.post("/uploads/{session_id}/complete", response_model=FileUploadResponse)
+async def complete_upload_session(
+    session_id: str,
+    force_upload: bool = Form(False, description="Guardar una copia nueva aunque el contenido ya exista"),
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para completar una sesión de carga.
+
+    Completa el archivo en S3 y guarda sus validaciones, que ya se
+    calcularon al recibir los bloques (si la sesión recibió bloques en otro
+    proceso, el archivo se valida leyéndolo de S3). La carga de filas en staging se
+    encola en segundo plano; su progreso se consulta en GET /api/files/{file_id}.
+
+    Args:
+        session_id: ID de la sesión
+        force_upload: Si se guarda una copia nueva aunque el mismo contenido ya exista
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        FileUploadResponse: Información del archivo subido y validaciones
+
+    Raises:
+        HTTPException: Si la sesión no existe, no tiene bloques o falla al completarse
+    """
+    session = await get_upload_session(session_id, current_user["id_usuario"], use_case)
+    try:
+        result = await upload_workers.run(use_case.complete_upload_session, session, force_upload)
+    except ChunkOrderError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "next_part": e.next_part}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al completar la carga: {str(e)}"
+        )
+    finally:
+        # Una sesión que sigue abierta (por ejemplo, sin bloques) admite más bloques
+        if session.state != "open":
+            upload_sessions.remove(session_id)
+
+    if not result["deduplicated"]:
+        upload_jobs.submit(result["file_id"], session.size, partial(run_staging_job, result["file_id"]))
+    return FileUploadResponse(**result)
+
+
+@router.delete("/uploads/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload_session(
+    session_id: str,
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para cancelar una sesión de carga.
+
+    Descarta las partes subidas a S3, las validaciones calculadas y el
+    registro provisional del archivo.
+
+    Args:
+        session_id: ID de la sesión
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Raises:
+        HTTPException: Si la sesión no existe
+    """
+    session = await get_upload_session(session_id, current_user["id_usuario"], use_case)
+    upload_sessions.remove(session_id)
+    await upload_workers.run(use_case.abort_upload_session, session)
+
+
+@router.post("/direct-uploads", response_model=DirectUploadResponse, status_code=status.HTTP_201_CREATED)
+async def create_direct_upload(
+    filename: str = Form(..., description="Nombre del archivo CSV"),
+    content_type: str = Form("text/csv", description="Tipo MIME del archivo"),
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para preparar la subida directa de un archivo al almacenamiento.
+
+    Devuelve un formulario POST firmado: el cliente envía el archivo
+    directamente a S3 (con los campos devueltos y el archivo en el campo
+    file), sin que sus bytes pasen por la API, y después llama a
+    POST /api/files/direct-uploads/{file_id}/complete para validarlo y registrarlo.
+
+    Args:
+        filename: Nombre del archivo CSV
+        content_type: Tipo MIME del archivo
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        DirectUploadResponse: Formulario firmado y ruta para completar la subida
+
+    Raises:
+        HTTPException: Si el archivo no es un CSV o no se pudo generar el formulario
+    """
+    if not filename.lower().endswith(ACCEPTED_EXTENSIONS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El archivo debe ser un CSV (.csv, .csv.gz o .csv.zst)"
+        )
+
+    try:
+        result = await run_in_threadpool(
+            use_case.start_direct_upload, filename, content_type, current_user["id_usuario"]
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al preparar la subida directa: {str(e)}"
+        )
+
+    return DirectUploadResponse(
+        **result,
+        complete_url=f"/api/files/direct-uploads/{result['file_id']}/complete"
+    )
+
+
+@router.post("/direct-uploads/{file_id}/complete", response_model=FileUploadResponse)
+async def complete_direct_upload(
+    file_id: int,
+    param1: str = Form(..., description="Primer parámetro adicional"),
+    param2: str = Form(..., description="Segundo parámetro adicional"),
+    validation_backend: Optional[str] = Form(None, description="Backend de validación: streaming o columnar"),
+    report_mode: Optional[str] = Form(None, description="Modo de reporte: full o summary"),
+    schema_profile: Optional[str] = Form(None, description="Perfil de esquema de validación"),
+    force_upload: bool = Form(False, description="Guardar una copia nueva aunque el contenido ya exista"),
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para completar una subida directa al almacenamiento.
+
+    Lee el archivo subido del almacenamiento por bloques, lo valida y guarda
+    sus validaciones. La carga de filas en staging se encola en segundo
+    plano; su progreso se consulta en GET /api/files/{file_id}.
+
+    Args:
+        file_id: ID del archivo devuelto al preparar la subida
+        param1: Primer parámetro adicional
+        param2: Segundo parámetro adicional
+        validation_backend: Backend de validación (opcional)
+        report_mode: Modo de reporte de validaciones (opcional)
+        schema_profile: Nombre del perfil de esquema (opcional)
+        force_upload: Si se guarda una copia nueva aunque el mismo contenido ya exista
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        FileUploadResponse: Información del archivo subido y validaciones
+
+    Raises:
+        HTTPException: Si el archivo no existe (404), no se ha subido o ya se
+                       completó (409), el contenido descomprimido supera el
+                       máximo (413) o falla la validación (500)
+    """
+    validate_upload_options(validation_backend, report_mode, schema_profile)
+
+    try:
+        result = await upload_workers.run(
+            use_case.complete_direct_upload,
+            file_id,
+            current_user["id_usuario"],
+            param1,
+            param2,
+            validation_backend=validation_backend,
+            report_mode=report_mode,
+            schema_profile=schema_profile,
+            force_upload=force_upload
+        )
+    except DecompressedSizeExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al completar la subida directa: {str(e)}"
+        )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archivo no encontrado"
+        )
+
+    if not result["deduplicated"]:
+        upload_jobs.submit(result["file_id"], 0, partial(run_staging_job, result["file_id"]))
+    return FileUploadResponse(**result)
+
+
+@router.get("/", response_model=FileListPage)
+async def list_files(
+    after: Optional[int] = Query(None, description="Cursor devuelto por la página anterior"),
+    limit: int = Query(100, ge=1, le=MAX_FILES_PAGE_SIZE, description="Archivos por página"),
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para listar paginados los archivos del usuario con sus URLs de descarga.
+
+    Las URLs firmadas se reutilizan desde la caché del proceso mientras les
+    quede al menos PRESIGN_CACHE_MIN_VALIDITY de su validez.
+
+    Args:
+        after: Cursor de la página anterior (opcional)
+        limit: Número máximo de archivos por página
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        FileListPage: Archivos de la página y cursor de la siguiente
+    """
+    result = await run_in_threadpool(use_case.list_files, current_user["id_usuario"], after, limit)
+    return FileListPage(**result)
+
+
+@router.get("/{file_id}", response_model=FileStatusResponse)
+async def get_file_status(
+    file_id: int,
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case),
+    storage: AsyncStorage = Depends(get_async_storage)
+):
+    """
+    Endpoint para consultar el estado de procesamiento de un archivo.
+
+    Mientras el archivo está encolado o en proceso en este servidor, la
+    respuesta incluye el progreso (etapa, bytes y filas leídas). Al terminar
+    incluye las validaciones y, en modo summary, el reporte agregado. Si el
+    archivo ya está en S3 incluye una URL firmada temporal de descarga.
+
+    Args:
+        file_id: ID del archivo
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+        storage: API asíncrona de almacenamiento
+
+    Returns:
+        FileStatusResponse: Estado, progreso y validaciones del archivo
+
+    Raises:
+        HTTPException: Si el archivo no existe o pertenece a otro usuario
+    """
+    result = await run_in_threadpool(
+        use_case.get_file_status, file_id, current_user["id_usuario"], upload_jobs.get_progress(file_id)
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archivo no encontrado"
+        )
+    if result["s3_url"]:
+        result["download_url"] = await storage.presign(result["s3_key"])
+    return FileStatusResponse(**result)
+
+
+@router.get("/{file_id}/content")
+async def download_file_content(
+    file_id: int,
+    request: Request,
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case),
+    storage: AsyncStorage = Depends(get_async_storage)
+):
+    """
+    Endpoint para descargar el contenido de un archivo a través de la API.
+
+    El contenido se lee del almacenamiento y se envía por bloques de
+    DOWNLOAD_CHUNK_SIZE, de modo que la memoria por descarga es constante.
+    Admite un rango de bytes (Range, con If-Range) y peticiones
+    condicionales por ETag (If-None-Match). Los archivos comprimidos se
+    envían tal cual con su Content-Encoding, y los rangos se refieren a los
+    bytes comprimidos.
+
+    Args:
+        file_id: ID del archivo
+        request: Petición HTTP (cabeceras Range, If-Range e If-None-Match)
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+        storage: API asíncrona de almacenamiento
+
+    Returns:
+        StreamingResponse: Contenido completo (200) o parcial (206), o Response vacía (304, 416)
+
+    Raises:
+        HTTPException: Si el archivo no existe, es de otro usuario o su contenido no se pudo leer
+    """
+    result = await run_in_threadpool(use_case.get_file_status, file_id, current_user["id_usuario"])
+    if result is None or not result["s3_url"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archivo no encontrado"
+        )
+    metadata = await storage.head(result["s3_key"])
+    if metadata is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contenido del archivo no encontrado"
+        )
+
+    size = metadata["size"]
+    headers = {"Accept-Ranges": "bytes", "Cache-Control": "private, no-cache"}
+    if metadata["etag"]:
+        headers["ETag"] = metadata["etag"]
+    if metadata["last_modified"] is not None:
+        headers["Last-Modified"] = format_datetime(metadata["last_modified"].astimezone(timezone.utc), usegmt=True)
+    if etag_matches(request.headers.get("if-none-match"), metadata["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range is not None and not etag_matches(if_range, metadata["etag"], weak=False):
+        range_header = None
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiable:
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+
+    stream = await storage.open(result["s3_key"], byte_range)
+    if stream is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error al leer el archivo del almacenamiento"
+        )
+    # El tipo se envía tal cual (sin el charset que Starlette añade a text/*): el CSV puede no ser UTF-8
+    headers["Content-Type"] = metadata["content_type"] or "application/octet-stream"
+    headers["Content-Disposition"] = content_disposition(result["filename"])
+    if metadata["content_encoding"]:
+        headers["Content-Encoding"] = metadata["content_encoding"]
+    status_code = status.HTTP_200_OK
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+    else:
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Length"] = str(byte_range[1] - byte_range[0] + 1)
+        headers["Content-Range"] = f"bytes {byte_range[0]}-{byte_range[1]}/{size}"
+    return StreamingResponse(
+        storage.iter_chunks(stream, DOWNLOAD_CHUNK_SIZE),
+        status_code=status_code,
+        headers=headers
+    )
+
+
+@router.get("/{file_id}/validations", response_model=FileValidationsPage)
+async def list_file_validations(
+    file_id: int,
+    after: Optional[int] = Query(None, description="Cursor devuelto por la página anterior"),
+    limit: int = Query(100, ge=1, le=MAX_VALIDATIONS_PAGE_SIZE, description="Validaciones por página"),
+    type: Optional[str] = Query(None, description="Tipo de validación"),
+    column: Optional[str] = Query(None, description="Nombre de columna"),
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case)
+):
+    """
+    Endpoint para consultar paginadas las validaciones por fila de un archivo.
+
+    Usa paginación por clave: para pedir la página siguiente se pasa como
+    after el next_cursor de la respuesta anterior. Cada petición lee solo
+    una página, sea cual sea el número total de validaciones.
+
+    Args:
+        file_id: ID del archivo
+        after: Cursor de la página anterior (opcional)
+        limit: Número máximo de validaciones por página
+        type: Tipo de validación por el que filtrar (opcional)
+        column: Columna por la que filtrar (opcional)
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+
+    Returns:
+        FileValidationsPage: Validaciones de la página y cursor de la siguiente
+
+    Raises:
+        HTTPException: Si el archivo no existe o pertenece a otro usuario
+    """
+    result = await run_in_threadpool(
+        use_case.list_file_validations, file_id, current_user["id_usuario"], after, limit, type, column
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archivo no encontrado"
+        )
+    return FileValidationsPage(**result)
+
+
+@router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_file(
+    file_id: int,
+    current_user: dict = Depends(require_role("uploader")),  # Cambiar "uploader" por el rol requerido
+    use_case: FileUseCase = Depends(get_file_use_case),
+    storage: AsyncStorage = Depends(get_async_storage)
+):
+    """
+    Endpoint para eliminar un archivo.
+
+    Elimina el registro del archivo con sus filas y validaciones, y después
+    sus objetos del almacenamiento (el archivo y, en modo summary, el
+    detalle de validaciones) y sus URLs firmadas en caché. Un objeto que no
+    se pudo eliminar queda huérfano y lo retira scripts/cleanup_orphans.py.
+
+    Args:
+        file_id: ID del archivo
+        current_user: Usuario actual autenticado (validado por middleware)
+        use_case: Caso de uso de archivos
+        storage: API asíncrona de almacenamiento
+
+    Raises:
+        HTTPException: Si el archivo no existe o es de otro usuario (404), o
+                       todavía se está subiendo o procesando (409)
+    """
+    try:
+        s3_keys = await run_in_threadpool(use_case.delete_file, file_id, current_user["id_usuario"])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    if s3_keys is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archivo no encontrado"
+        )
+    for s3_key in s3_keys:
+        await storage.delete(s3_key)
@@ -4,10 +4,49 @@ Esquemas de archivos.
 Define los DTOs para las operaciones con archivos.
 """
 
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
 
+class ValidationReportResponse(BaseModel):
+    """
+    Esquema para el reporte agregado de validaciones.
+
+    Attributes:
+        total: Número de validaciones encontradas
+        by_type: Número de validaciones por tipo
+        by_column: Número de validaciones por tipo y columna
+        samples: Muestra de validaciones
+        samples_truncated: Si hay validaciones fuera de la muestra
+        stopped_early: Si la validación se detuvo al alcanzar el máximo
+        details_key: Clave en S3 del detalle completo (JSON Lines comprimido)
+    """
+    total: int = Field(..., description="Número de validaciones")
+    by_type: Dict[str, int] = Field(default_factory=dict, description="Validaciones por tipo")
+    by_column: Dict[str, Dict[str, int]] = Field(default_factory=dict, description="Validaciones por tipo y columna")
+    samples: List[Dict[str, Any]] = Field(default_factory=list, description="Muestra de validaciones")
+    samples_truncated: bool = Field(False, description="Si la muestra está recortada")
+    stopped_early: bool = Field(False, description="Si la validación se detuvo antes de terminar")
+    details_key: Optional[str] = Field(None, description="Clave del detalle completo en S3")
+
+
+class StagingLoadResponse(BaseModel):
+    """
+    Esquema para el resultado de la carga en staging.
+
+    Attributes:
+        rows: Filas insertadas (incluido el encabezado)
+        batch_size: Filas por lote de inserción
+        seconds: Duración de la carga en segundos
+        rows_per_second: Rendimiento de la carga
+    """
+    rows: int = Field(..., description="Filas insertadas")
+    batch_size: int = Field(..., description="Filas por lote")
+    seconds: float = Field(..., description="Duración de la carga en segundos")
+    rows_per_second: int = Field(..., description="Filas por segundo")
+
+
 class FileUploadResponse(BaseModel):
     """
     Esquema para la respuesta de carga de archivo.
@@ -15,17 +54,240 @@ class FileUploadResponse(BaseModel):
     Attributes:
         file_id: ID del archivo creado
         s3_url: URL del archivo en S3
-        validations: Lista de validaciones aplicadas
+        validations: Lista de validaciones aplicadas (muestra en modo summary)
+        report: Reporte agregado de validaciones (modo summary)
+        staging: Resultado de la carga en staging
+        timings: Segundos de cada etapa (upload, validation, persist, staging) y total.
+                 La subida y la validación se solapan, por lo que su suma puede superar el total
+        deduplicated: Si se devolvió un archivo existente con el mismo contenido
         param1: Primer parámetro adicional
         param2: Segundo parámetro adicional
     """
     file_id: int = Field(..., description="ID del archivo")
     s3_url: str = Field(..., description="URL del archivo en S3")
     validations: List[Dict[str, Any]] = Field(default_factory=list, description="Lista de validaciones")
+    report: Optional[ValidationReportResponse] = Field(None, description="Reporte agregado de validaciones")
+    staging: Optional[StagingLoadResponse] = Field(None, description="Resultado de la carga en staging")
+    timings: Optional[Dict[str, float]] = Field(None, description="Segundos por etapa y total")
+    deduplicated: bool = Field(False, description="Si se reutilizó un archivo con el mismo contenido")
+    param1: str = Field(..., description="Primer parámetro adicional")
+    param2: str = Field(..., description="Segundo parámetro adicional")
+
+
+class FileJobResponse(BaseModel):
+    """
+    Esquema para la respuesta de una carga asíncrona (202 Accepted).
+
+    Attributes:
+        file_id: ID del archivo registrado
+        status: Estado del archivo (pending hasta que un worker lo procese)
+        status_url: Ruta del endpoint de estado del archivo
+        deduplicated: Si se devolvió un archivo existente con el mismo contenido
+        param1: Primer parámetro adicional
+        param2: Segundo parámetro adicional
+    """
+    file_id: int = Field(..., description="ID del archivo")
+    status: str = Field(..., description="Estado del archivo")
+    status_url: str = Field(..., description="Ruta del endpoint de estado")
+    deduplicated: bool = Field(False, description="Si se reutilizó un archivo con el mismo contenido")
     param1: str = Field(..., description="Primer parámetro adicional")
     param2: str = Field(..., description="Segundo parámetro adicional")
 
 
+class FileBatchItemResponse(BaseModel):
+    """
+    Esquema para el resultado de un archivo de una carga por lotes.
+
+    Attributes:
+        filename: Nombre del archivo
+        file_id: ID del archivo registrado (None si falló)
+        status: Estado del archivo (failed si no se pudo cargar)
+        file_size: Tamaño del archivo en bytes
+        s3_url: URL del archivo en S3
+        validations: Lista de validaciones aplicadas (muestra en modo summary)
+        report: Reporte agregado de validaciones (modo summary)
+        deduplicated: Si se devolvió un archivo con el mismo contenido
+        error: Motivo por el que el archivo no se pudo cargar
+    """
+    filename: str = Field(..., description="Nombre del archivo")
+    file_id: Optional[int] = Field(None, description="ID del archivo")
+    status: str = Field(..., description="Estado del archivo")
+    file_size: int = Field(0, description="Tamaño del archivo")
+    s3_url: Optional[str] = Field(None, description="URL del archivo en S3")
+    validations: List[Dict[str, Any]] = Field(default_factory=list, description="Lista de validaciones")
+    report: Optional[ValidationReportResponse] = Field(None, description="Reporte agregado de validaciones")
+    deduplicated: bool = Field(False, description="Si se reutilizó un archivo con el mismo contenido")
+    error: Optional[str] = Field(None, description="Error del archivo")
+
+
+class FileBatchResponse(BaseModel):
+    """
+    Esquema para la respuesta de una carga por lotes.
+
+    Attributes:
+        files: Resultado de cada archivo, en el orden del lote
+        uploaded: Archivos subidos y registrados
+        deduplicated: Archivos resueltos con un archivo existente
+        failed: Archivos que no se pudieron cargar
+        timings: Segundos de cada etapa (hash, upload, persist) y total
+        param1: Primer parámetro adicional
+        param2: Segundo parámetro adicional
+    """
+    files: List[FileBatchItemResponse] = Field(default_factory=list, description="Resultado por archivo")
+    uploaded: int = Field(0, description="Archivos registrados")
+    deduplicated: int = Field(0, description="Archivos reutilizados")
+    failed: int = Field(0, description="Archivos fallidos")
+    timings: Optional[Dict[str, float]] = Field(None, description="Segundos por etapa y total")
+    param1: str = Field(..., description="Primer parámetro adicional")
+    param2: str = Field(..., description="Segundo parámetro adicional")
+
+
+class UploadSessionResponse(BaseModel):
+    """
+    Esquema para el estado de una sesión de carga reanudable.
+
+    Attributes:
+        session_id: ID de la sesión
+        file_id: ID del archivo registrado para la carga
+        state: Estado de la sesión (open, completing, completed, aborted)
+        next_part: Número del siguiente bloque que espera la sesión
+        final_part_received: Si ya se recibió el último bloque (menor que min_chunk_size)
+        received_bytes: Bytes recibidos
+        validated_bytes: Bytes leídos por el validador
+        validated_rows: Filas leídas por el validador (incluido el encabezado)
+        min_chunk_size: Tamaño mínimo de los bloques salvo el último
+        max_chunk_size: Tamaño máximo de cada bloque
+    """
+    session_id: str = Field(..., description="ID de la sesión")
+    file_id: int = Field(..., description="ID del archivo")
+    state: str = Field(..., description="Estado de la sesión")
+    next_part: int = Field(..., description="Siguiente bloque esperado")
+    final_part_received: bool = Field(False, description="Si se recibió el último bloque")
+    received_bytes: int = Field(0, description="Bytes recibidos")
+    validated_bytes: int = Field(0, description="Bytes validados")
+    validated_rows: int = Field(0, description="Filas validadas")
+    min_chunk_size: int = Field(..., description="Tamaño mínimo de bloque salvo el último")
+    max_chunk_size: int = Field(..., description="Tamaño máximo de bloque")
+
+
+class DirectUploadResponse(BaseModel):
+    """
+    Esquema para el formulario firmado de una subida directa al almacenamiento.
+
+    Attributes:
+        file_id: ID del archivo registrado para la subida
+        s3_key: Clave del archivo en el almacenamiento
+        url: URL a la que enviar el formulario (POST multipart/form-data)
+        fields: Campos a enviar en el formulario, antes del campo file con el archivo
+        max_size: Tamaño máximo del archivo en bytes
+        expires_in: Segundos de validez del formulario
+        complete_url: Ruta del endpoint que completa la subida
+    """
+    file_id: int = Field(..., description="ID del archivo")
+    s3_key: str = Field(..., description="Clave del archivo")
+    url: str = Field(..., description="URL del formulario")
+    fields: Dict[str, str] = Field(default_factory=dict, description="Campos del formulario")
+    max_size: int = Field(..., description="Tamaño máximo del archivo")
+    expires_in: int = Field(..., description="Segundos de validez del formulario")
+    complete_url: str = Field(..., description="Ruta del endpoint que completa la subida")
+
+
+class UploadProgressResponse(BaseModel):
+    """
+    Esquema para el progreso de una carga en curso.
+
+    Attributes:
+        stage: Etapa actual (queued, validating, staging, done)
+        bytes_read: Bytes leídos por el validador
+        total_bytes: Tamaño del archivo en bytes
+        rows_read: Filas leídas por el validador (incluido el encabezado)
+        percent: Porcentaje del archivo leído
+    """
+    stage: str = Field(..., description="Etapa actual")
+    bytes_read: int = Field(..., description="Bytes leídos")
+    total_bytes: int = Field(..., description="Tamaño del archivo")
+    rows_read: int = Field(..., description="Filas leídas")
+    percent: float = Field(..., description="Porcentaje leído")
+
+
+class FileStatusResponse(BaseModel):
+    """
+    Esquema para el estado de procesamiento de un archivo.
+
+    Attributes:
+        file_id: ID del archivo
+        filename: Nombre original del archivo
+        status: Estado (pending, processing, completed, failed)
+        stage: Etapa del procesamiento (queued, uploading, validating, staging, processing, done)
+        s3_url: URL del archivo en S3 (cuando ya se subió)
+        download_url: URL firmada temporal de descarga (cuando ya se subió)
+        file_size: Tamaño del archivo en bytes
+        progress: Progreso mientras el archivo está encolado o en proceso
+        validations: Lista de validaciones (muestra en modo summary)
+        report: Reporte agregado de validaciones (modo summary)
+        created_at: Fecha de carga
+        updated_at: Fecha de última actualización
+    """
+    file_id: int = Field(..., description="ID del archivo")
+    filename: str = Field(..., description="Nombre del archivo")
+    status: str = Field(..., description="Estado del archivo")
+    stage: str = Field(..., description="Etapa del procesamiento")
+    s3_url: Optional[str] = Field(None, description="URL del archivo en S3")
+    download_url: Optional[str] = Field(None, description="URL firmada de descarga")
+    file_size: int = Field(..., description="Tamaño del archivo")
+    progress: Optional[UploadProgressResponse] = Field(None, description="Progreso del procesamiento")
+    validations: List[Dict[str, Any]] = Field(default_factory=list, description="Lista de validaciones")
+    report: Optional[ValidationReportResponse] = Field(None, description="Reporte agregado de validaciones")
+    created_at: Optional[datetime] = Field(None, description="Fecha de carga")
+    updated_at: Optional[datetime] = Field(None, description="Fecha de última actualización")
+
+
+class FileListItem(BaseModel):
+    """
+    Esquema para un archivo de la lista de archivos del usuario.
+
+    Attributes:
+        file_id: ID del archivo
+        filename: Nombre original del archivo
+        status: Estado (pending, processing, completed, failed)
+        file_size: Tamaño del archivo en bytes
+        download_url: URL firmada temporal de descarga (cuando ya se subió)
+        created_at: Fecha de carga
+        updated_at: Fecha de última actualización
+    """
+    file_id: int = Field(..., description="ID del archivo")
+    filename: str = Field(..., description="Nombre del archivo")
+    status: str = Field(..., description="Estado del archivo")
+    file_size: int = Field(..., description="Tamaño del archivo")
+    download_url: Optional[str] = Field(None, description="URL firmada de descarga")
+    created_at: Optional[datetime] = Field(None, description="Fecha de carga")
+    updated_at: Optional[datetime] = Field(None, description="Fecha de última actualización")
+
+
+class FileListPage(BaseModel):
+    """
+    Esquema para una página de la lista de archivos del usuario.
+
+    Attributes:
+        items: Archivos de la página, del más reciente al más antiguo
+        next_cursor: Valor de after para pedir la página siguiente (None en la última)
+    """
+    items: List[FileListItem] = Field(default_factory=list, description="Archivos de la página")
+    next_cursor: Optional[int] = Field(None, description="Cursor de la página siguiente")
+
+
+class FileValidationsPage(BaseModel):
+    """
+    Esquema para una página de validaciones por fila de un archivo.
+
+    Attributes:
+        items: Validaciones de la página, cada una con su número de orden (seq)
+        next_cursor: Valor de after para pedir la página siguiente (None en la última)
+    """
+    items: List[Dict[str, Any]] = Field(default_factory=list, description="Validaciones de la página")
+    next_cursor: Optional[int] = Field(None, description="Cursor de la página siguiente")
+
+
 class ValidationItem(BaseModel):
     """
     Esquema para un item de validación.
@@ -40,3 +302,4 @@ class ValidationItem(BaseModel):
     row: Optional[int] = Field(None, description="Número de fila")
     column: Optional[str] = Field(None, description="Nombre de columna")
     message: str = Field(..., description="Mensaje de validación")
+
@@ -0,0 +1,93 @@
+"""
+Benchmark del cliente de S3 compartido.
+
+Compara el coste por petición de crear un cliente de S3 nuevo (como hacía
+cada petición al construir S3Service) con el de usar el cliente compartido
+por el proceso. Sin --endpoint-url solo se mide la construcción del
+cliente; con él, cada petición hace además una llamada real (HeadBucket)
+contra un S3 local o compatible, de modo que se mide también la reutilización
+de conexiones del pool.
+
+Uso:
+    python scripts/benchmark_s3_client.py --requests 200
+    python scripts/benchmark_s3_client.py --requests 200 --endpoint-url http://localhost:9000 --bucket pruebas
+"""
+
+import sys
+import os
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.infrastructure.config import settings
+from app.infrastructure.services.s3_service import create_s3_client, get_s3_client
+
+
+def measure(get_client: Callable[[], object], requests: int, bucket: str, call: bool) -> List[float]:
+    """
+    Mide la duración de cada petición simulada.
+
+    Args:
+        get_client: Función que obtiene el cliente de cada petición
+        requests: Número de peticiones
+        bucket: Bucket de la llamada real
+        call: True para hacer una llamada real a S3 en cada petición
+
+    Returns:
+        List[float]: Segundos de cada petición
+    """
+    durations = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client = get_client()
+        if call:
+            client.head_bucket(Bucket=bucket)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def report(name: str, durations: List[float]) -> float:
+    """
+    Imprime la mediana y el percentil 95 de una serie de peticiones.
+
+    Args:
+        name: Nombre de la serie
+        durations: Segundos de cada petición
+
+    Returns:
+        float: Mediana en milisegundos
+    """
+    ordered = sorted(durations)
+    median = statistics.median(ordered) * 1000
+    p95 = ordered[int(len(ordered) * 0.95) - 1] * 1000
+    print(f"{name:>12} | mediana: {median:8.2f} ms | p95: {p95:8.2f} ms")
+    return median
+
+
+def main():
+    """
+    Punto de entrada del benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark del cliente de S3 compartido")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--endpoint-url", default=None, help="S3 local o compatible para llamadas reales")
+    parser.add_argument("--bucket", default=settings.S3_BUCKET_NAME)
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        settings.S3_ENDPOINT_URL = args.endpoint_url
+    call = bool(args.endpoint_url)
+
+    print(f"Peticiones: {args.requests} ({'con HeadBucket' if call else 'solo construcción del cliente'})")
+    per_request = report("por petición", measure(create_s3_client, args.requests, args.bucket, call))
+    get_s3_client()
+    shared = report("compartido", measure(get_s3_client, args.requests, args.bucket, call))
+    print(f"Ahorro por petición: {per_request - shared:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
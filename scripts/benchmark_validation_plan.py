@@ -0,0 +1,144 @@
+"""
+Benchmark del plan de validación de CSV.
+
+Compara el coste por fila de la validación anterior, que analizaba el nombre
+de columna con la lista de palabras clave en cada celda, con la validación
+basada en el plan compilado a partir del encabezado, sobre CSV anchos.
+
+Uso:
+    python scripts/benchmark_validation_plan.py --columns 50 100 200 --rows 20000
+"""
+
+import sys
+import os
+import argparse
+import csv
+import io
+import random
+import time
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.application.validation.csv_stream_validator import CSVStreamValidator
+from app.application.validation.validation_plan import NUMERIC_KEYWORDS
+
+
+def generate_csv(columns: int, rows: int, seed: int = 42) -> bytes:
+    """
+    Genera un CSV ancho sintético con una columna numérica (con coma decimal) de cada cinco.
+
+    Args:
+        columns: Número de columnas
+        rows: Número de filas
+        seed: Semilla del generador aleatorio
+
+    Returns:
+        bytes: Contenido del CSV
+    """
+    rng = random.Random(seed)
+    header = [f"precio_{i}" if i % 5 == 0 else f"campo_{i}" for i in range(columns)]
+    lines = [",".join(header)]
+    for _ in range(rows):
+        lines.append(",".join(
+            f'"{rng.randint(0, 99999)},{rng.randint(0, 99)}"' if i % 5 == 0 else f"valor{rng.randint(0, 999)}"
+            for i in range(columns)
+        ))
+    return "\n".join(lines).encode("utf-8")
+
+
+def legacy_validate(content: bytes) -> int:
+    """
+    Valida con el algoritmo anterior: palabras clave evaluadas en cada celda.
+
+    Args:
+        content: Contenido del CSV
+
+    Returns:
+        int: Número de incidencias encontradas
+    """
+    issues = 0
+    seen_rows = set()
+    for row_num, row in enumerate(csv.DictReader(io.StringIO(content.decode("utf-8"))), start=2):
+        row_key = tuple(row.values())
+        for col, value in row.items():
+            if not value or value.strip() == "":
+                issues += 1
+        if row_key in seen_rows:
+            issues += 1
+        else:
+            seen_rows.add(row_key)
+        for col, value in row.items():
+            if value and value.strip():
+                if any(keyword in col.lower() for keyword in NUMERIC_KEYWORDS):
+                    try:
+                        float(value.replace(',', '.'))
+                    except ValueError:
+                        issues += 1
+    return issues
+
+
+def plan_validate(content: bytes) -> int:
+    """
+    Valida con el plan compilado a partir del encabezado.
+
+    Args:
+        content: Contenido del CSV
+
+    Returns:
+        int: Número de incidencias encontradas
+    """
+    validator = CSVStreamValidator()
+    reader = csv.reader(io.StringIO(content.decode("utf-8")))
+    plan = validator.compile_plan(next(reader))
+    return sum(1 for _ in validator.iter_issues(reader, plan, validator.create_row_index()))
+
+
+def run_benchmark(columns: int, rows: int, repeat: int) -> None:
+    """
+    Ejecuta el benchmark para un ancho de CSV e imprime el coste por fila.
+
+    Args:
+        columns: Número de columnas
+        rows: Número de filas
+        repeat: Número de repeticiones (se toma la mejor)
+    """
+    content = generate_csv(columns, rows)
+    results = {}
+    for name, function in (("anterior", legacy_validate), ("plan", plan_validate)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            issues = function(content)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = (best, issues)
+
+    legacy_time, legacy_issues = results["anterior"]
+    plan_time, plan_issues = results["plan"]
+    assert legacy_issues == plan_issues, "Los dos algoritmos deben encontrar las mismas incidencias"
+    print(
+        f"{columns:>5} columnas | "
+        f"anterior: {legacy_time / rows * 1e6:8.1f} µs/fila | "
+        f"plan: {plan_time / rows * 1e6:8.1f} µs/fila | "
+        f"mejora: {legacy_time / plan_time:4.1f}x"
+    )
+
+
+def main():
+    """
+    Punto de entrada del benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark del plan de validación de CSV")
+    parser.add_argument("--columns", type=int, nargs="+", default=[20, 50, 100, 200])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Filas por archivo: {args.rows}")
+    for columns in args.columns:
+        run_benchmark(columns, args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Limpieza de objetos huérfanos del almacenamiento.
+
+Recorre los objetos bajo un prefijo por páginas y elimina los que no tienen
+registro en la tabla files y superan una antigüedad mínima. Con --dry-run
+solo los cuenta.
+
+Uso:
+    python scripts/cleanup_orphans.py --dry-run
+    python scripts/cleanup_orphans.py --prefix uploads/ --min-age-hours 24 --page-size 1000
+"""
+
+import sys
+import os
+import argparse
+from datetime import timedelta
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import Session
+from app.application.jobs.orphan_cleanup import OrphanCleanup
+from app.domain.services.storage_backend import MAX_KEYS_PER_REQUEST
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.repositories.file_repository_impl import FileRepository
+from app.infrastructure.services.storage_backends import get_storage_backend
+
+
+def main():
+    """
+    Ejecuta la limpieza con los argumentos de la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Elimina los objetos del almacenamiento sin registro en files")
+    parser.add_argument("--prefix", default="uploads/", help="Prefijo de las claves a revisar")
+    parser.add_argument("--min-age-hours", type=float, default=24, help="Antigüedad mínima de un objeto huérfano")
+    parser.add_argument("--page-size", type=int, default=MAX_KEYS_PER_REQUEST, help="Objetos por página del listado")
+    parser.add_argument("--dry-run", action="store_true", help="Contar los huérfanos sin eliminarlos")
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        cleanup = OrphanCleanup(
+            get_storage_backend(),
+            FileRepository(db),
+            min_age=timedelta(hours=args.min_age_hours),
+            page_size=args.page_size,
+            dry_run=args.dry_run
+        )
+        stats = cleanup.run(args.prefix).to_dict()
+    except Exception as e:
+        print(f"Error al limpiar los objetos huérfanos: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    mode = " (sin eliminar)" if args.dry_run else ""
+    print(f"Limpieza de huérfanos bajo '{args.prefix}'{mode}:")
+    for name, value in stats.items():
+        print(f"  - {name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Pruebas unitarias para la API asíncrona de almacenamiento.
+
+Verifica que las operaciones de AsyncStorage se ejecutan en su pool de
+hilos dedicado sin bloquear el bucle de eventos, y que las cargas del pool
+de upload_workers no retrasan las operaciones de AsyncStorage.
+"""
+
+import asyncio
+import io
+import threading
+import time
+from unittest.mock import Mock
+from app.application.jobs.upload_workers import UploadWorkerPool
+from app.infrastructure.services.async_storage import AsyncStorage
+
+
+def _storage():
+    """Crea la API con un servicio de S3 simulado que anota el hilo de cada operación."""
+    s3_service = Mock()
+    s3_service.threads = []
+
+    def upload_file(file_obj, s3_key, content_type, stats=None):
+        s3_service.threads.append(threading.current_thread().name)
+        time.sleep(0.2)
+        return f"https://bucket/{s3_key}"
+
+    s3_service.upload_file.side_effect = upload_file
+    s3_service.delete_file.return_value = True
+    s3_service.get_file_url.return_value = "https://bucket/a.csv?firma"
+    return AsyncStorage(s3_service, max_workers=2)
+
+
+class TestAsyncStorage:
+    """Clase de pruebas para AsyncStorage."""
+
+    def test_upload_does_not_block_event_loop(self):
+        """Prueba que una subida lenta no detiene otras tareas del bucle de eventos."""
+        storage = _storage()
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        async def scenario():
+            url, _ = await asyncio.gather(storage.upload(io.BytesIO(b"x"), "a.csv", "text/csv"), ticker())
+            return url
+
+        url = asyncio.run(scenario())
+        storage.shutdown()
+
+        assert url == "https://bucket/a.csv"
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.2
+        assert storage.storage.threads[0].startswith("storage")
+
+    def test_delete_and_presign(self):
+        """Prueba que delete y presign delegan en el servicio de S3."""
+        storage = _storage()
+
+        async def scenario():
+            return await storage.delete("a.csv"), await storage.presign("a.csv", 60)
+
+        deleted, url = asyncio.run(scenario())
+        storage.shutdown()
+
+        assert deleted is True
+        assert url == "https://bucket/a.csv?firma"
+        storage.storage.get_file_url.assert_called_once_with("a.csv", 60)
+
+    def test_pool_is_bounded(self):
+        """Prueba que como mucho max_workers operaciones se ejecutan a la vez."""
+        storage = _storage()
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def operation():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        async def scenario():
+            await asyncio.gather(*(storage.run(operation) for _ in range(6)))
+
+        asyncio.run(scenario())
+        storage.shutdown()
+
+        assert peak[0] == 2
+
+    def test_busy_upload_workers_do_not_delay_presign(self):
+        """Prueba que las cargas lentas del pool de upload_workers no retrasan una firma."""
+        storage = _storage()
+        workers = UploadWorkerPool(max_workers=2)
+
+        async def scenario():
+            uploads = [asyncio.ensure_future(workers.run(time.sleep, 0.5)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            started = time.perf_counter()
+            await storage.presign("a.csv")
+            elapsed = time.perf_counter() - started
+            await asyncio.gather(*uploads)
+            return elapsed
+
+        elapsed = asyncio.run(scenario())
+        workers.shutdown()
+        storage.shutdown()
+
+        assert elapsed < 0.2
@@ -0,0 +1,195 @@
+"""
+Pruebas unitarias para la carga de archivos por lotes.
+
+Verifica la lectura de archivos de un ZIP y el flujo de
+FileUseCase.upload_batch: deduplicación previa, fallos por archivo e
+inserción de los registros en una sola transacción.
+"""
+
+import hashlib
+import io
+import zipfile
+import pytest
+from unittest.mock import Mock, patch
+from app.application.ingestion.batch_archive import read_zip_items, stream_item
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.entities.file import File, FileStatus
+
+VALID = b"name,price\nA,1\n"
+INVALID = b"name,price\nA,\n"
+
+
+class _Upload:
+    """Carga por partes simulada que guarda los bytes escritos."""
+
+    def __init__(self, s3_key, fail=False):
+        self.s3_key = s3_key
+        self.data = b""
+        self.fail = fail
+        self.aborted = False
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+    def complete(self):
+        return None if self.fail else f"https://bucket/{self.s3_key}"
+
+    def abort(self):
+        self.aborted = True
+
+
+def _zip(members):
+    """Crea un ZIP en memoria con los miembros indicados."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+class TestReadZipItems:
+    """Clase de pruebas para read_zip_items."""
+
+    def test_lists_members(self):
+        """Prueba que se ignoran carpetas y metadatos y se rechazan extensiones no aceptadas."""
+        archive = _zip({
+            "datos/a.csv": VALID,
+            "__MACOSX/datos/._a.csv": b"x",
+            "notas.txt": b"x",
+        })
+
+        items = read_zip_items(archive, max_files=10, max_file_size=1024)
+
+        assert [item.filename for item in items] == ["a.csv", "notas.txt"]
+        assert items[0].error is None
+        assert items[0].open().read() == VALID
+        assert items[1].error is not None
+
+    def test_member_too_large(self):
+        """Prueba que un miembro mayor que el máximo descomprimido se rechaza."""
+        items = read_zip_items(_zip({"a.csv": VALID}), max_files=10, max_file_size=4)
+        assert "máximo" in items[0].error
+
+    def test_too_many_members(self):
+        """Prueba que un ZIP con más archivos que el máximo es un error."""
+        with pytest.raises(ValueError):
+            read_zip_items(_zip({"a.csv": VALID, "b.csv": VALID}), max_files=1, max_file_size=1024)
+
+    def test_invalid_zip(self):
+        """Prueba que un archivo que no es ZIP es un error."""
+        with pytest.raises(ValueError):
+            read_zip_items(io.BytesIO(b"no es un zip"), max_files=10, max_file_size=1024)
+
+
+class TestFileUseCaseUploadBatch:
+    """Clase de pruebas para FileUseCase.upload_batch."""
+
+    def _use_case(self, existing=None, failing=()):
+        """Crea el caso de uso con repositorios y S3 simulados."""
+        file_repository = Mock()
+        file_repository.create_many.side_effect = lambda entities: [
+            File(
+                id_=10 + position,
+                filename=entity.filename,
+                s3_key=entity.s3_key,
+                s3_url=entity.s3_url,
+                file_size=entity.file_size,
+                status=entity.status,
+                validations=entity.validations,
+                user_id=entity.user_id
+            )
+            for position, entity in enumerate(entities)
+        ]
+        file_repository.get_by_content_hashes.return_value = existing or {}
+        file_validation_repository = Mock()
+        file_validation_repository.insert_batch.side_effect = lambda file_id, first_seq, findings: len(findings)
+
+        s3_service = Mock()
+        s3_service.uploads = []
+
+        def start_upload(s3_key, content_type, content_encoding=None):
+            upload = _Upload(s3_key, fail=any(name in s3_key for name in failing))
+            s3_service.uploads.append(upload)
+            return upload
+
+        s3_service.start_upload.side_effect = start_upload
+        s3_service.delete_files.return_value = []
+        with patch("app.application.use_cases.file_use_case.get_storage_backend", return_value=s3_service):
+            use_case = FileUseCase(file_repository, None, file_validation_repository)
+        return use_case, file_repository, file_validation_repository
+
+    def _items(self, members):
+        """Crea archivos de un lote a partir de nombres y contenidos."""
+        return [stream_item(name, "text/csv", io.BytesIO(data)) for name, data in members]
+
+    def test_inserts_all_files_at_once(self):
+        """Prueba que los archivos subidos se registran en una sola inserción y se guardan sus validaciones."""
+        use_case, file_repository, file_validation_repository = self._use_case()
+
+        result = use_case.upload_batch(
+            self._items([("a.csv", VALID), ("b.csv", INVALID)]), 1, "p1", "p2", report_mode="full"
+        )
+
+        assert file_repository.create_many.call_count == 1
+        file_repository.create.assert_not_called()
+        assert [entry["file_id"] for entry in result["files"]] == [10, 11]
+        assert [entry["status"] for entry in result["files"]] == ["completed", "pending"]
+        assert result["uploaded"] == 2
+        assert set(result["timings"]) == {"hash", "upload", "persist", "total"}
+        file_validation_repository.insert_batch.assert_called_once()
+        assert file_validation_repository.insert_batch.call_args[0][0] == 11
+        assert sorted(upload.data for upload in use_case.storage.uploads) == sorted([VALID, INVALID])
+
+    def test_existing_and_repeated_content_not_uploaded(self):
+        """Prueba que el contenido ya subido y las copias dentro del lote no se vuelven a subir."""
+        existing = File(id_=3, s3_url="https://bucket/old.csv", status=FileStatus.COMPLETED, user_id=1)
+        use_case, file_repository, _ = self._use_case(
+            existing={hashlib.sha256(VALID).hexdigest(): existing}
+        )
+
+        result = use_case.upload_batch(
+            self._items([("a.csv", VALID), ("b.csv", INVALID), ("c.csv", INVALID)]), 1, "p1", "p2",
+            report_mode="full"
+        )
+
+        files = result["files"]
+        assert files[0]["file_id"] == 3 and files[0]["deduplicated"] is True
+        assert files[1]["file_id"] == 10 and files[1]["deduplicated"] is False
+        assert files[2]["file_id"] == 10 and files[2]["deduplicated"] is True
+        assert files[2]["filename"] == "c.csv"
+        assert len(use_case.storage.uploads) == 1
+        assert len(file_repository.create_many.call_args[0][0]) == 1
+        assert result["uploaded"] == 1
+        assert result["deduplicated"] == 2
+
+    def test_failed_file_does_not_stop_batch(self):
+        """Prueba que un archivo que falla queda con su error sin detener el resto."""
+        use_case, file_repository, _ = self._use_case(failing=("b.csv",))
+
+        result = use_case.upload_batch(
+            self._items([("a.csv", VALID), ("b.csv", INVALID), ("c.txt", VALID)]), 1, "p1", "p2",
+            report_mode="full"
+        )
+
+        files = result["files"]
+        assert files[0]["file_id"] == 10
+        assert files[1]["status"] == "failed" and "S3" in files[1]["error"]
+        assert files[2]["status"] == "failed" and files[2]["error"] is not None
+        assert result["failed"] == 2
+        assert sum(upload.aborted for upload in use_case.storage.uploads) == 1
+
+    def test_insert_failure_deletes_uploaded_objects(self):
+        """Prueba que si falla la inserción se eliminan de S3 los archivos subidos."""
+        use_case, file_repository, _ = self._use_case()
+        file_repository.create_many.side_effect = RuntimeError("sin conexión a la base de datos")
+
+        with pytest.raises(RuntimeError):
+            use_case.upload_batch(
+                self._items([("a.csv", VALID), ("b.csv", VALID + b"B,2\n")]), 1, "p1", "p2", report_mode="full"
+            )
+
+        use_case.storage.delete_files.assert_called_once()
+        deleted = use_case.storage.delete_files.call_args[0][0]
+        assert set(deleted) == {upload.s3_key for upload in use_case.storage.uploads}
@@ -0,0 +1,64 @@
+"""
+Pruebas unitarias para ColumnarCSVValidator.
+
+Verifica que el backend columnar produce exactamente las mismas validaciones
+(tipos, filas y columnas) que la validación fila a fila.
+"""
+
+import io
+import pytest
+from app.application.validation.columnar_validator import ColumnarCSVValidator
+from app.application.validation.csv_stream_validator import CSVStreamValidator
+
+
+@pytest.fixture
+def validator():
+    """Fixture para crear un validador columnar con bloques pequeños."""
+    return ColumnarCSVValidator(chunk_rows=2)
+
+
+def _streaming(content: bytes):
+    """Valida el contenido con el backend fila a fila."""
+    return CSVStreamValidator().validate(io.BytesIO(content))
+
+
+class TestColumnarCSVValidator:
+    """Clase de pruebas para el método validate."""
+
+    @pytest.mark.parametrize("content", [
+        b"",
+        b"name,email\n",
+        b"name,email\nJohn,john@example.com\n",
+        b"name,email,age\nJohn,,30\n,jane@example.com,25\n  ,x,\n",
+        b"a,b\n1,2\n3,4\n1,2\n3,4\n1,2\n",
+        b"product,price,quantity\nItem1,abc,5\nItem2,\"10,50\",xyz\nItem3,nan,1e3\n",
+        b"name,price\n,abc\n,abc\n",
+        b"a,b,c\n1\n1\n1,2\n",
+        b"a,b\n\n1,\n\n2,\n",
+        b"a,a,b\n1,2,3\n4,2,3\n",
+        b"a,b\n1,\n1,2,3\n4,5\n",
+        b'name,notes\nJohn,"line one\nline two"\nJohn,"line one\nline two"\n',
+    ])
+    def test_same_findings_as_streaming(self, validator, content):
+        """Prueba que las validaciones coinciden con el backend fila a fila."""
+        assert validator.validate(io.BytesIO(content)) == _streaming(content)
+
+    def test_duplicates_across_chunks(self, validator):
+        """Prueba detección de duplicados entre bloques distintos."""
+        validations = validator.validate(io.BytesIO(b"a,b\n1,2\n3,4\n5,6\n1,2\n"))
+        assert [(v["type"], v["row"]) for v in validations] == [("duplicate", 5)]
+
+    def test_missing_and_empty_are_distinct_rows(self, validator):
+        """Prueba que un valor ausente y uno vacío no se consideran la misma fila."""
+        validations = validator.validate(io.BytesIO(b"a,b\n1\n1,\n"))
+        assert not any(v["type"] == "duplicate" for v in validations)
+
+    def test_whitespace_only_is_empty(self, validator):
+        """Prueba que los valores con solo espacios se consideran vacíos."""
+        validations = validator.validate(io.BytesIO(b"a,b\n1,\t \n"))
+        assert [(v["type"], v["column"]) for v in validations] == [("empty_value", "b")]
+
+    def test_invalid_encoding_parse_error(self, validator):
+        """Prueba que un contenido no decodificable produce parse_error."""
+        validations = validator.validate(io.BytesIO(b"a,b\n\xff\xfe,1\n"))
+        assert validations[-1]["type"] == "parse_error"
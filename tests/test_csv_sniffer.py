@@ -0,0 +1,152 @@
+"""
+Pruebas unitarias para la detección de codificación y delimitador.
+
+Verifica la deducción de la codificación y del delimitador a partir del
+primer bloque, la devolución del bloque examinado al flujo y la
+validación de archivos con dialecto deducido.
+"""
+
+import codecs
+import io
+from app.application.validation.csv_sniffer import (
+    detect_delimiter,
+    detect_dialect,
+    detect_encoding,
+    sniff_stream,
+)
+from app.application.validation.csv_stream_validator import CSVStreamValidator, iter_text_lines
+from app.application.validation.columnar_validator import ColumnarCSVValidator
+
+
+class TestDetectEncoding:
+    """Clase de pruebas para detect_encoding."""
+
+    def test_ascii_is_utf8(self):
+        """Prueba que el contenido ASCII se trata como UTF-8."""
+        assert detect_encoding(b"name,price\nA,1\n") == "utf-8"
+
+    def test_bom(self):
+        """Prueba la detección de UTF-8 con BOM."""
+        assert detect_encoding(codecs.BOM_UTF8 + b"name\n") == "utf-8-sig"
+
+    def test_utf8(self):
+        """Prueba la detección de UTF-8 sin BOM."""
+        assert detect_encoding("nombre,año\nJosé,1\n".encode("utf-8")) == "utf-8"
+
+    def test_utf8_truncated_sample(self):
+        """Prueba que un carácter multibyte cortado al final del bloque no descarta UTF-8."""
+        sample = "nombre\nJosé".encode("utf-8")[:-1]
+        assert detect_encoding(sample, final=False) == "utf-8"
+
+    def test_cp1252(self):
+        """Prueba la detección de CP1252."""
+        assert detect_encoding("precio\n5 €\n".encode("cp1252")) == "cp1252"
+
+    def test_latin1(self):
+        """Prueba la detección de Latin-1 cuando CP1252 no puede decodificar."""
+        assert detect_encoding(b"nombre\nJos\xe9 \x81\n") == "latin-1"
+
+
+class TestDetectDelimiter:
+    """Clase de pruebas para detect_delimiter."""
+
+    def test_comma(self):
+        """Prueba la detección de la coma."""
+        assert detect_delimiter("a,b,c\n1,2,3\n") == ","
+
+    def test_semicolon_with_decimal_commas(self):
+        """Prueba la detección del punto y coma con comas decimales en los valores."""
+        assert detect_delimiter("nombre;precio\nA;1,5\nB;2,25\n") == ";"
+
+    def test_tab_and_pipe(self):
+        """Prueba la detección del tabulador y la barra vertical."""
+        assert detect_delimiter("a\tb\n1\t2\n") == "\t"
+        assert detect_delimiter("a|b|c\n1|2|3\n") == "|"
+
+    def test_single_column_defaults_to_comma(self):
+        """Prueba que un archivo de una sola columna usa la coma."""
+        assert detect_delimiter("name\nA\nB\n") == ","
+
+
+class TestSniffStream:
+    """Clase de pruebas para sniff_stream y detect_dialect."""
+
+    def test_fixed_dialect_skips_detection(self):
+        """Prueba que con codificación y delimitador fijos no se lee el flujo."""
+        stream = io.BytesIO(b"a;b\n")
+        sniffed, dialect = sniff_stream(stream, "utf-8", ",")
+        assert sniffed is stream
+        assert stream.tell() == 0
+        assert dialect == ("utf-8", ",")
+
+    def test_sample_is_replayed(self):
+        """Prueba que el bloque examinado se devuelve al flujo."""
+        content = b"a;b\n" + b"1;2\n" * 100
+        sniffed, dialect = sniff_stream(io.BytesIO(content), sample_bytes=10)
+        assert dialect.delimiter == ";"
+        data = b"".join(iter(lambda: sniffed.read(7), b""))
+        assert data == content
+
+    def test_bom_is_stripped(self):
+        """Prueba que el BOM se descarta y el resto se lee como UTF-8."""
+        sniffed, dialect = sniff_stream(io.BytesIO(codecs.BOM_UTF8 + b"a,b\n1,2\n"))
+        assert dialect.encoding == "utf-8"
+        assert sniffed.read() == b"a,b\n1,2\n"
+
+    def test_partial_last_line_is_ignored(self):
+        """Prueba que la última línea incompleta del bloque no afecta al delimitador."""
+        sample = b"a;b\n1;2\n3,4,5,6"
+        assert detect_dialect(sample, final=False).delimiter == ";"
+
+
+class TestIterTextLines:
+    """Clase de pruebas para la división en líneas de iter_text_lines."""
+
+    def _reference(self, content, encoding):
+        """Divide el contenido solo por saltos de línea '\\n'."""
+        text = content.decode(encoding)
+        lines = text.split("\n")
+        result = [line + "\n" for line in lines[:-1]]
+        if lines[-1]:
+            result.append(lines[-1])
+        return result
+
+    def test_only_newline_splits_lines(self):
+        """Prueba que solo '\\n' separa líneas, también con CRLF y otros separadores."""
+        samples = [
+            b"a,b\r\n1,2\r\n",
+            b"a,b\r\n1,\"x\ry\"\r\n3,4",
+            b"a,b\n1,\x0c2\n3,\x1e4\n",
+            "a,b\nJosé,1\r\n".encode("cp1252"),
+        ]
+        for content in samples:
+            for chunk_size in (1, 3, 64):
+                for encoding in ("utf-8", "cp1252"):
+                    try:
+                        expected = self._reference(content, encoding)
+                    except UnicodeDecodeError:
+                        continue
+                    lines = list(iter_text_lines(io.BytesIO(content), encoding, chunk_size))
+                    assert lines == expected
+
+
+class TestDetectedDialectValidation:
+    """Clase de pruebas para la validación con dialecto deducido."""
+
+    CONTENT = "nombre;precio;ciudad\nJosé;1,5;Málaga\n;abc;Cádiz\nJosé;1,5;Málaga\n".encode("latin-1")
+
+    def test_latin1_semicolon(self):
+        """Prueba la validación de un CSV Latin-1 separado por punto y coma."""
+        validator = CSVStreamValidator(encoding=None, delimiter=None)
+        findings = validator.validate(io.BytesIO(self.CONTENT))
+        assert [(f["type"], f["row"], f.get("column")) for f in findings] == [
+            ("empty_value", 3, "nombre"),
+            ("invalid_type", 3, "precio"),
+            ("duplicate", 4, None),
+        ]
+
+    def test_columnar_matches_streaming(self):
+        """Prueba que el backend columnar deduce el mismo dialecto."""
+        expected = CSVStreamValidator(encoding=None, delimiter=None).validate(io.BytesIO(self.CONTENT))
+        validator = ColumnarCSVValidator(encoding=None, delimiter=None)
+        assert validator.validate(io.BytesIO(self.CONTENT)) == expected
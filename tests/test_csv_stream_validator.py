@@ -0,0 +1,99 @@
+"""
+Pruebas unitarias para CSVStreamValidator.
+
+Verifica que la validación en streaming produce las mismas validaciones
+que el procesamiento en memoria, independientemente del tamaño de bloque.
+"""
+
+import io
+import pytest
+from app.application.validation.csv_stream_validator import CSVStreamValidator, iter_text_lines
+
+
+@pytest.fixture
+def validator():
+    """Fixture para crear un validador con bloques pequeños."""
+    return CSVStreamValidator(chunk_size=7)
+
+
+class TestIterTextLines:
+    """Clase de pruebas para la función iter_text_lines."""
+
+    def test_lines_keep_newlines(self):
+        """Prueba que las líneas conservan el salto de línea."""
+        lines = list(iter_text_lines(io.BytesIO(b"a,b\n1,2\n3,4"), chunk_size=3))
+        assert lines == ["a,b\n", "1,2\n", "3,4"]
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """Prueba que los caracteres multibyte partidos entre bloques se decodifican bien."""
+        content = "name\nJosé Ñandú\n".encode("utf-8")
+        lines = list(iter_text_lines(io.BytesIO(content), chunk_size=1))
+        assert lines == ["name\n", "José Ñandú\n"]
+
+    def test_empty_stream(self):
+        """Prueba flujo vacío."""
+        assert list(iter_text_lines(io.BytesIO(b""))) == []
+
+
+class TestCSVStreamValidator:
+    """Clase de pruebas para el método validate."""
+
+    def test_valid_file(self, validator):
+        """Prueba CSV sin errores."""
+        assert validator.validate(io.BytesIO(b"name,email\nJohn,john@example.com\n")) == []
+
+    def test_empty_values(self, validator):
+        """Prueba detección de valores vacíos con fila y columna."""
+        validations = validator.validate(io.BytesIO(b"name,email\nJohn,\n"))
+        assert validations == [{
+            "type": "empty_value",
+            "row": 2,
+            "column": "email",
+            "message": "Valor vacío en fila 2, columna email"
+        }]
+
+    def test_duplicates(self, validator):
+        """Prueba detección de filas duplicadas."""
+        validations = validator.validate(io.BytesIO(b"a,b\n1,2\n3,4\n1,2\n"))
+        assert [(v["type"], v["row"]) for v in validations] == [("duplicate", 4)]
+
+    def test_invalid_numeric(self, validator):
+        """Prueba validación de columnas numéricas con coma decimal."""
+        validations = validator.validate(io.BytesIO(b"product,price\nA,\"10,5\"\nB,abc\n"))
+        assert [(v["type"], v["row"], v["column"]) for v in validations] == [("invalid_type", 3, "price")]
+
+    def test_quoted_newline_across_chunks(self, validator):
+        """Prueba campos entrecomillados con saltos de línea partidos entre bloques."""
+        content = b'name,notes\nJohn,"line one\nline two"\nJane,\n'
+        validations = validator.validate(io.BytesIO(content))
+        assert [(v["type"], v["row"]) for v in validations] == [("empty_value", 3)]
+
+    def test_finding_order_within_row(self, validator):
+        """Prueba que el orden de validaciones por fila se conserva."""
+        validations = validator.validate(io.BytesIO(b"name,price\n,abc\n,abc\n"))
+        assert [v["type"] for v in validations] == [
+            "empty_value", "invalid_type", "empty_value", "duplicate", "invalid_type"
+        ]
+
+    def test_blank_lines_are_not_counted(self, validator):
+        """Prueba que las líneas en blanco no cuentan como filas."""
+        validations = validator.validate(io.BytesIO(b"a,b\n\n1,\n"))
+        assert validations[0]["row"] == 2
+
+    def test_extra_columns_parse_error(self, validator):
+        """Prueba que una fila con columnas de más detiene la validación con parse_error."""
+        validations = validator.validate(io.BytesIO(b"a,b\n1,\n1,2,3\n4,5\n"))
+        assert [v["type"] for v in validations] == ["empty_value", "parse_error"]
+
+    def test_invalid_encoding_parse_error(self, validator):
+        """Prueba que un contenido no decodificable produce parse_error."""
+        validations = validator.validate(io.BytesIO(b"a,b\n\xff\xfe,1\n"))
+        assert validations[-1]["type"] == "parse_error"
+
+    def test_iter_findings_is_lazy(self, validator):
+        """Prueba que las validaciones se emiten sin leer el flujo completo."""
+        content = b"a,b\n1,\n" + b"2,3\n" * 10000
+        stream = io.BytesIO(content)
+        first = next(validator.iter_findings(stream))
+        assert first["row"] == 2
+        assert stream.tell() < len(content)
@@ -0,0 +1,112 @@
+"""
+Pruebas unitarias para la carga de CSV comprimidos.
+
+Verifica la descompresión al vuelo con límite de tamaño de
+DecompressingStream y la carga de archivos .csv.gz de FileUseCase.
+"""
+
+import gzip
+import io
+import pytest
+from unittest.mock import Mock, patch
+from app.application.ingestion.decompression import (
+    DecompressedSizeExceeded,
+    DecompressingStream,
+    content_encoding,
+)
+from app.application.use_cases.file_use_case import FileUseCase
+
+CONTENT = b"name,price\nA,1\nB,\n"
+
+
+class _Unseekable:
+    """Flujo de solo lectura, como el cuerpo de una petición."""
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
+class TestDecompressingStream:
+    """Clase de pruebas para DecompressingStream."""
+
+    def test_content_encoding_by_extension(self):
+        """Prueba que la compresión se deduce de la extensión."""
+        assert content_encoding("datos.csv.gz") == "gzip"
+        assert content_encoding("DATOS.CSV.ZST") == "zstd"
+        assert content_encoding("datos.csv") is None
+
+    def test_reads_gzip_members(self):
+        """Prueba que se descomprimen por bloques varios miembros gzip de un flujo sin seek."""
+        stream = DecompressingStream(_Unseekable(gzip.compress(CONTENT) + gzip.compress(b"C,3\n")), "gzip", 1000)
+
+        data = b""
+        while True:
+            chunk = stream.read(5)
+            if not chunk:
+                break
+            data += chunk
+
+        assert data == CONTENT + b"C,3\n"
+        assert stream.size == len(CONTENT) + 4
+
+    def test_size_limit(self):
+        """Prueba que se detiene la lectura al superar el tamaño descomprimido máximo."""
+        stream = DecompressingStream(io.BytesIO(gzip.compress(b"0" * 10000)), "gzip", 100)
+
+        with pytest.raises(DecompressedSizeExceeded):
+            stream.read(-1)
+        with pytest.raises(DecompressedSizeExceeded):
+            stream.read(10)
+        assert stream.size <= 101
+
+    def test_zstd(self):
+        """Prueba que se descomprimen archivos zstd."""
+        zstandard = pytest.importorskip("zstandard")
+        compressed = zstandard.ZstdCompressor().compress(CONTENT)
+
+        assert DecompressingStream(io.BytesIO(compressed), "zstd", 1000).read(-1) == CONTENT
+
+
+class TestFileUseCaseCompressedUpload:
+    """Clase de pruebas para la carga de CSV comprimidos de FileUseCase."""
+
+    def _upload(self, content, filename):
+        """Sube un contenido comprimido con S3 y repositorio simulados."""
+        repository = Mock()
+        repository.create.side_effect = lambda entity: entity
+        repository.update.side_effect = lambda entity: entity
+        repository.get_by_content_hash.return_value = None
+        with patch("app.application.use_cases.file_use_case.get_storage_backend") as s3_class:
+            upload = s3_class.return_value.start_upload.return_value
+            upload.complete.return_value = "https://s3.amazonaws.com/bucket/file.csv.gz"
+            use_case = FileUseCase(repository)
+            result = use_case.upload_and_validate_stream(
+                _Unseekable(content), filename, "application/gzip", 1, "p1", "p2"
+            )
+        return result, upload, s3_class.return_value, repository
+
+    def test_gzip_validated_and_stored_compressed(self):
+        """Prueba que un .csv.gz se valida descomprimido y se sube comprimido a S3."""
+        compressed = gzip.compress(CONTENT)
+
+        result, upload, s3_service, repository = self._upload(compressed, "datos.csv.gz")
+
+        assert [v["type"] for v in result["validations"]] == ["empty_value"]
+        assert b"".join(call.args[0] for call in upload.write.call_args_list) == compressed
+        assert s3_service.start_upload.call_args[0][1:] == ("text/csv", "gzip")
+        assert repository.update.call_args[0][0].file_size == len(compressed)
+
+    def test_decompressed_limit_fails_upload(self):
+        """Prueba que superar el tamaño descomprimido máximo cancela la carga."""
+        with patch("app.application.use_cases.file_use_case.settings.CSV_MAX_DECOMPRESSED_BYTES", 10):
+            with pytest.raises(DecompressedSizeExceeded):
+                self._upload(gzip.compress(CONTENT), "datos.csv.gz")
+
+    def test_corrupt_gzip_is_parse_error(self):
+        """Prueba que un gzip dañado se informa como error de lectura."""
+        result, _, _, _ = self._upload(b"no es gzip", "datos.csv.gz")
+
+        assert [v["type"] for v in result["validations"]] == ["parse_error"]
@@ -0,0 +1,140 @@
+"""
+Pruebas unitarias para las subidas directas al almacenamiento.
+
+Verifica el formulario POST firmado de S3Service y que FileUseCase
+registra la subida, valida el archivo leyéndolo del almacenamiento y
+descarta los duplicados.
+"""
+
+import gzip
+import io
+import pytest
+from unittest.mock import Mock
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.entities.file import File, FileStatus
+from app.infrastructure.services.presigned_url_cache import PresignedUrlCache
+from app.infrastructure.services.s3_service import S3Service
+from app.infrastructure.services.storage_backends import MemoryStorageBackend
+
+VALID = b"name,price\nA,1\nB,2\n"
+INVALID = b"name,price\nA,1\nB,\n"
+
+
+def _repository(existing=None):
+    """Crea un repositorio simulado que guarda los archivos en un diccionario."""
+    files = {}
+    repository = Mock()
+
+    def create(entity):
+        entity.id = len(files) + 1
+        files[entity.id] = entity
+        return entity
+
+    repository.files = files
+    repository.create.side_effect = create
+    repository.get_by_id.side_effect = files.get
+    repository.update.side_effect = lambda entity: entity
+    repository.delete.side_effect = lambda file_id: files.pop(file_id, None) is not None
+    repository.get_by_content_hash.return_value = existing
+    return repository
+
+
+def _use_case(existing=None):
+    """Crea el caso de uso con el backend en memoria."""
+    storage = MemoryStorageBackend()
+    file_validation_repository = Mock()
+    file_validation_repository.insert_batch.side_effect = lambda file_id, first_seq, findings: len(findings)
+    return FileUseCase(_repository(existing), None, file_validation_repository, storage=storage), storage
+
+
+class TestS3ServicePresignedPost:
+    """Clase de pruebas para S3Service.create_presigned_post."""
+
+    def test_policy_conditions(self):
+        """Prueba que la política fija el tipo, la compresión y el tamaño máximo."""
+        client = Mock()
+        client.generate_presigned_post.return_value = {"url": "https://bucket", "fields": {"key": "a.csv.gz"}}
+        service = S3Service(client, url_cache=PresignedUrlCache(10))
+
+        form = service.create_presigned_post("a.csv.gz", "text/csv", "gzip", 100, 60)
+
+        assert form["url"] == "https://bucket"
+        kwargs = client.generate_presigned_post.call_args[1]
+        assert kwargs["Key"] == "a.csv.gz"
+        assert kwargs["Fields"] == {"Content-Type": "text/csv", "Content-Encoding": "gzip"}
+        assert ["content-length-range", 1, 100] in kwargs["Conditions"]
+        assert {"Content-Encoding": "gzip"} in kwargs["Conditions"]
+        assert kwargs["ExpiresIn"] == 60
+
+
+class TestDirectUpload:
+    """Clase de pruebas para start_direct_upload y complete_direct_upload."""
+
+    def test_start_registers_provisional_file(self):
+        """Prueba que se registra el archivo sin URL y se devuelve el formulario de su clave."""
+        use_case, _ = _use_case()
+
+        result = use_case.start_direct_upload("ventas.csv.gz", "application/gzip", 1)
+
+        file = use_case.file_repository.files[result["file_id"]]
+        assert file.status == FileStatus.PENDING
+        assert not file.s3_url
+        assert file.content_type == "text/csv"
+        assert result["s3_key"].startswith("uploads/1/")
+        assert result["fields"]["key"] == result["s3_key"]
+        assert result["fields"]["Content-Encoding"] == "gzip"
+
+    def test_complete_validates_from_storage(self):
+        """Prueba que el archivo subido se valida leyéndolo del almacenamiento."""
+        use_case, storage = _use_case()
+        started = use_case.start_direct_upload("ventas.csv.gz", "text/csv", 1)
+        storage.upload_file(io.BytesIO(gzip.compress(INVALID)), started["s3_key"], "text/csv")
+
+        result = use_case.complete_direct_upload(started["file_id"], 1, "p1", "p2", report_mode="full")
+
+        file = use_case.file_repository.files[started["file_id"]]
+        assert result["deduplicated"] is False
+        assert result["s3_url"] == storage.object_url(started["s3_key"])
+        assert any(validation["type"] == "empty_value" for validation in result["validations"])
+        assert file.file_size == len(gzip.compress(INVALID))
+        assert file.content_hash is not None
+
+    def test_complete_before_upload(self):
+        """Prueba que completar sin el archivo en el almacenamiento es un error y no cambia el registro."""
+        use_case, _ = _use_case()
+        started = use_case.start_direct_upload("ventas.csv", "text/csv", 1)
+
+        with pytest.raises(ValueError):
+            use_case.complete_direct_upload(started["file_id"], 1, "p1", "p2")
+        assert use_case.file_repository.files[started["file_id"]].status == FileStatus.PENDING
+
+    def test_complete_twice(self):
+        """Prueba que una subida completada no se puede volver a completar."""
+        use_case, storage = _use_case()
+        started = use_case.start_direct_upload("ventas.csv", "text/csv", 1)
+        storage.upload_file(io.BytesIO(VALID), started["s3_key"], "text/csv")
+        use_case.complete_direct_upload(started["file_id"], 1, "p1", "p2")
+
+        with pytest.raises(ValueError):
+            use_case.complete_direct_upload(started["file_id"], 1, "p1", "p2")
+
+    def test_other_user(self):
+        """Prueba que otro usuario no puede completar la subida."""
+        use_case, _ = _use_case()
+        started = use_case.start_direct_upload("ventas.csv", "text/csv", 1)
+
+        assert use_case.complete_direct_upload(started["file_id"], 2, "p1", "p2") is None
+
+    def test_duplicate_discards_upload(self):
+        """Prueba que un contenido ya subido elimina el objeto nuevo y devuelve el archivo existente."""
+        existing = File(id_=99, filename="a.csv", s3_key="uploads/1/a.csv", s3_url="memory://a", user_id=1)
+        use_case, storage = _use_case(existing)
+        started = use_case.start_direct_upload("ventas.csv", "text/csv", 1)
+        storage.upload_file(io.BytesIO(VALID), started["s3_key"], "text/csv")
+
+        result = use_case.complete_direct_upload(started["file_id"], 1, "p1", "p2")
+
+        assert result["deduplicated"] is True
+        assert result["file_id"] == 99
+        assert storage.head_file(started["s3_key"]) is None
+        assert started["file_id"] not in use_case.file_repository.files
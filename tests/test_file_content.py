@@ -0,0 +1,125 @@
+"""
+Pruebas unitarias para la descarga de archivos a través de la API.
+
+Verifica la interpretación de Range, If-None-Match e If-Range, los
+metadatos y la lectura por rangos de los backends en memoria y local, la
+lectura por bloques de AsyncStorage y la petición a S3 con Range.
+"""
+
+import asyncio
+import io
+import pytest
+from unittest.mock import Mock
+from app.infrastructure.services.async_storage import AsyncStorage
+from app.infrastructure.services.presigned_url_cache import PresignedUrlCache
+from app.infrastructure.services.s3_service import S3Service
+from app.infrastructure.services.storage_backends import LocalStorageBackend, MemoryStorageBackend
+from app.presentation.http_ranges import RangeNotSatisfiable, content_disposition, etag_matches, parse_range
+
+CONTENT = b"name,price\nA,1\nB,2\n"
+
+
+@pytest.fixture(params=["memory", "local"])
+def backend(request, tmp_path):
+    """Backend en memoria o local con un archivo subido."""
+    storage = MemoryStorageBackend() if request.param == "memory" else LocalStorageBackend(str(tmp_path))
+    storage.upload_file(io.BytesIO(CONTENT), "uploads/a.csv", "text/csv")
+    return storage
+
+
+class TestParseRange:
+    """Clase de pruebas para parse_range."""
+
+    def test_ranges(self):
+        """Prueba los rangos con inicio y fin, abiertos y de sufijo."""
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+        assert parse_range("bytes=90-", 100) == (90, 99)
+        assert parse_range("bytes=50-500", 100) == (50, 99)
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=-500", 100) == (0, 99)
+
+    def test_ignored(self):
+        """Prueba que sin cabecera, con varios rangos o mal formada se envía el archivo completo."""
+        assert parse_range(None, 100) is None
+        assert parse_range("bytes=0-1,5-6", 100) is None
+        assert parse_range("items=0-1", 100) is None
+        assert parse_range("bytes=9-5", 100) is None
+        assert parse_range("bytes=-", 100) is None
+
+    def test_not_satisfiable(self):
+        """Prueba que un rango fuera del archivo no es satisfacible."""
+        for header, size in (("bytes=100-", 100), ("bytes=-0", 100), ("bytes=-5", 0)):
+            with pytest.raises(RangeNotSatisfiable):
+                parse_range(header, size)
+
+
+class TestConditionalHeaders:
+    """Clase de pruebas para etag_matches y content_disposition."""
+
+    def test_if_none_match(self):
+        """Prueba la comparación débil de If-None-Match."""
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
+
+    def test_if_range_is_strong(self):
+        """Prueba que If-Range no acepta ETags débiles."""
+        assert etag_matches('"b"', '"b"', weak=False)
+        assert not etag_matches('W/"b"', '"b"', weak=False)
+
+    def test_content_disposition(self):
+        """Prueba que el nombre se envía en ASCII seguro y en UTF-8."""
+        header = content_disposition('año "1".csv')
+        assert header == 'attachment; filename="a_o _1_.csv"; filename*=UTF-8\'\'a%C3%B1o%20%221%22.csv'
+
+
+class TestBackendContent:
+    """Clase de pruebas de head_file y get_file_stream por rangos en los backends en memoria y local."""
+
+    def test_head_file(self, backend):
+        """Prueba que los metadatos incluyen tamaño, ETag, tipo y fecha de modificación."""
+        metadata = backend.head_file("uploads/a.csv")
+
+        assert metadata["size"] == len(CONTENT)
+        assert metadata["etag"].startswith('"')
+        assert metadata["content_type"] == "text/csv"
+        assert metadata["content_encoding"] is None
+        assert metadata["last_modified"].tzinfo is not None
+        assert backend.head_file("uploads/z.csv") is None
+
+    def test_range(self, backend):
+        """Prueba que se leen solo los bytes del rango."""
+        stream = backend.get_file_stream("uploads/a.csv", (5, 9))
+
+        assert stream.read() == CONTENT[5:10]
+        assert backend.get_file_stream("uploads/a.csv", (11, 1000)).read() == CONTENT[11:]
+        assert backend.get_file_stream("uploads/a.csv", (len(CONTENT), len(CONTENT) + 5)) is None
+
+
+class TestStreamedDownload:
+    """Clase de pruebas para la lectura por bloques de AsyncStorage y la petición a S3."""
+
+    def test_iter_chunks_closes_stream(self):
+        """Prueba que el contenido se lee por bloques y el flujo se cierra al terminar."""
+        stream = io.BytesIO(CONTENT)
+        storage = AsyncStorage(Mock(), max_workers=1)
+
+        async def scenario():
+            return [chunk async for chunk in storage.iter_chunks(stream, 4)]
+
+        chunks = asyncio.run(scenario())
+
+        assert b"".join(chunks) == CONTENT
+        assert max(len(chunk) for chunk in chunks) == 4
+        assert stream.closed
+
+    def test_s3_range_request(self):
+        """Prueba que S3Service pide el rango con la cabecera Range de GetObject."""
+        client = Mock()
+        client.get_object.return_value = {"Body": io.BytesIO(CONTENT[5:10])}
+        service = S3Service(client, url_cache=PresignedUrlCache(10))
+
+        assert service.get_file_stream("uploads/a.csv", (5, 9)).read() == CONTENT[5:10]
+        client.get_object.assert_called_once_with(Bucket=service.bucket_name, Key="uploads/a.csv", Range="bytes=5-9")
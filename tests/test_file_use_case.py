@@ -4,10 +4,17 @@ Pruebas unitarias para FileUseCase.
 Contiene al menos 10 casos de prueba para cada método del caso de uso de archivos.
 """
 
+import hashlib
+import io
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from app.application.use_cases.file_use_case import FileUseCase
+from app.application.validation.schema_profiles import SchemaProfile
 from app.domain.entities.file import File, FileStatus
+from app.infrastructure.services.storage_backends import MemoryStorageBackend
+
+# Opciones de validación por defecto (backend|modo|perfil)
+DEFAULT_OPTIONS = "streaming|full|"
 
 
 @pytest.fixture
@@ -31,7 +38,7 @@ def sample_csv_content():
 class TestFileUseCaseUploadAndValidateFile:
     """Clase de pruebas para el método upload_and_validate_file."""
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_valid_csv_success(self, mock_s3_service_class, file_use_case, mock_file_repository, sample_csv_content):
         """Prueba carga exitosa de CSV válido."""
         mock_s3_service = Mock()
@@ -65,7 +72,7 @@ class TestFileUseCaseUploadAndValidateFile:
         assert result["param2"] == "param2_value"
         assert len(result["validations"]) == 0
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_csv_with_empty_values(self, mock_s3_service_class, file_use_case, mock_file_repository):
         """Prueba validación de valores vacíos en CSV."""
         csv_content = b"name,email,age\nJohn Doe,,30\n,jane@example.com,25"
@@ -97,7 +104,7 @@ class TestFileUseCaseUploadAndValidateFile:
         assert len(result["validations"]) > 0
         assert any(v["type"] == "empty_value" for v in result["validations"])
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_csv_with_duplicates(self, mock_s3_service_class, file_use_case, mock_file_repository):
         """Prueba validación de filas duplicadas."""
         csv_content = b"name,email\nJohn Doe,john@example.com\nJohn Doe,john@example.com"
@@ -128,7 +135,7 @@ class TestFileUseCaseUploadAndValidateFile:
 
         assert any(v["type"] == "duplicate" for v in result["validations"])
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_csv_with_invalid_numeric_types(self, mock_s3_service_class, file_use_case, mock_file_repository):
         """Prueba validación de tipos numéricos inválidos."""
         csv_content = b"product,price,quantity\nItem1,abc,5\nItem2,10.50,xyz"
@@ -159,7 +166,7 @@ class TestFileUseCaseUploadAndValidateFile:
 
         assert any(v["type"] == "invalid_type" for v in result["validations"])
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_invalid_csv_format(self, mock_s3_service_class, file_use_case, mock_file_repository):
         """Prueba manejo de CSV inválido."""
         csv_content = b"This is not a CSV file"
@@ -190,12 +197,18 @@ class TestFileUseCaseUploadAndValidateFile:
 
         assert len(result["validations"]) > 0
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
-    def test_upload_s3_upload_failure(self, mock_s3_service_class, file_use_case, mock_file_repository, sample_csv_content):
-        """Prueba manejo de error al subir a S3."""
-        mock_s3_service = Mock()
-        mock_s3_service.upload_file.return_value = None
-        mock_s3_service_class.return_value = mock_s3_service
+    @pytest.mark.parametrize("complete", [
+        {"return_value": None},
+        {"side_effect": Exception("Error al subir archivo a S3: conexión cerrada")},
+    ])
+    def test_upload_s3_upload_failure(self, complete, mock_file_repository, sample_csv_content):
+        """Prueba que si no se completa la carga en S3 se cancela y el archivo queda en FAILED."""
+        storage = Mock()
+        upload = storage.start_upload.return_value
+        upload.complete.configure_mock(**complete)
+        mock_file_repository.get_by_content_hash.return_value = None
+        mock_file_repository.create.side_effect = lambda entity: entity
+        file_use_case = FileUseCase(mock_file_repository, storage=storage)
 
         with pytest.raises(Exception, match="Error al subir archivo a S3"):
             file_use_case.upload_and_validate_file(
@@ -207,7 +220,14 @@ class TestFileUseCaseUploadAndValidateFile:
                 param2="param2"
             )
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+        upload.complete.assert_called_once()
+        upload.abort.assert_called_once()
+        failed = mock_file_repository.update.call_args[0][0]
+        assert failed.status == FileStatus.FAILED
+        assert failed.file_size == len(sample_csv_content)
+        assert failed.s3_url == ""
+
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_large_file(self, mock_s3_service_class, file_use_case, mock_file_repository):
         """Prueba carga de archivo grande."""
         large_content = b"name,email\n" + b"User" + b"1" * 1000 + b",user1@example.com\n" * 100
@@ -238,7 +258,7 @@ class TestFileUseCaseUploadAndValidateFile:
 
         assert result["file_id"] == 1
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_empty_csv(self, mock_s3_service_class, file_use_case, mock_file_repository):
         """Prueba carga de CSV vacío."""
         csv_content = b"name,email\n"
@@ -269,7 +289,7 @@ class TestFileUseCaseUploadAndValidateFile:
 
         assert result["file_id"] == 1
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_csv_with_special_characters(self, mock_s3_service_class, file_use_case, mock_file_repository):
         """Prueba CSV con caracteres especiales."""
         csv_content = b"name,description\nJos\xc3\xa9,Descripci\xc3\xb3n con \xc3\xb1"
@@ -300,7 +320,7 @@ class TestFileUseCaseUploadAndValidateFile:
 
         assert result["file_id"] == 1
 
-    @patch('app.application.use_cases.file_use_case.S3Service')
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
     def test_upload_csv_s3_key_generation(self, mock_s3_service_class, file_use_case, mock_file_repository, sample_csv_content):
         """Prueba generación correcta de clave S3."""
         mock_s3_service = Mock()
@@ -396,3 +416,202 @@ class TestFileUseCaseValidateCSV:
         csv_content = "name,description\nJosé,Descripción con ñ".encode('utf-8')
         validations = file_use_case._validate_csv(csv_content)
         assert isinstance(validations, list)
+
+
+class TestFileUseCaseDeduplication:
+    """Clase de pruebas para la deduplicación por contenido de upload_and_validate_file."""
+
+    def _existing_file(self):
+        """Crea el archivo existente devuelto por el repositorio."""
+        return File(
+            id_=3,
+            filename="test.csv",
+            s3_key="uploads/1/test.csv",
+            s3_url="https://s3.amazonaws.com/bucket/test.csv",
+            status=FileStatus.PENDING,
+            validations=[{"type": "empty_value", "row": 2, "column": "email", "message": "Valor vacío"}],
+            user_id=1
+        )
+
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
+    def test_same_content_returns_existing_file(self, mock_s3_service_class, mock_file_repository, sample_csv_content):
+        """Prueba que el mismo contenido devuelve el archivo existente sin subirlo ni validarlo."""
+        file_use_case = FileUseCase(mock_file_repository)
+        mock_file_repository.get_by_content_hash.return_value = self._existing_file()
+        file_use_case.validate_csv_stream = Mock()
+
+        result = file_use_case.upload_and_validate_file(
+            sample_csv_content, "test.csv", "text/csv", 1, "p1", "p2"
+        )
+
+        assert result["file_id"] == 3
+        assert result["deduplicated"] is True
+        assert result["validations"][0]["type"] == "empty_value"
+        mock_file_repository.get_by_content_hash.assert_called_once_with(
+            1, hashlib.sha256(sample_csv_content).hexdigest(), DEFAULT_OPTIONS
+        )
+        mock_s3_service_class.return_value.start_upload.assert_not_called()
+        file_use_case.validate_csv_stream.assert_not_called()
+        mock_file_repository.create.assert_not_called()
+
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
+    def test_new_content_stores_hash(self, mock_s3_service_class, mock_file_repository, sample_csv_content):
+        """Prueba que un contenido nuevo se sube y guarda el resumen calculado durante la carga."""
+        file_use_case = FileUseCase(mock_file_repository)
+        mock_file_repository.get_by_content_hash.return_value = None
+        mock_s3_service_class.return_value.start_upload.return_value.complete.return_value = (
+            "https://s3.amazonaws.com/bucket/file.csv"
+        )
+        mock_file_repository.create.side_effect = lambda entity: entity
+        mock_file_repository.update.side_effect = lambda entity: entity
+
+        result = file_use_case.upload_and_validate_file(
+            sample_csv_content, "test.csv", "text/csv", 1, "p1", "p2", content_hash="abc"
+        )
+
+        assert result["deduplicated"] is False
+        mock_file_repository.get_by_content_hash.assert_called_once_with(1, "abc", DEFAULT_OPTIONS)
+        saved = mock_file_repository.update.call_args[0][0]
+        assert saved.content_hash == hashlib.sha256(sample_csv_content).hexdigest()
+        assert saved.validation_options == DEFAULT_OPTIONS
+        mock_s3_service_class.return_value.start_upload.return_value.complete.assert_called_once()
+
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
+    def test_force_upload_skips_lookup(self, mock_s3_service_class, mock_file_repository, sample_csv_content):
+        """Prueba que force_upload sube una copia nueva aunque el contenido exista."""
+        file_use_case = FileUseCase(mock_file_repository)
+        mock_file_repository.get_by_content_hash.return_value = self._existing_file()
+        mock_s3_service_class.return_value.start_upload.return_value.complete.return_value = (
+            "https://s3.amazonaws.com/bucket/file.csv"
+        )
+        mock_file_repository.create.side_effect = lambda entity: entity
+        mock_file_repository.update.side_effect = lambda entity: entity
+
+        result = file_use_case.upload_and_validate_file(
+            sample_csv_content, "test.csv", "text/csv", 1, "p1", "p2", force_upload=True
+        )
+
+        assert result["deduplicated"] is False
+        mock_file_repository.get_by_content_hash.assert_not_called()
+        mock_s3_service_class.return_value.start_upload.return_value.complete.assert_called_once()
+
+
+class TestFileUseCaseDeduplicationKey:
+    """Clase de pruebas para la clave de deduplicación: contenido, opciones de validación y validación terminada."""
+
+    def _repository(self):
+        """Crea un repositorio en memoria cuya búsqueda por contenido sigue el contrato de IFileRepository."""
+        files = {}
+        repository = Mock()
+
+        def create(entity):
+            entity.id = len(files) + 1
+            files[entity.id] = entity
+            return entity
+
+        def get_by_content_hash(user_id, content_hash, validation_options):
+            matches = [
+                file for file in files.values()
+                if file.user_id == user_id
+                and file.content_hash == content_hash
+                and file.validation_options == validation_options
+                and file.status != FileStatus.FAILED
+            ]
+            return matches[-1] if matches else None
+
+        repository.files = files
+        repository.create.side_effect = create
+        repository.get_by_id.side_effect = files.get
+        repository.update.side_effect = lambda entity: entity
+        repository.delete.side_effect = lambda file_id: files.pop(file_id, None) is not None
+        repository.get_by_content_hash.side_effect = get_by_content_hash
+        return repository
+
+    def _upload(self, use_case, content, **kwargs):
+        """Sube y valida un contenido en una sola petición."""
+        return use_case.upload_and_validate_stream(
+            io.BytesIO(content), "test.csv", "text/csv", 1, "p1", "p2", **kwargs
+        )
+
+    def test_profile_mismatch_validates_again(self, sample_csv_content):
+        """Prueba que el mismo contenido con otro perfil u otro modo de reporte se valida de nuevo."""
+        use_case = FileUseCase(self._repository(), storage=MemoryStorageBackend())
+        profile = SchemaProfile("ventas", 2, [])
+
+        first = self._upload(use_case, sample_csv_content)
+        with patch("app.application.use_cases.file_use_case.schema_registry.get", return_value=profile):
+            with_profile = self._upload(use_case, sample_csv_content, schema_profile="ventas")
+        summary = self._upload(use_case, sample_csv_content, report_mode="summary")
+        again = self._upload(use_case, sample_csv_content)
+
+        assert with_profile["deduplicated"] is False
+        assert summary["deduplicated"] is False
+        assert summary["report"] is not None
+        assert use_case.file_repository.files[with_profile["file_id"]].validation_options == "streaming|full|ventas@2"
+        assert again["deduplicated"] is True
+        assert again["file_id"] == first["file_id"]
+
+    def test_in_flight_duplicate_is_not_reused(self, sample_csv_content):
+        """Prueba que un archivo registrado pero aún sin procesar no resuelve un duplicado."""
+        use_case = FileUseCase(self._repository(), storage=MemoryStorageBackend())
+
+        pending = use_case.create_pending_upload(io.BytesIO(sample_csv_content), "test.csv", "text/csv", 1)
+        during = self._upload(use_case, sample_csv_content)
+
+        assert use_case.file_repository.files[pending["file_id"]].validation_options is None
+        assert during["deduplicated"] is False
+        assert during["file_id"] != pending["file_id"]
+
+    def test_async_duplicate_reused_after_processing(self, sample_csv_content):
+        """Prueba que un archivo asíncrono se reutiliza solo cuando termina su procesamiento."""
+        use_case = FileUseCase(self._repository(), storage=MemoryStorageBackend())
+
+        pending = use_case.create_pending_upload(io.BytesIO(sample_csv_content), "test.csv", "text/csv", 1)
+        before = use_case.create_pending_upload(io.BytesIO(sample_csv_content), "test.csv", "text/csv", 1)
+        use_case.process_upload(pending["file_id"])
+        after = use_case.create_pending_upload(io.BytesIO(sample_csv_content), "test.csv", "text/csv", 1)
+
+        assert before["deduplicated"] is False
+        assert after["deduplicated"] is True
+        assert after["file_id"] == pending["file_id"]
+
+
+class TestFileUseCaseDeleteFile:
+    """Clase de pruebas para el método delete_file."""
+
+    def _use_case(self, file):
+        """Crea el caso de uso con un repositorio que devuelve el archivo indicado."""
+        repository = Mock()
+        repository.get_by_id.return_value = file
+        return FileUseCase(repository, None, Mock(), storage=MemoryStorageBackend())
+
+    def test_deletes_record_and_returns_keys(self):
+        """Prueba que se eliminan el registro y sus validaciones y se devuelven las claves a eliminar."""
+        file = File(id_=1, filename="a.csv", s3_key="uploads/1/a.csv", s3_url="memory://a", user_id=1,
+                    status=FileStatus.PENDING,
+                    validation_report={"details_key": "uploads/1/a.csv.validations.jsonl.gz"})
+        use_case = self._use_case(file)
+
+        s3_keys = use_case.delete_file(1, 1)
+
+        assert s3_keys == ["uploads/1/a.csv", "uploads/1/a.csv.validations.jsonl.gz"]
+        use_case.file_validation_repository.delete_by_file_id.assert_called_once_with(1)
+        use_case.file_repository.delete.assert_called_once_with(1)
+
+    def test_other_user(self):
+        """Prueba que otro usuario no puede eliminar el archivo."""
+        file = File(id_=1, filename="a.csv", s3_key="uploads/1/a.csv", s3_url="memory://a", user_id=1)
+        use_case = self._use_case(file)
+
+        assert use_case.delete_file(1, 2) is None
+        use_case.file_repository.delete.assert_not_called()
+
+    @pytest.mark.parametrize("s3_url,status", [("", FileStatus.PENDING), ("memory://a", FileStatus.PROCESSING)])
+    def test_upload_in_progress(self, s3_url, status):
+        """Prueba que un archivo que se está subiendo o procesando no se elimina."""
+        file = File(id_=1, filename="a.csv", s3_key="uploads/1/a.csv", s3_url=s3_url, user_id=1, status=status)
+        use_case = self._use_case(file)
+
+        with pytest.raises(ValueError):
+            use_case.delete_file(1, 1)
+        use_case.file_repository.delete.assert_not_called()
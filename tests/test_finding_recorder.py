@@ -0,0 +1,115 @@
+"""
+Pruebas unitarias para el registro de validaciones por fila.
+
+Verifica la inserción en lotes de FindingRecorder y la paginación por
+cursor de FileUseCase.list_file_validations.
+"""
+
+from unittest.mock import Mock, patch
+from app.application.ingestion.finding_recorder import FindingRecorder
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.entities.file import File, FileStatus
+
+
+def _findings(count):
+    """Genera validaciones de prueba."""
+    for index in range(count):
+        yield {"type": "empty_value", "row": index + 2, "column": "price", "message": f"Fila {index + 2}"}
+
+
+def _repository():
+    """Crea un repositorio simulado que registra los lotes insertados."""
+    repository = Mock()
+    batches = []
+
+    def insert_batch(file_id, first_seq, findings):
+        batches.append((file_id, first_seq, [f["row"] for f in findings]))
+        return len(findings)
+
+    repository.insert_batch.side_effect = insert_batch
+    return repository, batches
+
+
+class TestFindingRecorder:
+    """Clase de pruebas para FindingRecorder."""
+
+    def test_record_all_in_batches(self):
+        """Prueba que las validaciones se insertan en lotes con secuencia consecutiva."""
+        repository, batches = _repository()
+        recorder = FindingRecorder(repository, 3, batch_size=2)
+
+        assert recorder.record_all(_findings(5)) == 5
+        assert batches == [(3, 0, [2, 3]), (3, 2, [4, 5]), (3, 4, [6])]
+
+    def test_record_yields_findings(self):
+        """Prueba que record devuelve las validaciones sin modificarlas."""
+        repository, _ = _repository()
+        recorder = FindingRecorder(repository, 1, batch_size=10)
+
+        rows = [f["row"] for f in recorder.record(_findings(3))]
+
+        assert rows == [2, 3, 4]
+        assert recorder.count == 3
+
+    def test_early_close_flushes_consumed(self):
+        """Prueba que al detener el consumo se guardan las validaciones ya devueltas."""
+        repository, batches = _repository()
+        recorder = FindingRecorder(repository, 1, batch_size=10)
+        source = _findings(100)
+
+        generator = recorder.record(source)
+        consumed = [next(generator) for _ in range(4)]
+        generator.close()
+
+        assert len(consumed) == 4
+        assert batches == [(1, 0, [2, 3, 4, 5])]
+        assert source.gi_frame is None
+
+    def test_empty_does_not_insert(self):
+        """Prueba que sin validaciones no se inserta ningún lote."""
+        repository, _ = _repository()
+        recorder = FindingRecorder(repository, 1)
+
+        assert recorder.record_all([]) == 0
+        repository.insert_batch.assert_not_called()
+
+
+class TestFileUseCaseValidationsPage:
+    """Clase de pruebas para la paginación de validaciones de FileUseCase."""
+
+    def _use_case(self, items):
+        """Crea el caso de uso con un archivo del usuario 1 y validaciones simuladas."""
+        file_repository = Mock()
+        file_repository.get_by_id.side_effect = lambda file_id: (
+            File(id_=file_id, status=FileStatus.PENDING, user_id=1) if file_id == 5 else None
+        )
+        validation_repository = Mock()
+        validation_repository.list_by_file_id.return_value = items
+        with patch("app.application.use_cases.file_use_case.get_storage_backend"):
+            use_case = FileUseCase(file_repository, None, validation_repository)
+        return use_case, validation_repository
+
+    def test_full_page_has_next_cursor(self):
+        """Prueba que una página completa devuelve el cursor de la última validación."""
+        items = [{"seq": 10, "type": "empty_value", "row": 2, "message": "a"},
+                 {"seq": 11, "type": "empty_value", "row": 3, "message": "b"}]
+        use_case, validation_repository = self._use_case(items)
+
+        page = use_case.list_file_validations(5, 1, after=9, limit=2, kind="empty_value", column="price")
+
+        assert page == {"items": items, "next_cursor": 11}
+        validation_repository.list_by_file_id.assert_called_once_with(5, 9, 2, "empty_value", "price")
+
+    def test_last_page_without_cursor(self):
+        """Prueba que la última página no devuelve cursor."""
+        use_case, _ = self._use_case([{"seq": 0, "type": "empty_value", "row": 2, "message": "a"}])
+
+        assert use_case.list_file_validations(5, 1, limit=2)["next_cursor"] is None
+
+    def test_other_user_file_not_found(self):
+        """Prueba que no se listan validaciones de archivos de otro usuario o inexistentes."""
+        use_case, validation_repository = self._use_case([])
+
+        assert use_case.list_file_validations(5, 2) is None
+        assert use_case.list_file_validations(6, 1) is None
+        validation_repository.list_by_file_id.assert_not_called()
@@ -0,0 +1,174 @@
+"""
+Pruebas unitarias para la eliminación por lotes y la limpieza de huérfanos.
+
+Verifica delete_files y list_objects de S3Service y de los backends en
+memoria y local, y que OrphanCleanup elimina solo los objetos sin registro
+con la antigüedad mínima, página a página.
+"""
+
+import io
+from datetime import datetime, timedelta, timezone
+import pytest
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+from app.application.jobs.orphan_cleanup import OrphanCleanup
+from app.infrastructure.services.presigned_url_cache import PresignedUrlCache
+from app.infrastructure.services.s3_service import S3Service
+from app.infrastructure.services.storage_backends import LocalStorageBackend, MemoryStorageBackend
+
+
+@pytest.fixture(params=["memory", "local"])
+def backend(request, tmp_path):
+    """Backend en memoria o local sin latencia."""
+    if request.param == "memory":
+        return MemoryStorageBackend()
+    return LocalStorageBackend(str(tmp_path))
+
+
+def _upload(backend, *s3_keys):
+    """Sube un objeto pequeño por cada clave."""
+    for s3_key in s3_keys:
+        backend.upload_file(io.BytesIO(b"a,b\n"), s3_key, "text/csv")
+
+
+def _repository(*s3_keys):
+    """Crea un repositorio simulado con archivos registrados para las claves indicadas."""
+    repository = Mock()
+    repository.get_existing_s3_keys.side_effect = lambda keys: set(keys) & set(s3_keys)
+    return repository
+
+
+class TestS3ServiceBatch:
+    """Clase de pruebas para delete_files y list_objects de S3Service."""
+
+    def test_delete_files_chunks_of_1000(self):
+        """Prueba que se envía una petición por cada 1000 claves y se devuelven las fallidas."""
+        client = Mock()
+        client.delete_objects.side_effect = [
+            {"Errors": [{"Key": "k5", "Code": "AccessDenied", "Message": "denegado"}]},
+            {},
+        ]
+        service = S3Service(client, url_cache=PresignedUrlCache(10))
+
+        failed = service.delete_files([f"k{i}" for i in range(1500)])
+
+        assert failed == ["k5"]
+        assert client.delete_objects.call_count == 2
+        first = client.delete_objects.call_args_list[0][1]["Delete"]
+        assert len(first["Objects"]) == 1000
+        assert first["Quiet"] is True
+
+    def test_delete_files_client_error(self):
+        """Prueba que si falla una petición todas sus claves se devuelven como fallidas."""
+        client = Mock()
+        client.delete_objects.side_effect = ClientError({"Error": {"Code": "500"}}, "DeleteObjects")
+        service = S3Service(client, url_cache=PresignedUrlCache(10))
+
+        assert service.delete_files(["a", "b"]) == ["a", "b"]
+
+    def test_list_objects_follows_token(self):
+        """Prueba que el listado sigue el token de continuación hasta la última página."""
+        now = datetime.now(timezone.utc)
+        client = Mock()
+        client.list_objects_v2.side_effect = [
+            {"Contents": [{"Key": "a", "Size": 1, "LastModified": now}], "IsTruncated": True,
+             "NextContinuationToken": "t1"},
+            {"Contents": [{"Key": "b", "Size": 2, "LastModified": now}], "IsTruncated": False},
+        ]
+        service = S3Service(client, url_cache=PresignedUrlCache(10))
+
+        pages = list(service.list_objects("uploads/", 1))
+
+        assert [[item["key"] for item in page] for page in pages] == [["a"], ["b"]]
+        assert client.list_objects_v2.call_args_list[1][1]["ContinuationToken"] == "t1"
+
+
+class TestBackendBatch:
+    """Clase de pruebas de delete_files y list_objects en los backends en memoria y local."""
+
+    def test_list_objects_pages(self, backend):
+        """Prueba que el listado devuelve los objetos del prefijo en orden y por páginas."""
+        _upload(backend, "uploads/1/c.csv", "uploads/1/a.csv", "uploads/2/b.csv", "otros/x.csv", "uploads/10.csv")
+
+        pages = list(backend.list_objects("uploads/1", 2))
+
+        assert [[item["key"] for item in page] for page in pages] == [
+            ["uploads/1/a.csv", "uploads/1/c.csv"], ["uploads/10.csv"]
+        ]
+        assert pages[0][0]["size"] == 4
+        assert pages[0][0]["last_modified"].tzinfo is not None
+
+    def test_list_objects_ignores_pending_parts(self, backend):
+        """Prueba que las partes de una carga por partes sin completar no se listan."""
+        upload_id = backend.create_multipart_upload("uploads/p.csv", "text/csv")
+        backend.upload_part("uploads/p.csv", upload_id, 1, b"a,b\n")
+
+        assert list(backend.list_objects("")) == []
+
+    def test_delete_files(self, backend):
+        """Prueba que se eliminan todas las claves, incluidas las que no existen."""
+        _upload(backend, "uploads/a.csv", "uploads/b.csv", "uploads/c.csv")
+
+        assert backend.delete_files(["uploads/a.csv", "uploads/b.csv", "uploads/z.csv"]) == []
+        assert [item["key"] for page in backend.list_objects("uploads/") for item in page] == ["uploads/c.csv"]
+
+
+class TestOrphanCleanup:
+    """Clase de pruebas para OrphanCleanup."""
+
+    def test_deletes_only_old_orphans(self, backend):
+        """Prueba que se eliminan los huérfanos y se conservan los registrados y sus detalles."""
+        _upload(
+            backend,
+            "uploads/1/a.csv", "uploads/1/a.csv.validations.jsonl.gz",
+            "uploads/1/b.csv", "uploads/1/b.csv.validations.jsonl.gz",
+            "uploads/2/c.csv"
+        )
+        repository = _repository("uploads/1/a.csv")
+        later = datetime.now(timezone.utc) + timedelta(days=2)
+
+        stats = OrphanCleanup(backend, repository, page_size=2).run(now=later).to_dict()
+
+        remaining = [item["key"] for page in backend.list_objects("") for item in page]
+        assert remaining == ["uploads/1/a.csv", "uploads/1/a.csv.validations.jsonl.gz"]
+        assert stats == {
+            "listed": 5, "referenced": 2, "skipped_recent": 0, "orphans": 3, "deleted": 3, "failed": 0
+        }
+        assert repository.get_existing_s3_keys.call_count == 3
+
+    def test_skips_recent_objects(self, backend):
+        """Prueba que los objetos sin registro más recientes que la antigüedad mínima se conservan."""
+        _upload(backend, "uploads/1/a.csv")
+
+        stats = OrphanCleanup(backend, _repository(), min_age=timedelta(hours=1)).run()
+
+        assert stats.skipped_recent == 1
+        assert stats.deleted == 0
+        assert len(list(backend.list_objects(""))) == 1
+
+    def test_dry_run(self, backend):
+        """Prueba que en modo de prueba se cuentan los huérfanos sin eliminarlos."""
+        _upload(backend, "uploads/1/a.csv", "uploads/1/b.csv")
+        later = datetime.now(timezone.utc) + timedelta(days=2)
+
+        stats = OrphanCleanup(backend, _repository(), dry_run=True).run(now=later)
+
+        assert stats.orphans == 2
+        assert stats.deleted == 0
+        assert sum(len(page) for page in backend.list_objects("")) == 2
+
+    def test_counts_failed_deletions(self):
+        """Prueba que las claves que no se pudieron eliminar se cuentan como fallidas."""
+        now = datetime.now(timezone.utc) - timedelta(days=2)
+        storage = Mock()
+        storage.list_objects.return_value = iter([[
+            {"key": "uploads/a.csv", "size": 1, "last_modified": now},
+            {"key": "uploads/b.csv", "size": 1, "last_modified": now},
+        ]])
+        storage.delete_files.return_value = ["uploads/b.csv"]
+
+        stats = OrphanCleanup(storage, _repository()).run()
+
+        storage.delete_files.assert_called_once_with(["uploads/a.csv", "uploads/b.csv"])
+        assert stats.deleted == 1
+        assert stats.failed == 1
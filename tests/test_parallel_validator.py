@@ -0,0 +1,78 @@
+"""
+Pruebas unitarias para ParallelCSVValidator.
+
+Verifica que la validación por bloques en varios procesos produce la misma
+lista ordenada de validaciones que la validación secuencial.
+"""
+
+import io
+import mmap
+import tempfile
+import pytest
+from app.application.validation.csv_stream_validator import CSVStreamValidator
+from app.application.validation.parallel_validator import ParallelCSVValidator, find_segments
+
+
+@pytest.fixture
+def validator():
+    """Fixture para crear un validador que parte incluso archivos pequeños."""
+    return ParallelCSVValidator(workers=2, min_bytes=0, segment_bytes=8)
+
+
+def _sequential(content: bytes):
+    """Valida el contenido de forma secuencial."""
+    return CSVStreamValidator().validate(io.BytesIO(content))
+
+
+class TestFindSegments:
+    """Clase de pruebas para la función find_segments."""
+
+    def test_segments_end_at_row_boundaries(self):
+        """Prueba que los bloques no parten campos entrecomillados con saltos de línea."""
+        content = b'a,"x\ny\nz"\nb,c\nd,e\n'
+        with tempfile.TemporaryFile() as spool:
+            spool.write(content)
+            spool.flush()
+            with mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                segments = find_segments(buffer, 0, 3)
+
+        assert segments[0] == (0, content.index(b"b,c"))
+        assert segments[-1][1] == len(content)
+        assert all(content[end - 1:end] == b"\n" for _, end in segments)
+
+
+class TestParallelCSVValidator:
+    """Clase de pruebas para el método validate."""
+
+    @pytest.mark.parametrize("content", [
+        b"",
+        b"name,email\n",
+        b"name,email,age\nJohn,,30\n,jane@example.com,25\n  ,x,\n",
+        b"a,b\n1,2\n3,4\n1,2\n3,4\n1,2\n",
+        b"product,price\nA,abc\nB,\"10,5\"\nA,abc\n",
+        b'name,notes\nJohn,"line one\nline two"\nJohn,"line one\nline two"\n,\n',
+        b"a,b\n\n1,\n\n2,\n1,\n",
+        b"a,b\n1,\n2,3\n1,2,3\n4,5\n",
+        b'a,b\n1,x"y\n2,"z\n3,4\n',
+    ])
+    def test_same_findings_as_sequential(self, validator, content):
+        """Prueba que las validaciones coinciden con la validación secuencial."""
+        assert validator.validate(io.BytesIO(content)) == _sequential(content)
+
+    def test_small_file_is_validated_sequentially(self):
+        """Prueba que los archivos por debajo del mínimo no se vuelcan a disco."""
+        validator = ParallelCSVValidator(workers=2, min_bytes=1024)
+        validations = validator.validate(io.BytesIO(b"a,b\n1,\n"))
+        assert [v["type"] for v in validations] == ["empty_value"]
+
+    def test_non_seekable_stream(self, validator):
+        """Prueba un flujo sin seek, como el cuerpo de una respuesta de S3."""
+        class Body:
+            def __init__(self, data):
+                self._data = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self._data.read(size)
+
+        content = b"a,b\n1,2\n1,2\n"
+        assert validator.validate(Body(content)) == _sequential(content)
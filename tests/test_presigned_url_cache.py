@@ -0,0 +1,173 @@
+"""
+Pruebas unitarias para la caché de URLs firmadas.
+
+Verifica la reutilización de URLs mientras les queda validez, el límite
+LRU, la invalidación, las métricas, get_file_urls de S3Service y la lista
+paginada de archivos de FileUseCase.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.entities.file import File, FileStatus
+from app.infrastructure.services.presigned_url_cache import PresignedUrlCache
+from app.infrastructure.services.s3_service import S3Service
+from app.infrastructure.services.storage_backends import MemoryStorageBackend
+
+
+class _Clock:
+    """Reloj manual para las pruebas."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client():
+    """Crea un cliente de S3 simulado que firma URLs distintas en cada llamada."""
+    client = Mock()
+    client.signed = 0
+
+    def sign(method, Params, ExpiresIn):
+        client.signed += 1
+        return f"https://bucket/{Params['Key']}?firma={client.signed}&expira={ExpiresIn}"
+
+    client.generate_presigned_url.side_effect = sign
+    return client
+
+
+class TestPresignedUrlCache:
+    """Clase de pruebas para PresignedUrlCache."""
+
+    def test_reused_until_min_validity(self):
+        """Prueba que la URL se reutiliza solo mientras le queda la validez mínima."""
+        clock = _Clock()
+        cache = PresignedUrlCache(10, 0.5, clock)
+        cache.put("ns", "a.csv", 3600, "url-a", clock.now)
+
+        clock.now += 1799
+        assert cache.get_many("ns", ["a.csv"], 3600) == {"a.csv": "url-a"}
+        clock.now += 1
+        assert cache.get_many("ns", ["a.csv"], 3600) == {}
+        assert cache.stats()["expired"] == 1
+
+    def test_keyed_by_expiry(self):
+        """Prueba que una URL con otra validez no se reutiliza."""
+        cache = PresignedUrlCache(10, 0.5, _Clock())
+        cache.put("ns", "a.csv", 3600, "url-a", 1000.0)
+
+        assert cache.get_many("ns", ["a.csv"], 60) == {}
+        assert cache.get_many("other", ["a.csv"], 3600) == {}
+
+    def test_lru_eviction(self):
+        """Prueba que al superar el tamaño se descarta la URL menos usada."""
+        clock = _Clock()
+        cache = PresignedUrlCache(2, 0.5, clock)
+        cache.put("ns", "a", 60, "url-a", clock.now)
+        cache.put("ns", "b", 60, "url-b", clock.now)
+        cache.get_many("ns", ["a"], 60)
+        cache.put("ns", "c", 60, "url-c", clock.now)
+
+        assert cache.get_many("ns", ["a", "b", "c"], 60) == {"a": "url-a", "c": "url-c"}
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size"] == 2
+
+    def test_invalidate(self):
+        """Prueba que invalidar un objeto descarta sus URLs de cualquier validez."""
+        clock = _Clock()
+        cache = PresignedUrlCache(10, 0.5, clock)
+        cache.put("ns", "a", 60, "url-60", clock.now)
+        cache.put("ns", "a", 3600, "url-3600", clock.now)
+        cache.put("ns", "b", 60, "url-b", clock.now)
+
+        cache.invalidate("ns", "a")
+
+        assert cache.get_many("ns", ["a"], 60) == {}
+        assert cache.get_many("ns", ["a"], 3600) == {}
+        assert cache.stats()["size"] == 1
+
+    def test_hit_rate(self):
+        """Prueba que las métricas cuentan aciertos y fallos."""
+        clock = _Clock()
+        cache = PresignedUrlCache(10, 0.5, clock)
+        cache.put("ns", "a", 60, "url-a", clock.now)
+
+        cache.get_many("ns", ["a", "b", "a"], 60)
+        cache.get_many("ns", ["a"], 60)
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == round(2 / 3, 4)
+
+    def test_disabled(self):
+        """Prueba que con tamaño 0 no se guarda ninguna URL."""
+        cache = PresignedUrlCache(0)
+        cache.put("ns", "a", 60, "url-a", cache.clock())
+
+        assert cache.get_many("ns", ["a"], 60) == {}
+
+
+class TestS3ServiceUrls:
+    """Clase de pruebas para get_file_url y get_file_urls de S3Service."""
+
+    def test_signs_only_misses(self):
+        """Prueba que solo se firman las URLs que no están en caché."""
+        client = _client()
+        service = S3Service(client, url_cache=PresignedUrlCache(100))
+
+        first = service.get_file_urls(["a.csv", "b.csv"])
+        second = service.get_file_urls(["a.csv", "b.csv", "c.csv"])
+
+        assert client.signed == 3
+        assert second["a.csv"] == first["a.csv"]
+        assert service.get_file_url("c.csv") == second["c.csv"]
+        assert service.url_cache.stats()["hits"] == 3
+
+    def test_error_not_cached(self):
+        """Prueba que una URL que no se pudo firmar devuelve None y no se guarda."""
+        client = _client()
+        client.generate_presigned_url.side_effect = ClientError({"Error": {"Code": "500"}}, "GetObject")
+        service = S3Service(client, url_cache=PresignedUrlCache(100))
+
+        assert service.get_file_urls(["a.csv"]) == {"a.csv": None}
+        assert service.url_cache.stats()["size"] == 0
+
+    def test_delete_invalidates(self):
+        """Prueba que eliminar un archivo descarta sus URLs en caché."""
+        client = _client()
+        service = S3Service(client, url_cache=PresignedUrlCache(100))
+        first = service.get_file_url("a.csv")
+
+        service.delete_file("a.csv")
+
+        assert service.get_file_url("a.csv") != first
+
+
+class TestListFiles:
+    """Clase de pruebas para FileUseCase.list_files."""
+
+    def test_page_with_download_urls(self):
+        """Prueba que la página incluye las URLs de los archivos subidos y el cursor."""
+        files = [
+            File(id_=3, filename="c.csv", s3_key="uploads/c.csv", s3_url="memory://c", file_size=1,
+                 status=FileStatus.COMPLETED, user_id=1, created_at=datetime.now()),
+            File(id_=2, filename="b.csv", s3_key="uploads/b.csv", file_size=1, user_id=1),
+        ]
+        repository = Mock()
+        repository.get_by_user_id.return_value = files
+        storage = MemoryStorageBackend()
+        storage.url_cache = PresignedUrlCache(100)
+        use_case = FileUseCase(repository, storage=storage)
+
+        result = use_case.list_files(1, after=10, limit=2)
+
+        repository.get_by_user_id.assert_called_once_with(1, 10, 2)
+        assert result["next_cursor"] == 2
+        assert result["items"][0]["download_url"].startswith("memory://")
+        assert result["items"][1]["download_url"] is None
+        assert use_case.list_files(1, after=10, limit=3)["next_cursor"] is None
+        assert storage.url_cache.stats()["hits"] == 1
@@ -0,0 +1,83 @@
+"""
+Pruebas unitarias para RowDigestStore.
+
+Verifica la detección de duplicados con la fila de la primera aparición,
+tanto en memoria como con volcado a disco, y que los validadores producen
+las mismas validaciones en ambos modos.
+"""
+
+import io
+import os
+import pytest
+from app.application.validation.columnar_validator import ColumnarCSVValidator
+from app.application.validation.csv_stream_validator import CSVStreamValidator, merge_duplicate_issues
+from app.application.validation.row_digest_store import ENTRY_BYTES, RowDigestStore, row_digest
+
+CONTENT = b"name,price\nA,1\nB,x\nA,1\nC,\nB,x\nD,2\nC,\nA,1\n"
+
+
+class TestRowDigestStore:
+    """Clase de pruebas para RowDigestStore."""
+
+    def test_duplicate_reports_first_row(self):
+        """Prueba que un duplicado informa la fila de su primera aparición."""
+        with RowDigestStore() as store:
+            assert store.add(("a", "1"), 2) is None
+            assert store.add(("b", "2"), 3) is None
+            assert store.add(("a", "1"), 4) == 2
+            assert not store.spilled
+
+    def test_missing_values_differ_from_empty(self):
+        """Prueba que un valor ausente no coincide con un valor vacío."""
+        assert row_digest(("a", None)) != row_digest(("a", ""))
+
+    def test_spilled_duplicates(self):
+        """Prueba que los duplicados entre filas volcadas se resuelven al final."""
+        with RowDigestStore(memory_bytes=ENTRY_BYTES) as store:
+            for row_num, key in enumerate([("a",), ("b",), ("c",), ("b",), ("a",), ("b",)], start=2):
+                store.add(key, row_num)
+            assert store.spilled
+            assert store.spilled_duplicates() == [(5, 3), (7, 3)]
+
+    def test_close_removes_spill_directory(self, tmp_path):
+        """Prueba que close elimina las particiones en disco."""
+        store = RowDigestStore(memory_bytes=ENTRY_BYTES, spill_dir=str(tmp_path))
+        store.add(("a",), 2)
+        store.add(("b",), 3)
+        assert os.listdir(tmp_path)
+        store.close()
+        assert os.listdir(tmp_path) == []
+
+
+class TestMergeDuplicateIssues:
+    """Clase de pruebas para la función merge_duplicate_issues."""
+
+    def test_duplicate_between_empty_and_invalid(self):
+        """Prueba que el duplicado se inserta tras los vacíos y antes de los tipos."""
+        issues = [("empty_value", 1, "a", None), ("invalid_type", 1, "price", "x")]
+        merged = merge_duplicate_issues(issues, [(1, 0), (3, 0)])
+        assert [issue[0] for issue in merged] == ["empty_value", "duplicate", "invalid_type", "duplicate"]
+
+
+class TestSpillModeValidation:
+    """Clase de pruebas de los validadores con volcado a disco."""
+
+    @pytest.mark.parametrize("validator_class", [CSVStreamValidator, ColumnarCSVValidator])
+    def test_same_findings_as_in_memory(self, validator_class):
+        """Prueba que el volcado a disco no cambia las validaciones ni su orden."""
+        in_memory = validator_class().validate(io.BytesIO(CONTENT))
+        spilled = validator_class(duplicate_memory_bytes=ENTRY_BYTES * 2).validate(io.BytesIO(CONTENT))
+        assert spilled == in_memory
+        assert [(v["row"], v["first_row"]) for v in in_memory if v["type"] == "duplicate"] == [
+            (4, 2), (6, 3), (8, 5), (9, 2)
+        ]
+
+    @pytest.mark.parametrize("validator_class", [CSVStreamValidator, ColumnarCSVValidator])
+    def test_wide_last_row_not_spilled_duplicate(self, validator_class):
+        """Prueba que la fila con más columnas que el encabezado no se informa como duplicado volcado a disco."""
+        content = b"name,price\nB,2\nC,3\nA,1\nD,4\nA,1,x\n"
+
+        spilled = validator_class(duplicate_memory_bytes=ENTRY_BYTES * 2).validate(io.BytesIO(content))
+
+        assert spilled == validator_class().validate(io.BytesIO(content))
+        assert [v["type"] for v in spilled] == ["parse_error"]
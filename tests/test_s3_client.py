@@ -0,0 +1,104 @@
+"""
+Pruebas unitarias para el cliente de S3 compartido.
+
+Verifica que get_s3_client crea un único cliente por proceso aunque se
+llame desde varios hilos, su configuración y que S3Service lo usa, y la
+configuración de transferencia y las estadísticas de upload_file.
+"""
+
+import io
+import threading
+from unittest.mock import Mock, patch
+from boto3.exceptions import S3UploadFailedError
+from app.infrastructure.services import s3_service
+from app.infrastructure.services.s3_service import (
+    MIN_PART_SIZE,
+    S3Service,
+    TransferStats,
+    create_s3_client,
+    create_transfer_config,
+    get_s3_client,
+)
+
+
+class TestS3Client:
+    """Clase de pruebas para el cliente de S3 compartido."""
+
+    def test_created_once_across_threads(self):
+        """Prueba que varios hilos obtienen el mismo cliente y solo se crea uno."""
+        created = []
+
+        def create():
+            client = Mock()
+            created.append(client)
+            return client
+
+        clients = []
+        with patch.object(s3_service, "_s3_client", None), \
+                patch.object(s3_service, "create_s3_client", side_effect=create):
+            threads = [threading.Thread(target=lambda: clients.append(get_s3_client())) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
+
+    def test_client_config(self):
+        """Prueba que el cliente se crea con el pool, los timeouts y el keep-alive configurados."""
+        with patch.object(s3_service.settings, "S3_MAX_POOL_CONNECTIONS", 32), \
+                patch.object(s3_service.settings, "S3_READ_TIMEOUT", 12):
+            client = create_s3_client()
+
+        config = client.meta.config
+        assert config.max_pool_connections == 32
+        assert config.read_timeout == 12
+        assert config.tcp_keepalive is True
+
+    def test_service_uses_shared_client(self):
+        """Prueba que S3Service usa el cliente compartido salvo que se indique otro."""
+        shared, other = Mock(), Mock()
+        with patch.object(s3_service, "_s3_client", shared):
+            assert S3Service().s3_client is shared
+            assert S3Service(other).s3_client is other
+
+
+class TestTransferConfig:
+    """Clase de pruebas para la configuración de transferencia de upload_file."""
+
+    def test_config_from_settings(self):
+        """Prueba que la configuración usa los valores de Settings con el mínimo de parte de S3."""
+        with patch.object(s3_service.settings, "S3_TRANSFER_CHUNK_SIZE", 1024), \
+                patch.object(s3_service.settings, "S3_TRANSFER_MULTIPART_THRESHOLD", 64 * 1024 * 1024), \
+                patch.object(s3_service.settings, "S3_TRANSFER_MAX_CONCURRENCY", 16):
+            config = create_transfer_config()
+
+        assert config.multipart_chunksize == MIN_PART_SIZE
+        assert config.multipart_threshold == 64 * 1024 * 1024
+        assert config.max_concurrency == 16
+        assert config.use_threads is True
+
+    def test_upload_reports_throughput(self):
+        """Prueba que upload_file usa la configuración y anota bytes y duración."""
+        client = Mock()
+
+        def upload_fileobj(file_obj, bucket, key, ExtraArgs, Callback, Config):
+            Callback(len(file_obj.read()))
+
+        client.upload_fileobj.side_effect = upload_fileobj
+        service = S3Service(client)
+        stats = TransferStats()
+
+        assert service.upload_file(io.BytesIO(b"x" * 100), "a.csv", "text/csv", stats) is not None
+        assert client.upload_fileobj.call_args.kwargs["Config"] is service.transfer_config
+        assert stats.bytes == 100
+        assert stats.seconds > 0
+        assert stats.to_dict()["bytes"] == 100
+
+    def test_multipart_failure_returns_none(self):
+        """Prueba que un fallo de la subida por partes devuelve None."""
+        client = Mock()
+        client.upload_fileobj.side_effect = S3UploadFailedError("fallo al subir la parte 3")
+
+        assert S3Service(client).upload_file(io.BytesIO(b"x"), "a.csv", "text/csv") is None
@@ -0,0 +1,119 @@
+"""
+Pruebas unitarias para los perfiles de esquema.
+
+Verifica la compilación de perfiles declarativos, las validaciones de cada
+tipo de columna en los distintos backends y la caché por versión.
+"""
+
+import io
+import json
+import os
+import pytest
+from app.application.validation.columnar_validator import ColumnarCSVValidator
+from app.application.validation.csv_stream_validator import CSVStreamValidator
+from app.application.validation.parallel_validator import ParallelCSVValidator
+from app.application.validation.schema_profiles import SchemaProfile, SchemaRegistry
+
+PROFILE = {
+    "name": "ventas",
+    "version": 1,
+    "columns": [
+        {"name": "fecha", "type": "date"},
+        {"name": "codigo", "type": "regex", "pattern": "[A-Z]{3}-\\d+"},
+        {"name": "cantidad", "type": "integer"},
+        {"name": "estado", "type": "enum", "values": ["abierta", "cerrada"]},
+        {"name": "notas", "required": False},
+        {"name": "region", "type": "string"}
+    ]
+}
+
+CONTENT = (
+    b"fecha,codigo,cantidad,estado,notas,precio\n"
+    b"2024-01-15,ABC-1,3,abierta,,10\n"
+    b"15/01/2024,abc,3.5,borrada,x,abc\n"
+    b"2024-02-30,XYZ-22,,cerrada,,\n"
+)
+
+
+@pytest.fixture
+def profile():
+    """Fixture para crear un perfil compilado."""
+    return SchemaProfile.from_dict(PROFILE)
+
+
+class TestSchemaProfile:
+    """Clase de pruebas para SchemaProfile."""
+
+    def test_invalid_column_type(self):
+        """Prueba que un tipo de columna desconocido es un error."""
+        with pytest.raises(ValueError):
+            SchemaProfile.from_dict({"columns": [{"name": "a", "type": "uuid"}]})
+
+    def test_enum_requires_values(self):
+        """Prueba que una columna enum debe indicar sus valores."""
+        with pytest.raises(ValueError):
+            SchemaProfile.from_dict({"columns": [{"name": "a", "type": "enum"}]})
+
+    def test_plan_cached_by_header(self, profile):
+        """Prueba que el plan se reutiliza para el mismo encabezado."""
+        header = ["fecha", "codigo"]
+        assert profile.compile_plan(header) is profile.compile_plan(list(header))
+
+    def test_missing_required_columns(self, profile):
+        """Prueba que las columnas obligatorias ausentes se detectan en el plan."""
+        plan = profile.compile_plan(["fecha", "notas"])
+        assert plan.missing_columns == ("codigo", "cantidad", "estado", "region")
+
+    @pytest.mark.parametrize("validator", [
+        CSVStreamValidator(profile=SchemaProfile.from_dict(PROFILE)),
+        ColumnarCSVValidator(chunk_rows=2, profile=SchemaProfile.from_dict(PROFILE)),
+        ParallelCSVValidator(
+            CSVStreamValidator(profile=SchemaProfile.from_dict(PROFILE)), workers=2, min_bytes=0, segment_bytes=8
+        ),
+    ])
+    def test_typed_validations(self, validator):
+        """Prueba las validaciones de cada tipo de columna en todos los backends."""
+        validations = validator.validate(io.BytesIO(CONTENT))
+        assert [(v["type"], v["row"], v["column"]) for v in validations] == [
+            ("missing_column", 1, "region"),
+            ("invalid_date", 3, "fecha"),
+            ("invalid_format", 3, "codigo"),
+            ("invalid_integer", 3, "cantidad"),
+            ("invalid_enum", 3, "estado"),
+            ("empty_value", 4, "cantidad"),
+            ("empty_value", 4, "precio"),
+            ("invalid_date", 4, "fecha"),
+        ]
+
+
+class TestSchemaRegistry:
+    """Clase de pruebas para SchemaRegistry."""
+
+    def _write(self, directory, data):
+        """Escribe un perfil en el directorio y fuerza un cambio de fecha de modificación."""
+        path = os.path.join(directory, "ventas.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_unknown_profile(self, tmp_path):
+        """Prueba que un perfil inexistente o con nombre inválido devuelve None."""
+        registry = SchemaRegistry(str(tmp_path))
+        assert registry.get("ventas") is None
+        assert registry.get("../ventas") is None
+
+    def test_profile_reused_while_version_unchanged(self, tmp_path):
+        """Prueba que el perfil compilado se reutiliza hasta que cambia la versión."""
+        registry = SchemaRegistry(str(tmp_path))
+        self._write(str(tmp_path), PROFILE)
+        first = registry.get("ventas")
+        assert registry.names() == ["ventas"]
+        assert registry.get("ventas") is first
+
+        self._write(str(tmp_path), PROFILE)
+        assert registry.get("ventas") is first
+
+        self._write(str(tmp_path), dict(PROFILE, version=2))
+        assert registry.get("ventas") is not first
+        assert registry.get("ventas").version == 2
@@ -0,0 +1,101 @@
+"""
+Pruebas unitarias para la carga de filas en staging.
+
+Verifica la numeración de las filas leídas, la medición del rendimiento
+y la integración con la carga de archivos.
+"""
+
+import io
+from unittest.mock import Mock, patch
+from app.application.ingestion.staging_loader import StagingLoader, iter_csv_rows
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.entities.file import File, FileStatus
+
+
+class TestIterCsvRows:
+    """Clase de pruebas para iter_csv_rows."""
+
+    def test_numbering_skips_blank_rows(self):
+        """Prueba que el encabezado es la fila 1 y las filas en blanco no cuentan."""
+        content = b"a,b\n1,2\n\n3,4\n"
+        assert list(iter_csv_rows(io.BytesIO(content))) == [(1, ["a", "b"]), (2, ["1", "2"]), (3, ["3", "4"])]
+
+    def test_detected_dialect(self):
+        """Prueba la lectura con codificación y delimitador deducidos."""
+        content = "nombre;precio\nJosé;1,5\n".encode("cp1252")
+        rows = list(iter_csv_rows(io.BytesIO(content), None, None))
+        assert rows == [(1, ["nombre", "precio"]), (2, ["José", "1,5"])]
+
+    def test_empty_file(self):
+        """Prueba que un archivo vacío no produce filas."""
+        assert list(iter_csv_rows(io.BytesIO(b""))) == []
+
+
+class TestStagingLoader:
+    """Clase de pruebas para StagingLoader."""
+
+    def test_load_reports_throughput(self):
+        """Prueba que la carga informa filas, lote y rendimiento."""
+        repository = Mock()
+        repository.bulk_insert.side_effect = lambda file_id, rows, batch_size: len(list(rows))
+        result = StagingLoader(repository, batch_size=2).load(1, io.BytesIO(b"a,b\n1,2\n3,4\n"))
+
+        assert result["rows"] == 3
+        assert result["batch_size"] == 2
+        assert result["seconds"] >= 0
+        assert result["rows_per_second"] > 0
+
+
+class TestFileUseCaseStaging:
+    """Clase de pruebas para la carga en staging desde FileUseCase."""
+
+    def _upload(self, content, row_repository):
+        """Sube un contenido con S3 y el repositorio de archivos simulados."""
+        file_repository = Mock()
+        file_repository.get_by_content_hash.return_value = None
+        file_repository.create.side_effect = lambda entity: File(
+            id_=7,
+            filename=entity.filename,
+            s3_key=entity.s3_key,
+            s3_url=entity.s3_url,
+            file_size=entity.file_size,
+            content_type=entity.content_type,
+            status=FileStatus.COMPLETED,
+            validations=entity.validations,
+            user_id=1
+        )
+        file_repository.update.side_effect = lambda entity: entity
+        with patch("app.application.use_cases.file_use_case.get_storage_backend") as s3_class:
+            s3_class.return_value.upload_file.return_value = "https://s3.amazonaws.com/bucket/file.csv"
+            use_case = FileUseCase(file_repository, row_repository)
+            return use_case.upload_and_validate_file(content, "test.csv", "text/csv", 1, "p1", "p2")
+
+    def test_rows_loaded(self):
+        """Prueba que las filas se cargan tras guardar el archivo."""
+        row_repository = Mock()
+        loaded = []
+        row_repository.bulk_insert.side_effect = lambda file_id, rows, batch_size: len(loaded.extend(rows) or loaded)
+
+        result = self._upload(b"name,price\nA,1\nB,2\n", row_repository)
+
+        assert loaded == [(1, ["name", "price"]), (2, ["A", "1"]), (3, ["B", "2"])]
+        assert row_repository.bulk_insert.call_args.args[0] == 7
+        assert result["staging"]["rows"] == 3
+
+    def test_skipped_on_parse_error(self):
+        """Prueba que no se cargan las filas si el archivo no se pudo leer completo."""
+        row_repository = Mock()
+        result = self._upload(b"name,price\nA,1,extra\n", row_repository)
+
+        row_repository.bulk_insert.assert_not_called()
+        assert result["staging"] is None
+
+    def test_load_failure_does_not_fail_upload(self):
+        """Prueba que un error de la base de datos en staging no interrumpe la carga."""
+        row_repository = Mock()
+        row_repository.bulk_insert.side_effect = Exception("timeout")
+
+        result = self._upload(b"name,price\nA,1\n", row_repository)
+
+        assert result["file_id"] == 7
+        assert result["staging"] is None
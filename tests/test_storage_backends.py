@@ -0,0 +1,221 @@
+"""
+Pruebas unitarias para los backends de almacenamiento.
+
+Verifica los backends en memoria y local (subidas, cargas por partes,
+lectura y eliminación), la latencia y el ancho de banda simulados, la
+selección del backend según la configuración y que FileUseCase funciona
+con un backend inyectado.
+"""
+
+import io
+import time
+import pytest
+from unittest.mock import Mock, patch
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.services.storage_backend import MIN_PART_SIZE, IStorageBackend
+from app.infrastructure.services import storage_backends
+from app.infrastructure.services.s3_service import S3Service
+from app.infrastructure.services.storage_backends import (
+    LocalStorageBackend,
+    MemoryStorageBackend,
+    create_storage_backend,
+)
+
+CONTENT = b"name,price\nA,1\nB,2\n"
+
+
+@pytest.fixture(params=["memory", "local"])
+def backend(request, tmp_path):
+    """Backend en memoria o local sin latencia."""
+    if request.param == "memory":
+        return MemoryStorageBackend()
+    return LocalStorageBackend(str(tmp_path))
+
+
+class TestStorageBackends:
+    """Clase de pruebas comunes a los backends en memoria y local."""
+
+    def test_upload_and_read(self, backend):
+        """Prueba que un archivo subido se lee con el mismo contenido."""
+        url = backend.upload_file(io.BytesIO(CONTENT), "uploads/a.csv", "text/csv")
+
+        assert url == backend.object_url("uploads/a.csv")
+        assert backend.get_file_stream("uploads/a.csv").read() == CONTENT
+
+    def test_missing_file(self, backend):
+        """Prueba que leer un archivo que no existe devuelve None."""
+        assert backend.get_file_stream("uploads/missing.csv") is None
+
+    def test_delete(self, backend):
+        """Prueba que un archivo eliminado deja de existir y eliminarlo de nuevo no falla."""
+        backend.upload_file(io.BytesIO(CONTENT), "a.csv", "text/csv")
+
+        assert backend.delete_file("a.csv") is True
+        assert backend.get_file_stream("a.csv") is None
+        assert backend.delete_file("a.csv") is True
+
+    def test_start_upload_in_parts(self, backend):
+        """Prueba que una carga por bloques de más de una parte se une en orden."""
+        data = bytes(range(256)) * (MIN_PART_SIZE // 128 + 10)
+        upload = backend.start_upload("big.csv", "text/csv", "gzip")
+        for start in range(0, len(data), 1024 * 1024):
+            upload.write(data[start:start + 1024 * 1024])
+
+        assert upload.complete() == backend.object_url("big.csv")
+        assert upload.size == len(data)
+        assert backend.get_file_stream("big.csv").read() == data
+        assert backend.store.get_object(Bucket=backend.bucket_name, Key="big.csv")["ContentEncoding"] == "gzip"
+
+    def test_multipart_api(self, backend):
+        """Prueba las partes subidas por separado, reemplazadas y completadas."""
+        upload_id = backend.create_multipart_upload("m.csv", "text/csv")
+        backend.upload_part("m.csv", upload_id, 2, b"tail")
+        backend.upload_part("m.csv", upload_id, 1, b"old")
+        first = backend.upload_part("m.csv", upload_id, 1, b"head,")
+        second = backend.upload_part("m.csv", upload_id, 2, b"tail")
+
+        url = backend.complete_multipart_upload(
+            "m.csv", upload_id, [{"ETag": first, "PartNumber": 1}, {"ETag": second, "PartNumber": 2}]
+        )
+
+        assert url == backend.object_url("m.csv")
+        assert backend.get_file_stream("m.csv").read() == b"head,tail"
+        assert backend.upload_part("m.csv", upload_id, 3, b"x") is None
+
+    def test_complete_with_wrong_etag(self, backend):
+        """Prueba que completar con un ETag que no coincide falla sin crear el objeto."""
+        upload_id = backend.create_multipart_upload("m.csv", "text/csv")
+        backend.upload_part("m.csv", upload_id, 1, b"data")
+
+        assert backend.complete_multipart_upload("m.csv", upload_id, [{"ETag": '"x"', "PartNumber": 1}]) is None
+        assert backend.get_file_stream("m.csv") is None
+
+    def test_abort(self, backend):
+        """Prueba que una carga cancelada no se puede completar."""
+        upload_id = backend.create_multipart_upload("m.csv", "text/csv")
+        etag = backend.upload_part("m.csv", upload_id, 1, b"data")
+
+        assert backend.abort_multipart_upload("m.csv", upload_id) is True
+        assert backend.complete_multipart_upload("m.csv", upload_id, [{"ETag": etag, "PartNumber": 1}]) is None
+        assert backend.abort_multipart_upload("m.csv", upload_id) is False
+
+    def test_presigned_url(self, backend):
+        """Prueba que la URL temporal apunta al objeto."""
+        assert backend.get_file_url("a.csv", 60).startswith(backend.object_url("a.csv"))
+
+
+class TestLocalStorageBackend:
+    """Clase de pruebas específicas del backend local."""
+
+    def test_persists_across_instances(self, tmp_path):
+        """Prueba que otro backend sobre el mismo directorio lee los objetos."""
+        LocalStorageBackend(str(tmp_path)).upload_file(io.BytesIO(CONTENT), "a.csv", "text/csv")
+
+        assert LocalStorageBackend(str(tmp_path)).get_file_stream("a.csv").read() == CONTENT
+        assert LocalStorageBackend(str(tmp_path)).object_url("a.csv").startswith("file://")
+
+    def test_rejects_key_outside_root(self, tmp_path):
+        """Prueba que una clave que sale del directorio no se escribe."""
+        backend = LocalStorageBackend(str(tmp_path / "store"))
+
+        assert backend.upload_file(io.BytesIO(CONTENT), "../../escape.csv", "text/csv") is None
+        assert not (tmp_path / "escape.csv").exists()
+
+
+class TestThrottle:
+    """Clase de pruebas para la latencia y el ancho de banda simulados."""
+
+    def test_latency_per_request(self):
+        """Prueba que cada petición espera la latencia configurada."""
+        backend = MemoryStorageBackend(latency=0.05)
+
+        started = time.perf_counter()
+        backend.upload_file(io.BytesIO(CONTENT), "a.csv", "text/csv")
+        backend.delete_file("a.csv")
+
+        assert time.perf_counter() - started >= 0.1
+
+    def test_bandwidth_per_transfer(self):
+        """Prueba que las subidas y lecturas tardan según el ancho de banda."""
+        backend = MemoryStorageBackend(bandwidth=1024 * 1024)
+
+        started = time.perf_counter()
+        backend.upload_file(io.BytesIO(b"x" * 200 * 1024), "a.csv", "text/csv")
+        upload_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        backend.get_file_stream("a.csv").read()
+
+        assert upload_seconds >= 0.19
+        assert time.perf_counter() - started >= 0.19
+
+    def test_parallel_parts_add_bandwidth(self):
+        """Prueba que las partes de upload_file en paralelo suman ancho de banda."""
+        sequential = MemoryStorageBackend(bandwidth=80 * 1024 * 1024)
+        sequential.transfer_config.max_concurrency = 1
+        sequential.transfer_config.use_threads = False
+        parallel = MemoryStorageBackend(bandwidth=80 * 1024 * 1024)
+        parallel.transfer_config.max_concurrency = 4
+        data = b"x" * 4 * parallel.transfer_config.multipart_chunksize
+
+        timings = []
+        for backend in (sequential, parallel):
+            started = time.perf_counter()
+            backend.upload_file(io.BytesIO(data), "a.bin", "application/octet-stream")
+            timings.append(time.perf_counter() - started)
+
+        assert parallel.get_file_stream("a.bin").read() == data
+        assert timings[1] < timings[0] / 2
+
+
+class TestCreateStorageBackend:
+    """Clase de pruebas para la selección del backend."""
+
+    def test_backend_from_settings(self, tmp_path):
+        """Prueba que se crea el backend de STORAGE_BACKEND con su latencia y ancho de banda."""
+        with patch.object(storage_backends.settings, "STORAGE_BACKEND", "local"), \
+                patch.object(storage_backends.settings, "STORAGE_LOCAL_ROOT", str(tmp_path)), \
+                patch.object(storage_backends.settings, "STORAGE_LATENCY_MS", 20), \
+                patch.object(storage_backends.settings, "STORAGE_BANDWIDTH_MBPS", 2):
+            backend = create_storage_backend()
+
+        assert isinstance(backend, LocalStorageBackend)
+        assert isinstance(backend, IStorageBackend)
+        assert backend.store.throttle.latency == 0.02
+        assert backend.store.throttle.bandwidth == 2 * 1024 * 1024
+
+    def test_memory_and_s3(self):
+        """Prueba que se crean los backends en memoria y de S3."""
+        assert isinstance(create_storage_backend("memory"), MemoryStorageBackend)
+        with patch("app.infrastructure.services.s3_service._s3_client", Mock()):
+            assert type(create_storage_backend("s3")) is S3Service
+
+    def test_invalid_backend(self):
+        """Prueba que un backend desconocido es un error de configuración."""
+        with pytest.raises(ValueError):
+            create_storage_backend("ftp")
+
+
+class TestFileUseCaseWithBackend:
+    """Clase de pruebas de FileUseCase con un backend inyectado."""
+
+    def test_upload_stream_to_memory_backend(self):
+        """Prueba que la carga por bloques guarda el archivo en el backend inyectado."""
+        repository = Mock()
+        files = {}
+
+        def create(entity):
+            entity.id = len(files) + 1
+            files[entity.id] = entity
+            return entity
+
+        repository.create.side_effect = create
+        repository.update.side_effect = lambda entity: entity
+        repository.get_by_content_hash.return_value = None
+        storage = MemoryStorageBackend()
+        use_case = FileUseCase(repository, storage=storage)
+
+        result = use_case.upload_and_validate_stream(io.BytesIO(CONTENT), "a.csv", "text/csv", 1, "p1", "p2")
+
+        s3_key = files[result["file_id"]].s3_key
+        assert use_case.storage is storage
+        assert storage.get_file_stream(s3_key).read() == CONTENT
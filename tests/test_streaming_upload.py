@@ -0,0 +1,355 @@
+"""
+Pruebas unitarias para la carga de archivos por bloques a S3.
+
+Verifica TeeStream, la carga por partes de S3MultipartUpload y el flujo
+de FileUseCase.upload_and_validate_stream.
+"""
+
+import hashlib
+import io
+import pytest
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+from app.application.ingestion.tee_stream import TeeStream
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.entities.file import File, FileStatus
+from app.infrastructure.services.s3_service import MIN_PART_SIZE, S3MultipartUpload
+
+CONTENT = b"name,price\nA,1\nB,\nC,abc\n"
+
+
+class _Sink:
+    """Destino que registra los bloques escritos."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+        return len(data)
+
+
+class TestTeeStream:
+    """Clase de pruebas para TeeStream."""
+
+    def test_copies_reads_to_sink(self):
+        """Prueba que cada bloque leído se copia al destino y al resumen."""
+        sink = _Sink()
+        tee = TeeStream(io.BytesIO(CONTENT), sink)
+
+        first = tee.read(5)
+
+        assert first == CONTENT[:5]
+        assert sink.chunks == [CONTENT[:5]]
+        assert tee.size == 5
+
+    def test_drain_reads_rest(self):
+        """Prueba que drain copia el resto del flujo y completa tamaño y resumen."""
+        sink = _Sink()
+        tee = TeeStream(io.BytesIO(CONTENT), sink, chunk_size=4)
+        tee.read(3)
+
+        assert tee.drain() == len(CONTENT)
+        assert b"".join(sink.chunks) == CONTENT
+        assert tee.hexdigest() == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_sink_error_kept(self):
+        """Prueba que el error del destino se vuelve a lanzar aunque el lector lo capture."""
+        sink = Mock()
+        sink.write.side_effect = OSError("fallo")
+        tee = TeeStream(io.BytesIO(CONTENT), sink, chunk_size=4)
+
+        with pytest.raises(OSError):
+            tee.read(4)
+        with pytest.raises(OSError):
+            tee.drain()
+        assert sink.write.call_count == 1
+
+    def test_empty_stream(self):
+        """Prueba que un flujo vacío no escribe en el destino."""
+        sink = _Sink()
+        tee = TeeStream(io.BytesIO(b""), sink)
+
+        assert tee.drain() == 0
+        assert sink.chunks == []
+        assert tee.hexdigest() == hashlib.sha256(b"").hexdigest()
+
+
+class TestS3MultipartUpload:
+    """Clase de pruebas para S3MultipartUpload."""
+
+    def _client(self):
+        """Crea un cliente de S3 simulado que registra las partes subidas."""
+        client = Mock()
+        client.create_multipart_upload.return_value = {"UploadId": "u1"}
+        client.upload_part.side_effect = lambda **kwargs: {"ETag": f"e{kwargs['PartNumber']}"}
+        return client
+
+    def test_small_object_single_request(self):
+        """Prueba que un objeto menor que una parte se sube con put_object."""
+        client = self._client()
+        upload = S3MultipartUpload(client, "bucket", "key.csv", "text/csv", MIN_PART_SIZE)
+
+        upload.write(CONTENT)
+        url = upload.complete()
+
+        assert url.endswith("/key.csv")
+        client.put_object.assert_called_once_with(Bucket="bucket", Key="key.csv", Body=CONTENT, ContentType="text/csv")
+        client.create_multipart_upload.assert_not_called()
+
+    def test_content_encoding_kept(self):
+        """Prueba que el objeto se guarda con su ContentEncoding si está comprimido."""
+        client = self._client()
+        upload = S3MultipartUpload(client, "bucket", "key.csv.gz", "text/csv", MIN_PART_SIZE, content_encoding="gzip")
+
+        upload.write(CONTENT)
+        upload.complete()
+
+        client.put_object.assert_called_once_with(
+            Bucket="bucket", Key="key.csv.gz", Body=CONTENT, ContentType="text/csv", ContentEncoding="gzip"
+        )
+
+    def test_parts_uploaded_as_filled(self):
+        """Prueba que cada parte se sube al completarse y la última al terminar."""
+        client = self._client()
+        upload = S3MultipartUpload(client, "bucket", "key.csv", "text/csv", 0)
+        block = b"x" * (MIN_PART_SIZE // 2)
+
+        for _ in range(5):
+            upload.write(block)
+        upload.complete()
+
+        assert upload.part_size == MIN_PART_SIZE
+        assert client.upload_part.call_count == 3
+        assert [len(call.kwargs["Body"]) for call in client.upload_part.call_args_list] == [
+            MIN_PART_SIZE, MIN_PART_SIZE, MIN_PART_SIZE // 2
+        ]
+        client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="key.csv",
+            UploadId="u1",
+            MultipartUpload={"Parts": [
+                {"ETag": "e1", "PartNumber": 1},
+                {"ETag": "e2", "PartNumber": 2},
+                {"ETag": "e3", "PartNumber": 3},
+            ]}
+        )
+
+    def test_abort_discards_parts(self):
+        """Prueba que cancelar una carga iniciada la aborta en S3."""
+        client = self._client()
+        upload = S3MultipartUpload(client, "bucket", "key.csv", "text/csv", MIN_PART_SIZE)
+        upload.write(b"x" * MIN_PART_SIZE)
+
+        upload.abort()
+        upload.abort()
+
+        client.abort_multipart_upload.assert_called_once_with(Bucket="bucket", Key="key.csv", UploadId="u1")
+
+    def test_failed_part_raises_on_next_write(self):
+        """Prueba que el error de una parte subida en segundo plano se lanza en la siguiente escritura."""
+        client = self._client()
+        client.upload_part.side_effect = ClientError({"Error": {"Code": "500"}}, "UploadPart")
+        upload = S3MultipartUpload(client, "bucket", "key.csv", "text/csv", MIN_PART_SIZE)
+        upload.write(b"x" * MIN_PART_SIZE)
+        upload._pending[0].exception()
+
+        with pytest.raises(ClientError):
+            upload.write(b"x")
+        client.abort_multipart_upload.assert_called_once()
+        assert upload.complete() is None
+        client.put_object.assert_not_called()
+
+    def test_parts_in_flight_bounded(self):
+        """Prueba que no hay más partes en vuelo que max_concurrency."""
+        client = self._client()
+        upload = S3MultipartUpload(client, "bucket", "key.csv", "text/csv", MIN_PART_SIZE, max_concurrency=2)
+
+        for _ in range(5):
+            upload.write(b"x" * MIN_PART_SIZE)
+            assert len(upload._pending) <= 2
+        upload.complete()
+
+        assert [part["PartNumber"] for part in client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]] == [1, 2, 3, 4, 5]
+
+    def test_complete_error_returns_none(self):
+        """Prueba que un error al completar devuelve None y cancela la carga."""
+        client = self._client()
+        client.complete_multipart_upload.side_effect = ClientError({"Error": {"Code": "500"}}, "CompleteMultipartUpload")
+        upload = S3MultipartUpload(client, "bucket", "key.csv", "text/csv", MIN_PART_SIZE)
+        upload.write(b"x" * MIN_PART_SIZE)
+
+        assert upload.complete() is None
+        client.abort_multipart_upload.assert_called_once()
+
+
+class TestFileUseCaseUploadStream:
+    """Clase de pruebas para FileUseCase.upload_and_validate_stream."""
+
+    def _repository(self):
+        """Crea un repositorio en memoria de archivos."""
+        repository = Mock()
+        files = {}
+
+        def create(entity):
+            entity.id = len(files) + 1
+            files[entity.id] = entity
+            return entity
+
+        repository.create.side_effect = create
+        repository.update.side_effect = lambda entity: entity
+        repository.get_by_content_hash.return_value = None
+        return repository
+
+    def _upload(self, repository, stream=None, **kwargs):
+        """Sube un contenido con S3 simulado y devuelve el resultado y la carga."""
+        with patch("app.application.use_cases.file_use_case.get_storage_backend") as s3_class:
+            upload = s3_class.return_value.start_upload.return_value
+            upload.complete.return_value = "https://s3.amazonaws.com/bucket/file.csv"
+            use_case = FileUseCase(repository)
+            result = use_case.upload_and_validate_stream(
+                stream or io.BytesIO(CONTENT), "test.csv", "text/csv", 1, "p1", "p2", **kwargs
+            )
+            return result, upload, s3_class.return_value
+
+    def test_streams_and_validates(self):
+        """Prueba que el contenido se sube por bloques mientras se valida."""
+        repository = self._repository()
+
+        result, upload, _ = self._upload(repository)
+
+        saved = repository.update.call_args[0][0]
+        assert b"".join(call.args[0] for call in upload.write.call_args_list) == CONTENT
+        assert result["s3_url"] == "https://s3.amazonaws.com/bucket/file.csv"
+        assert [v["type"] for v in result["validations"]] == ["empty_value", "invalid_type"]
+        assert saved.file_size == len(CONTENT)
+        assert saved.content_hash == hashlib.sha256(CONTENT).hexdigest()
+        assert saved.status == FileStatus.PENDING
+        repository.get_by_content_hash.assert_called_once_with(1, saved.content_hash, "streaming|full|")
+        assert saved.validation_options == "streaming|full|"
+
+    def test_early_stop_drains_rest(self):
+        """Prueba que si el validador se detiene antes se sube igualmente el archivo completo."""
+        repository = self._repository()
+        with patch("app.application.use_cases.file_use_case.settings.CSV_REPORT_MAX_FINDINGS", 1), \
+                patch("app.application.use_cases.file_use_case.settings.CSV_REPORT_STORE_DETAILS", False):
+            result, upload, _ = self._upload(repository, report_mode="summary")
+
+        assert result["report"]["stopped_early"] is True
+        assert b"".join(call.args[0] for call in upload.write.call_args_list) == CONTENT
+        assert repository.update.call_args[0][0].file_size == len(CONTENT)
+
+    def test_duplicate_aborts_upload(self):
+        """Prueba que un contenido ya subido cancela la carga y descarta el registro provisional."""
+        repository = self._repository()
+        repository.get_by_content_hash.return_value = File(
+            id_=3, s3_url="https://s3.amazonaws.com/bucket/old.csv", status=FileStatus.COMPLETED, user_id=1
+        )
+
+        result, upload, _ = self._upload(repository)
+
+        assert result["file_id"] == 3
+        assert result["deduplicated"] is True
+        upload.abort.assert_called_once()
+        upload.complete.assert_not_called()
+        repository.delete.assert_called_once_with(1)
+
+    def test_hash_first_duplicate_skips_storage(self):
+        """Prueba que con el resumen calculado antes de la carga un duplicado no toca el almacenamiento."""
+        repository = self._repository()
+        repository.get_by_content_hash.return_value = File(
+            id_=3, s3_url="https://s3.amazonaws.com/bucket/old.csv", status=FileStatus.COMPLETED, user_id=1
+        )
+        storage = Mock()
+        use_case = FileUseCase(repository, storage=storage)
+        stream = io.BytesIO(CONTENT)
+        stream.read(4)
+
+        content_hash, size = use_case.hash_stream(stream)
+        result = use_case.upload_and_validate_stream(
+            stream, "test.csv", "text/csv", 1, "p1", "p2", content_hash=content_hash
+        )
+
+        assert (content_hash, size) == (hashlib.sha256(CONTENT).hexdigest(), len(CONTENT))
+        assert stream.tell() == 0
+        assert result["file_id"] == 3
+        assert result["deduplicated"] is True
+        assert storage.method_calls == []
+        repository.create.assert_not_called()
+
+    def test_force_upload_skips_lookup(self):
+        """Prueba que force_upload completa la carga aunque el contenido exista."""
+        repository = self._repository()
+
+        result, upload, _ = self._upload(repository, force_upload=True)
+
+        assert result["deduplicated"] is False
+        repository.get_by_content_hash.assert_not_called()
+        upload.complete.assert_called_once()
+
+    def test_s3_failure_marks_failed(self):
+        """Prueba que si no se completa la carga el archivo queda en FAILED."""
+        repository = self._repository()
+        with patch("app.application.use_cases.file_use_case.get_storage_backend") as s3_class:
+            s3_class.return_value.start_upload.return_value.complete.return_value = None
+            use_case = FileUseCase(repository)
+            with pytest.raises(Exception, match="S3"):
+                use_case.upload_and_validate_stream(io.BytesIO(CONTENT), "test.csv", "text/csv", 1, "p1", "p2")
+
+        assert repository.update.call_args[0][0].status == FileStatus.FAILED
+
+    def test_staging_rereads_seekable_stream(self):
+        """Prueba que la carga en staging relee el flujo original sin descargarlo de S3."""
+        repository = self._repository()
+        row_repository = Mock()
+        loaded = []
+        row_repository.bulk_insert.side_effect = lambda file_id, rows, batch_size: len(loaded.extend(rows) or loaded)
+        with patch("app.application.use_cases.file_use_case.get_storage_backend") as s3_class:
+            s3_class.return_value.start_upload.return_value.complete.return_value = "https://s3/file.csv"
+            use_case = FileUseCase(repository, row_repository)
+            result = use_case.upload_and_validate_stream(
+                io.BytesIO(CONTENT), "test.csv", "text/csv", 1, "p1", "p2"
+            )
+            s3_class.return_value.get_file_stream.assert_not_called()
+
+        assert result["staging"]["rows"] == 4
+        assert loaded[0] == (1, ["name", "price"])
+
+    def test_timings_per_stage(self):
+        """Prueba que el resultado incluye la duración de cada etapa."""
+        repository = self._repository()
+
+        result, _, _ = self._upload(repository)
+
+        assert set(result["timings"]) == {"validation", "upload", "persist", "staging", "total"}
+
+    def test_upload_failure_stops_validation(self):
+        """Prueba que si falla la subida se detiene la validación y el archivo queda en FAILED."""
+        repository = self._repository()
+        stream = io.BytesIO(CONTENT)
+        with patch("app.application.use_cases.file_use_case.get_storage_backend") as s3_class:
+            upload = s3_class.return_value.start_upload.return_value
+            upload.write.side_effect = ClientError({"Error": {"Code": "500"}}, "UploadPart")
+            use_case = FileUseCase(repository)
+            with pytest.raises(ClientError):
+                use_case.upload_and_validate_stream(stream, "test.csv", "text/csv", 1, "p1", "p2")
+
+        assert upload.write.call_count == 1
+        upload.abort.assert_called()
+        upload.complete.assert_not_called()
+        assert repository.update.call_args[0][0].status == FileStatus.FAILED
+
+    def test_validation_failure_aborts_upload(self):
+        """Prueba que si falla la validación se cancela la carga en S3."""
+        repository = self._repository()
+        with patch("app.application.use_cases.file_use_case.get_storage_backend") as s3_class:
+            upload = s3_class.return_value.start_upload.return_value
+            use_case = FileUseCase(repository)
+            with pytest.raises(ValueError):
+                use_case.upload_and_validate_stream(
+                    io.BytesIO(CONTENT), "test.csv", "text/csv", 1, "p1", "p2", validation_backend="otro"
+                )
+
+        upload.abort.assert_called_once()
+        upload.complete.assert_not_called()
+        assert repository.update.call_args[0][0].status == FileStatus.FAILED
@@ -0,0 +1,257 @@
+"""
+Pruebas unitarias para el procesamiento asíncrono de cargas.
+
+Verifica el progreso de lectura, la cola de trabajos y las transiciones
+de estado PENDING -> PROCESSING -> COMPLETED/FAILED de FileUseCase.
+"""
+
+import gzip
+import hashlib
+import io
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from app.application.jobs.upload_jobs import ProgressStream, UploadJobQueue, UploadProgress
+from app.application.use_cases.file_use_case import FileUseCase
+from app.domain.entities.file import File, FileStatus
+
+CONTENT = b"name,price\nA,1\nB,\n"
+
+
+class TestProgressStream:
+    """Clase de pruebas para ProgressStream."""
+
+    def test_counts_bytes_and_rows(self):
+        """Prueba que se cuentan los bytes y filas leídos."""
+        progress = UploadProgress(len(CONTENT))
+        stream = ProgressStream(io.BytesIO(CONTENT), progress)
+        while stream.read(4):
+            pass
+        assert progress.bytes_read == len(CONTENT)
+        assert progress.rows_read == 3
+        assert progress.to_dict()["percent"] == 100.0
+
+    def test_seek_and_tell(self):
+        """Prueba que tell y seek se delegan al flujo original."""
+        stream = ProgressStream(io.BytesIO(CONTENT), UploadProgress(len(CONTENT)))
+        assert stream.seek(0, io.SEEK_END) == len(CONTENT)
+        stream.seek(0)
+        assert stream.tell() == 0
+
+
+class TestUploadJobQueue:
+    """Clase de pruebas para UploadJobQueue."""
+
+    def test_progress_available_while_running(self):
+        """Prueba que el progreso se publica durante el trabajo y se retira al terminar."""
+        queue = UploadJobQueue(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def job(progress):
+            progress.stage = "validating"
+            started.set()
+            release.wait(5)
+
+        queue.submit(1, 100, job)
+        assert started.wait(5)
+        assert queue.get_progress(1).stage == "validating"
+        release.set()
+        queue.shutdown(wait=True)
+        assert queue.get_progress(1) is None
+
+    def test_job_errors_are_contained(self):
+        """Prueba que un trabajo que falla no afecta a los siguientes."""
+        queue = UploadJobQueue(max_workers=1)
+        done = []
+
+        def failing(progress):
+            raise RuntimeError("fallo")
+
+        queue.submit(1, 0, failing)
+        queue.submit(2, 0, lambda progress: done.append(2))
+        queue.shutdown(wait=True)
+        assert done == [2]
+
+
+class TestFileUseCaseAsyncProcessing:
+    """Clase de pruebas para el procesamiento asíncrono de FileUseCase."""
+
+    def _repository(self):
+        """Crea un repositorio en memoria que registra los estados guardados."""
+        repository = Mock()
+        files = {}
+        statuses = []
+
+        def create(entity):
+            entity.id = len(files) + 1
+            files[entity.id] = entity
+            return entity
+
+        def update(entity):
+            statuses.append(entity.status)
+            files[entity.id] = entity
+            return entity
+
+        repository.create.side_effect = create
+        repository.update.side_effect = update
+        repository.get_by_id.side_effect = files.get
+        repository.get_by_content_hash.return_value = None
+        return repository, statuses
+
+    def _use_case(self, repository, s3_service_class):
+        """Crea el caso de uso con S3 simulado: las cargas se completan y se leen de memoria."""
+        s3_service = s3_service_class.return_value
+        s3_service.start_upload.return_value.complete.return_value = "https://s3.amazonaws.com/bucket/file.csv"
+        s3_service.get_file_stream.side_effect = lambda s3_key: io.BytesIO(CONTENT)
+        return FileUseCase(repository)
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_pending_with_findings(self, mock_s3_service_class):
+        """Prueba que un archivo con hallazgos pasa de PENDING a PROCESSING y vuelve a PENDING."""
+        repository, statuses = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+
+        pending = use_case.create_pending_upload(io.BytesIO(CONTENT), "test.csv", "text/csv", 1)
+        assert pending == {"file_id": 1, "status": "pending", "file_size": len(CONTENT), "deduplicated": False}
+        assert repository.get_by_id(1).s3_url == "https://s3.amazonaws.com/bucket/file.csv"
+
+        progress = UploadProgress(len(CONTENT))
+        processed = use_case.process_upload(1, progress=progress)
+
+        assert statuses == [FileStatus.PROCESSING, FileStatus.PENDING]
+        assert [v["type"] for v in processed.validations] == ["empty_value"]
+        assert progress.bytes_read == len(CONTENT)
+        assert progress.stage == "done"
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_pending_to_completed(self, mock_s3_service_class):
+        """Prueba las transiciones PENDING -> PROCESSING -> COMPLETED de un archivo sin hallazgos."""
+        valid = b"name,price\nA,1\nB,2\n"
+        repository, statuses = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        mock_s3_service_class.return_value.get_file_stream.side_effect = lambda s3_key: io.BytesIO(valid)
+
+        use_case.create_pending_upload(io.BytesIO(valid), "test.csv", "text/csv", 1)
+        processed = use_case.process_upload(1)
+
+        assert statuses == [FileStatus.PROCESSING, FileStatus.COMPLETED]
+        assert processed.validations == []
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_gzip_progress_counts_csv_rows(self, mock_s3_service_class):
+        """Prueba que en un .csv.gz se cuentan los bytes comprimidos y las filas del CSV descomprimido."""
+        content = b"name,price\n" + b"".join(b"n%05d,%d\n" % (i, i * 7) for i in range(3000))
+        compressed = gzip.compress(content)
+        repository, _ = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        mock_s3_service_class.return_value.get_file_stream.side_effect = lambda s3_key: io.BytesIO(compressed)
+
+        use_case.create_pending_upload(io.BytesIO(compressed), "test.csv.gz", "application/gzip", 1)
+        progress = UploadProgress(len(compressed))
+        use_case.process_upload(1, progress=progress)
+
+        assert compressed.count(b"\n") != content.count(b"\n")
+        assert progress.rows_read == content.count(b"\n")
+        assert progress.bytes_read == len(compressed)
+        assert progress.to_dict()["percent"] == 100.0
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_pending_upload_streams_to_s3(self, mock_s3_service_class):
+        """Prueba que el archivo se sube por bloques y se registra con su tamaño y resumen."""
+        repository, _ = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        upload = mock_s3_service_class.return_value.start_upload.return_value
+
+        use_case.create_pending_upload(io.BytesIO(CONTENT), "test.csv", "text/csv", 1)
+
+        written = b"".join(call.args[0] for call in upload.write.call_args_list)
+        assert written == CONTENT
+        assert repository.get_by_id(1).content_hash == hashlib.sha256(CONTENT).hexdigest()
+        upload.complete.assert_called_once()
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_s3_read_failure_marks_failed(self, mock_s3_service_class):
+        """Prueba que un error al leer de S3 deja el archivo en FAILED."""
+        repository, statuses = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        mock_s3_service_class.return_value.get_file_stream.side_effect = None
+        mock_s3_service_class.return_value.get_file_stream.return_value = None
+
+        use_case.create_pending_upload(io.BytesIO(CONTENT), "test.csv", "text/csv", 1)
+        processed = use_case.process_upload(1)
+
+        assert statuses == [FileStatus.PROCESSING, FileStatus.FAILED]
+        assert processed.validations[0]["type"] == "processing_error"
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_pending_upload_s3_failure_raises(self, mock_s3_service_class):
+        """Prueba que si no se completa la carga en S3 no se registra el archivo."""
+        repository, _ = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        mock_s3_service_class.return_value.start_upload.return_value.complete.return_value = None
+
+        with pytest.raises(Exception, match="S3"):
+            use_case.create_pending_upload(io.BytesIO(CONTENT), "test.csv", "text/csv", 1)
+        repository.create.assert_not_called()
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_pending_upload_deduplicated(self, mock_s3_service_class):
+        """Prueba que un contenido ya subido cancela la carga y devuelve el archivo existente."""
+        repository, _ = self._repository()
+        repository.get_by_content_hash.return_value = File(id_=9, status=FileStatus.COMPLETED, file_size=18, user_id=1)
+        use_case = self._use_case(repository, mock_s3_service_class)
+        upload = mock_s3_service_class.return_value.start_upload.return_value
+
+        result = use_case.create_pending_upload(io.BytesIO(CONTENT), "test.csv", "text/csv", 1)
+
+        assert result == {"file_id": 9, "status": "completed", "file_size": 18, "deduplicated": True}
+        upload.abort.assert_called_once()
+        upload.complete.assert_not_called()
+        repository.create.assert_not_called()
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_file_status(self, mock_s3_service_class):
+        """Prueba el estado con progreso y el acceso solo del propietario."""
+        repository, _ = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        use_case.create_pending_upload(io.BytesIO(CONTENT), "test.csv", "text/csv", 1)
+        progress = UploadProgress(len(CONTENT))
+
+        status = use_case.get_file_status(1, 1, progress)
+
+        assert status["status"] == "pending"
+        assert status["progress"]["stage"] == "queued"
+        assert use_case.get_file_status(1, 2) is None
+        assert use_case.get_file_status(5, 1) is None
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_file_status_stage_without_progress(self, mock_s3_service_class):
+        """Prueba que sin progreso en el proceso se distingue un archivo encolado de uno con hallazgos."""
+        repository, _ = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        use_case.create_pending_upload(io.BytesIO(CONTENT), "test.csv", "text/csv", 1)
+
+        queued = use_case.get_file_status(1, 1)
+        use_case.process_upload(1)
+        done = use_case.get_file_status(1, 1)
+
+        assert (queued["status"], queued["stage"]) == ("pending", "queued")
+        assert (done["status"], done["stage"]) == ("pending", "done")
+
+    @patch("app.application.use_cases.file_use_case.get_storage_backend")
+    def test_fail_stale_uploads(self, mock_s3_service_class):
+        """Prueba que las cargas encoladas que no se procesaron quedan en FAILED al arrancar."""
+        repository, statuses = self._repository()
+        use_case = self._use_case(repository, mock_s3_service_class)
+        lost = File(id_=1, s3_url="https://bucket/a.csv", status=FileStatus.PENDING, user_id=1)
+        legacy = File(
+            id_=2, s3_url="https://bucket/b.csv", status=FileStatus.PENDING, user_id=1,
+            validations=[{"type": "empty_value", "message": "Valor vacío"}]
+        )
+        repository.get_stale_pending.return_value = [lost, legacy]
+
+        assert use_case.fail_stale_uploads(3600) == 1
+        assert statuses == [FileStatus.FAILED]
+        assert lost.validations[0]["type"] == "processing_error"
+        assert legacy.status == FileStatus.PENDING
@@ -0,0 +1,442 @@
+"""
+Pruebas unitarias para las cargas reanudables por bloques.
+
+Verifica el flujo alimentado por bloques, el orden y la repetición de
+bloques de UploadSession, la validación continua entre bloques, el
+cierre de sesiones de FileUseCase y su reanudación en otro proceso.
+"""
+
+import hashlib
+import io
+import threading
+import time
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+from app.application.ingestion.upload_session import (
+    ChunkFeedStream,
+    ChunkOrderError,
+    UploadSession,
+    UploadSessionAborted,
+)
+from app.application.jobs.upload_sessions import UploadSessionRegistry
+from app.application.use_cases.file_use_case import FileUseCase
+from app.application.validation.csv_stream_validator import CSVStreamValidator
+from app.domain.entities.file import File, FileStatus
+
+
+def _s3_service():
+    """Crea un servicio de S3 simulado que guarda las partes subidas."""
+    s3_service = Mock()
+    s3_service.parts = {}
+
+    def upload_part(s3_key, upload_id, part_number, body):
+        s3_service.parts[part_number] = body
+        return f"etag-{part_number}"
+
+    s3_service.upload_part.side_effect = upload_part
+    s3_service.create_multipart_upload.return_value = "upload-1"
+    s3_service.complete_multipart_upload.return_value = "https://bucket/uploads/1/a.csv"
+    return s3_service
+
+
+def _session(s3_service=None, min_chunk_size=4):
+    """Crea una sesión con bloques de al menos min_chunk_size bytes."""
+    return UploadSession(
+        "abc123", 7, 1, "uploads/1/a.csv", "upload-1", s3_service or _s3_service(), "p1", "p2", min_chunk_size
+    )
+
+
+def _read_all(stream):
+    """Lee un flujo hasta el final."""
+    data = b""
+    while True:
+        chunk = stream.read(3)
+        if not chunk:
+            return data
+        data += chunk
+
+
+class TestChunkFeedStream:
+    """Clase de pruebas para ChunkFeedStream."""
+
+    def test_reads_across_chunks(self):
+        """Prueba que las lecturas unen bloques consecutivos y feed espera a que se lean."""
+        stream = ChunkFeedStream()
+        result = {}
+        reader = threading.Thread(target=lambda: result.setdefault("data", _read_all(stream)))
+        reader.start()
+
+        stream.feed(b"name,pr")
+        stream.feed(b"ice\nA,1\n")
+        stream.finish()
+        reader.join(5)
+
+        assert result["data"] == b"name,price\nA,1\n"
+
+    def test_abort_raises_in_reader(self):
+        """Prueba que cancelar el flujo lanza un error en el lector."""
+        stream = ChunkFeedStream()
+        stream.abort()
+        with pytest.raises(UploadSessionAborted):
+            stream.read(10)
+
+    def test_feed_returns_when_reader_done(self):
+        """Prueba que feed no se bloquea si el lector ya terminó."""
+        stream = ChunkFeedStream()
+        stream.close_reader()
+        stream.feed(b"A,1\n")
+
+
+class TestUploadSession:
+    """Clase de pruebas para UploadSession."""
+
+    def _started(self, session, validator=None):
+        """Inicia la validación de la sesión con el validador indicado."""
+        validator = validator or CSVStreamValidator(encoding="utf-8", delimiter=",")
+        session.start_validation(validator.validate)
+        return session
+
+    def test_validation_state_spans_chunks(self):
+        """Prueba que las líneas partidas y los duplicados se detectan entre bloques."""
+        s3_service = _s3_service()
+        session = self._started(_session(s3_service))
+
+        session.put_chunk(1, b"name,price\nA,")
+        session.put_chunk(2, b"1\nB,2\nA")
+        session.put_chunk(3, b",1\n")
+        session.finish()
+
+        assert session.error is None
+        assert session.result == [
+            {"type": "duplicate", "row": 4, "first_row": 2, "message": "Fila duplicada en la línea 4"}
+        ]
+        assert b"".join(s3_service.parts[n] for n in (1, 2, 3)) == b"name,price\nA,1\nB,2\nA,1\n"
+        assert session.size == 23
+
+    def test_repeated_chunk_is_ignored(self):
+        """Prueba que reenviar un bloque con el mismo contenido no lo vuelve a procesar."""
+        s3_service = _s3_service()
+        session = self._started(_session(s3_service))
+
+        session.put_chunk(1, b"name,price\n")
+        state = session.put_chunk(1, b"name,price\n")
+
+        assert state["next_part"] == 2
+        assert s3_service.upload_part.call_count == 1
+        session.abort()
+
+    def test_repeated_chunk_with_other_content(self):
+        """Prueba que reenviar un bloque con otro contenido es un conflicto."""
+        session = self._started(_session())
+        session.put_chunk(1, b"name,price\n")
+
+        with pytest.raises(ChunkOrderError) as error:
+            session.put_chunk(1, b"other,head\n")
+        assert error.value.next_part == 2
+        session.abort()
+
+    def test_out_of_order_chunk(self):
+        """Prueba que un bloque fuera de orden indica el bloque esperado."""
+        session = self._started(_session())
+
+        with pytest.raises(ChunkOrderError) as error:
+            session.put_chunk(2, b"name,price\n")
+        assert error.value.next_part == 1
+        session.abort()
+
+    def test_small_chunk_is_final(self):
+        """Prueba que tras un bloque menor que el mínimo no se admiten más bloques."""
+        session = self._started(_session(min_chunk_size=100))
+        state = session.put_chunk(1, b"name,price\n")
+
+        assert state["final_part_received"] is True
+        with pytest.raises(ChunkOrderError):
+            session.put_chunk(2, b"A,1\n")
+        session.abort()
+
+    def test_s3_failure_keeps_state(self):
+        """Prueba que si falla la subida del bloque se puede reenviar."""
+        s3_service = _s3_service()
+        session = self._started(_session(s3_service))
+        s3_service.upload_part.side_effect = [None, "etag-1"]
+
+        with pytest.raises(Exception, match="Error al subir el bloque a S3"):
+            session.put_chunk(1, b"name,price\n")
+        assert session.next_part == 1
+        assert session.put_chunk(1, b"name,price\n")["next_part"] == 2
+        session.abort()
+
+    def test_finish_without_chunks(self):
+        """Prueba que no se puede completar una sesión sin bloques."""
+        session = self._started(_session())
+        with pytest.raises(ValueError):
+            session.finish()
+        assert session.state == "open"
+        session.abort()
+
+    def test_abort_stops_validation(self):
+        """Prueba que cancelar la sesión detiene el validador y la carga en S3."""
+        s3_service = _s3_service()
+        session = self._started(_session(s3_service))
+        session.put_chunk(1, b"name,price\n")
+
+        session.abort()
+
+        assert session.state == "aborted"
+        assert not session._thread.is_alive()
+        s3_service.abort_multipart_upload.assert_called_once_with("uploads/1/a.csv", "upload-1")
+
+    def test_record_round_trip_restores_detached_session(self):
+        """Prueba que una sesión guardada se restaura sin validador y admite el bloque siguiente."""
+        s3_service = _s3_service()
+        session = self._started(_session(s3_service))
+        session.put_chunk(1, b"name,price\n")
+        record = session.to_record()
+        session.abort()
+
+        restored = UploadSession.from_record(record, record["parts"], s3_service)
+        state = restored.put_chunk(2, b"A,1\n")
+
+        assert restored.detached is True
+        assert state["next_part"] == 3
+        assert state["received_bytes"] == 15
+        assert restored._thread is None
+
+    def test_detach_stops_validation_without_abort(self):
+        """Prueba que desconectar el validador no cancela la carga en S3 ni la sesión."""
+        s3_service = _s3_service()
+        session = self._started(_session(s3_service))
+        session.put_chunk(1, b"name,price\n")
+
+        session.restore_parts(
+            session.parts + [{"PartNumber": 2, "ETag": "etag-2", "size": 4, "sha256": "x"}], 15, False
+        )
+
+        assert session.detached is True
+        assert session.state == "open"
+        assert session.next_part == 3
+        assert session.error is None
+        assert not session._thread.is_alive()
+        s3_service.abort_multipart_upload.assert_not_called()
+
+
+class TestUploadSessionRegistry:
+    """Clase de pruebas para UploadSessionRegistry."""
+
+    def test_pop_expired(self):
+        """Prueba que se retiran solo las sesiones abiertas sin actividad durante el TTL."""
+        registry = UploadSessionRegistry(ttl_seconds=60)
+        idle, active = _session(), _session()
+        active.session_id = "def456"
+        idle.last_activity = time.monotonic() - 120
+        registry.add(idle)
+        registry.add(active)
+
+        assert registry.pop_expired() == [idle]
+        assert registry.get("abc123") is None
+        assert registry.get("def456") is active
+
+
+class TestFileUseCaseUploadSession:
+    """Clase de pruebas para las sesiones de carga de FileUseCase."""
+
+    def _use_case(self, existing=None, session_repository=None):
+        """Crea el caso de uso con repositorios y S3 simulados."""
+        file_repository = Mock()
+        file_repository.create.side_effect = lambda entity: File(
+            id_=7, filename=entity.filename, s3_key=entity.s3_key, status=entity.status, user_id=entity.user_id
+        )
+        stored = {}
+        file_repository.get_by_id.side_effect = lambda file_id: stored.setdefault(
+            "file", File(id_=file_id, filename="a.csv", status=FileStatus.PROCESSING, user_id=1)
+        )
+        file_repository.update.side_effect = lambda entity: entity
+        file_repository.get_by_content_hash.return_value = existing
+        with patch("app.application.use_cases.file_use_case.get_storage_backend", return_value=_s3_service()):
+            use_case = FileUseCase(
+                file_repository, None, Mock(), upload_session_repository=session_repository
+            )
+        return use_case, file_repository
+
+    def _start(self, use_case, run_validation=None):
+        """Abre una sesión con validación en memoria."""
+        def validate(file_id, s3_key, stream):
+            return CSVStreamValidator(encoding="utf-8", delimiter=",").validate(stream), None
+
+        return use_case.start_upload_session(
+            "a.csv", "text/csv", 1, "p1", "p2", run_validation=run_validation or validate
+        )
+
+    def test_complete_session(self):
+        """Prueba que completar guarda las validaciones y completa la carga en S3."""
+        use_case, file_repository = self._use_case()
+        session = self._start(use_case)
+        created = file_repository.create.call_args[0][0]
+        assert created.status == FileStatus.PROCESSING
+
+        session.put_chunk(1, b"name,price\nA,\n")
+        result = use_case.complete_upload_session(session)
+
+        assert result["deduplicated"] is False
+        assert result["s3_url"] == "https://bucket/uploads/1/a.csv"
+        assert result["validations"][0]["type"] == "empty_value"
+        assert set(result["timings"]) == {"validation", "upload", "persist", "total"}
+        saved = file_repository.update.call_args[0][0]
+        assert saved.status == FileStatus.PENDING
+        assert saved.file_size == 14
+        use_case.storage.complete_multipart_upload.assert_called_once_with(
+            session.s3_key, "upload-1", [{"ETag": "etag-1", "PartNumber": 1}]
+        )
+
+    def test_duplicate_discards_session(self):
+        """Prueba que un contenido ya subido cancela la sesión y devuelve el archivo existente."""
+        existing = File(id_=3, s3_url="https://bucket/old.csv", status=FileStatus.COMPLETED, user_id=1)
+        use_case, file_repository = self._use_case(existing)
+        session = self._start(use_case)
+        session.put_chunk(1, b"name,price\nA,1\n")
+
+        result = use_case.complete_upload_session(session)
+
+        assert result["deduplicated"] is True
+        assert result["file_id"] == 3
+        use_case.storage.abort_multipart_upload.assert_called_once()
+        use_case.storage.complete_multipart_upload.assert_not_called()
+        file_repository.delete.assert_called_once_with(7)
+
+    def test_validation_failure_marks_failed(self):
+        """Prueba que si falla la validación la sesión se cancela y el archivo queda en FAILED."""
+        use_case, file_repository = self._use_case()
+
+        def failing(file_id, s3_key, stream):
+            stream.read(1)
+            raise RuntimeError("sin conexión a la base de datos")
+
+        session = self._start(use_case, failing)
+        session.put_chunk(1, b"name,price\n")
+
+        with pytest.raises(RuntimeError):
+            use_case.complete_upload_session(session)
+        assert session.state == "aborted"
+        assert file_repository.update.call_args[0][0].status == FileStatus.FAILED
+        use_case.storage.complete_multipart_upload.assert_not_called()
+
+    def test_abort_session_deletes_provisional_file(self):
+        """Prueba que cancelar una sesión elimina el registro provisional y sus validaciones."""
+        use_case, file_repository = self._use_case()
+        session = self._start(use_case)
+        session.put_chunk(1, b"name,price\n")
+
+        use_case.abort_upload_session(session)
+
+        use_case.file_validation_repository.delete_by_file_id.assert_called_once_with(7)
+        file_repository.delete.assert_called_once_with(7)
+
+    def test_session_state_is_saved_per_chunk(self):
+        """Prueba que se guarda la sesión al abrirla y cada parte nueva una sola vez."""
+        session_repository = Mock()
+        use_case, _ = self._use_case(session_repository=session_repository)
+        session = self._start(use_case)
+
+        use_case.put_upload_session_chunk(session, 1, b"name,price\n")
+        use_case.put_upload_session_chunk(session, 1, b"name,price\n")
+
+        record = session_repository.create.call_args[0][0]
+        assert record["session_id"] == session.session_id
+        assert record["upload_id"] == "upload-1"
+        session_repository.add_part.assert_called_once_with(
+            session.session_id, session.parts[0], 11, True
+        )
+        use_case.abort_upload_session(session)
+        session_repository.delete.assert_called_once_with(session.session_id)
+
+    def test_resume_restores_session_from_other_process(self):
+        """Prueba que una sesión que no está en el proceso se restaura de su estado guardado."""
+        session_repository = Mock()
+        record = _session().to_record()
+        record.update(part_count=1, size=11)
+        session_repository.get.return_value = record
+        session_repository.list_parts.return_value = [
+            {"PartNumber": 1, "ETag": "etag-1", "size": 11, "sha256": "x"}
+        ]
+        use_case, _ = self._use_case(session_repository=session_repository)
+
+        session = use_case.resume_upload_session("abc123", 1)
+
+        assert session.detached is True
+        assert session.next_part == 2
+        assert session.size == 11
+        assert use_case.resume_upload_session("abc123", 2) is None
+
+    def test_resume_syncs_local_session_behind_other_process(self):
+        """Prueba que una sesión local con menos partes que las guardadas toma las guardadas."""
+        session_repository = Mock()
+        use_case, _ = self._use_case(session_repository=session_repository)
+        local = self._start(use_case)
+        local.put_chunk(1, b"name,price\n")
+        record = local.to_record()
+        record.update(part_count=2, size=15)
+        session_repository.get.return_value = record
+        session_repository.list_parts.return_value = local.parts + [
+            {"PartNumber": 2, "ETag": "etag-2", "size": 4, "sha256": "x"}
+        ]
+
+        session = use_case.resume_upload_session(local.session_id, 1, local)
+
+        assert session is local
+        assert local.detached is True
+        assert local.next_part == 3
+
+    def test_resume_finished_elsewhere_detaches_local(self):
+        """Prueba que una sesión completada en otro proceso no se encuentra y se desconecta la local."""
+        session_repository = Mock()
+        session_repository.get.return_value = None
+        use_case, _ = self._use_case(session_repository=session_repository)
+        local = self._start(use_case)
+
+        assert use_case.resume_upload_session(local.session_id, 1, local) is None
+        assert local.detached is True
+        use_case.storage.abort_multipart_upload.assert_not_called()
+
+    def test_complete_detached_session_validates_from_storage(self):
+        """Prueba que una sesión restaurada completa la carga y valida el archivo leído de S3."""
+        session_repository = Mock()
+        use_case, file_repository = self._use_case(session_repository=session_repository)
+        content = b"name,price\nA,\n"
+        record = _session().to_record()
+        record.update(part_count=1, size=len(content), final_part=True)
+        session = UploadSession.from_record(
+            record, [{"PartNumber": 1, "ETag": "etag-1", "size": len(content), "sha256": "x"}], use_case.storage
+        )
+        use_case.file_validation_repository.insert_batch.side_effect = lambda file_id, seq, findings: len(findings)
+
+        with patch.object(use_case, "_open_s3_stream", return_value=io.BytesIO(content)):
+            result = use_case.complete_upload_session(session)
+
+        assert result["validations"][0]["type"] == "empty_value"
+        use_case.storage.complete_multipart_upload.assert_called_once_with(
+            "uploads/1/a.csv", "upload-1", [{"ETag": "etag-1", "PartNumber": 1}]
+        )
+        use_case.file_validation_repository.delete_by_file_id.assert_called_once_with(7)
+        saved = file_repository.update.call_args[0][0]
+        assert saved.content_hash == hashlib.sha256(content).hexdigest()
+        assert saved.file_size == len(content)
+        session_repository.delete.assert_called_once_with("abc123")
+
+    def test_abort_expired_sessions(self):
+        """Prueba que caducan las sesiones guardadas y no las activas en otro proceso."""
+        session_repository = Mock()
+        use_case, file_repository = self._use_case(session_repository=session_repository)
+        active_elsewhere = self._start(use_case)
+        session_repository.get.return_value = {"updated_at": datetime.utcnow()}
+        stale = _session().to_record()
+        stale.update(session_id="def456", file_id=9, updated_at=datetime.utcnow() - timedelta(days=1))
+        session_repository.list_expired.return_value = [stale]
+
+        use_case.abort_expired_upload_sessions([active_elsewhere])
+
+        assert active_elsewhere.detached is True
+        assert active_elsewhere.state == "open"
+        use_case.storage.abort_multipart_upload.assert_called_once_with("uploads/1/a.csv", "upload-1")
+        session_repository.delete.assert_called_once_with("def456")
+        file_repository.delete.assert_called_once_with(9)
@@ -0,0 +1,52 @@
+"""
+Pruebas unitarias para ValidationPlan.
+
+Verifica la compilación del encabezado en comprobaciones por columna.
+"""
+
+from app.application.validation.validation_plan import ValidationPlan, is_number
+
+
+class TestValidationPlanCompile:
+    """Clase de pruebas para el método compile."""
+
+    def test_numeric_columns_resolved_once(self):
+        """Prueba que las columnas numéricas se resuelven por nombre de columna."""
+        plan = ValidationPlan.compile(["Producto", "Precio_Unitario", "TOTAL", "notes"])
+        assert [rule.name for rule in plan.typed_columns] == ["Precio_Unitario", "TOTAL"]
+        assert plan.numeric_positions == [1, 2]
+
+    def test_all_columns_check_empty(self):
+        """Prueba que todas las columnas comprueban valores vacíos."""
+        plan = ValidationPlan.compile(["a", "b"])
+        assert all(rule.check_empty for rule in plan.columns)
+
+    def test_custom_keywords(self):
+        """Prueba palabras clave numéricas personalizadas."""
+        plan = ValidationPlan.compile(["importe", "price"], numeric_keywords=["importe"])
+        assert [rule.name for rule in plan.typed_columns] == ["importe"]
+
+    def test_repeated_header_takes_last_position(self):
+        """Prueba que un nombre repetido toma el valor de su última aparición."""
+        plan = ValidationPlan.compile(["a", "b", "a"])
+        assert [(rule.name, rule.position) for rule in plan.columns] == [("a", 2), ("b", 1)]
+        assert not plan.positional
+        assert plan.row_key(["1", "2", "3"]) == ("3", "2")
+
+    def test_row_key_marks_missing_values(self):
+        """Prueba que los valores ausentes se representan con None en la clave."""
+        plan = ValidationPlan.compile(["a", "b"])
+        assert plan.row_key(["1"]) == ("1", None)
+        assert plan.row_key(["1", "2"]) == ("1", "2")
+
+
+class TestIsNumber:
+    """Clase de pruebas para la función is_number."""
+
+    def test_comma_decimal(self):
+        """Prueba números con coma decimal."""
+        assert is_number("10,50")
+
+    def test_not_a_number(self):
+        """Prueba valores no numéricos."""
+        assert not is_number("abc")
@@ -0,0 +1,111 @@
+"""
+Pruebas unitarias para ValidationReport.
+
+Verifica los contadores por tipo y columna, los límites de la muestra,
+la detención temprana y el volcado del detalle completo.
+"""
+
+import gzip
+import io
+import json
+import pytest
+from unittest.mock import Mock, patch
+from app.application.use_cases.file_use_case import FileUseCase
+from app.application.validation.csv_stream_validator import CSVStreamValidator
+from app.application.validation.validation_report import ValidationReport
+
+CONTENT = b"name,email,price\n" + b"".join(b"user%d,,abc\n" % i for i in range(50))
+
+
+def _findings():
+    """Genera las validaciones del contenido de prueba."""
+    return CSVStreamValidator().iter_findings(io.BytesIO(CONTENT))
+
+
+class TestValidationReport:
+    """Clase de pruebas para ValidationReport."""
+
+    def test_counts_by_type_and_column(self):
+        """Prueba los contadores por tipo y por columna."""
+        report = ValidationReport().consume(_findings()).to_dict()
+        assert report["total"] == 100
+        assert report["by_type"] == {"empty_value": 50, "invalid_type": 50}
+        assert report["by_column"] == {"empty_value": {"email": 50}, "invalid_type": {"price": 50}}
+        assert not report["stopped_early"]
+
+    def test_sample_caps(self):
+        """Prueba los límites de muestra por tipo y en total."""
+        report = ValidationReport(samples_per_type=3, max_samples=5).consume(_findings())
+        kinds = [finding["type"] for finding in report.samples]
+        assert kinds.count("empty_value") == 3
+        assert len(kinds) == 5
+        assert report.samples_truncated
+
+    def test_early_exit_closes_generator(self):
+        """Prueba que al alcanzar el máximo se detiene la validación."""
+        findings = _findings()
+        report = ValidationReport(max_findings=7).consume(findings)
+        assert report.total == 7
+        assert report.stopped_early
+        assert next(findings, None) is None
+
+    def test_details_written_as_json_lines(self):
+        """Prueba que el detalle completo se escribe como JSON Lines."""
+        details = io.StringIO()
+        report = ValidationReport(max_samples=2, details=details).consume(_findings())
+        lines = details.getvalue().splitlines()
+        assert len(lines) == report.total
+        assert json.loads(lines[0]) == report.samples[0]
+
+
+class TestFileUseCaseBuildValidationReport:
+    """Clase de pruebas para el método build_validation_report."""
+
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
+    def test_details_uploaded_when_truncated(self, mock_s3_service_class):
+        """Prueba que el detalle comprimido se sube a S3 cuando la muestra está recortada."""
+        uploaded = {}
+
+        def upload_file(file_obj, s3_key, content_type):
+            uploaded[s3_key] = gzip.decompress(file_obj.read())
+            return f"https://bucket/{s3_key}"
+
+        mock_s3_service = Mock()
+        mock_s3_service.upload_file.side_effect = upload_file
+        mock_s3_service_class.return_value = mock_s3_service
+
+        use_case = FileUseCase(Mock())
+        report = use_case.build_validation_report(
+            io.BytesIO(CONTENT), "streaming", details_key="uploads/1/f.csv.validations.jsonl.gz"
+        )
+
+        assert report["details_key"] == "uploads/1/f.csv.validations.jsonl.gz"
+        assert len(uploaded[report["details_key"]].splitlines()) == report["total"] == 100
+
+    @patch('app.application.use_cases.file_use_case.get_storage_backend')
+    def test_no_details_for_valid_file(self, mock_s3_service_class):
+        """Prueba que no se sube detalle si no hay validaciones."""
+        mock_s3_service = Mock()
+        mock_s3_service_class.return_value = mock_s3_service
+
+        use_case = FileUseCase(Mock())
+        report = use_case.build_validation_report(
+            io.BytesIO(b"a,b\n1,2\n"), details_key="uploads/1/f.csv.validations.jsonl.gz"
+        )
+
+        assert report["total"] == 0
+        assert report["details_key"] is None
+        mock_s3_service.upload_file.assert_not_called()
+
+    def test_summary_stops_early_on_large_file(self):
+        """Prueba que un archivo grande se valida secuencialmente y deja de leerse al alcanzar el límite."""
+        content = b"name,email,price\n" + b"".join(b"user%d,,abc\n" % i for i in range(400000))
+        stream = io.BytesIO(content)
+
+        with patch("app.application.use_cases.file_use_case.settings.CSV_REPORT_MAX_FINDINGS", 10), \
+                patch("app.application.use_cases.file_use_case.settings.CSV_PARALLEL_WORKERS", 2), \
+                patch("app.application.use_cases.file_use_case.settings.CSV_PARALLEL_MIN_BYTES", 1):
+            report = FileUseCase(Mock(), storage=Mock()).build_validation_report(stream, "streaming")
+
+        assert report["stopped_early"] is True
+        assert stream.tell() < len(content)